@@ -0,0 +1,432 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import sys, os, re, time, json, random, getopt, hashlib, base64, tempfile
+import urllib.parse, urllib.request, urllib.error
+from threading import Thread, Lock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import formatdate
+from bench import synthetic
+
+
+UPSTREAMS = (
+    ('/rpc.php', 'https://aur.archlinux.org'),
+    ('/packages.php', 'https://aur.archlinux.org'),
+    ('/cgit/', 'https://aur.archlinux.org'),
+    ('/packages/', 'https://archive.archlinux.org'),
+    ('/api/', 'http://pacnet.karbownicki.com'),
+    )
+
+
+class Fixtures(object):
+    def __init__(self, path):
+        self._path = path
+        self._lock = Lock()
+
+    def _filename(self, target):
+        digest = hashlib.sha1(target.encode('utf-8')).hexdigest()
+        return os.path.join(self._path, '%s.json' % digest)
+
+    def get(self, target):
+        try:
+            with open(self._filename(target)) as stream:
+                data = json.load(stream)
+        except (IOError, ValueError):
+            return None
+        return (data['status'], data['type'],
+                base64.b64decode(data['body'].encode('ascii')))
+
+    def put(self, target, status, type, body):
+        with self._lock:
+            os.makedirs(self._path, exist_ok=True)
+            with open(self._filename(target), 'w') as stream:
+                json.dump({
+                    'target': target,
+                    'status': status,
+                    'type': type,
+                    'body': base64.b64encode(body).decode('ascii'),
+                    }, stream, indent=1)
+
+
+class Faults(object):
+    latency = 0.0
+    jitter = 0.0
+    bandwidth = 0
+    errors = 0.0
+    seed = 0
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            if not hasattr(self, key):
+                raise TypeError('unknown option: %s' % key)
+            setattr(self, key, value)
+        self._random = random.Random(self.seed)
+        self._lock = Lock()
+
+    def delay(self):
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter)
+        return self.latency + jitter
+
+    def failed(self):
+        with self._lock:
+            return self._random.random() < self.errors
+
+
+class Site(object):
+    def __init__(self, data):
+        self.root = data['root']
+        self.mirror = os.path.join(self.root, 'mirror')
+        self.aur = dict((package.name, package) for package in data['aur'])
+        self.names = dict((package.name, package) for package in
+                          data['packages'] + data['foreign'] + data['aur'])
+        self.required = {}
+        for package in data['aur']:
+            for name in package.depends:
+                self.required.setdefault(name, []).append(package.name)
+        self.categories = {}
+        for package in data['packages']:
+            words = package.description.split()
+            category = '%s-%s' % (words[0], words[-1])
+            self.categories.setdefault(category, []).append(package.name)
+
+    def info(self, package, index):
+        return {
+            'ID': index + 1,
+            'Name': package.name,
+            'PackageBaseID': index + 1,
+            'PackageBase': package.name,
+            'Version': package.version,
+            'Description': package.description,
+            'URL': 'https://example.org/%s' % package.name,
+            'NumVotes': package.votes,
+            'Popularity': package.popularity,
+            'OutOfDate': None,
+            'Maintainer': package.maintainer,
+            'FirstSubmitted': package.builddate,
+            'LastModified': package.builddate,
+            'URLPath': '/cgit/aur.git/snapshot/%s.tar.gz' % package.name,
+            'Depends': list(package.depends),
+            'MakeDepends': [],
+            'OptDepends': list(package.optdepends),
+            'License': [package.license],
+            'Keywords': [],
+            }
+
+    def rpc(self, query):
+        mode = query.get('type', [''])[0]
+        if mode in ('info', 'multiinfo'):
+            names = query.get('arg[]', []) + query.get('arg', [])
+            results = [self.info(self.aur[name], index)
+                       for index, name in enumerate(sorted(self.aur))
+                       if name in names]
+            mode = 'multiinfo'
+        elif mode == 'search':
+            term = query.get('arg', [''])[0].lower()
+            by = query.get('by', ['name-desc'])[0]
+            results = []
+            for index, name in enumerate(sorted(self.aur)):
+                package = self.aur[name]
+                if by == 'maintainer':
+                    found = term == (package.maintainer or '').lower()
+                elif by == 'name':
+                    found = term in name
+                else:
+                    found = (term in name or
+                             term in package.description.lower())
+                if found:
+                    results.append(self.info(package, index))
+        else:
+            return self.json({'version': 5, 'type': 'error',
+                              'resultcount': 0, 'results': [],
+                              'error': 'Incorrect request type specified.'})
+        return self.json({'version': 5, 'type': mode,
+                          'resultcount': len(results), 'results': results})
+
+    def htm(self, query):
+        name = query.get('N', [''])[0]
+        if name not in self.aur:
+            return 404, 'text/html', b'<html><body>not found</body></html>'
+        links = ''.join('<li><a href="/packages/%s">%s</a></li>' % (
+            required, required) for required in self.required.get(name, ()))
+        html = ('<html><body><div id="pkgdetails"></div>'
+                '<div id="pkgreqs"><ul>%s</ul></div></body></html>' % links)
+        return 200, 'text/html', html.encode('utf-8')
+
+    def srcinfo(self, query):
+        package = self.aur.get(query.get('h', [''])[0])
+        if package is None:
+            return 404, 'text/plain', b''
+        base, release = package.version.rsplit('-', 1)
+        lines = ['pkgbase = %s' % package.name,
+                 '\tpkgdesc = %s' % package.description,
+                 '\tpkgver = %s' % base,
+                 '\tpkgrel = %s' % release,
+                 '\turl = https://example.org/%s' % package.name,
+                 '\tarch = %s' % synthetic.ARCH,
+                 '\tlicense = %s' % package.license]
+        lines.extend('\tdepends = %s' % name for name in package.depends)
+        lines.extend(('', 'pkgname = %s' % package.name, ''))
+        return 200, 'text/plain', '\n'.join(lines).encode('utf-8')
+
+    def ala(self, path):
+        parts = [part for part in path.split('/') if part]
+        package = self.names.get(parts[-1]) if len(parts) == 3 else None
+        if package is None:
+            return 404, 'text/html', b'<html><body>not found</body></html>'
+        versions = [package.version, synthetic._older(package.version)]
+        links = []
+        for version in versions:
+            for suffix in ('xz', 'zst'):
+                filename = '%s-%s-%s.pkg.tar.%s' % (
+                    package.name, version, synthetic.ARCH, suffix)
+                links.append('<a href="%s">%s</a>' % (filename, filename))
+        html = '<html><body><pre>%s</pre></body></html>' % '\n'.join(links)
+        return 200, 'text/html', html.encode('utf-8')
+
+    def pacnet(self, path):
+        parts = [part for part in path.split('/') if part]
+        if parts[1:] == ['categories']:
+            return self.json([{'name': name}
+                              for name in sorted(self.categories)])
+        elif len(parts) == 3 and parts[1] == 'category':
+            names = self.categories.get(parts[2])
+            if names is not None:
+                return self.json([{'name': name} for name in names])
+        return 404, 'application/json', b'[]'
+
+    def json(self, data):
+        return 200, 'application/json', json.dumps(data).encode('utf-8')
+
+    def resolve(self, path, query):
+        if path == '/rpc.php' or path.startswith('/rpc'):
+            return self.rpc(query)
+        elif path == '/packages.php':
+            return self.htm(query)
+        elif path == '/cgit/aur.git/plain/.SRCINFO':
+            return self.srcinfo(query)
+        elif path.startswith('/packages/'):
+            return self.ala(path)
+        elif path.startswith('/api/'):
+            return self.pacnet(path)
+        return 404, 'text/plain', b'not found'
+
+    def file(self, path):
+        relative = os.path.normpath(path[len('/mirror/'):]).lstrip('/')
+        if relative.startswith('..'):
+            return None
+        filename = os.path.join(self.mirror, relative)
+        if os.path.isfile(filename):
+            return filename
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def do_HEAD(self):
+        self.handle_request(False)
+
+    def do_GET(self):
+        self.handle_request(True)
+
+    def handle_request(self, body):
+        server = self.server
+        server.count()
+        delay = server.faults.delay()
+        if delay:
+            time.sleep(delay)
+        if server.faults.failed():
+            return self.respond(503, 'text/plain', b'injected failure', body)
+        parts = urllib.parse.urlsplit(self.path)
+        if parts.path.startswith('/mirror/'):
+            filename = server.site and server.site.file(parts.path)
+            if filename is None:
+                return self.respond(404, 'text/plain', b'not found', body)
+            with open(filename, 'rb') as stream:
+                data = stream.read()
+            headers = {'Accept-Ranges': 'bytes'}
+            match = re.match(r'^bytes=(\d+)-(\d*)$',
+                             self.headers.get('Range', ''))
+            if match is None:
+                return self.respond(200, 'application/octet-stream', data,
+                                    body, os.path.getmtime(filename), headers)
+            start = int(match.group(1))
+            end = min(int(match.group(2) or len(data) - 1), len(data) - 1)
+            if start > end:
+                headers['Content-Range'] = 'bytes */%d' % len(data)
+                return self.respond(416, 'text/plain', b'', body,
+                                    headers=headers)
+            headers['Content-Range'] = 'bytes %d-%d/%d' % (
+                start, end, len(data))
+            return self.respond(206, 'application/octet-stream',
+                                data[start:end + 1], body,
+                                os.path.getmtime(filename), headers)
+        response = None
+        if server.fixtures is not None:
+            response = server.fixtures.get(self.path)
+            if response is None and server.record:
+                response = self.fetch(self.path)
+                if response is not None:
+                    server.fixtures.put(self.path, *response)
+        if response is None and server.site is not None:
+            response = server.site.resolve(
+                parts.path, urllib.parse.parse_qs(parts.query))
+        if response is None:
+            response = 404, 'text/plain', b'not found'
+        self.respond(*(response + (body,)))
+
+    def fetch(self, target):
+        for prefix, domain in UPSTREAMS:
+            if target.startswith(prefix):
+                try:
+                    response = urllib.request.urlopen(
+                        domain + target, timeout=30)
+                    try:
+                        return (response.status,
+                                response.info().get_content_type(),
+                                response.read())
+                    finally:
+                        response.close()
+                except urllib.error.HTTPError as exception:
+                    return (exception.code, 'text/plain', b'')
+                except urllib.error.URLError:
+                    return None
+
+    def respond(self, status, type, data, body=True, mtime=None,
+                headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', type)
+        self.send_header('Content-Length', str(len(data)))
+        if mtime is not None:
+            self.send_header('Last-Modified', formatdate(mtime, usegmt=True))
+        for key, value in sorted((headers or {}).items()):
+            self.send_header(key, value)
+        self.end_headers()
+        if body:
+            bandwidth = self.server.faults.bandwidth
+            if bandwidth:
+                chunk = max(1, bandwidth // 20)
+                for offset in range(0, len(data), chunk):
+                    self.wfile.write(data[offset:offset + chunk])
+                    time.sleep(min(chunk, len(data) - offset) / bandwidth)
+            else:
+                self.wfile.write(data)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, port=0, faults=None, fixtures=None, record=False,
+                 verbose=False):
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', port), Handler)
+        self.faults = faults or Faults()
+        self.fixtures = fixtures and Fixtures(fixtures)
+        self.record = record
+        self.verbose = verbose
+        self.site = None
+        self.requests = 0
+        self._lock = Lock()
+        self._thread = None
+
+    def count(self):
+        with self._lock:
+            self.requests += 1
+
+    def url(self, path=''):
+        return 'http://127.0.0.1:%d%s' % (self.server_address[1], path)
+
+    def environment(self):
+        return {
+            'AUR_DOM': self.url(),
+            'ALA_DOM': self.url(),
+            'PACNET_DOM': self.url(),
+            }
+
+    def mirrors(self):
+        return [self.url('/mirror/$repo')]
+
+    def load(self, data):
+        self.site = Site(data)
+
+    def start(self):
+        self._thread = Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def usage():
+    print("""
+usage: python3 -m bench.mockserver [opts]
+
+options:
+ -h  display this help and exit
+ -p  port to listen on (default: random)
+ -w  work directory for the synthetic system (default: temporary)
+ -n  number of sync packages (default: %d)
+ -a  number of aur-only packages (default: %d)
+ -l  latency per request in seconds (default: 0)
+ -j  random latency jitter in seconds (default: 0)
+ -b  bandwidth limit in bytes per second (default: unlimited)
+ -e  ratio of requests that fail with http 503 (default: 0)
+ -F  fixtures directory for recorded responses
+ -R  record missing fixtures from the real services
+ -v  log each request
+""" % (synthetic.Options.packages, synthetic.Options.aur))
+
+def main(argv=None):
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:] if argv is None else argv, 'hp:w:n:a:l:j:b:e:F:Rv')
+    except getopt.GetoptError as exception:
+        print(':: ERROR:', exception)
+        usage()
+        return 2
+    opts = dict(opts)
+    if '-h' in opts:
+        usage()
+        return 0
+    try:
+        faults = Faults(
+            latency=float(opts.get('-l', 0)),
+            jitter=float(opts.get('-j', 0)),
+            bandwidth=int(opts.get('-b', 0)),
+            errors=float(opts.get('-e', 0)),
+            )
+        server = Server(int(opts.get('-p', 0)), faults, opts.get('-F'),
+                        '-R' in opts, '-v' in opts)
+        options = synthetic.Options(
+            packages=int(opts.get('-n', synthetic.Options.packages)),
+            aur=int(opts.get('-a', synthetic.Options.aur)),
+            )
+    except ValueError as exception:
+        print(':: ERROR:', exception)
+        return 2
+    workdir = opts.get('-w') or tempfile.mkdtemp(prefix='pkgbrowser-mock-')
+    data = synthetic.generate(os.path.join(workdir, 'root'), options,
+                              server.mirrors())
+    server.load(data)
+    print(':: serving synthetic system on', server.url())
+    for key, value in sorted(server.environment().items()):
+        print('export %s=%s' % (key, value))
+    print('export PM_CONF_FILE=%s' % data['config'])
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
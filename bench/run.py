@@ -0,0 +1,684 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import sys, os, gc, glob, json, time, getopt, shutil, tempfile, platform
+import subprocess, importlib.util
+from io import StringIO
+from contextlib import redirect_stdout, contextmanager
+from threading import Event
+from bench import synthetic, mockserver
+
+
+_scenarios = []
+_budgets = {}
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'main.py')
+
+
+def scenario(name, requires=('alpm',), budget=None):
+    # a scenario whose best run exceeds its budget (in seconds) fails the
+    # whole benchmark
+    def decorator(function):
+        _scenarios.append((name, requires, function))
+        if budget is not None:
+            _budgets[name] = budget
+        return function
+    return decorator
+
+
+class Context(object):
+    def __init__(self, root, options, faults=None):
+        self.root = root
+        self.options = options
+        self.faults = faults or mockserver.Faults()
+        self.server = None
+        self.servers = []
+        self.data = None
+        self.missing = {}
+
+    def prepare(self):
+        self.server = mockserver.Server(faults=self.faults).start()
+        self.data = synthetic.generate(
+            self.root, self.options, self.server.mirrors())
+        self.server.load(self.data)
+        os.environ.update(self.server.environment())
+        os.environ['PM_CONF_FILE'] = self.data['config']
+        from pkgbrowser.conf import zstd
+        if zstd is None:
+            self.missing['zstd'] = 'No module named zstandard'
+        if importlib.util.find_spec('PyQt5') is None:
+            self.missing['qt'] = 'No module named PyQt5'
+        from pkgbrowser.store import available
+        if not available():
+            self.missing['sqlite'] = 'sqlite has no fts5 trigram tokenizer'
+        try:
+            from pkgbrowser import alpm
+        except ImportError as exception:
+            self.missing['alpm'] = str(exception)
+        else:
+            from pkgbrowser.backend import backend, Cache
+            backend.set_offline(True)
+            Cache.set_path(self.data['cache'])
+
+    def backend(self):
+        from pkgbrowser import alpm
+        from pkgbrowser.backend import backend
+        # start each scenario without the summaries restored from a snapshot,
+        # and on the python engine
+        if not alpm.is_initialized() or backend._summaries is not None:
+            backend.initialize()
+        backend.set_engine('python')
+        return backend
+
+    def release(self):
+        for server in self.servers:
+            server.stop()
+        if self.server is not None:
+            self.server.stop()
+
+    @contextmanager
+    def mirrors(self, *faults):
+        servers = []
+        for item in faults:
+            server = mockserver.Server(faults=item).start()
+            server.load(self.data)
+            self.servers.append(server)
+            servers.extend(server.mirrors())
+        dead = mockserver.Server().start()
+        dead.stop()
+        servers.insert(0, dead.mirrors()[0])
+        servers.extend(self.server.mirrors())
+        config = self.data['config']
+        with open(config, 'r') as stream:
+            original = stream.read()
+        synthetic.write_config(config, self.data['root'],
+                               self.options.repositories, servers)
+        try:
+            yield servers
+        finally:
+            with open(config, 'w') as stream:
+                stream.write(original)
+
+    @contextmanager
+    def online(self):
+        from pkgbrowser.backend import backend
+        backend.set_offline(False)
+        try:
+            yield backend
+        finally:
+            backend.set_offline(True)
+
+    def aur(self, depends=False):
+        for package in self.data['aur']:
+            if package.repository == 'aur' and (
+                not depends or len(package.depends) > 2):
+                return package.name
+
+    def files_cache(self):
+        from pkgbrowser import conf
+        cache = self.data['cache']
+        # the cache also holds the search indexes, so only the files
+        # archives show whether it has been updated
+        if not glob.glob(os.path.join(cache, '*.files.zip')):
+            if quiet(conf.update_cache, cache, 'PkgBrowser'):
+                raise RuntimeError('files cache update failed')
+
+
+def quiet(function, *args):
+    with redirect_stdout(StringIO()):
+        return function(*args)
+
+def measure(function, repeat):
+    runs = []
+    errors = []
+    count = None
+    for index in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        try:
+            count = function()
+        except Exception as exception:
+            errors.append('%s: %s' % (type(exception).__name__, exception))
+        runs.append(time.perf_counter() - start)
+    runs.sort()
+    result = {
+        'best': runs[0],
+        'median': runs[len(runs) // 2],
+        'mean': sum(runs) / len(runs),
+        'runs': runs,
+        }
+    if count is not None:
+        result['items'] = count
+    if errors:
+        result['errors'] = len(errors)
+        result['error'] = errors[0]
+    return result
+
+
+@scenario('update-cache', requires=())
+def _update_cache(context):
+    from pkgbrowser import conf
+    cache = context.data['cache']
+    def run():
+        for name in os.listdir(cache):
+            os.remove(os.path.join(cache, name))
+        if quiet(conf.update_cache, cache, 'PkgBrowser'):
+            raise RuntimeError('files cache update failed')
+        return len(glob.glob(os.path.join(cache, '*.files.zip')))
+    return run
+
+def _update_mirrors(chunk=None):
+    def factory(context):
+        from pkgbrowser import conf
+        cache = context.data['cache']
+        slow = mockserver.Faults(latency=2.0)
+        fast = mockserver.Faults(latency=0.01)
+        def run():
+            for name in os.listdir(cache):
+                if name.endswith('.files.zip'):
+                    os.remove(os.path.join(cache, name))
+            default = conf.MIRROR_CHUNK
+            conf.MIRROR_CHUNK = chunk or default
+            try:
+                with context.mirrors(slow, fast):
+                    if quiet(conf.update_cache, cache, 'PkgBrowser'):
+                        raise RuntimeError('files cache update failed')
+            finally:
+                conf.MIRROR_CHUNK = default
+            return len(glob.glob(os.path.join(cache, '*.files.zip')))
+        return run
+    return factory
+
+scenario('update-cache-mirrors', requires=())(_update_mirrors())
+scenario('update-cache-ranged', requires=())(_update_mirrors(16 << 10))
+
+def _files_index(compression):
+    def factory(context):
+        from zipfile import ZipFile
+        from pkgbrowser import conf
+        repository = context.options.repositories[-1]
+        members = [package for package in context.data['packages']
+                   if package.repository == repository]
+        source = os.path.join(context.root, '%s.files.%s' % (
+                              repository, compression))
+        synthetic.write_archive(source, members, True, compression)
+        path = os.path.join(context.root, '%s.files.zip' % repository)
+        def run():
+            with open(source, 'rb') as archive:
+                conf.convert_archive(archive, path)
+            with ZipFile(path) as zip:
+                return len(zip.namelist())
+        return run
+    return factory
+
+scenario('files-index-gz', requires=())(_files_index('gz'))
+scenario('files-index-bz2', requires=())(_files_index('bz2'))
+scenario('files-index-xz', requires=())(_files_index('xz'))
+scenario('files-index-zst', requires=('zstd',))(_files_index('zst'))
+
+@scenario('startup-cli', requires=(), budget=0.25)
+def _startup_cli(context):
+    # the command line must start without loading qt or the backend
+    def run():
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', MAIN, '-V'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if process.returncode:
+            raise RuntimeError('exit status %d' % process.returncode)
+        modules = [line.rsplit('|', 1)[-1].strip()
+                   for line in process.stderr.splitlines()
+                   if line.startswith('import time:')]
+        for name in ('PyQt5', 'pkgbrowser.backend'):
+            if name in modules:
+                raise RuntimeError('%s imported by the command line' % name)
+        return len(modules)
+    return run
+
+@scenario('startup-window', requires=('qt', 'alpm'), budget=2.0)
+def _startup_window(context):
+    environment = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    def run():
+        process = subprocess.run(
+            [sys.executable, MAIN, '-t'], env=environment, timeout=60,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        stages = [line for line in process.stderr.splitlines()
+                  if line.startswith('startup:')]
+        if process.returncode or not stages:
+            raise RuntimeError('no startup report (exit status %d)' %
+                               process.returncode)
+        return len(stages) - 1
+    return run
+
+@scenario('initialize')
+def _initialize(context):
+    backend = context.backend()
+    def run():
+        backend.initialize()
+        return len(backend.list_repositories())
+    return run
+
+@scenario('initialize-snapshot')
+def _initialize_snapshot(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    done = Event()
+    def callback(*args):
+        done.set()
+    backend.verify_snapshot(callback)
+    done.wait()
+    def run():
+        done.clear()
+        backend.set_callback(callback)
+        try:
+            backend.initialize()
+            done.wait()
+        finally:
+            backend.set_callback(None)
+        return len(backend.list_packages(State.Installed))
+    return run
+
+@scenario('refresh')
+def _refresh(context):
+    backend = context.backend()
+    path = os.path.join(context.data['dbpath'], 'sync',
+                        '%s.db' % context.options.repositories[0])
+    def run():
+        stamp = time.time()
+        os.utime(path, (stamp, stamp))
+        backend.refresh()
+        return len(backend.list_repositories())
+    return run
+
+@scenario('list-all')
+def _list_all(context):
+    backend = context.backend()
+    return lambda: len(backend.list_packages())
+
+@scenario('list-installed')
+def _list_installed(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    return lambda: len(backend.list_packages(State.Installed))
+
+@scenario('list-updates')
+def _list_updates(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    return lambda: len(backend.list_packages(State.Update))
+
+@scenario('list-repository')
+def _list_repository(context):
+    backend = context.backend()
+    location = context.options.repositories[-1]
+    return lambda: len(backend.list_packages(0, location))
+
+@scenario('statistics')
+def _statistics(context):
+    backend = context.backend()
+    backend.statistics()
+    def run():
+        return sum(item[1] for item in backend.statistics()['reasons'])
+    return run
+
+@scenario('statistics-snapshot')
+def _statistics_snapshot(context):
+    backend = context.backend()
+    def run():
+        backend._snapshot = None
+        return len(backend.statistics()['repositories'])
+    return run
+
+@scenario('filter-packages')
+def _filter_packages(context):
+    from pkgbrowser.enum import Source
+    backend = context.backend()
+    source = Source.Sync | Source.Local | Source.Foreign
+    packages = list(backend._iter_packages(source))
+    return lambda: len(backend._filter_packages(packages))
+
+@scenario('matcher')
+def _matcher(context):
+    from pkgbrowser.backend import Matcher
+    from pkgbrowser.enum import Source
+    backend = context.backend()
+    packages = [package for location, package in
+                backend._iter_packages(Source.Sync)]
+    getters = backend._dispatch(['name', 'description'])
+    text = 'lib (py | qt) ~doc %"^x.*-"'
+    def run():
+        matcher = Matcher(text, getters)
+        return sum(1 for package in packages if matcher.match(package))
+    return run
+
+def _find(keys, text, limit=0, engine='python'):
+    def factory(context):
+        from pkgbrowser.enum import State
+        backend = context.backend()
+        if 'files' in keys:
+            context.files_cache()
+        backend.set_engine(engine)
+        pattern = text(context) if callable(text) else text
+        filters = State.Installed | State.NonInstalled | State.Update
+        if engine == 'sqlite':
+            # the first search builds the store, which is timed separately
+            backend.find(pattern, filters, keys, limit)
+        return lambda: len(backend.find(pattern, filters, keys, limit))
+    return factory
+
+scenario('find-name')(_find(['name'], 'lib'))
+scenario('find-name-top')(_find(['name'], 'lib', 50))
+scenario('find-description')(_find(['name', 'description'], 'editor'))
+scenario('find-description-top')(_find(['name', 'description'], 'lib', 50))
+scenario('find-depends')(_find(['depends'], 'py'))
+scenario('find-relations')(_find(
+    ['depends', 'provides', 'replaces', 'optdepends'], 'nosuchname'))
+scenario('find-regexp')(_find(['name', 'description'], '%"^(lib|py).*a$"'))
+scenario('find-files')(_find(['files'], lambda context: os.path.basename(
+    context.data['packages'][-1].files[0])))
+scenario('find-files-regexp')(_find(['files'], '%"^/usr/bin/lib.*-1$"'))
+
+_sqlite = ('alpm', 'sqlite')
+scenario('find-name-sqlite', _sqlite)(_find(['name'], 'lib', engine='sqlite'))
+scenario('find-description-sqlite', _sqlite)(_find(
+    ['name', 'description'], 'editor', engine='sqlite'))
+scenario('find-depends-sqlite', _sqlite)(_find(
+    ['depends'], 'py', engine='sqlite'))
+scenario('find-files-sqlite', _sqlite)(_find(
+    ['files'], lambda context: os.path.basename(
+    context.data['packages'][-1].files[0]), engine='sqlite'))
+scenario('find-files-regexp-sqlite', _sqlite)(_find(
+    ['files'], '%"^/usr/bin/lib.*-1$"', engine='sqlite'))
+
+@scenario('list-all-sqlite', _sqlite)
+def _list_all_sqlite(context):
+    # without summaries in memory, the listing is served from the store
+    backend = context.backend()
+    context.files_cache()
+    backend.set_engine('sqlite')
+    backend.update_store()
+    return lambda: len(backend.list_packages())
+
+@scenario('store-update', _sqlite)
+def _store_update(context):
+    backend = context.backend()
+    context.files_cache()
+    def run():
+        # rebuild every repository from scratch
+        store = backend.update_store()
+        store.close()
+        os.remove(store.path)
+        return len(backend.update_store().names('core'))
+    return run
+
+@scenario('files-cache')
+def _files_cache(context):
+    from pkgbrowser.backend import Cache
+    from pkgbrowser.enum import Source
+    backend = context.backend()
+    packages = [package for location, package in
+                backend._iter_packages(Source.Sync)]
+    context.files_cache()
+    def run():
+        Cache.clear()
+        return sum(1 for package in packages if Cache.get_files(package))
+    return run
+
+@scenario('aur-load')
+def _aur_load(context):
+    backend = context.backend()
+    def run():
+        with context.online():
+            return len(backend._load(sorted(backend._foreign)))
+    return run
+
+@scenario('aur-search')
+def _aur_search(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    filters = State.NonInstalled | State.AUR
+    def run():
+        with context.online():
+            return len(backend._find_aur(
+                'lib', filters, ['name', 'description']))
+    return run
+
+@scenario('aur-details')
+def _aur_details(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    name = context.aur()
+    def run():
+        with context.online():
+            package = backend.get_package(
+                name, state=State.AUR | State.NonInstalled)
+            return len(package['depends'] or ())
+    return run
+
+@scenario('aur-tree')
+def _aur_tree(context):
+    from pkgbrowser.enum import State
+    backend = context.backend()
+    name = context.aur(True)
+    def run():
+        with context.online():
+            package = backend.get_package(
+                name, state=State.AUR | State.NonInstalled)
+            tree = package['tree']
+            return tree['installed'] + tree['missing'] + tree['aur']
+    return run
+
+@scenario('categories')
+def _categories(context):
+    backend = context.backend()
+    def run():
+        with context.online():
+            categories = backend._list_categories()
+            return sum(len(backend._list_category(target))
+                       for parent, children in categories[:3]
+                       for child, target in children)
+    return run
+
+@scenario('package-cache')
+def _package_cache(context):
+    from pkgbrowser.backend import Cache
+    backend = context.backend()
+    names = [package.name for package in context.data['packages']
+             if package.installed][:50]
+    def run():
+        with context.online():
+            Cache.clear()
+            return sum(len(source) for source in
+                       Cache.get_cache(synthetic.ARCH, *names))
+    return run
+
+def _threads(threads, count=60):
+    def factory(context):
+        from pkgbrowser.backend import Downloader
+        urls = [context.server.url('/packages/%s/%s/' % (
+                package.name[0], package.name))
+                for package in context.data['packages'][:count]]
+        def run():
+            Downloader.set_threads(threads)
+            try:
+                return len(Downloader.download(urls))
+            finally:
+                Downloader.set_threads(10)
+        return run
+    return factory
+
+for threads in (1, 4, 10, 20):
+    scenario('download-threads-%d' % threads)(_threads(threads))
+
+
+def metadata(options, faults):
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stderr=subprocess.DEVNULL).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        from pkgbrowser import alpm
+        version = alpm.version()
+    except ImportError:
+        version = None
+    return {
+        'time': int(time.time()),
+        'commit': commit,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'alpm': version,
+        'options': {
+            'packages': options.packages,
+            'repositories': list(options.repositories),
+            'installed': options.installed,
+            'foreign': options.foreign,
+            'depends': options.depends,
+            'files': options.files,
+            'seed': options.seed,
+            'aur': options.aur,
+            },
+        'network': {
+            'latency': faults.latency,
+            'jitter': faults.jitter,
+            'bandwidth': faults.bandwidth,
+            'errors': faults.errors,
+            },
+        }
+
+def compare(previous, current, stream=sys.stderr):
+    print('%-20s %10s %10s %8s' % ('scenario', 'before', 'after', 'ratio'),
+          file=stream)
+    for name, result in current['results'].items():
+        before = previous.get('results', {}).get(name, {}).get('best')
+        after = result.get('best')
+        if before and after:
+            print('%-20s %10.4f %10.4f %7.2fx' % (
+                  name, before, after, after / before), file=stream)
+
+def execute(names, options, repeat=5, workdir=None, faults=None):
+    temporary = workdir is None
+    if temporary:
+        workdir = tempfile.mkdtemp(prefix='pkgbrowser-bench-')
+    root = os.path.join(workdir, 'root')
+    context = None
+    try:
+        if os.path.exists(root):
+            shutil.rmtree(root)
+        context = Context(root, options, faults)
+        start = time.perf_counter()
+        context.prepare()
+        output = {'meta': metadata(options, context.faults), 'results': {}}
+        output['meta']['generate'] = time.perf_counter() - start
+        for name, requires, factory in _scenarios:
+            if names and name not in names:
+                continue
+            missing = [key for key in requires if key in context.missing]
+            if missing:
+                output['results'][name] = {
+                    'skipped': context.missing[missing[0]]}
+                continue
+            output['results'][name] = result = measure(
+                factory(context), repeat)
+            if name in _budgets:
+                result['budget'] = _budgets[name]
+                if 'errors' not in result and result['best'] > _budgets[name]:
+                    result['over-budget'] = True
+            if context.server.requests:
+                output['results'][name]['requests'] = context.server.requests
+                context.server.requests = 0
+        return output
+    finally:
+        if context is not None:
+            context.release()
+        if temporary:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+def usage():
+    print("""
+usage: python3 -m bench.run [opts] [scenario ...]
+
+options:
+ -h  display this help and exit
+ -l  list the available scenarios
+ -n  number of sync packages (default: %d)
+ -d  dependency fan-out per package (default: %d)
+ -f  maximum files per package (default: %d)
+ -i  ratio of installed packages (default: %.1f)
+ -a  number of aur-only packages (default: %d)
+ -s  random seed (default: %d)
+ -L  mock server latency per request in seconds (default: 0)
+ -J  mock server random latency jitter in seconds (default: 0)
+ -B  mock server bandwidth in bytes per second (default: unlimited)
+ -E  ratio of mock server requests that fail (default: 0)
+ -r  repetitions per scenario (default: 5)
+ -w  work directory for the synthetic system (default: temporary)
+ -o  write json results to a file (default: stdout)
+ -c  compare with the json results of a previous run
+""" % (synthetic.Options.packages, synthetic.Options.depends,
+       synthetic.Options.files, synthetic.Options.installed,
+       synthetic.Options.aur, synthetic.Options.seed))
+
+def main(argv=None):
+    try:
+        opts, args = getopt.getopt(
+            sys.argv[1:] if argv is None else argv, 'hln:d:f:i:a:s:r:w:o:c:L:J:B:E:')
+    except getopt.GetoptError as exception:
+        print(':: ERROR:', exception)
+        usage()
+        return 2
+    opts = dict(opts)
+    if '-h' in opts:
+        usage()
+        return 0
+    if '-l' in opts:
+        for name, requires, factory in _scenarios:
+            print(name)
+        return 0
+    unknown = set(args).difference(name for name, r, f in _scenarios)
+    if unknown:
+        print(':: ERROR: unknown scenarios:', ', '.join(sorted(unknown)))
+        return 2
+    try:
+        options = synthetic.Options(
+            packages=int(opts.get('-n', synthetic.Options.packages)),
+            depends=int(opts.get('-d', synthetic.Options.depends)),
+            files=int(opts.get('-f', synthetic.Options.files)),
+            installed=float(opts.get('-i', synthetic.Options.installed)),
+            aur=int(opts.get('-a', synthetic.Options.aur)),
+            seed=int(opts.get('-s', synthetic.Options.seed)),
+            )
+        faults = mockserver.Faults(
+            latency=float(opts.get('-L', 0)),
+            jitter=float(opts.get('-J', 0)),
+            bandwidth=int(opts.get('-B', 0)),
+            errors=float(opts.get('-E', 0)),
+            )
+        repeat = max(1, int(opts.get('-r', 5)))
+    except ValueError as exception:
+        print(':: ERROR:', exception)
+        return 2
+    output = execute(args, options, repeat, opts.get('-w'), faults)
+    data = json.dumps(output, indent=2, sort_keys=True)
+    if '-o' in opts:
+        with open(opts['-o'], 'w') as stream:
+            stream.write(data + '\n')
+    else:
+        print(data)
+    if '-c' in opts:
+        with open(opts['-c']) as stream:
+            compare(json.load(stream), output)
+    over = sorted(name for name, result in output['results'].items()
+                  if result.get('over-budget'))
+    if over:
+        print(':: ERROR: over budget:', ', '.join(over), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,365 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import os, time, random, hashlib, tarfile
+from io import BytesIO
+
+
+ARCH = 'x86_64'
+REPOSITORIES = ('core', 'extra', 'community')
+PACKAGER = 'Bench Packager <bench@example.org>'
+LICENSES = ('GPL', 'GPL2', 'GPL3', 'LGPL', 'MIT', 'BSD', 'Apache', 'custom')
+SYLLABLES = (
+    'lib', 'py', 'gtk', 'qt', 'x', 'font', 'net', 'core', 'util', 'doc',
+    'ka', 'lo', 'mi', 'ra', 'te', 'zu', 'vo', 'ne', 'si', 'da', 'fe', 'go',
+    )
+WORDS = (
+    'library', 'tool', 'utility', 'daemon', 'interface', 'bindings',
+    'framework', 'support', 'plugin', 'theme', 'font', 'editor', 'client',
+    'server', 'parser', 'compiler', 'manager', 'viewer', 'network', 'audio',
+    'video', 'image', 'python', 'graphical', 'terminal', 'fast', 'simple',
+    )
+DIRECTORIES = (
+    'usr/bin', 'usr/lib', 'usr/include', 'usr/share/doc',
+    'usr/share/man/man1', 'usr/share/locale/de/LC_MESSAGES',
+    'usr/share/icons/hicolor/48x48/apps', 'etc',
+    )
+
+
+class Options(object):
+    packages = 2000
+    repositories = REPOSITORIES
+    installed = 0.3
+    foreign = 50
+    aur = 200
+    depends = 3
+    files = 40
+    groups = 40
+    seed = 0
+    compression = 'gz'
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            if not hasattr(self, key):
+                raise TypeError('unknown option: %s' % key)
+            setattr(self, key, value)
+
+
+class Package(object):
+    def __init__(self, name, version, repository):
+        self.name = name
+        self.version = version
+        self.repository = repository
+        self.description = ''
+        self.depends = []
+        self.optdepends = []
+        self.provides = []
+        self.replaces = []
+        self.groups = []
+        self.files = []
+        self.backup = []
+        self.license = 'GPL'
+        self.builddate = 0
+        self.installdate = 0
+        self.isize = 0
+        self.csize = 0
+        self.reason = 0
+        self.installed = None
+        self.votes = 0
+        self.popularity = 0.0
+        self.maintainer = None
+
+    def fullname(self, version=None):
+        return '%s-%s' % (self.name, version or self.version)
+
+
+def _name(rng, seen):
+    while True:
+        name = '-'.join(
+            ''.join(rng.choice(SYLLABLES) for count in range(rng.randint(1, 3)))
+            for count in range(rng.randint(1, 2)))
+        if name not in seen:
+            seen.add(name)
+            return name
+
+def _version(rng):
+    return '%d.%d.%d-%d' % (
+        rng.randint(0, 9), rng.randint(0, 30),
+        rng.randint(0, 99), rng.randint(1, 5))
+
+def _older(version):
+    base, release = version.rsplit('-', 1)
+    parts = base.split('.')
+    if parts[0] != '0':
+        parts[0] = str(int(parts[0]) - 1)
+    else:
+        parts = ['0'] * len(parts)
+    return '%s-%s' % ('.'.join(parts), release)
+
+def build_packages(options):
+    rng = random.Random(options.seed)
+    names = set()
+    groups = ['%s-group' % _name(rng, names) for count in range(options.groups)]
+    packages = []
+    now = int(time.time())
+    for index in range(options.packages):
+        repository = options.repositories[index % len(options.repositories)]
+        package = Package(_name(rng, names), _version(rng), repository)
+        package.description = ' '.join(
+            rng.choice(WORDS) for count in range(rng.randint(3, 10)))
+        package.license = rng.choice(LICENSES)
+        package.builddate = now - rng.randint(0, 3 * 365 * 86400)
+        package.isize = rng.randint(1024, 256 * 1024 * 1024)
+        package.csize = package.isize // rng.randint(2, 5)
+        if packages and options.depends:
+            count = rng.randint(0, 2 * options.depends)
+            for target in rng.sample(packages, min(count, len(packages))):
+                if rng.random() < 0.2:
+                    package.depends.append('%s>=%s' % (
+                        target.name, target.version.split('-')[0]))
+                else:
+                    package.depends.append(target.name)
+            for target in rng.sample(packages, min(count // 2, len(packages))):
+                package.optdepends.append('%s: %s' % (
+                    target.name, rng.choice(WORDS)))
+        if rng.random() < 0.05:
+            package.provides.append('%s-virtual' % package.name)
+        if rng.random() < 0.02:
+            package.replaces.append('%s-legacy' % package.name)
+        if groups and rng.random() < 0.15:
+            package.groups.append(rng.choice(groups))
+        for count in range(rng.randint(options.files // 2, options.files)):
+            package.files.append('%s/%s%s' % (
+                rng.choice(DIRECTORIES), package.name,
+                count and '-%d' % count or ''))
+        if rng.random() < 0.1:
+            package.backup.append('etc/%s.conf' % package.name)
+            package.files.append(package.backup[-1])
+        if rng.random() < options.installed:
+            package.installed = package.version
+            if rng.random() < 0.1:
+                package.installed = _older(package.version)
+            package.installdate = now - rng.randint(0, 365 * 86400)
+            package.reason = int(rng.random() < 0.6)
+        packages.append(package)
+    foreign = []
+    for index in range(options.foreign):
+        package = Package(_name(rng, names), _version(rng), 'local')
+        package.description = ' '.join(
+            rng.choice(WORDS) for count in range(rng.randint(3, 10)))
+        package.installed = package.version
+        package.installdate = now - rng.randint(0, 365 * 86400)
+        package.builddate = package.installdate
+        package.isize = rng.randint(1024, 64 * 1024 * 1024)
+        for target in rng.sample(packages, min(options.depends, len(packages))):
+            package.depends.append(target.name)
+        for count in range(rng.randint(1, max(1, options.files // 4))):
+            package.files.append('opt/%s/file-%d' % (package.name, count))
+        foreign.append(package)
+    return packages, foreign
+
+def build_aur(options, packages, foreign):
+    rng = random.Random(options.seed + 1)
+    names = set(package.name for package in packages)
+    names.update(package.name for package in foreign)
+    aur = []
+    for index in range(options.aur):
+        package = Package(_name(rng, names), _version(rng), 'aur')
+        package.description = ' '.join(
+            rng.choice(WORDS) for count in range(rng.randint(3, 10)))
+        package.license = rng.choice(LICENSES)
+        package.builddate = int(time.time()) - rng.randint(0, 5 * 365 * 86400)
+        aur.append(package)
+    targets = aur + foreign
+    for package in targets:
+        count = rng.randint(0, 2 * options.depends)
+        if aur:
+            for target in rng.sample(aur, min(count // 2, len(aur))):
+                if target is not package:
+                    package.depends.append(target.name)
+        for target in rng.sample(packages, min(count, len(packages))):
+            package.depends.append(target.name)
+        package.votes = rng.randint(0, 500)
+        package.popularity = round(rng.expovariate(2), 6)
+        package.maintainer = rng.choice((None, 'alice', 'bob', 'carol'))
+    return targets
+
+def _section(key, values):
+    if isinstance(values, (list, tuple)):
+        values = [str(value) for value in values if value != '']
+    elif values in (None, '', 0):
+        values = []
+    else:
+        values = [str(values)]
+    if values:
+        return '%%%s%%\n%s\n\n' % (key, '\n'.join(values))
+    return ''
+
+def _desc(package, local=False):
+    version = package.installed if local else package.version
+    parts = [
+        _section('NAME', package.name),
+        _section('VERSION', version),
+        _section('BASE', package.name),
+        _section('DESC', package.description),
+        ]
+    if not local:
+        filename = '%s-%s.pkg.tar.%s' % (
+            package.fullname(), ARCH, 'xz')
+        parts.append(_section('FILENAME', filename))
+        parts.append(_section('CSIZE', package.csize))
+        parts.append(_section('ISIZE', package.isize))
+        parts.append(_section('MD5SUM', hashlib.md5(
+            filename.encode('utf-8')).hexdigest()))
+        parts.append(_section('SHA256SUM', hashlib.sha256(
+            filename.encode('utf-8')).hexdigest()))
+    parts.extend((
+        _section('GROUPS', package.groups),
+        _section('URL', 'https://example.org/%s' % package.name),
+        _section('LICENSE', package.license),
+        _section('ARCH', ARCH),
+        _section('BUILDDATE', package.builddate),
+        _section('PACKAGER', PACKAGER),
+        ))
+    if local:
+        parts.append(_section('INSTALLDATE', package.installdate))
+        parts.append(_section('SIZE', package.isize))
+        parts.append(_section('REASON', package.reason))
+        parts.append(_section('VALIDATION', 'sha256'))
+    parts.extend((
+        _section('REPLACES', package.replaces),
+        _section('DEPENDS', package.depends),
+        _section('OPTDEPENDS', package.optdepends),
+        _section('PROVIDES', package.provides),
+        ))
+    return ''.join(parts).encode('utf-8')
+
+def _files(package):
+    directories = set()
+    for path in package.files:
+        parts = path.split('/')[:-1]
+        for index in range(1, len(parts) + 1):
+            directories.add('/'.join(parts[:index]) + '/')
+    lines = sorted(directories.union(package.files))
+    data = _section('FILES', lines)
+    if package.backup:
+        data += _section('BACKUP', ['%s\t%s' % (
+            path, hashlib.md5(path.encode('utf-8')).hexdigest())
+            for path in package.backup])
+    return data.encode('utf-8')
+
+def _add(tar, name, data, mtime):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = mtime
+    tar.addfile(info, BytesIO(data))
+
+def write_archive(path, packages, files=False, compression='gz'):
+    mtime = int(time.time())
+    if compression == 'zst':
+        from pkgbrowser.conf import zstd
+        if zstd is None:
+            raise RuntimeError('zstd compression is not available')
+        output = BytesIO()
+        tar = tarfile.open(fileobj=output, mode='w')
+    else:
+        mode = 'w:%s' % compression if compression else 'w'
+        tar = tarfile.open(path, mode)
+    with tar:
+        for package in packages:
+            fullname = package.fullname()
+            _add(tar, '%s/desc' % fullname, _desc(package), mtime)
+            if files:
+                _add(tar, '%s/files' % fullname, _files(package), mtime)
+    if compression == 'zst':
+        with open(path, 'wb') as stream:
+            stream.write(zstd.compress(output.getvalue()))
+    return path
+
+def write_local(dbpath, packages):
+    local = os.path.join(dbpath, 'local')
+    os.makedirs(local, exist_ok=True)
+    with open(os.path.join(local, 'ALPM_DB_VERSION'), 'w') as stream:
+        stream.write('9\n')
+    for package in packages:
+        path = os.path.join(local, package.fullname(package.installed))
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'desc'), 'wb') as stream:
+            stream.write(_desc(package, True))
+        with open(os.path.join(path, 'files'), 'wb') as stream:
+            stream.write(_files(package))
+
+def write_log(path, packages):
+    entries = []
+    for package in packages:
+        date = time.strftime('%Y-%m-%d %H:%M', time.localtime(
+            package.installdate))
+        entries.append('[%s] [ALPM] installed %s (%s)\n' % (
+            date, package.name, package.installed))
+    entries.sort()
+    with open(path, 'w') as stream:
+        stream.writelines(entries)
+
+def write_pkgcache(path, packages):
+    os.makedirs(path, exist_ok=True)
+    for package in packages:
+        filename = '%s-%s.pkg.tar.xz' % (
+            package.fullname(package.installed), ARCH)
+        open(os.path.join(path, filename), 'w').close()
+
+def write_config(path, root, repositories, servers=None):
+    lines = [
+        '[options]',
+        'RootDir = %s' % root,
+        'DBPath = %s' % os.path.join(root, 'var/lib/pacman/'),
+        'LogFile = %s' % os.path.join(root, 'var/log/pacman.log'),
+        'CacheDir = %s' % os.path.join(root, 'var/cache/pacman/pkg/'),
+        'Architecture = %s' % ARCH,
+        'SigLevel = Never',
+        '',
+        ]
+    if servers is None:
+        servers = ['file://%s' % os.path.join(root, 'mirror', '$repo')]
+    for repository in repositories:
+        lines.append('[%s]' % repository)
+        for server in servers:
+            lines.append('Server = %s' % server)
+        lines.append('')
+    with open(path, 'w') as stream:
+        stream.write('\n'.join(lines))
+    return path
+
+def generate(root, options=None, servers=None, **kwargs):
+    if options is None:
+        options = Options(**kwargs)
+    root = os.path.abspath(root)
+    dbpath = os.path.join(root, 'var/lib/pacman')
+    sync = os.path.join(dbpath, 'sync')
+    for path in (sync, os.path.join(root, 'etc'),
+                 os.path.join(root, 'var/log'), os.path.join(root, 'cache')):
+        os.makedirs(path, exist_ok=True)
+    packages, foreign = build_packages(options)
+    aur = build_aur(options, packages, foreign)
+    installed = [package for package in packages if package.installed]
+    installed.extend(foreign)
+    for repository in options.repositories:
+        members = [package for package in packages
+                   if package.repository == repository]
+        write_archive(os.path.join(sync, '%s.db' % repository), members)
+        mirror = os.path.join(root, 'mirror', repository)
+        os.makedirs(mirror, exist_ok=True)
+        write_archive(os.path.join(mirror, '%s.files.tar.gz' % repository),
+                      members, True, options.compression)
+    write_local(dbpath, installed)
+    write_log(os.path.join(root, 'var/log/pacman.log'), installed)
+    write_pkgcache(os.path.join(root, 'var/cache/pacman/pkg'), installed)
+    config = write_config(os.path.join(root, 'etc/pacman.conf'),
+                          root, options.repositories, servers)
+    return {
+        'root': root,
+        'config': config,
+        'dbpath': dbpath,
+        'cache': os.path.join(root, 'cache'),
+        'packages': packages,
+        'foreign': foreign,
+        'aur': aur,
+        }
@@ -4,6 +4,6 @@
 if __name__ == '__main__':
 
     import sys
-    from pkgbrowser import app
+    from pkgbrowser import cli
 
-    sys.exit(app.run())
+    sys.exit(cli.run())
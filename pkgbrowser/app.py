@@ -1,17 +1,18 @@
 # Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
 
-import sys, os, getopt
+import sys, os, time, importlib
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import (
-    QSettings,
+    QObject, QEvent, QTimer, QSettings,
     )
 from PyQt5.QtWidgets import (
     QApplication,
     )
+from pkgbrowser import cli
 
 
-QApplication.setApplicationName('PkgBrowser')
-QApplication.setApplicationVersion('0.20.1')
+QApplication.setApplicationName(cli.APPLICATION)
+QApplication.setApplicationVersion(cli.VERSION)
 
 QSettings.setPath(QSettings.NativeFormat, QSettings.SystemScope, '/etc')
 
@@ -76,40 +77,67 @@ class Settings(QSettings):
             return default
 
 
-def usage():
-    print(QApplication.translate('usage', """
-usage: %s [opts]
-
-options:
- -h  display this help and exit
- -V  display version information
- -u  create/update files cache
-""" % Application.applicationName()))
-
-def run():
-    keys = 'hVu'
-    try:
-        options, args = getopt.getopt(sys.argv[1:], keys)
-    except getopt.GetoptError as exception:
-        print(':: ERROR:', exception)
-        usage()
-        return 2
-    else:
-        options = dict(options)
-        if '-h' in options:
-            usage()
-        elif '-V' in options:
-            print('%s-%s' % (
-                Application.applicationTitle(),
-                Application.applicationVersion(),
-                ))
-        elif '-u' in options:
-            from pkgbrowser.conf import update_cache
-            return update_cache(Application.cacheDirectory(),
-                                Application.applicationTitle())
-        elif QApplication.instance() is None:
-            app = QtWidgets.qApp = Application()
-            app.window().setup()
-            app.window().show()
-            return app.exec_()
-        return 0
+class Startup(QObject):
+    # times each startup stage up to the first paint of the main window,
+    # in the same layout as the output of python -X importtime
+    def __init__(self, start):
+        QObject.__init__(self)
+        self._start = self._last = start
+        self._stages = []
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self._stages.append((stage, now - self._last))
+        self._last = now
+
+    def watch(self, widget):
+        widget.installEventFilter(self)
+
+    def eventFilter(self, widget, event):
+        if event.type() == QEvent.Paint:
+            widget.removeEventFilter(self)
+            self.mark('first paint')
+            self.report()
+            QTimer.singleShot(0, QApplication.quit)
+        return False
+
+    def report(self, stream=None):
+        stream = stream or sys.stderr
+        print('startup: self [ms] | cumulative | stage', file=stream)
+        total = 0
+        for stage, seconds in self._stages:
+            total += seconds
+            print('startup: %9.1f | %10.1f | %s' % (
+                  seconds * 1000, total * 1000, stage), file=stream)
+        stream.flush()
+
+
+def run(start=None):
+    if QApplication.instance() is None:
+        startup = None
+        if start is not None:
+            startup = Startup(start)
+            startup.mark('import PyQt5')
+        app = QtWidgets.qApp = Application()
+        if startup is not None:
+            startup.mark('application')
+            # each module on its own, in the order the window needs them
+            for name in ('pkgbrowser.enum', 'pkgbrowser.fmt',
+                         'pkgbrowser.ui.window', 'pkgbrowser.window'):
+                importlib.import_module(name)
+                startup.mark('import %s' % name)
+        window = app.window()
+        if startup is not None:
+            startup.mark('window')
+            from pkgbrowser.window import load_backend
+            load_backend()
+            startup.mark('import pkgbrowser.backend')
+        window.setup()
+        if startup is not None:
+            startup.mark('setup')
+            startup.watch(window)
+        window.show()
+        if startup is not None:
+            startup.mark('show')
+        return app.exec_()
+    return 0
@@ -1,30 +1,43 @@
 # Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
 
-import sys, os, re, glob, copy, errno, socket, json
-import urllib.request, urllib.error, http.client
+import sys, os, re, glob, copy, errno, socket, json, time, pickle, math
+import mmap, struct, zlib
 from zipfile import ZipFile, BadZipfile
+from tarfile import TarError
 from html.parser import HTMLParser
 from traceback import format_exception
 from functools import cmp_to_key
-from collections import defaultdict
+from array import array
+from bisect import bisect_left
+from heapq import nsmallest
+from datetime import date, timedelta
+from collections import defaultdict, OrderedDict
 from multiprocessing import Pool
-from threading import Thread
-from queue import Queue
+from threading import Thread, Lock, current_thread
+from queue import Queue, LifoQueue
 from pkgbrowser import alpm, conf, utils
 from pkgbrowser.enum import State, Source
+from pkgbrowser.index import (
+    Segment, Trigrams, INDEX_VERSION, candidates, pattern_query,
+    )
+
+numpy = None
+_numpy_checked = False
 
 
 AUR_DOM = os.environ.get('AUR_DOM', 'https://aur.archlinux.org')
 AUR_RPC = AUR_DOM + '/rpc.php'
 AUR_HTM = AUR_DOM + '/packages.php'
 AUR_SRC = AUR_DOM + '/cgit/aur.git/plain/.SRCINFO'
-PACNET_DOM = ('http://pacnet.karbownicki.com',
-              'http://pacnet.archlinux.pl')
+PACNET_DOM = tuple(os.environ.get('PACNET_DOM',
+    'http://pacnet.karbownicki.com http://pacnet.archlinux.pl').split())
 PACNET_CAT = '/api/categories/'
 PACNET_LIST = '/api/category/%s/'
 ALA_DOM = os.environ.get('ALA_DOM', 'https://archive.archlinux.org')
 ALA_LIST = ALA_DOM + '/packages/%s/%s/'
 ARCH_PKG = 'https://www.archlinux.org/packages/%s/%s/%s'
+TRACE_LOG = os.environ.get('PKGBROWSER_TRACE')
+SNAPSHOT_VERSION = 1
 
 _arch_repos = set([
     'core', 'extra', 'community', 'multilib',
@@ -66,6 +79,7 @@ class NetworkError(BackendError):
             else:
                 message = reason.strerror
         elif isinstance(reason, int):
+            import http.client
             message = '[HTTP %d] %s' % (
                 reason, http.client.responses.get(reason, ''))
         elif reason is None:
@@ -102,48 +116,371 @@ class Traceback(Exception):
         return (self.__class__, self.args)
 
 
+class Profiler(object):
+    Stages = (
+        'index', 'pool', 'alpm', 'snapshot', 'match', 'files', 'filter',
+        'network', 'download', 'worker', 'pickle', 'unpickle', 'model',
+        'total',
+        )
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = Lock()
+        self.reset(active=False)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        self._lock = Lock()
+
+    def reset(self, request='', active=True):
+        with self._lock:
+            self._request = request
+            self._start = time.time()
+            self._stages = {}
+            self._events = []
+            self._memory = {}
+            self._active = active
+
+    def active(self):
+        return self._active
+
+    def tracing(self):
+        # the stages of single packages are only worth timing for a trace
+        return bool(self._path)
+
+    def add(self, stage, seconds, start=None, **args):
+        if self._active:
+            self.append(stage, seconds, start, False, **args)
+
+    def append(self, stage, seconds, start=None, write=True, **args):
+        with self._lock:
+            item = self._stages.get(stage)
+            if item is None:
+                self._stages[stage] = [seconds, 1]
+            else:
+                item[0] += seconds
+                item[1] += 1
+            if self._path and start is not None:
+                args['request'] = self._request
+                event = {
+                    'name': stage, 'cat': 'pkgbrowser', 'ph': 'X',
+                    'ts': int(start * 1000000),
+                    'dur': int(seconds * 1000000),
+                    'pid': os.getpid(), 'tid': current_thread().ident,
+                    'args': args,
+                    }
+                if write:
+                    self._write([event])
+                else:
+                    self._events.append(event)
+
+    def sample(self):
+        if self._active:
+            size = _memory_usage()
+            with self._lock:
+                self._memory[os.getpid()] = size
+                if self._path:
+                    self._events.append({
+                        'name': 'memory', 'cat': 'pkgbrowser', 'ph': 'C',
+                        'ts': int(time.time() * 1000000),
+                        'pid': os.getpid(), 'args': {'size': size},
+                        })
+
+    def memory(self):
+        with self._lock:
+            return len(self._memory), sum(self._memory.values())
+
+    def export(self):
+        with self._lock:
+            return dict(self._stages), list(self._events), dict(self._memory)
+
+    def merge(self, profile):
+        stages, events, memory = profile
+        with self._lock:
+            self._memory.update(memory)
+            for stage, (seconds, count) in stages.items():
+                item = self._stages.get(stage)
+                if item is None:
+                    self._stages[stage] = [seconds, count]
+                else:
+                    item[0] += seconds
+                    item[1] += count
+            self._events.extend(events)
+
+    def finish(self):
+        if self._active:
+            self.add('total', time.time() - self._start, self._start)
+            with self._lock:
+                self._active = False
+                events, self._events = self._events, []
+            self._write(events)
+
+    def stages(self):
+        with self._lock:
+            stages = dict(self._stages)
+        result = []
+        for stage in Profiler.Stages + tuple(sorted(stages)):
+            item = stages.pop(stage, None)
+            if item is not None:
+                result.append((stage, item[0], item[1]))
+        return result
+
+    def _write(self, events):
+        if self._path and events:
+            try:
+                with open(self._path, 'a') as stream:
+                    if not stream.tell():
+                        stream.write('[\n')
+                    for event in events:
+                        stream.write(json.dumps(event) + ',\n')
+            except EnvironmentError:
+                pass
+
+
+def _memory_usage():
+    # proportional set size counts pages shared between workers only once
+    for path, field in (('/proc/self/smaps_rollup', 'Pss:'),
+                        ('/proc/self/status', 'VmRSS:')):
+        try:
+            with open(path) as stream:
+                for line in stream:
+                    if line.startswith(field):
+                        return int(line.split()[1]) * 1024
+        except (EnvironmentError, ValueError, IndexError):
+            pass
+    return 0
+
+
+profiler = Profiler(TRACE_LOG)
+
+
+def _import_numpy():
+    # numpy is slow to import and is only used by the snapshot, so it is
+    # loaded when the first snapshot is built
+    global numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+class FilesIndex(object):
+    # layout: header, package offsets, package names, file lists.
+    # each file list is front-coded by directory: runs of paths sharing
+    # the same parent are stored once as "dir\0name\0name...", with the
+    # runs separated by "\1"
+    Magic = b'PKBFIDX1'
+    Header = struct.Struct('<8sQQ')
+
+    @classmethod
+    def build(cls, source, path):
+        names = []
+        blobs = []
+        with ZipFile(source) as archive:
+            for name in sorted(archive.namelist()):
+                names.append(name)
+                blobs.append(cls._encode(
+                    archive.read(name).decode('utf-8')).encode('utf-8'))
+        offsets = array('Q', [0])
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        data = '\n'.join(names).encode('utf-8')
+        temp = path + '.tmp'
+        with open(temp, 'wb') as stream:
+            stream.write(cls.Header.pack(cls.Magic, len(names), len(data)))
+            stream.write(offsets.tobytes())
+            stream.write(data)
+            for blob in blobs:
+                stream.write(blob)
+        os.replace(temp, path)
+
+    @staticmethod
+    def _encode(files):
+        runs = []
+        current = None
+        for line in files.split('\n'):
+            if not line:
+                continue
+            head, sep, name = line[1:].rpartition('/')
+            head += sep
+            if head != current:
+                current = head
+                runs.append([head])
+            runs[-1].append(name)
+        return '\1'.join('\0'.join(run) for run in runs)
+
+    @staticmethod
+    def _decode(data):
+        if not data:
+            return ''
+        output = ['\n']
+        for run in data.split('\1'):
+            head, _, names = run.partition('\0')
+            output.append('/%s%s\n' % (
+                head, ('\n/' + head).join(names.split('\0'))))
+        return ''.join(output)
+
+    def __init__(self, path):
+        with open(path, 'rb') as stream:
+            self._map = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ)
+            self.mtime = os.fstat(stream.fileno()).st_mtime
+        try:
+            magic, count, size = self.Header.unpack_from(self._map)
+            if magic != self.Magic:
+                raise ValueError('invalid files index: %s' % path)
+            start = self.Header.size
+            end = start + 8 * (count + 1)
+            self._offsets = memoryview(self._map)[start:end].cast('Q')
+            names = self._map[end:end + size].decode('utf-8')
+            self._names = dict(zip(names.split('\n'), range(count)))
+            self._data = end + size
+        except Exception:
+            self._map.close()
+            raise
+
+    def current(self, source):
+        try:
+            return os.path.getmtime(source) <= self.mtime
+        except OSError:
+            return False
+
+    def read(self, name):
+        index = self._names[name]
+        start = self._data + self._offsets[index]
+        end = self._data + self._offsets[index + 1]
+        return self._decode(self._map[start:end].decode('utf-8'))
+
+    def close(self):
+        self._offsets.release()
+        self._map.close()
+
+
 class Cache(object):
     _caches = {}
     _path = ''
+    _dbpath = ''
     _offline = False
 
     @classmethod
     def set_path(cls, path):
         cls._path = path
 
+    @classmethod
+    def get_path(cls):
+        return cls._path
+
+    @classmethod
+    def set_dbpath(cls, path):
+        cls._dbpath = path
+
     @classmethod
     def set_offline(cls, offline):
         cls._offline = bool(offline)
 
     @classmethod
     def has_files(cls):
+        paths = []
         if cls._path:
-            return any(os.access(path, os.R_OK) for path in
-                       glob.glob(os.path.join(cls._path, '*.files.zip')))
-        return False
+            paths.extend(glob.glob(os.path.join(cls._path, '*.files.zip')))
+        if cls._dbpath:
+            paths.extend(glob.glob(
+                os.path.join(cls._dbpath, 'sync', '*.files')))
+        return any(os.access(path, os.R_OK) for path in paths)
 
     @classmethod
     def get_files(cls, package):
         if alpm.pkg_get_installdate(package):
             return alpm.pkg_join_files(package) or ''
-        else:
-            key = alpm.pkg_get_repository(package)
+        if not profiler.tracing():
+            return cls._get_files(package)
+        start = time.time()
+        try:
+            return cls._get_files(package)
+        finally:
+            profiler.add('files', time.time() - start)
+
+    @classmethod
+    def _get_files(cls, package):
+        key = alpm.pkg_get_repository(package)
+        cache = cls._caches.get(key)
+        if cache is None:
+            cache = cls._open_files(key)
+            if cache is not None:
+                cls._caches[key] = cache
+        if cache is not None:
+            try:
+                files = cache.read(alpm.pkg_get_fullname(package))
+            except KeyError:
+                pass
+            except (IOError, ValueError, BadZipfile):
+                cls.clear(key)
+            else:
+                if isinstance(files, bytes):
+                    files = files.decode('utf-8')
+                return files
+
+    @classmethod
+    def prepare_files(cls, keys):
+        # open the files indexes before the workers are forked, so that
+        # they all share the same mapping rather than each decompressing
+        # its own copy of the file lists
+        for key in keys:
             cache = cls._caches.get(key)
-            if cache is None:
+            if isinstance(cache, FilesIndex):
                 path = os.path.join(cls._path, '%s.files.zip' % key)
+                if cache.current(path):
+                    continue
+            cls.clear(key)
+            cache = cls._open_files(key, True)
+            if cache is not None:
+                cls._caches[key] = cache
+
+    @classmethod
+    def _open_files(cls, key, build=False):
+        path = os.path.join(cls._path, '%s.files.zip' % key)
+        cls._index_files(key, path)
+        index = os.path.join(cls._path, '%s.files.idx' % key)
+        try:
+            try:
+                current = os.path.getmtime(index) >= os.path.getmtime(path)
+            except OSError:
+                current = False
+            if build and not current and os.path.exists(path):
+                start = time.time()
+                FilesIndex.build(path, index)
+                profiler.add('index', time.time() - start, start, key=key)
+                current = True
+            if current:
+                return FilesIndex(index)
+        except (EnvironmentError, ValueError, UnicodeError, BadZipfile):
+            pass
+        try:
+            return ZipFile(path)
+        except (IOError, BadZipfile):
+            pass
+
+    @classmethod
+    def _index_files(cls, key, path):
+        if cls._path and cls._dbpath:
+            filesdb = conf.get_filesdb(cls._dbpath, key)
+            if filesdb is not None:
                 try:
-                    cache = cls._caches[key] = ZipFile(path)
-                except (IOError, BadZipfile):
+                    if os.path.getmtime(path) >= os.path.getmtime(filesdb):
+                        return
+                except OSError:
                     pass
-            if cache is not None:
                 try:
-                    files = cache.read(alpm.pkg_get_fullname(package))
-                except KeyError:
+                    if not os.path.isdir(cls._path):
+                        os.makedirs(cls._path)
+                    with open(filesdb, 'rb') as archive:
+                        conf.convert_archive(archive, path)
+                except (EnvironmentError, TarError, UnicodeError):
                     pass
-                except (IOError, BadZipfile):
-                    cls.clear(key)
-                else:
-                    return files.decode('utf-8')
 
     @classmethod
     def get_log(cls, *names):
@@ -233,15 +570,24 @@ class Cache(object):
 
 
 class Downloader(Thread):
-    @staticmethod
-    def download(urls, quiet=False):
+    _threads = 10
+
+    @classmethod
+    def set_threads(cls, threads):
+        cls._threads = max(1, int(threads))
+
+    @classmethod
+    def download(cls, urls, quiet=False):
         tasks = Queue()
         output = Queue()
+        start = time.time()
         for index, url in enumerate(urls):
-            if index < 10:
+            if index < cls._threads:
                 Downloader(tasks, output)
             tasks.put(url)
         tasks.join()
+        profiler.add('download', time.time() - start, start,
+                     urls=tasks.qsize() + output.qsize())
         result = {}
         while not output.empty():
             url, data, exception = output.get()
@@ -258,12 +604,19 @@ class Downloader(Thread):
         self.start()
 
     def run(self):
+        # urllib pulls in ssl, email and http.client, so it is not loaded
+        # until the first download
+        import urllib.request, urllib.error
         while True:
             url = self._tasks.get()
+            start = time.time()
             try:
                 response = urllib.request.urlopen(url, timeout=20)
                 try:
-                    self._output.put((url, response.read(), None))
+                    data = response.read()
+                    profiler.add('network', time.time() - start, start,
+                                 url=url, size=len(data))
+                    self._output.put((url, data, None))
                 finally:
                     response.close()
             except urllib.error.HTTPError as exception:
@@ -279,6 +632,30 @@ class Downloader(Thread):
                 self._tasks.task_done()
 
 
+class Fetcher(Thread):
+    _threads = 3
+
+    @classmethod
+    def spawn(cls, tasks):
+        for index in range(cls._threads):
+            Fetcher(tasks).start()
+
+    def __init__(self, tasks):
+        Thread.__init__(self)
+        self._tasks = tasks
+        self.daemon = True
+
+    def run(self):
+        while True:
+            task = self._tasks.get()
+            try:
+                task()
+            except BaseException:
+                pass
+            finally:
+                self._tasks.task_done()
+
+
 class AlaParser(HTMLParser):
     def __init__(self):
         HTMLParser.__init__(self)
@@ -348,10 +725,32 @@ class Matcher(object):
     Exact = 2
     RegExp = 4
     Group = 8
+    Field = 16
+
+    Fields = {
+        'size': 'size', 'built': 'date', 'installed': 'date',
+        'votes': 'number', 'license': 'text', 'packager': 'text',
+        }
+    Periods = {
+        'today': 0, 'yesterday': 1, 'lastweek': 7,
+        'lastmonth': 30, 'lastyear': 365,
+        }
+
+    _field = re.compile(r'^(%s)(<=|>=|<|>|=|:)(.*)$' % '|'.join(Fields),
+                        re.I | re.S).match
+    _prefix = re.compile(r'^(%s)[<>]?$' % '|'.join(Fields), re.I).match
+
+    @classmethod
+    def has_fields(cls, text):
+        return any(cls._field(term) for term in re.split(r'[\s()|~]+', text))
 
-    def __init__(self, text, getters, files=False):
+    def __init__(self, text, getters, files=False, columns=None):
         self._text = text
         self._getters = getters
+        self._files = files
+        self._columns = columns
+        self._table = None
+        self._tests = {}
         self._targets = self._compile(
             self._parse(iter(text)), files)
 
@@ -387,6 +786,10 @@ class Matcher(object):
                     elif char in '"\'':
                         quote = char
                         char = ''
+                    elif char == '=' and self._prefix(term[1]):
+                        term[1] += char
+                        char = ''
+                        continue
                     elif char in '|~=%':
                         if not term[1]:
                             if char == '~':
@@ -448,6 +851,10 @@ class Matcher(object):
             for term in item:
                 if term[0] & Matcher.Group:
                     term = (term[0], self._compile(term[1], files))
+                elif (not term[0] & (Matcher.RegExp | Matcher.Exact) and
+                      self._field(term[1])):
+                    term = (term[0] | Matcher.Field, term[1],
+                            self._selector(term[1]))
                 else:
                     if files and not term[0] & Matcher.RegExp:
                         pattern = '/%s\n' % term[1].lstrip('/')
@@ -473,11 +880,72 @@ class Matcher(object):
                 result.append(element)
         return tuple(result)
 
+    def _selector(self, text):
+        field, operator, value = self._field(text).groups()
+        field = field.lower()
+        kind = Matcher.Fields[field]
+        if kind == 'text':
+            if operator not in '=:':
+                raise PatternError(
+                    self._text, 'invalid operator for %s: %s' % (
+                    field, operator))
+            return field, None, None, value.lower(), operator == '='
+        try:
+            low, high = self._range(kind, value.lower())
+        except (ValueError, OverflowError):
+            raise PatternError(
+                self._text, 'invalid value for %s: %s' % (field, value))
+        if operator == '<':
+            low, high = None, low
+        elif operator == '<=':
+            low = None
+        elif operator == '>':
+            low, high = high if high is not None else low, None
+        elif operator == '>=':
+            high = None
+        return field, low, high, None, False
+
+    def _range(self, kind, value):
+        if kind == 'number':
+            number = int(value)
+            return number, number + 1
+        elif kind == 'size':
+            match = re.match(r'^(\d+(?:\.\d*)?)([kmgt]?)(?:i?b)?$', value)
+            if match is None:
+                raise ValueError(value)
+            number = int(float(match.group(1)) *
+                         1024 ** ' kmgt'.index(match.group(2) or ' '))
+            return number, number + 1
+        today = date.today()
+        if value in Matcher.Periods:
+            start = today - timedelta(Matcher.Periods[value])
+            end = today if value == 'yesterday' else None
+        else:
+            match = re.match(r'^(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?$', value)
+            if match is None:
+                raise ValueError(value)
+            year, month, day = match.groups()
+            if day is not None:
+                start = date(int(year), int(month), int(day))
+                end = start + timedelta(1)
+            elif month is not None:
+                start = date(int(year), int(month), 1)
+                end = date(start.year + start.month // 12,
+                           start.month % 12 + 1, 1)
+            else:
+                start = date(int(year), 1, 1)
+                end = date(start.year + 1, 1, 1)
+        def timestamp(day):
+            if day is not None:
+                return int(time.mktime(day.timetuple()))
+        return timestamp(start), timestamp(end)
+
     def _compare(self, a, b):
-        if a[0] & (Matcher.Not | Matcher.RegExp):
-            if not b[0] & (Matcher.Not | Matcher.RegExp):
+        flags = Matcher.Not | Matcher.RegExp | Matcher.Field
+        if a[0] & flags:
+            if not b[0] & flags:
                 return 1
-        elif b[0] & (Matcher.Not | Matcher.RegExp):
+        elif b[0] & flags:
             return -1
         if isinstance(a[1], (tuple, list)):
             if isinstance(b[1], (tuple, list)):
@@ -498,6 +966,36 @@ class Matcher(object):
     def prioritize(self, strict=False):
         return self._prioritize(self._targets, strict)
 
+    def literals(self):
+        # the plain terms of each element, or None for elements that have
+        # only negated, regexp, field or group terms. an item can only match
+        # an element if it contains every one of its plain terms
+        result = []
+        for element in self._targets:
+            terms = [term[1] for term in element
+                     if not term[0] & ~Matcher.Exact]
+            result.append(terms or None)
+        return result
+
+    def query(self):
+        # the literals that each element requires, for the trigram indexes.
+        # negated, field and group terms are left out, which can only make
+        # the query match more
+        elements = []
+        for element in self._targets:
+            queries = []
+            for term in element:
+                if term[0] & (Matcher.Not | Matcher.Group | Matcher.Field):
+                    continue
+                if term[0] & Matcher.RegExp:
+                    queries.append(pattern_query(term[1], not self._files))
+                elif self._files:
+                    queries.append('/%s\n' % term[1].lstrip('/'))
+                else:
+                    queries.append(term[1])
+            elements.append(('and', queries))
+        return 'or', elements
+
     def _prioritize(self, items, strict=False):
         result = []
         for index, element in enumerate(items):
@@ -506,6 +1004,8 @@ class Matcher(object):
                 raise PatternError(self._text, 'unqualified negative term')
             if strict and term[0] & Matcher.RegExp:
                 raise PatternError(self._text, 'unqualified regexp term')
+            if strict and term[0] & Matcher.Field:
+                raise PatternError(self._text, 'unqualified field term')
             if term[0] & Matcher.Group:
                 result.extend(self._prioritize(term[1], strict))
             else:
@@ -525,7 +1025,10 @@ class Matcher(object):
                     if term[0] & Matcher.Group:
                         match = self._match(item, term[1])
                     else:
-                        match = term[2](value) is not None
+                        if term[0] & Matcher.Field:
+                            match = self._test(term)(item)
+                        else:
+                            match = term[2](value) is not None
                         if term[0] & Matcher.Not:
                             match = not match
                     if match:
@@ -534,79 +1037,382 @@ class Matcher(object):
                     return True
         return False
 
+    def _test(self, term):
+        test = self._tests.get(term)
+        if test is None:
+            if self._table is None:
+                if self._columns is not None:
+                    self._table = self._columns()
+                else:
+                    self._table = Columns()
+            test = self._tests[term] = self._table.test(*term[2])
+        return test
+
+
+class Columns(object):
+    # numeric fields are stored as sorted arrays, so that range predicates
+    # are resolved by binary search rather than by testing every package
+    def __init__(self):
+        self._numbers = {}
+        self._strings = {}
+
+    def add_numbers(self, field, key, items):
+        items = sorted(items)
+        self._numbers[field] = (
+            key, array('q', [item[0] for item in items]),
+            [item[1] for item in items])
+
+    def add_strings(self, field, key, items):
+        table = defaultdict(list)
+        for value, identifier in items:
+            table[value.lower()].append(identifier)
+        self._strings[field] = key, table
+
+    def test(self, field, low=None, high=None, text=None, exact=False):
+        if field in self._numbers:
+            key, values, identifiers = self._numbers[field]
+            start = 0 if low is None else bisect_left(values, low)
+            end = len(values) if high is None else bisect_left(values, high)
+            selected = frozenset(identifiers[start:end])
+        elif field in self._strings:
+            key, table = self._strings[field]
+            selected = set()
+            for value, identifiers in table.items():
+                if value == text if exact else text in value:
+                    selected.update(identifiers)
+        else:
+            return lambda item: False
+        return lambda item: key(item) in selected
+
+
+class Completions(object):
+    # names are kept sorted for prefix lookups with bisect, and each one
+    # has a position in the ranking (installed first, then by popularity),
+    # so the best matches for a prefix are the smallest positions in a slice
+    def __init__(self, entries=()):
+        table = {}
+        for name, installed, popularity in entries:
+            if not isinstance(popularity, (int, float)):
+                popularity = -1
+            item = table.get(name)
+            if item is None:
+                table[name] = [bool(installed), popularity]
+            else:
+                item[0] = item[0] or bool(installed)
+                item[1] = max(item[1], popularity)
+        self._ranked = sorted(table, key=lambda name: (
+            not table[name][0], -table[name][1], len(name), name))
+        self._keys = [self._key(name, *table[name]) for name in self._ranked]
+        names = sorted((name.lower(), rank)
+                       for rank, name in enumerate(self._ranked))
+        self._names = [name for name, rank in names]
+        self._order = array('l', [rank for name, rank in names])
+
+    @staticmethod
+    def _key(name, installed, popularity):
+        return not installed, -popularity, len(name), name
+
+    def __len__(self):
+        return len(self._names)
+
+    def complete(self, prefix, limit=10):
+        prefix = prefix.lower()
+        start = bisect_left(self._names, prefix)
+        end = bisect_left(self._names, prefix + '\U0010ffff', start)
+        if end - start > limit:
+            ranks = nsmallest(limit, self._order[start:end])
+        else:
+            ranks = sorted(self._order[start:end])
+        return [(self._keys[rank], self._ranked[rank]) for rank in ranks]
+
 
 def _call(args):
     return getattr(backend, args[0])(*args[1:])
 
 def _call_async(args):
+    profiler.reset(args[0])
+    start = time.time()
     try:
-        return _call(args)
+        result = _call(args)
     except BackendError as exception:
-        return exception
+        result = exception
     except BaseException:
-        return Traceback(*sys.exc_info())
+        result = Traceback(*sys.exc_info())
+    profiler.add('worker', time.time() - start, start)
+    profiler.sample()
+    start = time.time()
+    data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    profiler.add('pickle', time.time() - start, start, size=len(data))
+    return data, profiler.export()
+
+def _profiled(method):
+    def wrapper(self, *args, **kwargs):
+        if profiler.active():
+            return method(self, *args, **kwargs)
+        self._pending = False
+        profiler.reset(method.__name__)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if not self._pending:
+                profiler.finish()
+    wrapper.__name__ = method.__name__
+    return wrapper
 
 
 class Backend(object):
+    _details_limit = 100
+    _packages_limit = 50
+    _statistics_limit = 10
+    _joins = {
+        'provides': alpm.pkg_join_provides,
+        'replaces': alpm.pkg_join_replaces,
+        'depends': alpm.pkg_join_depends,
+        'optdepends': alpm.pkg_join_optdepends,
+        }
+
     def __init__(self):
-        self._aurparser = AurParser()
         self._rpcs = {}
+        self._groups = {}
+        self._columns = None
+        self._votes = None
+        self._joined = {}
+        self._cursor = None
+        self._snapshot = None
+        self._summaries = None
+        self._completions = None
+        self._aur_names = {}
+        self._aur_completions = None
+        self._segments = {}
+        self._trigrams = {}
+        self._indexer = None
+        self._verifier = None
+        self._completer = None
+        self._versions = None
+        self._history = None
+        self._config = None
+        self._stamps_cache = {}
+        self._foreign = set()
         self._pool = None
         self._callback = None
+        self._pending = False
         self._offline = False
+        self._inline = False
+        self._engine = 'python'
+        self._store = None
+        self._store_state = None
+        self._store_failed = None
+        self._lock = Lock()
+        self._details = OrderedDict()
+        self._packages = OrderedDict()
+        self._fetching = {}
+        self._fetches = None
+        self._generation = 0
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        self._lock = Lock()
+        self._fetching = {}
+        self._fetches = None
 
     def version(self):
         return alpm.version()
 
+    @_profiled
     def initialize(self):
+        config = self._read_config()
+        self.release()
+        self._setup(config)
+        if self._callback is not None and self._restore_snapshot():
+            self._callback([], None)
+            return
+        self._load_rpcs(self._foreign)
+
+    @_profiled
+    def refresh(self):
+        config = self._read_config()
+        if (self._config is None or not alpm.is_initialized() or
+            self._settings(config) != self._config['Settings']):
+            return self.initialize()
+        stamps = self._stamps()
+        changed = set(path for path, stamp in stamps.items()
+                      if stamp != self._stamps_cache.get(path))
+        if changed.intersection(self._config['LogPaths']):
+            Cache.clear('log.zip')
+        if changed.intersection(self._config['CachePaths']):
+            Cache.clear('pkgcache.zip')
+        dbpath = self._config['DBPath']
+        synced = [name for name in self._config['Repositories']
+                  if os.path.join(dbpath, 'sync', '%s.db' % name) in changed]
+        queried = self._foreign
+        if os.path.join(dbpath, 'local') in changed:
+            # the local db cannot be registered again on its own, so the
+            # handle is re-created
+            self._update_history()
+            if alpm.release() != 0:
+                raise DatabaseError()
+            self._groups = {}
+            self._joined = {}
+            self._versions = None
+            self._packages.clear()
+            self._clear_states()
+            self._setup(config)
+        elif synced:
+            # keep the versions of the outgoing generation for list_changes
+            self._update_history()
+            reloaded = self._reload_syncdbs(synced)
+            # the tables of the dbs that were registered again hold pointers
+            # into them, and the joined strings and versions of the dbs that
+            # changed are out of date
+            for location in reloaded:
+                self._groups.pop(location, None)
+            for table in self._joined.values():
+                for location in synced:
+                    table.pop(location, None)
+            if self._versions is not None:
+                self._versions = dict(
+                    (location, items) for location, items in
+                    self._versions.items() if location not in synced)
+            for key in list(self._packages):
+                if key[0] in reloaded or key[3]:
+                    del self._packages[key]
+            self._clear_states()
+            self._stamps_cache = stamps
+            self._foreign = self._foreign_names()
+        else:
+            self._stamps_cache = stamps
+            if self._callback is not None:
+                self._callback([], None)
+            return
+        rpcs = dict((name, rpc) for name, rpc in self._rpcs.items()
+                    if name in self._foreign)
+        self._load_rpcs(self._foreign.difference(queried), rpcs)
+
+    def is_modified(self):
+        if self._config is None or os.path.exists(
+            os.path.join(self._config['DBPath'], 'db.lck')):
+            return False
+        for path in self.watch_paths():
+            if self._stamp(path) != self._stamps_cache.get(path):
+                return True
+        return False
+
+    def watch_paths(self):
+        paths = []
+        if self._config is not None:
+            dbpath = self._config['DBPath']
+            paths.append(dbpath)
+            paths.append(os.path.join(dbpath, 'local'))
+            paths.append(os.path.join(dbpath, 'sync'))
+            for name in self._config['Repositories']:
+                paths.append(os.path.join(dbpath, 'sync', '%s.db' % name))
+        return paths
+
+    def _stamp(self, path):
         try:
-            config = conf.read_config()
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _stamps(self):
+        stamps = {}
+        if self._config is not None:
+            for path in (self.watch_paths() + self._config['LogPaths'] +
+                         self._config['CachePaths']):
+                stamps[path] = self._stamp(path)
+        return stamps
+
+    def _settings(self, config):
+        return tuple(config.get(key) for key in (
+            'RootDir', 'DBPath', 'Architecture', 'Repositories',
+            'LogFile', 'CacheDir'))
+
+    def _read_config(self):
+        try:
+            return conf.read_config()
         except IOError as exception:
             raise DatabaseError(exception.filename, alpm.ERR_NOT_A_FILE)
+
+    def _setup(self, config):
+        rootdir = config.get('RootDir') or conf.PM_ROOT_DIR
+        dbpath = conf.get_dbpath(config)
+        error = alpm.initialize(rootdir, dbpath)
+        if error == alpm.ERR_NOT_A_DIR:
+            if not os.path.isdir(rootdir):
+                raise DatabaseError(rootdir, error)
+            raise DatabaseError(dbpath, error)
+        elif error:
+            raise DatabaseError(None, error)
+        arch = config.get('Architecture')
+        if arch:
+            alpm.option_set_arch(arch)
+        for name in config['Repositories']:
+            if alpm.register_syncdb(name) is None:
+                raise DatabaseError(name)
+        logfile = config.get('LogFile', conf.PM_LOG_FILE)
+        alpm.option_set_logfile(logfile)
+        cachedirs = config.get('CacheDir', conf.PM_CACHE_DIRS)
+        for path in cachedirs:
+            alpm.option_add_cachedir(path)
+        Cache.set_dbpath(dbpath)
+        self._config = dict(config, DBPath=dbpath, LogPaths=[logfile],
+                            CachePaths=list(cachedirs),
+                            Settings=self._settings(config))
+        self._stamps_cache = self._stamps()
+        self._foreign = self._foreign_names()
+
+    def _foreign_names(self):
+        return set(alpm.pkg_get_name(package) for location, package in
+                   self._iter_packages(Source.Local | Source.Foreign))
+
+    def _reload_syncdbs(self, names):
+        # alpm searches the sync dbs in the order they were registered in,
+        # so every db from the first one that changed on is registered
+        # again. returns the locations of those dbs
+        repositories = self._config['Repositories']
+        reloaded = repositories[min(map(repositories.index, names)):]
+        for location, db in list(self._iter_dbs(Source.Sync, reloaded)):
+            if alpm.db_unregister(db) != 0:
+                raise DatabaseError(location)
+        for name in reloaded:
+            if alpm.register_syncdb(name) is None:
+                raise DatabaseError(name)
+        return reloaded
+
+    def _clear_states(self):
+        # the states of installed packages depend on every db, so these
+        # tables are dropped whichever db changed
+        self._columns = None
+        self._snapshot = None
+        self._summaries = None
+        self._completions = None
+
+    def _load_rpcs(self, targets, rpcs=None):
+        rpcs = rpcs or {}
+        if self._callback is not None:
+            if not targets:
+                self._rpcs = rpcs
+                self._callback([], None)
+                return
+            _callback = self._callback
+            def callback(items, exception):
+                if exception is None:
+                    rpcs.update(items)
+                    self._rpcs = rpcs
+                self._callback = _callback
+                _callback([], exception)
+            self.set_callback(callback)
+            self._call([['_load', sorted(targets)]])
         else:
-            self.release()
-            rootdir = config.get('RootDir')
-            if rootdir:
-                dbpath = os.path.join(rootdir, conf.PM_DB_PATH)
-            else:
-                rootdir = conf.PM_ROOT_DIR
-                dbpath = config.get('DBPath', conf.PM_DB_PATH)
-            error = alpm.initialize(rootdir, dbpath)
-            if error == alpm.ERR_NOT_A_DIR:
-                if not os.path.isdir(rootdir):
-                    raise DatabaseError(rootdir, error)
-                raise DatabaseError(dbpath, error)
-            elif error:
-                raise DatabaseError(None, error)
-            arch = config.get('Architecture')
-            if arch:
-                alpm.option_set_arch(arch)
-            for name in config['Repositories']:
-                if alpm.register_syncdb(name) is None:
-                    raise DatabaseError(name)
-            alpm.option_set_logfile(config.get('LogFile', conf.PM_LOG_FILE))
-            for path in config.get('CacheDir', conf.PM_CACHE_DIRS):
-                alpm.option_add_cachedir(path)
-            if self._callback is not None:
-                _callback = self._callback
-                def callback(items, exception):
-                    if exception is None:
-                        self._rpcs = dict(items)
-                    self._callback = _callback
-                    _callback([], exception)
-                self.set_callback(callback)
-                self._call([['_load']])
-            else:
-                self._rpcs = dict(self._load())
+            rpcs.update(self._load(sorted(targets)))
+            self._rpcs = rpcs
 
-    def _load(self):
+    def _load(self, targets):
         items = []
-        if alpm.is_initialized():
-            targets = defaultdict(list)
-            source = Source.Local | Source.Foreign
-            for location, package in self._iter_packages(source):
-                targets[('info', '')].append(alpm.pkg_get_name(package))
-            for info in self._fetch_packages(targets):
+        if alpm.is_initialized() and targets:
+            for info in self._fetch_packages({('info', ''): targets}):
                 items.append((info['Name'], (
                     info['PackageBase'],
                     info['Version'],
@@ -618,7 +1424,38 @@ class Backend(object):
 
     def release(self):
         Cache.clear()
-        self._rpcs.clear()
+        self._rpcs = {}
+        self._groups = {}
+        self._columns = None
+        self._votes = None
+        self._joined = {}
+        self._snapshot = None
+        self._summaries = None
+        self._completions = None
+        self._aur_names = {}
+        self._aur_completions = None
+        self._versions = None
+        self._segments = {}
+        for table in self._trigrams.values():
+            table.close()
+        self._trigrams = {}
+        if self._indexer is not None:
+            self._indexer.terminate()
+            self._indexer = None
+        self._close_store()
+        self._store_state = None
+        self._store_failed = None
+        if self._verifier is not None:
+            self._verifier.terminate()
+            self._verifier = None
+        if self._completer is not None:
+            self._completer.terminate()
+            self._completer = None
+        self._config = None
+        self._foreign = set()
+        with self._lock:
+            self._details.clear()
+        self._packages.clear()
         if alpm.is_initialized() and alpm.release() != 0:
             raise DatabaseError()
 
@@ -626,32 +1463,98 @@ class Backend(object):
         self._offline = bool(offline)
         Cache.set_offline(offline)
 
+    def set_inline(self, inline):
+        self._inline = bool(inline)
+
+    def set_engine(self, engine):
+        # the python engine keeps its indexes in pickles, and the sqlite
+        # engine keeps the whole package universe in one database
+        if engine not in ('python', 'sqlite'):
+            raise ValueError('unknown search engine: %s' % engine)
+        if engine == 'sqlite':
+            from pkgbrowser import store
+            if not store.available():
+                raise BackendError(
+                    'sqlite has no support for fts5 trigram indexes')
+            if not conf.is_writable(Cache.get_path()):
+                raise BackendError(
+                    'cannot write to the cache directory: %s' % (
+                    Cache.get_path() or '(not set)'))
+        self._engine = engine
+
     def set_callback(self, callback):
         if self._pool is not None:
             self._pool.terminate()
+        if self._pending:
+            self._pending = False
+            profiler.reset(active=False)
         self._callback = callback
 
-    def _call(self, args):
+    def timings(self):
+        return profiler.stages()
+
+    def memory(self):
+        return profiler.memory()
+
+    def add_timing(self, stage, start):
+        profiler.append(stage, time.time() - start, start)
+
+    def _call(self, args, finish=None):
+        if self._inline and self._callback is None:
+            # keep the caches of this process warm across repeated calls
+            items = []
+            for arg in args:
+                items.extend(getattr(self, arg[0])(*arg[1:]))
+            return finish(items) if finish is not None else items
+        start = time.time()
         self._pool = Pool()
+        profiler.add('pool', time.time() - start, start)
         if self._callback is not None:
+            self._pending = True
             def callback(results):
-                items = []
-                exception = None
-                for result in results:
-                    if not isinstance(result, BaseException):
-                        items.extend(result)
-                    else:
-                        exception = result
-                        items = None
-                        break
+                items, exception = self._collect(results)
+                if exception is None and finish is not None:
+                    items = finish(items)
+                self._pending = False
+                profiler.finish()
                 self._callback(items, exception)
             self._pool.map_async(_call_async, args, callback=callback)
         else:
-            items = []
-            for item in self._pool.map(_call, args):
-                items.extend(item)
-            self._pool.terminate()
-            return items
+            try:
+                items, exception = self._collect(self._pool.map(
+                    _call_async, args))
+            finally:
+                self._pool.terminate()
+            if exception is not None:
+                raise exception
+            return finish(items) if finish is not None else items
+
+    def _collect(self, results):
+        items = []
+        exception = None
+        for data, profile in results:
+            profiler.merge(profile)
+            start = time.time()
+            result = pickle.loads(data)
+            profiler.add('unpickle', time.time() - start, start)
+            if isinstance(result, BaseException):
+                if exception is None:
+                    exception = result
+                    items = None
+            elif exception is None:
+                items.extend(result)
+        if exception is None:
+            self._remember_aur(items)
+        return items, exception
+
+    def _remember_aur(self, items):
+        # aur names seen in results are offered as completions as well
+        count = len(self._aur_names)
+        for item in items:
+            if isinstance(item, Summary) and item.repository == 'aur':
+                self._aur_names[item.name] = item.popularity
+        if len(self._aur_names) != count:
+            self._aur_completions = None
 
     def _iter_dbs(self, source=0, locations=()):
         if not source:
@@ -681,26 +1584,207 @@ class Backend(object):
                 yield location, group
 
     def _iter_group(self, locations=(), targets=()):
+        table = self._group_table()
         for location, db in self._iter_dbs(Source.Sync, locations):
             for target in targets or ():
-                group = alpm.db_get_group(db, target)
-                item = alpm.group_get_pkgs(group)
+                entry = table.get(location, {}).get(target)
+                if entry is not None:
+                    for package in entry[0]:
+                        yield location, package
+
+    def _column_table(self):
+        if self._columns is None and alpm.is_initialized():
+            start = time.time()
+            sizes = []
+            dates = []
+            installed = []
+            licenses = []
+            packagers = []
+            local = alpm.db_get_name(alpm.get_localdb())
+            for location, db in self._iter_dbs(Source.Sync | Source.Local):
+                item = alpm.db_get_pkgcache(db)
                 while item is not None:
-                    yield location, alpm.list_get_pkg(item)
+                    package = alpm.list_get_pkg(item)
                     item = alpm.list_next(item)
-
-    def _iter_packages(self, source=0, locations=(), match=None):
+                    key = alpm.pkg_get_fullname(package)
+                    sizes.append((alpm.pkg_get_isize(package), key))
+                    dates.append((alpm.pkg_get_builddate(package), key))
+                    if location == local:
+                        installed.append((alpm.pkg_get_installdate(package),
+                                          alpm.pkg_get_name(package)))
+                    packager = alpm.pkg_get_packager(package)
+                    if packager:
+                        packagers.append((packager, key))
+                    node = alpm.pkg_get_licenses(package)
+                    while node is not None:
+                        licenses.append((alpm.list_get_str(node), key))
+                        node = alpm.list_next(node)
+            columns = Columns()
+            columns.add_numbers('size', alpm.pkg_get_fullname, sizes)
+            columns.add_numbers('built', alpm.pkg_get_fullname, dates)
+            columns.add_numbers('installed', alpm.pkg_get_name, installed)
+            columns.add_strings('license', alpm.pkg_get_fullname, licenses)
+            columns.add_strings('packager', alpm.pkg_get_fullname, packagers)
+            self._columns = columns
+            self._votes = None
+            profiler.add('alpm', time.time() - start, start)
+        if self._columns is None:
+            return Columns()
+        # the rpcs are always replaced rather than updated, so the votes
+        # only need rebuilding when the dict itself changes
+        if self._votes is not self._rpcs:
+            votes = []
+            for name, rpc in self._rpcs.items():
+                try:
+                    votes.append((int(rpc[3]), name))
+                except (ValueError, TypeError):
+                    pass
+            self._columns.add_numbers('votes', alpm.pkg_get_name, votes)
+            self._votes = self._rpcs
+        return self._columns
+
+    def _joined_table(self, key):
+        # the joined strings of a db never change until it does, so they are
+        # built once per key and db (interned, as many packages share them)
+        # and looked up by the position of the package in its db
+        table = self._joined.setdefault(key, {})
+        if alpm.is_initialized():
+            join = self._joins[key]
+            for location, db in self._iter_dbs(Source.Sync | Source.Local):
+                if location in table:
+                    continue
+                start = time.time()
+                column = []
+                item = alpm.db_get_pkgcache(db)
+                while item is not None:
+                    value = join(alpm.list_get_pkg(item))
+                    column.append(sys.intern(value) if value else value)
+                    item = alpm.list_next(item)
+                table[location] = column
+                profiler.add('index', time.time() - start, start,
+                             key='%s/%s' % (location, key))
+        return table
+
+    def _joined_getter(self, key):
+        join = self._joins[key]
+        def getter(package):
+            # the cursor is only set while _iter_packages is matching
+            if self._cursor is None:
+                return join(package)
+            location, index = self._cursor
+            return self._joined_table(key)[location][index]
+        return getter
+
+    def _aur_columns(self, packages):
+        key = lambda item: item['ID']
+        votes = []
+        licenses = []
+        for package in packages:
+            try:
+                votes.append((int(package['NumVotes']), package['ID']))
+            except (KeyError, ValueError, TypeError):
+                pass
+            for license in package.get('License') or ():
+                licenses.append((license, package['ID']))
+        columns = Columns()
+        columns.add_numbers('votes', key, votes)
+        columns.add_strings('license', key, licenses)
+        return columns
+
+    def _group_table(self):
+        # one table of groups per db, as the entries hold pointers into it
+        if alpm.is_initialized():
+            packages = {}
+            for location, db in self._iter_dbs(Source.Sync):
+                if location in self._groups:
+                    continue
+                start = time.time()
+                table = {}
+                item = alpm.db_get_groupcache(db)
+                while item is not None:
+                    group = alpm.list_get_group(item)
+                    item = alpm.list_next(item)
+                    members = []
+                    state = State.Group | State.Installed
+                    size = 0
+                    node = alpm.group_get_pkgs(group)
+                    while node is not None:
+                        package = alpm.list_get_pkg(node)
+                        node = alpm.list_next(node)
+                        members.append(package)
+                        key = location, alpm.pkg_get_name(package)
+                        info = packages.get(key)
+                        if info is None:
+                            info = packages[key] = (
+                                alpm.pkg_get_status(package),
+                                alpm.pkg_get_isize(package))
+                        if info[0] & State.NonInstalled:
+                            state = State.Group | State.NonInstalled
+                        size += info[1]
+                    table[alpm.group_get_name(group)] = members, state, size
+                self._groups[location] = table
+                profiler.add('alpm', time.time() - start, start,
+                             key=location)
+        return self._groups
+
+    def _iter_pkgcache(self, db):
+        index = 0
+        item = alpm.db_get_pkgcache(db)
+        while item is not None:
+            yield index, alpm.list_get_pkg(item)
+            item = alpm.list_next(item)
+            index += 1
+
+    def _iter_packages(self, source=0, locations=(), match=None,
+                       candidates=None):
+        # candidates maps locations to the only (index, name) pairs worth
+        # looking up. each db is scanned and timed as a whole, and matching
+        # is only timed on its own while tracing, as that costs two clock
+        # reads per package
+        matching = [0.0]
+        if match and profiler.tracing():
+            scan = match
+            def match(package):
+                now = time.time()
+                try:
+                    return scan(package)
+                finally:
+                    matching[0] += time.time() - now
         local = alpm.db_get_name(alpm.get_localdb())
         for location, db in self._iter_dbs(source, locations):
-            item = alpm.db_get_pkgcache(db)
-            while item is not None:
-                package = alpm.list_get_pkg(item)
-                item = alpm.list_next(item)
-                if ((location == local and source & Source.Foreign and
-                     alpm.pkg_get_repository(package) != local) or
-                    (match and not match(package))):
-                    continue
-                yield location, package
+            start = time.time()
+            matching[0] = 0.0
+            if candidates is not None and location in candidates:
+                packages = [(index, alpm.db_get_pkg(db, name))
+                            for index, name in candidates[location]]
+            else:
+                packages = self._iter_pkgcache(db)
+            found = []
+            try:
+                for index, package in packages:
+                    if package is None:
+                        continue
+                    if (location == local and source & Source.Foreign and
+                        alpm.pkg_get_repository(package) != local):
+                        continue
+                    if match:
+                        self._cursor = location, index
+                        if not match(package):
+                            continue
+                    found.append((location, package))
+            finally:
+                self._cursor = None
+            elapsed = time.time() - start
+            if not match:
+                profiler.add('alpm', elapsed, start, key=location)
+            elif profiler.tracing():
+                profiler.add('alpm', elapsed - matching[0], start,
+                             key=location)
+                profiler.add('match', matching[0], key=location)
+            else:
+                profiler.add('match', elapsed, start, key=location)
+            for item in found:
+                yield item
 
     def _dispatch(self, keys, source=0):
         if source == Source.Group:
@@ -722,10 +1806,10 @@ class Backend(object):
             dispatch = {
                 'name': alpm.pkg_get_name,
                 'description': alpm.pkg_get_desc,
-                'provides': alpm.pkg_join_provides,
-                'replaces': alpm.pkg_join_replaces,
-                'depends': alpm.pkg_join_depends,
-                'optdepends': alpm.pkg_join_optdepends,
+                'provides': self._joined_getter('provides'),
+                'replaces': self._joined_getter('replaces'),
+                'depends': self._joined_getter('depends'),
+                'optdepends': self._joined_getter('optdepends'),
                 'maintainer': pkg_get_maintainer,
                 'files': Cache.get_files,
                 }
@@ -757,7 +1841,83 @@ class Backend(object):
                     packages.extend(data['results'])
         return packages
 
+    def fetch_package(self, target, callback, neighbors=()):
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if self._fetches is None:
+                self._fetches = LifoQueue()
+                Fetcher.spawn(self._fetches)
+            for pending in self._fetching.values():
+                del pending[1][:]
+        for neighbor in reversed(neighbors):
+            key = self._detail_key(neighbor)
+            if key is not None:
+                self._queue_fetch(key, generation)
+        key = self._detail_key(target)
+        if key is None:
+            return False
+        self._queue_fetch(key, generation, callback)
+        return True
+
+    def _detail_key(self, target):
+        if not self._offline and isinstance(target, Summary):
+            state = target.state
+            update = bool(state & State.Update)
+            if state & State.AUR and not state & State.Installed:
+                return target.name, target.basename, update
+            elif (state & State.Installed and state & State.Foreign and
+                  not state & State.Database):
+                rpc = self._rpcs.get(target.name)
+                if rpc is not None:
+                    return target.name, rpc[0], update
+
+    def _queue_fetch(self, key, generation, callback=None):
+        with self._lock:
+            cached = key in self._details
+            if not cached:
+                pending = self._fetching.get(key)
+                if pending is None:
+                    self._fetching[key] = pending = [generation, []]
+                    self._fetches.put(lambda: self._run_fetch(key))
+                pending[0] = generation
+                if callback is not None:
+                    pending[1].append(callback)
+        if cached and callback is not None:
+            callback(None)
+
+    def _run_fetch(self, key):
+        with self._lock:
+            generation, callbacks = self._fetching[key]
+            # skip prefetches and requests for a previous selection
+            stale = generation != self._generation and not callbacks
+        exception = None
+        if not stale:
+            try:
+                self._fetch_package(*key)
+            except BaseException as error:
+                exception = error
+        with self._lock:
+            callbacks = self._fetching.pop(key)[1]
+        for callback in callbacks:
+            callback(exception)
+
     def _fetch_package(self, name, basename=None, update=False):
+        key = name, basename, update
+        with self._lock:
+            package = self._details.pop(key, None)
+            if package is not None:
+                self._details[key] = package
+                return package
+        package = self._load_package(name, basename, update)
+        if not self._offline:
+            with self._lock:
+                self._details[key] = package
+                while len(self._details) > self._details_limit:
+                    self._details.popitem(False)
+        return package
+
+    def _load_package(self, name, basename=None, update=False):
         if not self._offline:
             info = None
             urls = {
@@ -780,7 +1940,7 @@ class Backend(object):
                             info = data['results'][0]
                             data = downloads.get(urls.pop('htm'))
                             if data is not None:
-                                info.update(self._aurparser.read(data))
+                                info.update(AurParser().read(data))
                             if not basename:
                                 basename = info['PackageBase']
                                 continue
@@ -792,6 +1952,71 @@ class Backend(object):
                 break
         return NullPackage(name)
 
+    def prefetch_tree(self, package):
+        # resolve the aur dependencies of a package one level at a time,
+        # using a single multiinfo request per level. the html scrape is
+        # skipped, because it only provides the required-by list
+        resolved = {}
+        if self._offline:
+            return resolved
+        seen = set()
+        level = [package]
+        while level:
+            names = []
+            for parent in level:
+                for depends in (parent.get('depends', ()),
+                                parent.get('makedepends', ())):
+                    for name, data in depends:
+                        if name not in seen:
+                            seen.add(name)
+                            if not self._is_known(name):
+                                names.append(name)
+            if not names:
+                break
+            infos = {}
+            for info in self._fetch_packages({('info', ''): names}):
+                infos[info['Name']] = info
+            urls = {}
+            for name, info in infos.items():
+                if 'Depends' not in info and 'MakeDepends' not in info:
+                    urls[name] = utils.make_url(
+                        AUR_SRC, dict(h=info['PackageBase']))
+            downloads = Downloader.download(urls.values(), True)
+            level = []
+            for name in names:
+                info = infos.get(name)
+                if info is None:
+                    resolved[name] = NullPackage(name)
+                    continue
+                data = downloads.get(urls.get(name))
+                if data is not None:
+                    info.update(conf.load_srcinfo(name, data))
+                resolved[name] = package = AurPackage(info)
+                level.append(package)
+        return resolved
+
+    def _is_known(self, name):
+        if alpm.db_get_pkg(alpm.get_localdb(), name) is not None:
+            return True
+        for location, db in self._iter_dbs(Source.Sync):
+            if alpm.db_get_pkg(db, name) is not None:
+                return True
+        return (alpm.db_find_provider(name, 0) is not None or
+                alpm.db_find_replacer(name, 0) is not None)
+
+    def _package(self, base, aur=None, update=False):
+        key = (alpm.pkg_get_repository(base), alpm.pkg_get_name(base),
+               alpm.pkg_get_version(base), alpm.pkg_get_installdate(base),
+               aur, update)
+        package = self._packages.pop(key, None)
+        if package is None:
+            package = Package(base, aur, update)
+        self._packages[key] = package
+        while len(self._packages) > self._packages_limit:
+            self._packages.popitem(False)
+        return package
+
+    @_profiled
     def get_package(self, target, location=None, state=State.Unknown):
         if isinstance(target, Summary):
             state = target.state
@@ -814,9 +2039,9 @@ class Backend(object):
                     sync = alpm.db_get_pkg(db, target)
                     if sync is not None:
                         if state & State.NonInstalled or local is None:
-                            return Package(sync, update=update)
+                            return self._package(sync, update=update)
                         else:
-                            return Package(local)
+                            return self._package(local)
                     elif locations:
                         return NullPackage(target)
             if (local is not None and
@@ -826,29 +2051,436 @@ class Backend(object):
                     rpc = self._rpcs.get(target)
                     if rpc is not None:
                         aur = self._fetch_package(target, rpc[0], update)
-                        return Package(local, aur)
-                return Package(local)
+                        return self._package(local, aur)
+                return self._package(local)
             elif not locations and state & State.Unknown:
                 provider = alpm.db_find_provider(target, 0)
                 if provider is not None:
-                    return Package(provider)
+                    return self._package(provider)
                 replacer = alpm.db_find_replacer(target, 0)
                 if replacer is not None:
-                    return Package(replacer)
+                    return self._package(replacer)
                 if not state & State.Database:
                     return self._fetch_package(target, None, update)
         return NullPackage(target)
 
-    def find(self, text, filters=0, keys=()):
+    @_profiled
+    def find(self, text, filters=0, keys=(), limit=0, token=None):
+        # with a limit, only the best matches are returned, as a page with
+        # a token for fetching the ones after it
         keys = keys or ['name']
+        offset = 0
+        if token is not None:
+            offset = self._page_offset(token, text, filters, keys)
+        count = offset + limit + 1 if limit else 0
         args = []
         if filters & State.AUR and filters & State.NonInstalled:
-            args.append(('_find_aur', text, filters, keys))
-        for location in self.list_repositories():
-            args.append(('_find', text, filters, keys, [location]))
-        return self._call(args)
+            args.append(('_find_aur', text, filters, keys, count))
+        locations = self.list_repositories()
+        if 'files' in keys and filters & State.NonInstalled:
+            Cache.prepare_files(locations)
+        if filters & State.Group:
+            # the group table is built on demand, but before the fork, so
+            # that the workers do not each build their own
+            self._group_table()
+        else:
+            # build the column indexes once, before the workers are forked
+            if Matcher.has_fields(text):
+                self._column_table()
+            for key in keys:
+                if key in self._joins:
+                    self._joined_table(key)
+            if self._indexed(keys):
+                self._prepare_segments()
+            for source, group in self._find_sources(keys, filters).items():
+                if not self._prefiltered(group):
+                    continue
+                if self._engine == 'sqlite' and Cache.get_path():
+                    # if the store cannot be updated, this search falls
+                    # back to the python indexes
+                    try:
+                        ready = self._prepare_store()
+                    except BackendError:
+                        pass
+                    else:
+                        # no connection may be carried across the fork
+                        if ready:
+                            self._store.close()
+                        break
+                self._prepare_trigrams(source, group)
+        for location in locations:
+            args.append(('_find', text, filters, keys, [location], count))
+        finish = None
+        if limit:
+            key = self._page_key(text, filters, keys)
+            finish = lambda items: self._rank(items, offset, limit, key)
+        return self._call(args, finish)
+
+    def _rank(self, items, offset=0, limit=0, key=''):
+        # each worker only sends back its own best matches, which always
+        # include all of those that can make it into the requested page
+        items.sort(key=lambda item: (item.tier, -item.score))
+        page = Page(items[offset:offset + limit])
+        if len(items) > offset + limit:
+            page.token = '%d:%s' % (offset + limit, key)
+        return page
+
+    def _page_key(self, text, filters, keys):
+        return '%08x' % zlib.crc32(json.dumps(
+            [text, filters, sorted(keys)]).encode('utf-8'))
+
+    def _page_offset(self, token, text, filters, keys):
+        offset, _, key = str(token).partition(':')
+        if not offset.isdigit() or key != self._page_key(text, filters, keys):
+            raise ValueError('invalid continuation token: %s' % token)
+        return int(offset)
+
+    def _relevance(self, terms, name, score=0.0, installed=False,
+                   popularity=0):
+        # exact names come first, then prefixes and substrings of names,
+        # then all other matches, each ordered by score
+        folded = name.casefold()
+        tier = 3
+        for term in terms:
+            if term == folded:
+                tier = 0
+            elif folded.startswith(term):
+                tier = min(tier, 1)
+            elif term in folded:
+                tier = min(tier, 2)
+        if installed:
+            score += 1.0
+        if popularity > 0:
+            score += math.log1p(popularity)
+        return tier, score
+
+    def _indexed(self, keys):
+        return 'description' in keys and set(keys) <= {'name', 'description'}
+
+    def _prefiltered(self, keys):
+        return bool(keys) and set(keys) <= {
+            'name', 'description', 'depends', 'provides', 'replaces',
+            'optdepends', 'files',
+            }
+
+    def _find_sources(self, keys, filters=0):
+        sources = defaultdict(list)
+        for key in keys:
+            if key == 'files' and not filters & State.NonInstalled:
+                source = Source.Local
+            else:
+                source = Source.Sync | Source.Local | Source.Foreign
+            sources[source].append(key)
+        return sources
+
+    def _segment_stamp(self, location):
+        dbpath = self._config['DBPath']
+        if location == alpm.db_get_name(alpm.get_localdb()):
+            path = os.path.join(dbpath, 'local')
+        else:
+            path = os.path.join(dbpath, 'sync', '%s.db' % location)
+        return INDEX_VERSION, path, self._stamp(path)
+
+    def _text_segment(self, location):
+        # one segment per db, loaded from the cache directory. segments are
+        # only ever built by _build_segments, so this returns None for any
+        # that are missing or out of date
+        stamp = self._segment_stamp(location)
+        segment = self._segments.get(location)
+        if segment is not None and segment.stamp == stamp:
+            return segment
+        start = time.time()
+        data = conf.load_snapshot(
+            Cache.get_path(), conf.WORDS_FILE % location) or {}
+        segment = data.get('segment')
+        if not isinstance(segment, Segment) or segment.stamp != stamp:
+            self._segments.pop(location, None)
+            return None
+        self._segments[location] = segment
+        profiler.add('index', time.time() - start, start, key=location)
+        return segment
+
+    def _prepare_segments(self):
+        # built like the trigram tables: never if they cannot be saved, and
+        # in the background for the gui, which scans every package until
+        # they are ready
+        if self._config is None:
+            return
+        missing = [(location, self._segment_stamp(location))
+                   for location, db in self._iter_dbs(
+                   Source.Sync | Source.Local)
+                   if self._text_segment(location) is None]
+        if not missing or not conf.is_writable(Cache.get_path()):
+            return
+        if self._callback is None:
+            self._build_segments(missing)
+        elif self._indexer is None:
+            pool = self._indexer = Pool(1)
+            def finish(results):
+                pool.close()
+                if self._indexer is pool:
+                    self._indexer = None
+            pool.map_async(_call_async, [['_build_segments', missing]],
+                           callback=finish)
+
+    def _build_segments(self, segments):
+        stamps = dict(segments)
+        for location, db in self._iter_dbs(Source.Sync | Source.Local,
+                                           list(stamps)):
+            start = time.time()
+            segment = Segment(stamps[location], (
+                (alpm.pkg_get_name(package), alpm.pkg_get_desc(package))
+                for index, package in self._iter_pkgcache(db)))
+            conf.save_snapshot(Cache.get_path(), {'segment': segment},
+                               conf.WORDS_FILE % location)
+            self._segments[location] = segment
+            profiler.add('index', time.time() - start, start, key=location)
+        return []
+
+    def update_store(self):
+        # brings the store up to date, rewriting only the repositories whose
+        # stamps have changed, and the summaries if anything has
+        from pkgbrowser.store import Store, Error
+        stamps = self._store_stamps()
+        rpcs = self._rpcs
+        try:
+            if self._store is None:
+                self._store = Store(
+                    os.path.join(Cache.get_path(), conf.STORE_FILE))
+            local = alpm.db_get_name(alpm.get_localdb())
+            for location, db in self._iter_dbs(Source.Sync | Source.Local):
+                if self._store.stamp(location) != stamps[location]:
+                    start = time.time()
+                    if location != local:
+                        Cache.prepare_files([location])
+                    self._store.update(
+                        location, stamps[location], self._store_rows(db))
+                    profiler.add('index', time.time() - start, start,
+                                 key='store/%s' % location)
+            self._store.remove(list(stamps))
+            entries = sorted((name,) + tuple(rpc[:5])
+                             for name, rpc in rpcs.items())
+            if entries != self._store.aur():
+                self._store.update_aur(entries)
+            stamp = repr((sorted(stamps.items()), entries))
+            if self._store.summary_stamp() != stamp:
+                start = time.time()
+                summaries = self._summaries
+                if summaries is None:
+                    source = Source.Sync | Source.Local | Source.Foreign
+                    summaries = self._summarize(self._iter_packages(source))
+                self._store.update_summaries(
+                    stamp, self._pack_summaries(summaries))
+                profiler.add('index', time.time() - start, start,
+                             key='store/summaries')
+        except (Error, EnvironmentError) as exception:
+            self._close_store()
+            message = 'could not update the package store: %s' % exception
+            self._store_failed = stamps, rpcs, message
+            raise BackendError(message)
+        self._store_state = stamps, rpcs
+        self._store_failed = None
+        return self._store
+
+    def _build_store(self):
+        self.update_store().close()
+        return []
+
+    def _store_stamps(self):
+        # one stamp per db, which for the sync dbs includes the files cache
+        local = alpm.db_get_name(alpm.get_localdb())
+        stamps = {}
+        for location, db in self._iter_dbs(Source.Sync | Source.Local):
+            stamp = self._segment_stamp(location)
+            if location != local:
+                stamp += (self._stamp(os.path.join(
+                    Cache.get_path(), '%s.files.zip' % location)),)
+            stamps[location] = repr(stamp)
+        return stamps
+
+    def _prepare_store(self):
+        # like the trigram tables, the store is updated in the background
+        # for the gui, and searches and listings do without it until it is
+        # ready. returns whether it can be used, and raises BackendError if
+        # it could not be updated for the current stamps
+        from pkgbrowser.store import Store, Error
+        stamps = self._store_stamps()
+        def matches(state):
+            return (state is not None and state[0] == stamps and
+                    state[1] is self._rpcs)
+        if matches(self._store_state):
+            if self._store is None:
+                self._store = Store(
+                    os.path.join(Cache.get_path(), conf.STORE_FILE))
+            # the file may have been replaced by another process
+            try:
+                if self._store.stamps() == stamps:
+                    return True
+            except (Error, EnvironmentError):
+                pass
+            self._store_state = None
+        self._close_store()
+        if matches(self._store_failed):
+            raise BackendError(self._store_failed[2])
+        if self._callback is None:
+            self.update_store()
+            return True
+        if self._indexer is None:
+            state = stamps, self._rpcs
+            pool = self._indexer = Pool(1)
+            def finish(results):
+                pool.close()
+                if self._indexer is pool:
+                    self._indexer = None
+                data, profile = results[0]
+                result = pickle.loads(data)
+                if isinstance(result, BaseException):
+                    self._store_failed = state + (str(result),)
+                else:
+                    self._store_state = state
+            pool.map_async(_call_async, [['_build_store']], callback=finish)
+        return False
+
+    def _ready_store(self):
+        # the store for the listings, or None if it is not used or not
+        # ready yet
+        if self._engine != 'sqlite' or not Cache.get_path():
+            return None
+        try:
+            if self._prepare_store():
+                return self._store
+        except BackendError:
+            pass
+        return None
+
+    def _stored_summaries(self, locations, states=0):
+        from pkgbrowser.store import Error
+        store = self._ready_store()
+        if store is not None:
+            start = time.time()
+            try:
+                entries = store.summaries(locations, states)
+            except Error:
+                self._close_store()
+            else:
+                profiler.add('snapshot', time.time() - start, start)
+                return self._unpack_summaries(entries)
+        return None
+
+    def export_store(self, path):
+        from pkgbrowser.store import Error
+        store = self.update_store()
+        try:
+            store.export(path)
+        except (Error, EnvironmentError) as exception:
+            raise BackendError(
+                'could not write %s: %s' % (path, exception))
+        finally:
+            self._close_store()
+
+    def _close_store(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _store_rows(self, db):
+        for index, package in self._iter_pkgcache(db):
+            groups = []
+            node = alpm.pkg_get_groups(package)
+            while node is not None:
+                groups.append(alpm.list_get_str(node))
+                node = alpm.list_next(node)
+            yield (
+                alpm.pkg_get_name(package), alpm.pkg_get_version(package),
+                alpm.pkg_get_desc(package), alpm.pkg_get_url(package),
+                alpm.pkg_get_arch(package), alpm.pkg_get_packager(package),
+                alpm.pkg_get_builddate(package),
+                alpm.pkg_get_installdate(package),
+                alpm.pkg_get_isize(package),
+                dict((key, join(package))
+                     for key, join in self._joins.items()),
+                groups, Cache.get_files(package),
+                )
+
+    def _trigram_stamp(self, location, key):
+        # the files tables also depend on the files cache
+        stamp = self._segment_stamp(location)
+        if key == 'files':
+            stamp += (self._stamp(os.path.join(
+                Cache.get_path(), '%s.files.zip' % location)),)
+        return stamp
+
+    def _trigram_table(self, location, key):
+        # one table per db and key, mapped from the cache directory. tables
+        # are only ever built by _build_trigrams, so this returns None for
+        # any that are missing or out of date
+        stamp = repr(self._trigram_stamp(location, key))
+        table = self._trigrams.get((location, key))
+        if table is not None:
+            if table.stamp == stamp:
+                return table
+            del self._trigrams[(location, key)]
+            table.close()
+        path = os.path.join(
+            Cache.get_path(), conf.TRIGRAMS_FILE % (location, key))
+        try:
+            table = Trigrams(path)
+        except (EnvironmentError, ValueError, UnicodeError, struct.error):
+            return None
+        if table.stamp != stamp:
+            table.close()
+            return None
+        self._trigrams[(location, key)] = table
+        return table
+
+    def _prepare_trigrams(self, source, keys):
+        # tables that cannot be saved are never built, since that would
+        # take longer than the scan they are meant to avoid. for the gui
+        # they are built in the background, like the summaries, and the
+        # searches scan every package until they are ready
+        missing = [(location, key, self._trigram_stamp(location, key))
+                   for location, db in self._iter_dbs(source) for key in keys
+                   if self._trigram_table(location, key) is None]
+        if not missing or not conf.is_writable(Cache.get_path()):
+            return
+        if self._callback is None:
+            self._build_trigrams(missing)
+        elif self._indexer is None:
+            pool = self._indexer = Pool(1)
+            def finish(results):
+                pool.close()
+                if self._indexer is pool:
+                    self._indexer = None
+            pool.map_async(_call_async, [['_build_trigrams', missing]],
+                           callback=finish)
+
+    def _build_trigrams(self, tables):
+        # the stamps are taken when the build is requested, so that a table
+        # is never newer than the packages it was built from
+        path = Cache.get_path()
+        for location, db in self._iter_dbs(Source.Sync | Source.Local):
+            for name, key, stamp in tables:
+                if name != location:
+                    continue
+                start = time.time()
+                getter = self._dispatch([key])[0]
+                try:
+                    if not os.path.isdir(path):
+                        os.makedirs(path)
+                    Trigrams.build(
+                        os.path.join(path, conf.TRIGRAMS_FILE % (
+                            location, key)),
+                        stamp,
+                        ((alpm.pkg_get_name(package), getter(package))
+                         for index, package in self._iter_pkgcache(db)),
+                        key != 'files')
+                except EnvironmentError:
+                    pass
+                profiler.add('index', time.time() - start, start,
+                             key='%s/%s' % (location, key))
+        return []
 
-    def _find(self, text, filters=0, keys=(), locations=()):
+    def _find(self, text, filters=0, keys=(), locations=(), count=0):
         items = []
         if filters & State.Group:
             filters &= ~State.Group
@@ -857,22 +2489,107 @@ class Backend(object):
             items.extend(self._filter_groups(iterator, filters))
         else:
             filters &= ~State.AUR
-            args = defaultdict(list)
-            for key in keys:
-                if key == 'files' and not filters & State.NonInstalled:
-                    source = Source.Local
+            # only searches with a limit are ranked, since the gui sorts the
+            # results by column anyway
+            scores = {} if count else None
+            ranks = {}
+            for source, keys in self._find_sources(keys, filters).items():
+                matcher = Matcher(text, self._dispatch(keys), 'files' in keys,
+                                  self._column_table)
+                if self._prefiltered(keys):
+                    iterator = self._iter_indexed(
+                        matcher, source, keys, locations, scores)
                 else:
-                    source = Source.Sync | Source.Local | Source.Foreign
-                args[source].append(key)
-            for source, keys in args.items():
-                matcher = Matcher(text, self._dispatch(keys), 'files' in keys)
-                iterator = self._iter_packages(
-                    source, locations, matcher.match)
-                items.extend(self._filter_packages(iterator, filters))
+                    iterator = self._iter_packages(
+                        source, locations, matcher.match)
+                if count:
+                    iterator = self._iter_ranked(
+                        iterator, matcher, scores, ranks, count)
+                items.extend(self._filter_packages(iterator, filters, count))
+            for item in items:
+                item.tier, item.score = ranks.get(item.name, (3, 0.0))
         return items
 
-    def _find_aur(self, text, filters=0, keys=()):
-        matcher = Matcher(text, self._dispatch(keys, Source.AUR))
+    def _iter_ranked(self, iterator, matcher, scores, ranks, count):
+        # the matches are put in order so that summarizing can stop as soon
+        # as there are enough of them
+        localdb = alpm.get_localdb()
+        local = alpm.db_get_name(localdb)
+        terms = [term.casefold() for terms in matcher.literals() if terms
+                 for term in terms if term]
+        entries = []
+        for location, package in iterator:
+            name = alpm.pkg_get_name(package)
+            popularity = 0
+            if location == local:
+                installed = True
+                if name in self._rpcs:
+                    popularity = self._rpcs[name][4]
+            else:
+                installed = alpm.db_get_pkg(localdb, name) is not None
+            ranks[name] = rank = self._relevance(
+                terms, name, scores.get(name, 0.0), installed, popularity)
+            entries.append(((rank[0], -rank[1]), location, package))
+        entries.sort(key=lambda entry: entry[0])
+        for rank, location, package in entries:
+            yield location, package
+
+    def _iter_indexed(self, matcher, source, keys, locations, scores):
+        # the indexes narrow the search down to the packages that contain
+        # every literal of some element of the pattern, and the matcher then
+        # checks those in full, so the results are the same as for a full
+        # scan. ranked description searches are also scored
+        query = matcher.query()
+        literals = matcher.literals()
+        selection = {}
+        weights = {}
+        for location, db in self._iter_dbs(source, locations):
+            rows, names = self._candidates(location, keys, query)
+            segment = None
+            if self._indexed(keys):
+                segment = self._text_segment(location)
+            if segment is not None:
+                selected, weights[location] = segment.select(literals)
+                if selected is not None:
+                    if rows is None:
+                        rows, names = selected, segment.names
+                    else:
+                        rows = rows & selected
+            if rows is not None:
+                selection[location] = [(row, names[row])
+                                       for row in sorted(rows)]
+        for location, package in self._iter_packages(
+            source, locations, matcher.match, selection):
+            if scores is not None and weights.get(location):
+                scores[alpm.pkg_get_name(package)] = Segment.score(
+                    weights[location], alpm.pkg_get_name(package),
+                    alpm.pkg_get_desc(package))
+            yield location, package
+
+    def _candidates(self, location, keys, query):
+        # the rows of one db that may match, with the names of all of its
+        # packages, or (None, None) if the search cannot be narrowed
+        if self._engine == 'sqlite' and self._store is not None:
+            from pkgbrowser.store import Error
+            try:
+                rows = candidates(query, self._store.finders(location, keys))
+                if rows is not None:
+                    return rows, self._store.names(location)
+            except (Error, EnvironmentError):
+                pass
+            return None, None
+        tables = [self._trigram_table(location, key) for key in keys]
+        if None in tables:
+            return None, None
+        rows = candidates(query, tables)
+        if rows is None:
+            return None, None
+        return rows, tables[0].names
+
+    def _find_aur(self, text, filters=0, keys=(), count=0):
+        packages = []
+        matcher = Matcher(text, self._dispatch(keys, Source.AUR),
+                          columns=lambda: self._aur_columns(packages))
         terms = matcher.prioritize(True)
         maintainer = 'maintainer' in keys
         if 'name' in keys and 'description' not in keys:
@@ -888,15 +2605,23 @@ class Backend(object):
                     targets[('info', '')].append(target)
                 else:
                     targets[('search', by)].append(target)
-        items = []
         seen = set()
         for package in self._fetch_packages(targets):
             identifier = package['ID']
             if identifier not in seen:
                 seen.add(identifier)
-                if matcher.match(package):
-                    items.append(package)
-        return self._filter_aur(items, filters)
+                packages.append(package)
+        items = [package for package in packages if matcher.match(package)]
+        output = self._filter_aur(items, filters)
+        terms = [term.casefold() for terms in matcher.literals() if terms
+                 for term in terms if term]
+        for summary in output:
+            summary.tier, summary.score = self._relevance(
+                terms, summary.name, popularity=summary.popularity)
+        if count:
+            output.sort(key=lambda item: (item.tier, -item.score))
+            del output[count:]
+        return output
 
     def _filter_aur(self, items, filters=0):
         output = []
@@ -915,33 +2640,41 @@ class Backend(object):
         return output
 
     def _filter_groups(self, items, filters=0):
+        start = time.time()
         output = []
         if not filters:
             filters = State.Installed | State.NonInstalled | State.Update
+        table = self._group_table()
         for repository, group in items:
             name = alpm.group_get_name(group)
+            entry = table.get(repository, {}).get(name)
+            if entry is None:
+                continue
             summary = Summary()
             summary.name = name
             summary.repository = repository
-            summary.state = State.Group | State.Installed
-            locations = [repository] if repository else None
-            for location, package in self._iter_group(locations, [name]):
-                if (summary.state & State.Installed and
-                    alpm.pkg_get_status(package) & State.NonInstalled):
-                    summary.state = State.Group | State.NonInstalled
-                summary.size += alpm.pkg_get_isize(package)
+            summary.state = entry[1]
+            summary.size = entry[2]
             if filters & summary.state:
                 output.append(summary)
+        profiler.add('filter', time.time() - start, start)
         return output
 
-    def _filter_packages(self, items, filters=0):
-        output = []
+    def _filter_packages(self, items, filters=0, limit=0):
+        start = time.time()
         if not filters:
             filters = State.Installed | State.NonInstalled | State.Update
+        output = self._select(
+            self._summarize(items, filters & State.Update), filters, limit)
+        profiler.add('filter', time.time() - start, start)
+        return output
+
+    def _summarize(self, items, updates=True):
         localdb = alpm.get_localdb()
         local = alpm.db_get_name(localdb)
         for repository, package in items:
             update = None
+            current = True
             summary = Summary()
             summary.repository = repository
             summary.name = alpm.pkg_get_name(package)
@@ -960,42 +2693,261 @@ class Backend(object):
                         summary.popularity = rpc[4]
                     elif summary.repository == local:
                         summary.repository = alpm.pkg_get_repository(package)
-                if filters & State.Update:
+                if updates:
                     state = alpm.pkg_check_update(summary.name,
                                                   summary.version)
-                    if filters & state:
+                    if state:
                         update = copy.copy(summary)
                         update.state = state | summary.state & State.AUR
                         if update.state & State.AUR:
                             update.size = -1
-                        output.append(update)
-                current = alpm.db_get_pkg(localdb, summary.name)
-                summary.version = alpm.pkg_get_version(current)
-                summary.date = alpm.pkg_get_installdate(current)
+                package = alpm.db_get_pkg(localdb, summary.name)
+                summary.version = alpm.pkg_get_version(package)
+                summary.date = alpm.pkg_get_installdate(package)
+                if update is not None:
+                    current = (summary.repository ==
+                               alpm.pkg_get_repository(package))
+            yield repository, summary, update, current
+
+    def _select(self, entries, filters, limit=0):
+        output = []
+        for location, summary, update, current in entries:
+            if limit and len(output) >= limit:
+                break
+            shown = (update is not None and filters & State.Update and
+                     filters & update.state & ~State.AUR)
+            if shown:
+                output.append(update)
             if (filters & summary.state and (
-                update is None or summary.state & State.AUR or
-                summary.repository == alpm.pkg_get_repository(current))):
+                not shown or summary.state & State.AUR or current)):
                 output.append(summary)
         return output
 
+    def _filter_summaries(self, source, locations, filters=0, entries=None):
+        start = time.time()
+        if not filters:
+            filters = State.Installed | State.NonInstalled | State.Update
+        local = alpm.db_get_name(alpm.get_localdb())
+        if entries is None:
+            entries = self._summaries
+        selected = []
+        for entry in entries:
+            location = entry[0]
+            if (not source & (Source.Local if location == local
+                              else Source.Sync) or
+                locations and location not in locations):
+                continue
+            selected.append(entry)
+        output = self._select(selected, filters)
+        profiler.add('filter', time.time() - start, start)
+        return output
+
+    def verify_snapshot(self, callback):
+        # rebuild the summaries in the background, and replace the ones
+        # restored at startup (if any) when they are ready
+        if self._verifier is not None:
+            self._verifier.terminate()
+        key = self._snapshot_key()
+        previous = self._summaries
+        pool = self._verifier = Pool(1)
+        def finish(results):
+            pool.close()
+            if self._verifier is pool:
+                self._verifier = None
+            data, profile = results[0]
+            result = pickle.loads(data)
+            if isinstance(result, BaseException):
+                callback(False, result)
+                return
+            if key != self._snapshot_key():
+                return
+            rpcs, summaries, completions = result
+            rows = self._pack_summaries(summaries)
+            changed = (previous is not None and
+                       rows != self._pack_summaries(previous))
+            self._rpcs = rpcs
+            self._summaries = summaries
+            self._completions = completions
+            conf.save_snapshot(Cache.get_path(), {
+                'key': key, 'rpcs': rpcs, 'summaries': rows,
+                })
+            callback(changed, None)
+        pool.map_async(_call_async, [['_summary_table', sorted(
+            self._foreign)]], callback=finish)
+
+    def _summary_table(self, targets):
+        try:
+            rpcs = dict(self._load(targets))
+        except BackendError:
+            rpcs = dict((name, rpc) for name, rpc in self._rpcs.items()
+                        if name in self._foreign)
+        self._rpcs = rpcs
+        source = Source.Sync | Source.Local | Source.Foreign
+        summaries = list(self._summarize(self._iter_packages(source)))
+        return rpcs, summaries, self._build_completions(summaries)
+
+    def _build_completions(self, entries):
+        start = time.time()
+        completions = Completions(
+            (summary.name, summary.state & State.Installed,
+             summary.popularity)
+            for location, summary, update, current in entries)
+        profiler.add('index', time.time() - start, start)
+        return completions
+
+    def _completion_table(self):
+        # for the gui, the table comes with the summaries that
+        # verify_snapshot builds in the background. if that is not running
+        # (or failed), the table is built in the background on its own, and
+        # there are no completions until it is ready
+        if (self._completions is None and self._verifier is None and
+            alpm.is_initialized()):
+            if self._callback is None:
+                self._completions = self._build_completion_table()
+            elif self._completer is None:
+                key = self._snapshot_key()
+                pool = self._completer = Pool(1)
+                def finish(results):
+                    pool.close()
+                    if self._completer is pool:
+                        self._completer = None
+                    data, profile = results[0]
+                    result = pickle.loads(data)
+                    if (not isinstance(result, BaseException) and
+                        key == self._snapshot_key()):
+                        self._completions = result
+                pool.map_async(_call_async, [['_build_completion_table']],
+                               callback=finish)
+        return self._completions
+
+    def _build_completion_table(self):
+        entries = self._summaries
+        if entries is None:
+            source = Source.Sync | Source.Local | Source.Foreign
+            entries = self._summarize(self._iter_packages(source), False)
+        return self._build_completions(entries)
+
+    def complete(self, prefix, limit=10):
+        if not prefix:
+            return []
+        matches = []
+        completions = self._completion_table()
+        if completions is not None:
+            matches.extend(completions.complete(prefix, limit))
+        if self._aur_names:
+            if self._aur_completions is None:
+                self._aur_completions = Completions(
+                    (name, name in self._rpcs, popularity)
+                    for name, popularity in self._aur_names.items())
+            matches.extend(self._aur_completions.complete(prefix, limit))
+        names = []
+        for key, name in sorted(matches):
+            if name not in names:
+                names.append(name)
+        return names[:limit]
+
+    def _snapshot_key(self):
+        if self._config is not None:
+            return (SNAPSHOT_VERSION, self._settings(self._config),
+                    self._offline, tuple(
+                    (path, self._stamp(path)) for path in self.watch_paths()))
+
+    def _restore_snapshot(self):
+        data = conf.load_snapshot(Cache.get_path())
+        if data is None or data.get('key') != self._snapshot_key():
+            return False
+        self._rpcs = data['rpcs']
+        self._summaries = self._unpack_summaries(data['summaries'])
+        return True
+
+    def _pack_summaries(self, entries):
+        fields = Summary.Fields
+        def pack(summary):
+            if summary is not None:
+                return tuple(getattr(summary, key) for key in fields)
+        return [(location, pack(summary), pack(update), current)
+                for location, summary, update, current in entries]
+
+    def _unpack_summaries(self, rows):
+        fields = Summary.Fields
+        def unpack(values):
+            if values is not None:
+                summary = Summary()
+                for key, value in zip(fields, values):
+                    setattr(summary, key, value)
+                return summary
+        return [(location, unpack(summary), unpack(update), current)
+                for location, summary, update, current in rows]
+
+    @_profiled
     def list_targets(self, targets):
         return self._call([['_list_targets', targets]])
 
     def _list_targets(self, targets):
-        unknown = []
-        packages = []
-        for target in set(targets):
-            package = self.get_package(
-                target, state=(State.Database | State.Unknown))
-            if package['state'] & State.Unknown:
-                unknown.append(target)
+        targets = list(OrderedDict.fromkeys(targets))
+        resolved = self._resolve_targets(targets)
+        unknown = [target for target in targets if target not in resolved]
+        packages = {}
+        for info in self._fetch_packages({('info', ''): unknown}):
+            packages[info['Name']] = info
+        items = []
+        runs = []
+        for target in targets:
+            package = resolved.get(target)
+            if package is not None:
+                item = False, (alpm.pkg_get_repository(package), package)
+            elif target in packages:
+                item = True, packages[target]
+            else:
+                continue
+            if runs and runs[-1][0] == item[0]:
+                runs[-1][1].append(item[1])
+            else:
+                runs.append((item[0], [item[1]]))
+        for aur, run in runs:
+            if aur:
+                items.extend(self._filter_aur(run))
             else:
-                packages.append((package['repository'], package.base()))
-        items = self._filter_packages(packages)
-        items.extend(self._filter_aur(
-            self._fetch_packages({('info', ''): unknown})))
+                items.extend(self._filter_packages(run))
         return items
 
+    def _resolve_targets(self, targets):
+        resolved = {}
+        localdb = alpm.get_localdb()
+        dbs = [db for location, db in self._iter_dbs(Source.Sync)]
+        for target in targets:
+            package = alpm.db_get_pkg(localdb, target)
+            for db in dbs:
+                sync = alpm.db_get_pkg(db, target)
+                if sync is not None:
+                    if package is None:
+                        package = sync
+                    break
+            if package is not None:
+                resolved[target] = package
+        missing = set(targets).difference(resolved)
+        if missing:
+            providers = {}
+            replacers = {}
+            for db in [localdb] + dbs:
+                item = alpm.db_get_pkgcache(db)
+                while item is not None:
+                    package = alpm.list_get_pkg(item)
+                    item = alpm.list_next(item)
+                    for index, names in (
+                        (providers, alpm.pkg_join_provides(package)),
+                        (replacers, alpm.pkg_join_replaces(package))):
+                        if names:
+                            for name in missing.intersection(
+                                names.split('\n')):
+                                index.setdefault(name, package)
+            for target in missing:
+                package = providers.get(target, replacers.get(target))
+                if package is not None:
+                    resolved[target] = package
+        return resolved
+
+    @_profiled
     def list_packages(self, filters=0, location=None):
         if filters and filters & State.Foreign:
             source = Source.Local | Source.Foreign
@@ -1004,21 +2956,205 @@ class Backend(object):
             source = Source.Sync
         else:
             source = Source.Sync | Source.Local | Source.Foreign
+        if self._summaries is not None:
+            return self._filter_summaries(
+                source, location and [location], filters)
+        # without the summaries in memory, the store can serve the states
+        # of the packages
+        locations = [name for name, db in self._iter_dbs(
+                     source & (Source.Sync | Source.Local),
+                     location and [location])]
+        entries = self._stored_summaries(locations, filters)
+        if entries is not None:
+            return self._filter_summaries(
+                source, locations, filters, entries)
         packages = self._iter_packages(source, location and [location])
         return self._filter_packages(packages, filters)
 
+    @_profiled
+    def list_changes(self, kind=None):
+        history = self._update_history()
+        changes = [change for change in history.get('changes', ())
+                   if kind is None or change[1] == kind]
+        start = time.time()
+        output = []
+        items = []
+        dbs = dict(self._iter_dbs(Source.Sync))
+        for name, kind, before, after in changes:
+            if after is None:
+                summary = Summary()
+                summary.name = name
+                summary.repository, summary.version = before
+                summary.state = State.Unknown
+                output.append(summary)
+                continue
+            db = dbs.get(after[0])
+            package = db and alpm.db_get_pkg(db, name)
+            if package is not None:
+                items.append((after[0], package))
+        changed = dict(((change[3][0], change[0]), change)
+                       for change in changes if change[3] is not None)
+        for location, summary, update, current in self._summarize(
+            items, False):
+            name, kind, before, after = changed[location, summary.name]
+            if before is not None and before[1] != after[1]:
+                summary.version = '%s \u2192 %s' % (before[1], after[1])
+            output.append(summary)
+        profiler.add('filter', time.time() - start, start)
+        return output
+
+    def _update_history(self):
+        settings = self._config and self._config['Settings']
+        if settings is None or not alpm.is_initialized():
+            return self._history or {}
+        path = Cache.get_path()
+        history = self._history
+        if history is None:
+            history = conf.load_snapshot(path, conf.HISTORY_FILE) or {}
+        versions = self._version_table()
+        if history.get('settings') != settings:
+            history = {'settings': settings, 'versions': versions,
+                       'changes': []}
+            conf.save_snapshot(path, history, conf.HISTORY_FILE)
+        elif history['versions'] != versions:
+            start = time.time()
+            history = {'settings': settings, 'versions': versions,
+                       'changes': self._diff_versions(
+                       history['versions'], versions)}
+            profiler.add('match', time.time() - start, start)
+            conf.save_snapshot(path, history, conf.HISTORY_FILE)
+        self._history = history
+        return history
+
+    def _version_table(self):
+        # built per db, and always as a new dict, since the history keeps
+        # the table of the previous generation
+        versions = self._versions or {}
+        missing = [(location, db) for location, db in
+                   self._iter_dbs(Source.Sync) if location not in versions]
+        if self._versions is None or missing:
+            versions = dict(versions)
+            for location, db in missing:
+                start = time.time()
+                items = []
+                item = alpm.db_get_pkgcache(db)
+                while item is not None:
+                    package = alpm.list_get_pkg(item)
+                    item = alpm.list_next(item)
+                    items.append((alpm.pkg_get_name(package),
+                                  alpm.pkg_get_version(package)))
+                items.sort()
+                versions[location] = items
+                profiler.add('alpm', time.time() - start, start,
+                             key=location)
+            self._versions = versions
+        return self._versions
+
+    def _diff_versions(self, old, new):
+        # merge the sorted name lists of each repository, then pair up the
+        # additions and removals of the same name as moves
+        changes = []
+        added = defaultdict(list)
+        removed = defaultdict(list)
+        for location in set(old).union(new):
+            before = old.get(location, ())
+            after = new.get(location, ())
+            index = position = 0
+            while index < len(before) or position < len(after):
+                if position == len(after) or (
+                    index < len(before) and
+                    before[index][0] < after[position][0]):
+                    name, version = before[index]
+                    removed[name].append((location, version))
+                    index += 1
+                elif index == len(before) or (
+                    after[position][0] < before[index][0]):
+                    name, version = after[position]
+                    added[name].append((location, version))
+                    position += 1
+                else:
+                    name, version = after[position]
+                    previous = before[index][1]
+                    if version != previous:
+                        if alpm.pkg_vercmp(version, previous) > 0:
+                            kind = 'upgraded'
+                        else:
+                            kind = 'downgraded'
+                        changes.append((name, kind, (location, previous),
+                                        (location, version)))
+                    index += 1
+                    position += 1
+        for name, items in added.items():
+            for item in items:
+                if removed.get(name):
+                    changes.append((name, 'moved', removed[name].pop(), item))
+                else:
+                    changes.append((name, 'new', None, item))
+        for name, items in removed.items():
+            for item in items:
+                changes.append((name, 'removed', item, None))
+        changes.sort()
+        return changes
+
+    @_profiled
     def list_group(self, location=None, target=None):
+        if location and target:
+            entries = self._stored_group(location, target)
+            if entries is not None:
+                return self._select(entries, State.Installed |
+                                    State.NonInstalled | State.Update)
         packages = self._iter_group(location and [location],
                                     target and [target])
         return self._filter_packages(packages)
 
+    @_profiled
     def list_groups(self, location=None):
+        if not self._groups:
+            # the store saves building the group tables from alpm
+            output = self._stored_groups(location and [location])
+            if output is not None:
+                return output
         groups = self._iter_groups(location and [location])
         return self._filter_groups(groups)
 
+    def _stored_group(self, location, target):
+        from pkgbrowser.store import Error
+        store = self._ready_store()
+        if store is not None:
+            try:
+                return self._unpack_summaries(store.group(location, target))
+            except Error:
+                self._close_store()
+        return None
+
+    def _stored_groups(self, locations):
+        from pkgbrowser.store import Error
+        store = self._ready_store()
+        if store is None:
+            return None
+        start = time.time()
+        output = []
+        try:
+            for location, db in self._iter_dbs(Source.Sync, locations):
+                for name, missing, size in store.groups(
+                    location, State.NonInstalled):
+                    summary = Summary()
+                    summary.name = name
+                    summary.repository = location
+                    summary.state = State.Group | (
+                        State.NonInstalled if missing else State.Installed)
+                    summary.size = size
+                    output.append(summary)
+        except Error:
+            self._close_store()
+            return None
+        profiler.add('snapshot', time.time() - start, start)
+        return output
+
     def list_repositories(self):
         return [repository for repository, db in self._iter_dbs()]
 
+    @_profiled
     def list_categories(self):
         return self._call([['_list_categories']])
 
@@ -1033,6 +3169,7 @@ class Backend(object):
                     categories[parent].append((child, target))
         return sorted(categories.items())
 
+    @_profiled
     def list_category(self, category):
         return self._call([['_list_category', category]])
 
@@ -1059,24 +3196,222 @@ class Backend(object):
             if exception is not None:
                 raise exception
 
+    @_profiled
     def statistics(self):
-        data = defaultdict(list)
-        for package in self.list_packages(State.Installed):
-            for key in ('total', package.repository):
-                item = data[key]
-                if not item:
-                    item[:] = [0, 0]
-                item[0] += 1
-                item[1] += package.size
-        stats = []
-        for key in self.list_repositories() + ['aur', 'total']:
-            item = data.get(key)
-            if item is not None:
-                stats.append((key, item[0], item[1]))
+        snapshot = self._snapshot_table()
+        start = time.time()
+        repository = snapshot.column('repository')
+        if snapshot.foreign:
+            aur = snapshot.intern('repositories', 'aur')
+            if numpy is not None:
+                repository = repository.copy()
+            else:
+                repository = list(repository)
+            for row in snapshot.foreign:
+                if snapshot.names[row] in self._rpcs:
+                    repository[row] = aur
+        installed = snapshot.select(State.Installed)
+        stats = {}
+        available = snapshot.group(
+            repository, len(snapshot.repositories))[0]
+        counts, sizes = snapshot.group(
+            repository, len(snapshot.repositories), installed)
+        table = []
+        for key in self.list_repositories() + ['aur']:
+            index = snapshot.intern('repositories', key)
+            if index < len(counts) and (counts[index] or available[index]):
+                table.append((key, counts[index], sizes[index],
+                              available[index]))
+        table.append(('total', sum(counts), sum(sizes), sum(available)))
+        stats['repositories'] = table
+        table = []
+        for key, state in (('explicit', State.Explicit),
+                           ('dependency', State.Dependency),
+                           ('optional', State.Optional),
+                           ('orphan', State.Orphan),
+                           ('foreign', State.Foreign)):
+            counts, sizes = snapshot.group(
+                None, 1, snapshot.select(state))
+            table.append((key, counts[0], sizes[0]))
+        stats['reasons'] = table
+        for key, table, names in (
+            ('licenses', 'license', snapshot.licenses),
+            ('packagers', 'packager', snapshot.packagers)):
+            if table == 'license':
+                counts, sizes = snapshot.group(
+                    snapshot.column('license'), len(names), installed,
+                    snapshot.column('licensed'))
+            else:
+                counts, sizes = snapshot.group(
+                    snapshot.column('packager'), len(names), installed)
+            ranking = sorted(range(len(names)),
+                             key=lambda index: (-counts[index], names[index]))
+            stats[key] = [(names[index], counts[index], sizes[index])
+                          for index in ranking[:self._statistics_limit]
+                          if counts[index]]
+        today = date.today()
+        current = today.year * 12 + today.month - 1
+        months = snapshot.column('month')
+        if numpy is not None:
+            months = months - (current - 11)
+            recent = installed & (months >= 0) & (months < 12)
+        else:
+            months = [month - (current - 11) for month in months]
+            recent = [selected and 0 <= month < 12
+                      for selected, month in zip(installed, months)]
+        counts, sizes = snapshot.group(months, 12, recent)
+        table = []
+        for index in range(12):
+            year, month = divmod(current - 11 + index, 12)
+            table.append(('%04d-%02d' % (year, month + 1),
+                          counts[index], sizes[index]))
+        stats['months'] = table
+        profiler.add('filter', time.time() - start, start)
         return stats
 
+    def _snapshot_table(self):
+        if self._snapshot is None:
+            start = time.time()
+            snapshot = Snapshot()
+            localdb = alpm.get_localdb()
+            local = alpm.db_get_name(localdb)
+            for location in self.list_repositories() + ['aur']:
+                snapshot.intern('repositories', location)
+            source = Source.Sync | Source.Local | Source.Foreign
+            for location, package in self._iter_packages(source):
+                state = alpm.pkg_get_status(package)
+                name = alpm.pkg_get_name(package)
+                installed = 0
+                if state & State.Installed:
+                    installed = alpm.pkg_get_installdate(
+                        alpm.db_get_pkg(localdb, name))
+                licenses = []
+                node = alpm.pkg_get_licenses(package)
+                while node is not None:
+                    licenses.append(alpm.list_get_str(node))
+                    node = alpm.list_next(node)
+                snapshot.append(
+                    name, location, state, alpm.pkg_get_isize(package),
+                    alpm.pkg_get_size(package),
+                    alpm.pkg_get_builddate(package), installed,
+                    alpm.pkg_get_packager(package) or '', licenses,
+                    location == local)
+            self._snapshot = snapshot
+            profiler.add('snapshot', time.time() - start, start)
+        return self._snapshot
+
+
+class Snapshot(object):
+    # one row per package, stored column-wise so that statistics can be
+    # computed with group-by operations over whole arrays
+    Columns = (
+        'repository', 'state', 'isize', 'size', 'built', 'installed',
+        'month', 'packager', 'license', 'licensed',
+        )
+
+    def __init__(self):
+        _import_numpy()
+        self.names = []
+        self.repositories = []
+        self.packagers = []
+        self.licenses = []
+        self.foreign = []
+        self._ids = defaultdict(dict)
+        self._columns = dict((key, array('q')) for key in Snapshot.Columns)
+
+    def intern(self, table, value):
+        ids = self._ids[table]
+        index = ids.get(value)
+        if index is None:
+            index = ids[value] = len(ids)
+            getattr(self, table).append(value)
+        return index
+
+    def append(self, name, repository, state, isize, size, built,
+               installed, packager, licenses, foreign=False):
+        columns = self._columns
+        row = len(self.names)
+        self.names.append(name)
+        if foreign:
+            self.foreign.append(row)
+        columns['repository'].append(self.intern('repositories', repository))
+        columns['state'].append(state)
+        columns['isize'].append(max(0, isize or 0))
+        columns['size'].append(max(0, size or 0))
+        columns['built'].append(built or 0)
+        columns['installed'].append(installed or 0)
+        month = -1
+        if installed:
+            moment = time.localtime(installed)
+            month = moment.tm_year * 12 + moment.tm_mon - 1
+        columns['month'].append(month)
+        columns['packager'].append(self.intern('packagers', packager))
+        for license in licenses:
+            columns['license'].append(self.intern('licenses', license))
+            columns['licensed'].append(row)
+
+    def __len__(self):
+        return len(self.names)
+
+    def column(self, key):
+        column = self._columns[key]
+        if numpy is not None:
+            if not column:
+                return numpy.zeros(0, numpy.int64)
+            return numpy.frombuffer(column, numpy.int64)
+        return column
+
+    def select(self, bits):
+        state = self.column('state')
+        if numpy is not None:
+            return (state & bits) != 0
+        return [bool(value & bits) for value in state]
+
+    def group(self, keys, length, mask=None, rows=None, weight='isize'):
+        # keys are aligned with rows (or with the whole table when rows is
+        # None), and a key of None puts everything into a single group
+        weights = self.column(weight)
+        if numpy is not None:
+            if rows is not None:
+                weights = weights[rows]
+                if mask is not None:
+                    mask = mask[rows]
+            if keys is None:
+                keys = numpy.zeros(len(weights), numpy.int64)
+            if mask is not None:
+                keys = keys[mask]
+                weights = weights[mask]
+            counts = numpy.bincount(keys, minlength=length)
+            sums = numpy.bincount(keys, weights, minlength=length)
+            return counts.tolist(), [int(value) for value in sums]
+        counts = [0] * length
+        sums = [0] * length
+        if rows is None:
+            rows = range(len(weights))
+        for index, row in enumerate(rows):
+            if mask is None or mask[row]:
+                key = 0 if keys is None else keys[index]
+                counts[key] += 1
+                sums[key] += weights[row]
+        return counts, sums
+
+
+def _sizeof(value):
+    if isinstance(value, str):
+        return len(value)
+    elif isinstance(value, dict):
+        return sum(_sizeof(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        return sum(_sizeof(item) for item in value) + len(value)
+    return 1
+
 
 class Summary(object):
+    Fields = (
+        'name', 'version', 'repository', 'basename', 'state', 'date',
+        'size', 'votes', 'popularity',
+        )
+
     name = ''
     version = ''
     repository = ''
@@ -1086,15 +3421,46 @@ class Summary(object):
     size = -1
     votes = -1
     popularity = -1
+    tier = 3
+    score = 0.0
+
+
+class Page(list):
+    # one page of ranked results, with the token for the next one
+    token = None
 
 
 class BasePackage(object):
     _base = None
+    _values = None
+    _size = 0
     _match = re.compile(r'^([^\s<>=:]*)\s*(.*?)$').match
+    _volatile = ('backup',)
+    _large = ('tree', 'log', 'cache', 'files')
+    _budget = 1 << 20
+
+    def __getitem__(self, key):
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        elif key in values:
+            return values[key]
+        value = self._compute(key)
+        if key not in self._volatile:
+            if key in self._large:
+                size = _sizeof(value)
+                if self._size + size > self._budget:
+                    return value
+                self._size += size
+            values[key] = value
+        return value
 
     def _tree(self):
         result = {'installed': 0, 'missing': 0, 'aur': 0,
                   'isize': 0, 'msize': 0}
+        resolved = {}
+        if self['state'] & (State.AUR | State.Foreign):
+            resolved = backend.prefetch_tree(self)
         def tree(parent, seen=None):
             output = []
             if seen is None:
@@ -1105,7 +3471,9 @@ class BasePackage(object):
                     if provides in seen:
                         continue
                     seen.add(provides)
-                    package = backend.get_package(provides)
+                    package = resolved.get(provides)
+                    if package is None:
+                        package = backend.get_package(provides)
                     if isinstance(package, NullPackage):
                         continue
                     name = package['name']
@@ -1178,7 +3546,7 @@ class Package(BasePackage):
             node = alpm.list_next(node)
         return items
 
-    def __getitem__(self, key):
+    def _compute(self, key):
         if key == 'name':
             return alpm.pkg_get_name(self._base)
         elif key == 'version':
@@ -1295,7 +3663,7 @@ class AurPackage(BasePackage):
             value = self._base.get(key)
         return value
 
-    def __getitem__(self, key):
+    def _compute(self, key):
         if key == 'name':
             name = self._find(key, 'Name')
             if isinstance(name, list):
@@ -1389,7 +3757,7 @@ class NullPackage(BasePackage):
     def __init__(self, name):
         self._name = name
 
-    def __getitem__(self, key):
+    def _compute(self, key):
         if key == 'name':
             return self._name
         elif key == 'state':
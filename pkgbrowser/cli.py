@@ -0,0 +1,312 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import time
+# taken before anything else is imported, for the startup timings
+STARTED = time.perf_counter()
+
+import sys, os, json, getopt
+from configparser import RawConfigParser, Error as ConfigError
+
+
+APPLICATION = 'PkgBrowser'
+VERSION = '0.20.1'
+
+SHORT_OPTIONS = 'hVutq:bk:s:l:aoje:x:'
+LONG_OPTIONS = [
+    'help', 'version', 'update', 'timings', 'query=', 'batch', 'keys=',
+    'scope=', 'limit=', 'aur', 'offline', 'json', 'engine=', 'export=',
+    ]
+
+KEYS = (
+    'name', 'description', 'depends', 'provides', 'replaces',
+    'optdepends', 'maintainer', 'files',
+    )
+SCOPES = ('all', 'installed', 'noninstalled')
+
+
+def application_name():
+    return APPLICATION.lower()
+
+def read_settings():
+    # the same ini files that QSettings reads, without loading qt
+    home = os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser(
+        '~/.config')
+    parser = RawConfigParser()
+    for root in ('/etc', home):
+        path = os.path.join(root, application_name(),
+                            '%s.conf' % application_name())
+        try:
+            parser.read(path)
+        except (ConfigError, UnicodeError):
+            print(':: WARNING: could not read config file:', path,
+                  file=sys.stderr)
+    settings = {}
+    if parser.has_section('options'):
+        for key, value in parser.items('options'):
+            if len(value) > 1 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            settings[key] = value
+    return settings
+
+def cache_directory(settings=None):
+    if settings is None:
+        settings = read_settings()
+    return (settings.get('cache-directory') or
+            os.path.join('/var/cache', application_name()))
+
+def usage():
+    print("""
+usage: %s [opts]
+
+options:
+ -h  display this help and exit
+ -V  display version information
+ -u  create/update files cache
+ -t  print startup timings and exit after the window is first painted
+
+query options (no gui):
+ -q, --query PATTERN  search for packages matching PATTERN
+ -b, --batch          read patterns from stdin, one query per line
+ -k, --keys KEYS      comma-separated search keys (default: name)
+ -s, --scope SCOPE    all, installed or noninstalled (default: all)
+ -l, --limit N        only show the N best matches
+ -a, --aur            include the AUR in searches
+ -o, --offline        work offline
+ -j, --json           print newline-delimited json
+ -e, --engine ENGINE  search indexes: python or sqlite (default: python)
+ -x, --export PATH    write all package data to an sqlite database
+""" % application_name())
+
+
+class Query(object):
+    States = (
+        ('installed', 'Installed'),
+        ('noninstalled', 'NonInstalled'),
+        ('explicit', 'Explicit'),
+        ('dependency', 'Dependency'),
+        ('optional', 'Optional'),
+        ('orphan', 'Orphan'),
+        ('foreign', 'Foreign'),
+        ('upgrade', 'Upgrade'),
+        ('downgrade', 'Downgrade'),
+        ('aur', 'AUR'),
+        )
+
+    def __init__(self, backend, keys=(), scope='all', aur=False, limit=0):
+        from pkgbrowser.enum import State
+        self._backend = backend
+        self._state = State
+        self._keys = self.parse_keys(keys)
+        self._scope = self.parse_scope(scope)
+        self._aur = bool(aur)
+        self._limit = self.parse_limit(limit)
+
+    @staticmethod
+    def parse_keys(keys):
+        if isinstance(keys, str):
+            keys = [key.strip().lower() for key in keys.split(',')]
+        keys = [key for key in keys if key]
+        for key in keys:
+            if key not in KEYS:
+                raise ValueError('invalid search key: %s' % key)
+        return keys or ['name']
+
+    @staticmethod
+    def parse_scope(scope):
+        scope = (scope or 'all').lower()
+        if scope not in SCOPES:
+            raise ValueError('invalid search scope: %s' % scope)
+        return scope
+
+    @staticmethod
+    def parse_limit(limit):
+        try:
+            value = int(limit or 0)
+        except (TypeError, ValueError):
+            value = -1
+        if value < 0:
+            raise ValueError('invalid result limit: %s' % limit)
+        return value
+
+    def filters(self, scope, aur, keys):
+        State = self._state
+        if scope == 'installed':
+            filters = State.Installed
+        elif scope == 'noninstalled':
+            filters = State.NonInstalled | State.Update
+        else:
+            filters = State.Installed | State.NonInstalled | State.Update
+        if aur and 'files' not in keys:
+            filters |= State.AUR
+        return filters
+
+    def request(self, line):
+        # a request is either a bare pattern or a json object that can
+        # override the command line options for a single query, and ask for
+        # the page after a previous result
+        line = line.strip()
+        if not line.startswith('{'):
+            return line, self._keys, self._scope, self._aur, self._limit, None
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError('request must be a json object')
+        token = request.get('token')
+        return (
+            str(request.get('query', '')).strip(),
+            self.parse_keys(request.get('keys', self._keys)),
+            self.parse_scope(request.get('scope', self._scope)),
+            bool(request.get('aur', self._aur)),
+            self.parse_limit(request.get('limit', self._limit)),
+            None if token is None else str(token),
+            )
+
+    def run(self, line):
+        from pkgbrowser.backend import BackendError
+        start = time.time()
+        result = {'query': line.strip()}
+        try:
+            text, keys, scope, aur, limit, token = self.request(line)
+            result['query'] = text
+            if not text:
+                raise ValueError('empty search pattern')
+            if token is not None and not limit:
+                raise ValueError('a token needs a limit')
+            items = self._backend.find(
+                text, self.filters(scope, aur, keys), keys, limit, token)
+        except (BackendError, ValueError) as exception:
+            result['error'] = str(exception)
+        else:
+            result['results'] = [self.encode(item) for item in items]
+            if getattr(items, 'token', None) is not None:
+                result['next'] = items.token
+        result['time'] = round(time.time() - start, 6)
+        return result
+
+    def encode(self, summary):
+        item = dict((field, getattr(summary, field))
+                    for field in summary.Fields)
+        item['state'] = [name for name, flag in self.States
+                         if summary.state & getattr(self._state, flag)]
+        return item
+
+
+def write(result, as_json, batch=False, output=None):
+    output = output or sys.stdout
+    if as_json:
+        output.write(json.dumps(result, sort_keys=True) + '\n')
+    else:
+        if batch:
+            output.write(':: %s\n' % result['query'])
+        if 'error' in result:
+            print(':: ERROR:', result['error'], file=sys.stderr)
+        else:
+            for item in result['results']:
+                output.write('%s/%s %s\n' % (
+                    item['repository'], item['name'], item['version']))
+    output.flush()
+
+def open_backend(options, settings):
+    from pkgbrowser.backend import backend, Cache, BackendError
+    Cache.set_path(cache_directory(settings))
+    backend.set_offline('-o' in options)
+    backend.set_inline(True)
+    try:
+        backend.set_engine(
+            options.get('-e') or settings.get('search-engine') or 'python')
+    except (BackendError, ValueError) as exception:
+        print(':: ERROR:', exception, file=sys.stderr)
+        return None
+    try:
+        backend.initialize()
+    except BackendError as exception:
+        print(':: ERROR: could not load package databases:', file=sys.stderr)
+        print('::  ', exception, file=sys.stderr)
+        return None
+    return backend
+
+def query(options):
+    try:
+        keys = Query.parse_keys(options.get('-k', ''))
+        scope = Query.parse_scope(options.get('-s', 'all'))
+        limit = Query.parse_limit(options.get('-l', 0))
+    except ValueError as exception:
+        print(':: ERROR:', exception, file=sys.stderr)
+        return 2
+    as_json = '-j' in options
+    backend = open_backend(options, read_settings())
+    if backend is None:
+        return 1
+    search = Query(backend, keys, scope, '-a' in options, limit)
+    status = 0
+    try:
+        if '-b' in options:
+            for line in sys.stdin:
+                if not line.strip():
+                    continue
+                result = search.run(line)
+                if 'error' in result:
+                    status = 1
+                write(result, as_json, True)
+        else:
+            result = search.run(options['-q'])
+            if 'error' in result:
+                status = 1
+            write(result, as_json)
+    except BrokenPipeError:
+        sys.stderr.close()
+    except KeyboardInterrupt:
+        status = 130
+    finally:
+        backend.release()
+    return status
+
+def export(options):
+    # the export always goes through the sqlite engine, so the store in the
+    # cache directory is brought up to date on the way
+    from pkgbrowser.backend import BackendError
+    options = dict(options, **{'-e': 'sqlite'})
+    backend = open_backend(options, read_settings())
+    if backend is None:
+        return 1
+    path = os.path.abspath(options['-x'])
+    try:
+        backend.export_store(path)
+    except (BackendError, EnvironmentError) as exception:
+        print(':: ERROR: could not export package data:', exception,
+              file=sys.stderr)
+        return 1
+    finally:
+        backend.release()
+    print(path)
+    return 0
+
+def run():
+    aliases = {
+        '--help': '-h', '--version': '-V', '--update': '-u',
+        '--timings': '-t', '--query': '-q', '--batch': '-b', '--keys': '-k',
+        '--scope': '-s', '--limit': '-l', '--aur': '-a', '--offline': '-o',
+        '--json': '-j', '--engine': '-e', '--export': '-x',
+        }
+    try:
+        options, args = getopt.getopt(
+            sys.argv[1:], SHORT_OPTIONS, LONG_OPTIONS)
+    except getopt.GetoptError as exception:
+        print(':: ERROR:', exception)
+        usage()
+        return 2
+    options = dict((aliases.get(key, key), value) for key, value in options)
+    if '-h' in options:
+        usage()
+    elif '-V' in options:
+        print('%s-%s' % (APPLICATION, VERSION))
+    elif '-u' in options:
+        from pkgbrowser.conf import update_cache
+        return update_cache(cache_directory(), APPLICATION)
+    elif '-x' in options:
+        return export(options)
+    elif '-q' in options or '-b' in options:
+        return query(options)
+    else:
+        from pkgbrowser import app
+        return app.run(STARTED if '-t' in options else None)
+    return 0
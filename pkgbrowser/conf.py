@@ -1,26 +1,48 @@
 # Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
 
-import os, re, glob, time, signal
-import urllib.request
+import os, re, glob, time, json, pickle, signal
+import urllib.parse
 from email.utils import parsedate
 from tarfile import TarFile, TarError
 from zipfile import ZipFile, BadZipfile, ZIP_DEFLATED
 from tempfile import TemporaryFile
 from collections import defaultdict
 from io import BytesIO
+from threading import Thread
+from queue import Queue, Empty
 from multiprocessing import Pool, TimeoutError
+from multiprocessing.pool import ThreadPool
 from pkgbrowser import utils
 
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
 
 PM_ROOT_DIR = '/'
 PM_DB_PATH = '/var/lib/pacman'
-PM_CONF_FILE = '/etc/pacman.conf'
+PM_CONF_FILE = os.environ.get('PM_CONF_FILE', '/etc/pacman.conf')
 PM_LOG_FILE = '/var/log/pacman.log'
 PM_CACHE_DIRS = ('/var/cache/pacman/pkg',)
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+MIRROR_STATS = 'mirrors.json'
+MIRROR_PROBES = 5
+MIRROR_TIMEOUT = 30
+MIRROR_GRACE = 0.5
+MIRROR_CHUNK = 4 << 20
+SNAPSHOT_FILE = 'summaries.pickle'
+HISTORY_FILE = 'versions.pickle'
+WORDS_FILE = '%s.words.pickle'
+TRIGRAMS_FILE = '%s.%s.trigrams'
+STORE_FILE = 'packages.sqlite'
 
 match_pkgfile = re.compile(r"""
     ^(.+)-([^-\s]+-[^-\s]+)-(i686|x86_64|any)
-    \.pkg\.tar(?:\.(?:gz|bz2|xz|Z))?$
+    \.pkg\.tar(?:\.(?:gz|bz2|xz|zst|lz4|lrz|lzo|lz|Z))?$
     """, re.X).match
 
 
@@ -161,8 +183,260 @@ def load_srcinfo(pkgname, data):
     srcinfo.update(pkgbase)
     return srcinfo
 
+def get_dbpath(config):
+    rootdir = config.get('RootDir')
+    if rootdir:
+        return config.get('DBPath', os.path.join(
+            rootdir, PM_DB_PATH.lstrip('/')))
+    return config.get('DBPath', PM_DB_PATH)
+
+def get_filesdb(dbpath, name):
+    path = os.path.join(dbpath, 'sync', '%s.files' % name)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    try:
+        if mtime < os.path.getmtime(
+            os.path.join(dbpath, 'sync', '%s.db' % name)):
+            return None
+    except OSError:
+        pass
+    return path
+
+def open_archive(archive):
+    magic = archive.read(len(ZSTD_MAGIC))
+    archive.seek(0)
+    if magic == ZSTD_MAGIC:
+        if zstd is None:
+            raise TarError('zstd compression requires python-zstandard')
+        elif hasattr(zstd, 'ZstdFile'):
+            stream = zstd.ZstdFile(archive)
+        else:
+            stream = zstd.ZstdDecompressor().stream_reader(archive)
+        return TarFile.open(fileobj=stream, mode='r|')
+    return TarFile.open(fileobj=archive)
+
+def convert_archive(archive, path, comment=b''):
+    temp = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with ZipFile(temp, 'w', ZIP_DEFLATED) as zip:
+            with open_archive(archive) as tar:
+                for info in tar:
+                    if info.isfile() and info.name.endswith('/files'):
+                        state = 0
+                        lines = [b'']
+                        stream = tar.extractfile(info)
+                        for line in stream:
+                            if line.isspace():
+                                state = 0
+                            elif state == 1:
+                                lines.append(line)
+                            elif state == 2:
+                                continue
+                            elif line.startswith(b'%FILES%'):
+                                state = 1
+                            elif line.startswith(b'%BACKUP%'):
+                                state = 2
+                        lines = b'/'.join(sorted(lines))
+                        if len(lines) > 1:
+                            lines = b'\n' + lines
+                        zip.writestr(info.name.split('/')[0], lines)
+                        stream.close()
+            zip.comment = comment
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+
+def load_mirror_stats(root):
+    try:
+        with open(os.path.join(root, MIRROR_STATS), 'r') as stream:
+            stats = json.load(stream)
+    except (EnvironmentError, ValueError):
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+def save_mirror_stats(root, stats):
+    path = os.path.join(root, MIRROR_STATS)
+    try:
+        with open(path + '.tmp', 'w') as stream:
+            json.dump(stats, stream, indent=1, sort_keys=True)
+        os.replace(path + '.tmp', path)
+    except EnvironmentError:
+        pass
+
+def load_snapshot(root, name=SNAPSHOT_FILE):
+    if not root:
+        return None
+    try:
+        with open(os.path.join(root, name), 'rb') as stream:
+            data = pickle.load(stream)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+def save_snapshot(root, data, name=SNAPSHOT_FILE):
+    if not root:
+        return
+    path = os.path.join(root, name)
+    try:
+        if not os.path.isdir(root):
+            os.makedirs(root)
+        with open(path + '.tmp', 'wb') as stream:
+            pickle.dump(data, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+    except EnvironmentError:
+        pass
+
+def is_writable(root):
+    # whether files can be saved in root, which is created if necessary
+    if not root:
+        return False
+    path = os.path.abspath(root)
+    while not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False
+        path = parent
+    return os.access(path, os.W_OK | os.X_OK)
+
+def _mirror(url):
+    parts = urllib.parse.urlsplit(url)
+    return '%s://%s' % (parts.scheme, parts.netloc)
+
+def _update_stats(stats, url, latency=None, throughput=None):
+    item = stats.setdefault(_mirror(url), {})
+    if latency is None:
+        item['failures'] = item.get('failures', 0) + 1
+    else:
+        item['failures'] = 0
+        for key, value in (('latency', latency), ('throughput', throughput)):
+            if value is not None:
+                previous = item.get(key)
+                if previous is not None:
+                    value = 0.7 * previous + 0.3 * value
+                item[key] = value
+    item['updated'] = int(time.time())
+
+def _rank_mirrors(urls, stats):
+    def score(item):
+        index, url = item
+        info = stats.get(_mirror(url))
+        if info is None:
+            return 1, 0, index
+        return min(info.get('failures', 0), 3), info.get('latency', 0), index
+    return [url for index, url in sorted(enumerate(urls), key=score)]
+
+def _probe(url):
+    # urllib.request is only loaded when the cache is being updated
+    import urllib.request, http.client
+    start = time.time()
+    try:
+        request = urllib.request.Request(url, method='HEAD')
+        response = urllib.request.urlopen(request, timeout=MIRROR_TIMEOUT)
+        try:
+            info = response.info()
+            modified = parsedate(info.get('last-modified'))
+            if modified is not None:
+                modified = time.mktime(modified)
+            size = info.get('content-length')
+            ranges = info.get('accept-ranges') == 'bytes'
+        finally:
+            response.close()
+    except (IOError, ValueError, http.client.HTTPException):
+        return url, None, None, None, False
+    return (url, time.time() - start, modified,
+            int(size) if size and size.isdigit() else None, ranges)
+
+def _probe_mirrors(urls, stats):
+    results = Queue()
+    for url in urls:
+        thread = Thread(target=lambda url=url: results.put(_probe(url)))
+        thread.daemon = True
+        thread.start()
+    probes = []
+    pending = set(urls)
+    deadline = time.time() + MIRROR_TIMEOUT
+    while pending:
+        try:
+            result = results.get(timeout=max(0, deadline - time.time()))
+        except Empty:
+            break
+        pending.discard(result[0])
+        _update_stats(stats, result[0], result[1])
+        if result[1] is not None:
+            if not probes:
+                deadline = min(deadline, time.time() + max(
+                    MIRROR_GRACE, 2 * result[1]))
+            probes.append(result)
+    # a mirror that only missed the grace period is slow, not broken
+    if not probes:
+        for url in pending:
+            _update_stats(stats, url)
+    return probes
+
+def _fetch(url, start=None, end=None):
+    import urllib.request
+    request = urllib.request.Request(url)
+    if start is not None:
+        request.add_header('Range', 'bytes=%d-%d' % (start, end - 1))
+    response = urllib.request.urlopen(request, timeout=MIRROR_TIMEOUT)
+    try:
+        if start is not None and response.status != 206:
+            raise IOError('range request ignored: %s' % url)
+        data = response.read()
+    finally:
+        response.close()
+    if start is not None and len(data) != end - start:
+        raise IOError('incomplete range: %s' % url)
+    return data
+
+def _download(candidates, current, stats):
+    import http.client
+    size = candidates[0][3]
+    ranged = [url for url, latency, modified, length, ranges in candidates
+              if ranges and length == size and modified == current]
+    if size and size >= MIRROR_CHUNK * 2 and len(ranged) > 1:
+        chunks = [(offset, min(offset + MIRROR_CHUNK, size))
+                  for offset in range(0, size, MIRROR_CHUNK)]
+        def fetch(index):
+            start, end = chunks[index]
+            for attempt in range(len(ranged)):
+                url = ranged[(index + attempt) % len(ranged)]
+                begin = time.time()
+                try:
+                    data = _fetch(url, start, end)
+                except (IOError, http.client.HTTPException):
+                    _update_stats(stats, url)
+                else:
+                    _update_stats(stats, url, time.time() - begin,
+                                  len(data) / max(time.time() - begin, 1e-6))
+                    return data
+        pool = ThreadPool(min(len(ranged) * 2, len(chunks)))
+        try:
+            parts = pool.map(fetch, range(len(chunks)))
+        finally:
+            pool.terminate()
+        if all(part is not None for part in parts):
+            return ranged[0], b''.join(parts)
+    for url, latency, modified, length, ranges in candidates:
+        begin = time.time()
+        try:
+            data = _fetch(url)
+        except (IOError, http.client.HTTPException):
+            _update_stats(stats, url)
+        else:
+            _update_stats(stats, url, latency,
+                          len(data) / max(time.time() - begin, 1e-6))
+            return url, data
+    return None, None
+
 def _process_archive(args):
-    path, root, urls, comment = args
+    path, root, urls, comment, filesdb, stats = args
     archive = None
     timestamp = 0
     try:
@@ -174,67 +448,53 @@ def _process_archive(args):
             zip.close()
     except (EnvironmentError, BadZipfile):
         pass
-    for url in urls:
-        url = utils.make_url(url)
+    if filesdb is not None:
+        if os.path.getmtime(filesdb) <= timestamp:
+            print(':: already up to date: [%s.files]' % root)
+            return True, stats
         try:
-            response = urllib.request.urlopen(url, timeout=30)
-            current = parsedate(response.info().get('last-modified'))
-            if current is not None:
-                current = time.mktime(current)
-            try:
-                if current is None or current > timestamp:
-                    archive = BytesIO(response.read())
-                else:
-                    print(':: already up to date: [%s.files]' % root)
-                    return True
-            finally:
-                response.close()
+            archive = open(filesdb, 'rb')
         except IOError:
             pass
         else:
-            print(':: download succeeded: [%s.files] (%s)' % (root, url))
+            print(':: using local database: [%s.files] (%s)' % (
+                  root, filesdb))
+            urls = ()
+    urls = [utils.make_url(url) for url in _rank_mirrors(urls, stats)]
+    # the best ranked mirrors are probed first, and the rest in further
+    # batches until one of them delivers the file-lists
+    for index in range(0, len(urls), MIRROR_PROBES):
+        if archive is not None:
             break
+        probes = _probe_mirrors(urls[index:index + MIRROR_PROBES], stats)
+        if not probes:
+            continue
+        current = max(probe[2] or 0 for probe in probes)
+        if current and current <= timestamp:
+            print(':: already up to date: [%s.files]' % root)
+            return True, stats
+        candidates = sorted(probes, key=lambda probe: (
+            (probe[2] or 0) != current, probe[1]))
+        url, data = _download(candidates, candidates[0][2], stats)
+        if data is not None:
+            archive = BytesIO(data)
+            print(':: download succeeded: [%s.files] (%s)' % (root, url))
     if archive is not None:
         try:
-            with ZipFile(path, 'w', ZIP_DEFLATED) as zip:
-                print(':: converting archive: [%s.files] ...' % root)
-                with TarFile.open(fileobj=archive) as tar:
-                    for info in tar:
-                        if info.isfile() and info.name.endswith('/files'):
-                            state = 0
-                            lines = [b'']
-                            stream = tar.extractfile(info)
-                            for line in stream:
-                                if line.isspace():
-                                    state = 0
-                                elif state == 1:
-                                    lines.append(line)
-                                elif state == 2:
-                                    continue
-                                elif line.startswith(b'%FILES%'):
-                                    state = 1
-                                elif line.startswith(b'%BACKUP%'):
-                                    state = 2
-                            lines = b'/'.join(sorted(lines))
-                            if len(lines) > 1:
-                                lines = b'\n' + lines
-                            zip.writestr(info.name.split('/')[0], lines)
-                            stream.close()
-                zip.comment = comment
+            print(':: converting archive: [%s.files] ...' % root)
+            try:
+                convert_archive(archive, path, comment)
+            finally:
                 archive.close()
-            return True
+            return True, stats
         except (EnvironmentError, TarError, UnicodeError) as exception:
             print(':: ERROR: failed to convert archive: '
                   '[%s.files]' % root)
             print('::  ', exception)
-            try:
-                os.remove(path)
-            except OSError:
-                pass
     else:
         print(':: ERROR: could not find a valid mirror: '
               '[%s.files]' % root)
-    return False
+    return False, stats
 
 def update_cache(root, comment=''):
     try:
@@ -256,18 +516,28 @@ def update_cache(root, comment=''):
             args = []
             if not isinstance(comment, bytes):
                 comment = comment.encode('utf-8')
+            dbpath = get_dbpath(config)
+            stats = load_mirror_stats(root)
             for name in config['Repositories']:
                 mirrors = config['Servers'].get(name, [])
                 urls = [os.path.join(mirror, '%s.files.tar.gz' % name)
                         for mirror in mirrors]
                 path = os.path.join(root, '%s.files.zip' % name)
-                args.append((path, name, urls, comment))
+                filesdb = get_filesdb(dbpath, name)
+                args.append((path, name, urls, comment, filesdb, stats))
             if args:
                 def initializer():
                     signal.signal(signal.SIGINT, signal.SIG_IGN)
                 pool = Pool(initializer=initializer)
                 start = time.time()
-                if all(pool.map_async(_process_archive, args).get(1000)):
+                results = pool.map_async(_process_archive, args).get(1000)
+                for result in results:
+                    for mirror, item in result[1].items():
+                        if item.get('updated', 0) >= stats.get(
+                            mirror, {}).get('updated', 0):
+                            stats[mirror] = item
+                save_mirror_stats(root, stats)
+                if all(result[0] for result in results):
                     seconds = time.time() - start
                     print(':: update completed in %.1f seconds' % seconds)
                     return 0
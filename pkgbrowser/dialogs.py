@@ -0,0 +1,60 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+from PyQt5.QtCore import Qt, QFile
+from PyQt5.QtWidgets import qApp, QDialog
+from pkgbrowser.backend import backend
+from pkgbrowser.ui.about import Ui_AboutDialog
+from pkgbrowser.ui.help import Ui_HelpDialog
+
+
+class AboutDialog(QDialog, Ui_AboutDialog):
+    def __init__(self):
+        QDialog.__init__(self, qApp.window())
+        self.setupUi(self)
+        self.setWindowFlags(
+            self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        from sys import version as py_version
+        from PyQt5.QtCore import qVersion, PYQT_VERSION_STR
+        url = qApp.applicationUrl()
+        title = qApp.applicationTitle()
+        self.setWindowTitle('About - %s' % title)
+        self.title.setText(
+            """<h2>%s %s</h2>""" % (title, qApp.applicationVersion())
+            )
+        self.details.setText(self.tr("""
+            <div align="center">
+            <p>A utility for browsing pacman databases and the AUR</p>
+            <p>Copyright &copy; 2010-2017, kachelaqa<br>
+            &lt;kachelaqa@gmail.com&gt;</p>
+            <p><a href="%s">%s</a></p>
+            <p>Using:<br>Qt %s<br>Python %s<br>PyQt %s<br>libalpm %s</p>
+            </div>
+            """
+            % (url, url, qVersion(), py_version.split()[0],
+               PYQT_VERSION_STR, backend.version())
+            ))
+        self.information.currentChanged.connect(self.handleInformationChanged)
+        self.details.linkActivated.connect(qApp.window().openLink)
+
+    def handleInformationChanged(self, index):
+        tab = self.information.widget(index)
+        if tab is self.licenseTab:
+            if self.license.document().isEmpty():
+                stream = QFile(':/LICENSE')
+                if stream.open(QFile.ReadOnly):
+                    self.license.setPlainText(str(stream.readAll(), 'utf-8'))
+                    stream.close()
+
+
+class HelpDialog(QDialog, Ui_HelpDialog):
+    def __init__(self):
+        QDialog.__init__(self, qApp.window())
+        self.setupUi(self)
+        self.setWindowFlags(
+            self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.setWindowTitle('Manual - %s' % qApp.applicationTitle())
+        stream = QFile(':/doc/manual.html')
+        if stream.open(QFile.ReadOnly):
+            self.browser.setHtml(str(stream.readAll(), 'utf-8'))
+            stream.close()
+        self.browser.anchorClicked.connect(qApp.window().openLink)
@@ -18,6 +18,7 @@ class State(object):
     Category = alpm.PKG_STATUS_MAX << 2
     Unknown = alpm.PKG_STATUS_MAX << 3
     Database = alpm.PKG_STATUS_MAX << 4
+    Changes = alpm.PKG_STATUS_MAX << 5
     del alpm
 
 class Validation(object):
@@ -311,26 +311,89 @@ class Format(object):
             <html><head><style type="text/css">
             table {margin-top: 10; margin-bottom: 10; margin-right: 20}
             </style></head><body>
-            <div><table width="320">
             """]
         row = """
             <tr><td><b>%s</b></td>
-            <td align="right" width="40%%">%s</td>
+            <td align="right" width="25%%">%s</td>
+            <td align="right" width="25%%">%s</td>
             <td align="right">%s</td></tr>
             """
-        line = """<tr><td colspan="3"><hr></td></tr>"""
-        markup.append(row % (
-            """<b>%s</b>""" % self._escape(self.tr('Repository')),
-            """<b>%s</b>""" % self._escape(self.tr('Count')),
-            """<b>%s</b>""" % self._escape(self.tr('Installed Size')),
-            ))
-        markup.append(line)
-        for key, count, size in data:
+        line = """<tr><td colspan="4"><hr></td></tr>"""
+        def header(*labels):
+            markup.append("""<div><table width="400">""")
+            markup.append(row % tuple(
+                """<b>%s</b>""" % self._escape(label) for label in labels))
+            markup.append(line)
+        header(self.tr('Repository'), self.tr('Installed'),
+               self.tr('Installed Size'), self.tr('Packages'))
+        for key, count, size, available in data['repositories']:
             if key == 'total':
-                key = self._escape(self.tr('Total'))
+                key = self.tr('Total')
                 markup.append(line)
-            markup.append(row % (key, count, self.size(size, 0)))
-        markup.append("""</table></div></body></html>""")
+            markup.append(row % (self._escape(key), count,
+                                 self.size(size, 0), available))
+        markup.append("""</table></div>""")
+        reasons = {
+            'explicit': self.tr('Explicit'),
+            'dependency': self.tr('Dependency'),
+            'optional': self.tr('Optional'),
+            'orphan': self.tr('Orphan'),
+            'foreign': self.tr('Foreign'),
+            }
+        sections = (
+            ('reasons', self.tr('Reason'), reasons),
+            ('licenses', self.tr('License'), None),
+            ('packagers', self.tr('Packager'), None),
+            ('months', self.tr('Installed In'), None),
+            )
+        for key, title, labels in sections:
+            header(title, self.tr('Count'), self.tr('Installed Size'), '')
+            for name, count, size in data[key]:
+                if labels is not None:
+                    name = labels.get(name, name)
+                markup.append(row % (self._escape(name or self.tr('None')),
+                                     count, self.size(size, 0), ''))
+            markup.append("""</table></div>""")
+        markup.append("""</body></html>""")
+        return ''.join(markup)
+
+    def timings(self, stages, memory=None):
+        labels = {
+            'index': self.tr('Files indexing'),
+            'pool': self.tr('Worker startup'),
+            'alpm': self.tr('Database scan'),
+            'snapshot': self.tr('Package snapshot'),
+            'match': self.tr('Pattern matching'),
+            'files': self.tr('Files lookup'),
+            'filter': self.tr('Filtering'),
+            'network': self.tr('Network requests'),
+            'download': self.tr('Downloads'),
+            'worker': self.tr('Worker time'),
+            'pickle': self.tr('Serialization'),
+            'unpickle': self.tr('Deserialization'),
+            'model': self.tr('List population'),
+            'total': self.tr('Total'),
+            }
+        markup = ["""<html><body><table>"""]
+        row = """
+            <tr><td>%s</td><td align="right">%.1f ms</td>
+            <td align="right">%s</td></tr>
+            """
+        for stage, seconds, count in stages:
+            label = self._escape(labels.get(stage, stage))
+            if stage == 'total':
+                label = """<b>%s</b>""" % label
+                count = ''
+            else:
+                count = '&times;%d' % count
+            markup.append(row % (label, seconds * 1000, count))
+        if memory and memory[0]:
+            markup.append("""
+                <tr><td>%s</td><td align="right">%s</td>
+                <td align="right">&times;%d</td></tr>
+                """ % (self._escape(self.tr('Worker memory')),
+                       self._escape(self.size(memory[1])), memory[0]))
+        markup.append("""</table></body></html>""")
         return ''.join(markup)
 
     def file(self, text, source):
@@ -0,0 +1,287 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import os, re, mmap, struct
+from array import array
+from bisect import bisect_left, bisect_right
+from math import log
+from collections import defaultdict
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse, sre_constants
+
+
+INDEX_VERSION = 3
+
+_words = re.compile(r'\w+').findall
+
+
+def tokenize(text):
+    # casefold rather than lower, so that words match at least everything
+    # that a case-insensitive regexp does
+    return _words(text.casefold())
+
+
+class Segment(object):
+    # an inverted index of the words in the names and descriptions of the
+    # packages in one database. the vocabulary is also kept as a single
+    # string, so that words containing a substring are found with str.find
+    # rather than by testing every word
+    def __init__(self, stamp, entries):
+        self.stamp = stamp
+        self.names = []
+        postings = defaultdict(list)
+        for name, description in entries:
+            row = len(self.names)
+            self.names.append(name)
+            for word in set(tokenize(name) + tokenize(description or '')):
+                postings[word].append(row)
+        self.vocabulary = sorted(postings)
+        self.postings = [array('l', postings[word])
+                         for word in self.vocabulary]
+        self.text = '\n'.join(self.vocabulary)
+        self.offsets = array('l')
+        offset = 0
+        for word in self.vocabulary:
+            self.offsets.append(offset)
+            offset += len(word) + 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def lookup(self, piece):
+        # the rows of all packages with a word that contains piece
+        rows = set()
+        offsets = self.offsets
+        start = self.text.find(piece)
+        while start >= 0:
+            index = bisect_right(offsets, start) - 1
+            rows.update(self.postings[index])
+            if index + 1 >= len(offsets):
+                break
+            start = self.text.find(piece, offsets[index + 1])
+        return rows
+
+    def select(self, literals):
+        # literals holds the plain terms of each alternative element of a
+        # query, or None for elements that the index cannot narrow. returns
+        # the rows of the packages that may match (None if every package
+        # may match), and a weight for each word of the terms
+        hits = {}
+        selected = set()
+        narrowed = True
+        for terms in literals:
+            element = None
+            for term in terms or ():
+                for piece in tokenize(term):
+                    if piece not in hits:
+                        hits[piece] = self.lookup(piece)
+                    if element is None:
+                        element = set(hits[piece])
+                    else:
+                        element &= hits[piece]
+            if element is None:
+                narrowed = False
+            else:
+                selected |= element
+        total = len(self.names)
+        weights = dict((piece, log(1 + total / (1 + len(rows))))
+                       for piece, rows in hits.items())
+        if not narrowed:
+            return None, weights
+        return selected, weights
+
+    @staticmethod
+    def score(weights, name, description):
+        # term frequency in the description, weighted by the rarity of the
+        # word, with a boost for words found in the name
+        name = name.casefold()
+        description = (description or '').casefold()
+        score = 0.0
+        for piece, weight in weights.items():
+            score += weight * description.count(piece)
+            if piece == name:
+                score += weight * 4
+            elif name.startswith(piece):
+                score += weight * 3
+            elif piece in name:
+                score += weight * 2
+        return score
+
+
+class Trigrams(object):
+    # the rows of the packages containing each sequence of three bytes in
+    # the utf-8 values of one search key. the table is written to a file
+    # and mapped rather than loaded, so that even the files tables of large
+    # repositories open at once and are shared by the workers. folded
+    # tables ignore case, and are also valid for case-sensitive searches,
+    # since they only ever return more rows than needed
+    Magic = b'PBTRI001'
+    Header = struct.Struct('<8sBIIIQ')
+
+    @classmethod
+    def build(cls, path, stamp, entries, fold=True):
+        names = []
+        postings = defaultdict(lambda: array('I'))
+        for name, value in entries:
+            row = len(names)
+            names.append(name)
+            if value:
+                if fold:
+                    value = value.casefold()
+                data = value.encode('utf-8')
+                for gram in set(data[index:index + 3]
+                                for index in range(len(data) - 2)):
+                    postings[gram].append(row)
+        grams = sorted(postings)
+        offsets = array('Q', [0])
+        for gram in grams:
+            offsets.append(offsets[-1] + len(postings[gram]))
+        stamp = repr(stamp).encode('utf-8')
+        data = '\n'.join(names).encode('utf-8')
+        temp = path + '.tmp'
+        with open(temp, 'wb') as stream:
+            stream.write(cls.Header.pack(
+                cls.Magic, fold, len(stamp), len(data), len(grams),
+                offsets[-1]))
+            stream.write(stamp)
+            stream.write(data)
+            stream.write(array('I', (int.from_bytes(gram, 'big')
+                                     for gram in grams)).tobytes())
+            stream.write(offsets.tobytes())
+            for gram in grams:
+                stream.write(postings[gram].tobytes())
+        os.replace(temp, path)
+
+    def __init__(self, path):
+        with open(path, 'rb') as stream:
+            self._map = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, fold, stamp, size, count, total = (
+                self.Header.unpack_from(self._map))
+            if magic != self.Magic:
+                raise ValueError('invalid trigrams table: %s' % path)
+            start = self.Header.size
+            self.fold = bool(fold)
+            self.stamp = self._map[start:start + stamp].decode('utf-8')
+            start += stamp
+            names = self._map[start:start + size].decode('utf-8')
+            self.names = names.split('\n') if names else []
+            start += size
+            view = memoryview(self._map)
+            self._grams = view[start:start + 4 * count].cast('I')
+            start += 4 * count
+            self._offsets = view[start:start + 8 * (count + 1)].cast('Q')
+            start += 8 * (count + 1)
+            self._postings = view[start:start + 4 * total].cast('I')
+            view.release()
+        except Exception:
+            self._map.close()
+            raise
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, literal):
+        # the rows that may contain literal, or None for literals too short
+        # to narrow the search
+        if self.fold:
+            literal = literal.casefold()
+        data = literal.encode('utf-8')
+        grams = set(int.from_bytes(data[index:index + 3], 'big')
+                    for index in range(len(data) - 2))
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            index = bisect_left(self._grams, gram)
+            if index == len(self._grams) or self._grams[index] != gram:
+                return set()
+            postings.append(self._postings[
+                self._offsets[index]:self._offsets[index + 1]])
+        postings.sort(key=len)
+        rows = set(postings[0])
+        for other in postings[1:]:
+            rows.intersection_update(other)
+            if not rows:
+                break
+        return rows
+
+    def close(self):
+        for view in (self._grams, self._offsets, self._postings):
+            view.release()
+        self._map.close()
+
+
+def candidates(query, indexes):
+    # the rows that may match a query, where a term matches if any of the
+    # indexes contains it. queries are literal strings, ('and', queries),
+    # ('or', queries), or None for anything that cannot be narrowed
+    if query is None:
+        return None
+    if isinstance(query, str):
+        rows = set()
+        for index in indexes:
+            found = index.find(query)
+            if found is None:
+                return None
+            rows |= found
+        return rows
+    operator, queries = query
+    if operator == 'or':
+        rows = set()
+        for query in queries:
+            found = candidates(query, indexes)
+            if found is None:
+                return None
+            rows |= found
+        return rows
+    rows = None
+    for query in queries:
+        found = candidates(query, indexes)
+        if found is not None:
+            rows = found if rows is None else rows & found
+            if not rows:
+                break
+    return rows
+
+
+def pattern_query(pattern, fold=True):
+    # the literals that every match of a regexp must contain
+    try:
+        parsed = sre_parse.parse(pattern, re.M | (re.I if fold else 0))
+    except Exception:
+        return None
+    if not fold and parsed.state.flags & re.I:
+        return None
+    return _required(parsed, fold)
+
+
+_repeats = tuple(getattr(sre_constants, name) for name in (
+    'MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+    if hasattr(sre_constants, name))
+
+
+def _required(items, fold):
+    queries = []
+    run = []
+    for opcode, value in items:
+        if opcode == sre_constants.LITERAL:
+            run.append(chr(value))
+            continue
+        if run:
+            queries.append(''.join(run))
+            run = []
+        if opcode == sre_constants.SUBPATTERN:
+            if fold or not value[1] & re.I:
+                queries.append(_required(value[-1], fold))
+        elif opcode == sre_constants.BRANCH:
+            queries.append(('or', [_required(item, fold)
+                                   for item in value[1]]))
+        elif opcode in _repeats:
+            if value[0] >= 1:
+                queries.append(_required(value[2], fold))
+    if run:
+        queries.append(''.join(run))
+    return 'and', queries
@@ -0,0 +1,320 @@
+# Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
+
+import os, sqlite3
+
+
+STORE_VERSION = 2
+
+# the errors raised by the store, besides those of the filesystem
+Error = sqlite3.Error
+
+# connections inherited across a fork must not be used, and closing them
+# counts as using them, so they are kept here and left alone
+_inherited = []
+
+RELATIONS = ('depends', 'provides', 'replaces', 'optdepends')
+
+# the popularity of the summaries has no type, since it is -1 (an int) for
+# the packages that are not in the aur, and must come back as it was saved
+SCHEMA = """
+create table if not exists meta (
+    key text primary key, value text);
+create table if not exists repos (
+    name text primary key, stamp text);
+create table if not exists packages (
+    id integer primary key, repo text not null, position integer not null,
+    name text not null, version text, description text, url text,
+    arch text, packager text, builddate integer, installdate integer,
+    size integer);
+create index if not exists packages_repo on packages (repo, position);
+create index if not exists packages_name on packages (name);
+create table if not exists relations (
+    package integer not null, kind text not null, value text not null);
+create index if not exists relations_package on relations (package);
+create index if not exists relations_value on relations (kind, value);
+create table if not exists groups (
+    package integer not null, name text not null);
+create index if not exists groups_package on groups (package);
+create index if not exists groups_name on groups (name);
+create table if not exists files (
+    package integer not null, path text not null);
+create index if not exists files_package on files (package);
+create table if not exists aur (
+    name text primary key, basename text, version text, maintainer text,
+    votes integer, popularity real);
+create table if not exists summaries (
+    position integer primary key, repo text not null, name text not null,
+    version text, repository text, basename text, state integer,
+    date integer, size integer, votes integer, popularity,
+    update_version text, update_state integer, update_date integer,
+    update_size integer, current integer);
+create index if not exists summaries_name on summaries (repo, name);
+create virtual table if not exists text using fts5(
+    name, description, depends, provides, replaces, optdepends,
+    tokenize='trigram');
+create virtual table if not exists paths using fts5(
+    files, tokenize='trigram case_sensitive 1');
+"""
+
+
+def available():
+    # fts5 and its trigram tokenizer need sqlite 3.34 or later
+    connection = sqlite3.connect(':memory:')
+    try:
+        connection.execute(
+            "create virtual table probe using fts5(x, tokenize='trigram')")
+    except sqlite3.Error:
+        return False
+    finally:
+        connection.close()
+    return True
+
+
+class Store(object):
+    # the package universe as an sqlite database, for searches and for any
+    # other tools. each repository is replaced as a whole when its stamp
+    # changes, and the rows of a package keep its position in the pkgcache
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._pid = None
+
+    def connection(self):
+        # the backend closes the store before forking its workers, so this
+        # is only a safety net: each process opens its own connection
+        if self._connection is not None and self._pid != os.getpid():
+            _inherited.append(self._connection)
+            self._connection = None
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            self._connection = sqlite3.connect(self.path)
+            self._pid = os.getpid()
+            self._prepare(self._connection)
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            if self._pid == os.getpid():
+                self._connection.close()
+            else:
+                _inherited.append(self._connection)
+        self._connection = None
+        self._pid = None
+
+    def _prepare(self, connection):
+        row = None
+        try:
+            row = connection.execute(
+                "select value from meta where key = 'version'").fetchone()
+        except sqlite3.Error:
+            pass
+        if row is None or row[0] != str(STORE_VERSION):
+            connection.close()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            connection = self._connection = sqlite3.connect(self.path)
+            with connection:
+                connection.executescript(SCHEMA)
+                connection.execute(
+                    "insert into meta values ('version', ?)",
+                    (str(STORE_VERSION),))
+
+    def stamp(self, repo):
+        row = self.connection().execute(
+            'select stamp from repos where name = ?', (repo,)).fetchone()
+        return row[0] if row is not None else None
+
+    def stamps(self):
+        return dict(self.connection().execute('select name, stamp from repos'))
+
+    def update(self, repo, stamp, packages):
+        # packages yields the attributes of each package in pkgcache order,
+        # with a dict of its joined relations, its groups and its files
+        connection = self.connection()
+        with connection:
+            self._delete(connection, repo)
+            for position, package in enumerate(packages):
+                (name, version, description, url, arch, packager, builddate,
+                 installdate, size, relations, groups, files) = package
+                cursor = connection.execute(
+                    'insert into packages values '
+                    '(null, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (repo, position, name, version, description, url, arch,
+                     packager, builddate, installdate, size))
+                identifier = cursor.lastrowid
+                connection.executemany(
+                    'insert into relations values (?, ?, ?)',
+                    ((identifier, kind, value) for kind in RELATIONS
+                     for value in (relations.get(kind) or '').split('\n')
+                     if value))
+                connection.executemany(
+                    'insert into groups values (?, ?)',
+                    ((identifier, group) for group in groups))
+                connection.executemany(
+                    'insert into files values (?, ?)',
+                    ((identifier, path) for path in
+                     (files or '').split('\n') if path))
+                connection.execute(
+                    'insert into text (rowid, name, description, depends, '
+                    'provides, replaces, optdepends) '
+                    'values (?, ?, ?, ?, ?, ?, ?)',
+                    (identifier, name, description or '') + tuple(
+                     relations.get(kind) or '' for kind in RELATIONS))
+                connection.execute(
+                    'insert into paths (rowid, files) values (?, ?)',
+                    (identifier, files or ''))
+            connection.execute(
+                'insert or replace into repos values (?, ?)', (repo, stamp))
+
+    def _delete(self, connection, repo):
+        selection = 'select id from packages where repo = ?'
+        for table, column in (('relations', 'package'),
+                              ('groups', 'package'), ('files', 'package'),
+                              ('text', 'rowid'), ('paths', 'rowid')):
+            connection.execute('delete from %s where %s in (%s)' % (
+                table, column, selection), (repo,))
+        connection.execute('delete from packages where repo = ?', (repo,))
+        connection.execute('delete from repos where name = ?', (repo,))
+
+    def remove(self, repos):
+        # drops the repositories that are no longer configured
+        connection = self.connection()
+        with connection:
+            for (repo,) in connection.execute(
+                'select name from repos').fetchall():
+                if repo not in repos:
+                    self._delete(connection, repo)
+
+    def aur(self):
+        return [tuple(row) for row in self.connection().execute(
+            'select * from aur order by name')]
+
+    def update_aur(self, entries):
+        connection = self.connection()
+        with connection:
+            connection.execute('delete from aur')
+            connection.executemany(
+                'insert or replace into aur values (?, ?, ?, ?, ?, ?)',
+                entries)
+
+    def summary_stamp(self):
+        row = self.connection().execute(
+            "select value from meta where key = 'summaries'").fetchone()
+        return row[0] if row is not None else None
+
+    def update_summaries(self, stamp, entries):
+        # the summaries hold the states of the packages, which depend on
+        # every repository, so they are always replaced as a whole. each
+        # entry is a repository, the fields of a summary and of its update
+        # (or None) in the order of the columns, and whether the installed
+        # package comes from that repository
+        def rows():
+            for position, (repo, summary, update, current) in enumerate(
+                entries):
+                if update is None:
+                    update = (None,) * len(summary)
+                yield ((position, repo) + tuple(summary) +
+                       (update[1], update[4], update[5], update[6],
+                        int(current)))
+        connection = self.connection()
+        with connection:
+            connection.execute('delete from summaries')
+            connection.executemany(
+                'insert into summaries values (%s)' % ', '.join('?' * 16),
+                rows())
+            connection.execute(
+                "insert or replace into meta values ('summaries', ?)",
+                (stamp,))
+
+    def summaries(self, repos, states=0):
+        # the entries of the given repositories, in the form they were
+        # saved in. with states, only those whose package or update has one
+        # of them are returned
+        if not repos:
+            return []
+        sql = 'select * from summaries where repo in (%s)' % ', '.join(
+            '?' * len(repos))
+        args = list(repos)
+        if states:
+            sql += ' and (state & ? or update_state & ?)'
+            args.extend((states, states))
+        return [self._entry(row) for row in self.connection().execute(
+            sql + ' order by position', args)]
+
+    def group(self, repo, name):
+        return [self._entry(row) for row in self.connection().execute(
+            'select s.* from summaries s join packages p '
+            'on p.repo = s.repo and p.name = s.name '
+            'join groups g on g.package = p.id '
+            'where p.repo = ? and g.name = ? order by s.position',
+            (repo, name))]
+
+    def groups(self, repo, state):
+        # the groups of a repository, with whether any member has the state
+        # and the total size of the members
+        return [tuple(row) for row in self.connection().execute(
+            'select g.name, max(s.state & ?), sum(s.size) from groups g '
+            'join packages p on p.id = g.package '
+            'join summaries s on s.repo = p.repo and s.name = p.name '
+            'where p.repo = ? group by g.name order by g.name',
+            (state, repo))]
+
+    def _entry(self, row):
+        summary = tuple(row[2:11])
+        update = None
+        if row[12] is not None:
+            update = (summary[0], row[11], summary[2], summary[3], row[12],
+                      row[13], row[14], summary[7], summary[8])
+        return row[1], summary, update, bool(row[15])
+
+    def names(self, repo):
+        return [row[0] for row in self.connection().execute(
+            'select name from packages where repo = ? order by position',
+            (repo,))]
+
+    def finders(self, repo, keys):
+        # one finder for the text keys and one for the files, which are
+        # searched case-sensitively
+        finders = []
+        columns = [key for key in keys if key != 'files']
+        if columns:
+            finders.append(Finder(self, repo, 'text', columns))
+        if 'files' in keys:
+            finders.append(Finder(self, repo, 'paths', ['files'], True))
+        return finders
+
+    def export(self, path):
+        target = sqlite3.connect(path)
+        try:
+            self.connection().backup(target)
+        finally:
+            target.close()
+
+
+class Finder(object):
+    # looks up the literals of a query in the full-text tables, with the
+    # same interface as the trigram indexes
+    def __init__(self, store, repo, table, columns, exact=False):
+        self._store = store
+        self._repo = repo
+        # the full-text match has to drive the query, otherwise it is
+        # evaluated for every package of the repository
+        self._sql = (
+            'select position from packages where id in '
+            '(select rowid from %s where %s match ?) and repo = ?'
+            % (table, table))
+        self._columns = '{%s}' % ' '.join(columns)
+        self._exact = exact
+
+    def find(self, literal):
+        # the trigram tokenizer only folds the case of ascii reliably in the
+        # same way as the matcher, so other literals are not narrowed
+        if len(literal) < 3 or not (self._exact or literal.isascii()):
+            return None
+        expression = '%s : "%s"' % (self._columns, literal.replace('"', '""'))
+        return set(row[0] for row in self._store.connection().execute(
+            self._sql, (expression, self._repo)))
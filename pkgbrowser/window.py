@@ -1,28 +1,39 @@
 # Copyright (C) 2010-2017, kachelaqa <kachelaqa@gmail.com>
 
-import sys, time, subprocess
+import sys, re, time, subprocess
 from PyQt5.QtCore import (
     Qt, QObject, QTimer, QEvent, QSignalMapper, QFile, QDir, QUrl,
-    QTextStream, QStringListModel,
+    QTextStream, QStringListModel, QFileSystemWatcher,
     )
 from PyQt5.QtGui import (
     QInputEvent, QKeySequence, QIcon, QTextCursor, QTextDocument,
     QStandardItemModel, QStandardItem, QFontMetrics, QFont, QPalette,
     )
 from PyQt5.QtWidgets import (
-    qApp, QMainWindow, QDialog, QMessageBox, QFileDialog, QHBoxLayout,
+    qApp, QMainWindow, QMessageBox, QFileDialog, QHBoxLayout,
     QWidget, QProgressBar, QShortcut, QAction, QMenu, QButtonGroup,
     QGroupBox, QToolButton, QRadioButton, QCheckBox, QTextBrowser,
-    QTreeWidgetItem, QHeaderView,
-    )
-from pkgbrowser.backend import (
-    backend, DatabaseError, NetworkError, PatternError, Traceback, Cache,
+    QTreeWidgetItem, QHeaderView, QCompleter,
     )
 from pkgbrowser.fmt import Format
 from pkgbrowser.enum import State
 from pkgbrowser.ui.window import Ui_Window
-from pkgbrowser.ui.about import Ui_AboutDialog
-from pkgbrowser.ui.help import Ui_HelpDialog
+
+# the backend (with multiprocessing, zipfile and the html parser) is only
+# imported when the window is set up, see load_backend
+backend = Cache = Traceback = None
+BackendError = DatabaseError = NetworkError = PatternError = None
+
+
+def load_backend():
+    global backend, Cache, Traceback
+    global BackendError, DatabaseError, NetworkError, PatternError
+    if backend is None:
+        from pkgbrowser.backend import (
+            backend, BackendError, DatabaseError, NetworkError, PatternError,
+            Traceback, Cache,
+            )
+    return backend
 
 
 def delayed(method):
@@ -41,9 +52,14 @@ class Window(QMainWindow, Ui_Window):
         self._about = None
         self._dialog = None
         self._package = None
+        self._summary = None
         self._history = []
         self._bookmarks = []
         self._index = 0
+        self._limit = 0
+        self._engine = 'python'
+        self._search = None
+        self._more = None
         self.setWindowTitle(qApp.applicationTitle())
         self.iconPackage = QIcon(':/icons/package.png')
         self.iconGroup = QIcon(':/icons/group.png')
@@ -64,7 +80,25 @@ class Window(QMainWindow, Ui_Window):
         self.progress = QProgressBar()
         self.progress.setFixedSize(150, 16)
         self.statusBar().addPermanentWidget(self.progress)
+        self.statusBar().messageChanged.connect(self.handleMessageChanged)
         self.progress.hide()
+        self.moreButton = QToolButton()
+        self.moreButton.setText(self.tr('More'))
+        self.moreButton.setToolTip(self.tr('Show more matching items'))
+        self.moreButton.setAutoRaise(True)
+        self.moreButton.clicked.connect(self.handleShowMore)
+        self.statusBar().addPermanentWidget(self.moreButton)
+        self.moreButton.hide()
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.handleDatabaseChanged)
+        self.watcher.fileChanged.connect(self.handleDatabaseChanged)
+        self.watchTimer = QTimer(self)
+        self.watchTimer.setSingleShot(True)
+        self.watchTimer.setInterval(1500)
+        self.watchTimer.timeout.connect(self.handleAutoRefresh)
+        self.pollTimer = QTimer(self)
+        self.pollTimer.setInterval(5000)
+        self.pollTimer.timeout.connect(self.handleDatabaseChanged)
         model = QStandardItemModel(self.packages)
         self.packages.setModel(model)
         header = self.packages.header()
@@ -115,7 +149,7 @@ class Window(QMainWindow, Ui_Window):
         self.information.setCornerWidget(corner)
         self.information.installEventFilter(self)
         self.searchBox.lineEdit().setPlaceholderText(self.tr('Search'))
-        self.searchBox.setCompleter(None)
+        self.searchBox.setCompleter(NameCompleter(self.searchBox))
         self.searchBox.view().installEventFilter(self)
         self.searchBox.setModel(QStringListModel(self.searchBox))
         self.searchFiles.setHidden(True)
@@ -241,6 +275,8 @@ class Window(QMainWindow, Ui_Window):
         elif settings.value('include-aur', False):
             self.scopeAUR.setChecked(True)
             self.updateSearchConditions(self.scopeAUR)
+        self._limit = max(0, settings.value('search-limit', 0))
+        self._engine = settings.value('search-engine', 'python')
         settings.endGroup()
         settings.beginGroup('search')
         strings = settings.value('strings', None, 'QStringList')
@@ -256,11 +292,17 @@ class Window(QMainWindow, Ui_Window):
         sys.excepthook = self.handleExceptions
 
     def setup(self):
+        load_backend()
         self.filters.clear()
         self.packages.model().setRowCount(0)
         self.setCurrentPackage(None)
         self.setDisabled(True, True)
         Cache.set_path(qApp.cacheDirectory())
+        # the sqlite engine needs a writable cache directory
+        try:
+            backend.set_engine(self._engine)
+        except (BackendError, ValueError) as exception:
+            print('WARNING: %s' % exception)
         if self.keyFiles.isChecked():
             self.updateSearchConditions(self.keyFiles)
         self.statusBar().showMessage(
@@ -299,6 +341,25 @@ class Window(QMainWindow, Ui_Window):
                 self.handleBackButton()
             elif event.button() == Qt.XButton2:
                 self.handleForwardButton()
+        elif (isinstance(event, Callback) and
+              event.type() == Callback.LoadPackage):
+            summary, exception = event.data
+            del event.data
+            if summary is self._summary:
+                self.statusBar().clearMessage()
+                if exception is not None:
+                    raise exception
+                self.loadPackage(summary)
+            return True
+        elif (isinstance(event, Callback) and
+              event.type() == Callback.BackendVerify):
+            changed, exception = event.data
+            del event.data
+            if exception is not None:
+                raise exception
+            if changed and not self._active:
+                self.reloadItems()
+            return True
         elif isinstance(event, Callback):
             items, exception, duration = event.data
             del event.data
@@ -306,12 +367,26 @@ class Window(QMainWindow, Ui_Window):
             self.statusBar().clearMessage()
             if event.type() == Callback.BackendInitialize:
                 self.setDisabled(False, True)
+                self.watchDatabases()
+                if exception is None:
+                    self.verifySnapshot()
+            elif event.type() == Callback.BackendRefresh:
+                self.watchDatabases()
+                if exception is None:
+                    self.verifySnapshot()
+                    self.reloadItems()
             elif event.type() == Callback.ListItems:
                 self.searchButton.setIcon(self.iconSearch)
                 if items is not None:
                     self.filters.clearSelection()
                     self.listItems(items)
                     self.showCount(duration)
+                    self.updateMore(items)
+            elif event.type() == Callback.ListMore:
+                if items is not None:
+                    self.listItems(items, append=True)
+                    self.showCount(duration)
+                    self.updateMore(items)
             elif items is not None:
                 if event.type() == Callback.LoadCategories:
                     self.loadCategories(items)
@@ -427,6 +502,7 @@ class Window(QMainWindow, Ui_Window):
         return details
 
     def handleExceptions(self, cls=None, exception=None, traceback=None):
+        load_backend()
         if not self._aborting:
             while qApp.overrideCursor() is not None:
                 qApp.restoreOverrideCursor()
@@ -491,6 +567,51 @@ class Window(QMainWindow, Ui_Window):
     def handleRefresh(self):
         self.setup()
 
+    def watchDatabases(self):
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
+        paths = [path for path in backend.watch_paths() if QFile.exists(path)]
+        if paths and self.watcher.addPaths(paths):
+            self.pollTimer.start()
+        else:
+            self.pollTimer.stop()
+
+    def handleDatabaseChanged(self, path=None):
+        self.watchTimer.start()
+
+    def handleAutoRefresh(self):
+        if self._active:
+            self.watchTimer.start()
+        elif backend.is_modified():
+            self.setCurrentPackage(None)
+            self._summary = None
+            self.statusBar().showMessage(
+                self.tr('Updating package data. Please wait...'))
+            self.setActive(True, Callback.BackendRefresh)
+            backend.refresh()
+        else:
+            self.watchDatabases()
+
+    def verifySnapshot(self):
+        def callback(changed, exception):
+            qApp.postEvent(self.centralWidget(),
+                Callback(Callback.BackendVerify, changed, exception))
+        backend.verify_snapshot(callback)
+
+    def reloadItems(self):
+        repositories = [item.data(0, Qt.UserRole)[1] for item in (
+            self.filters.topLevelItem(index) for index in
+            range(1, self.filters.topLevelItemCount() - 1))
+            if not item.data(0, Qt.UserRole)[0] & State.Changes]
+        if repositories != backend.list_repositories():
+            self.updateFilters()
+        elif self.filters.selectedItems():
+            self.handleFilterActivated()
+        else:
+            selection = self.packages.selectionModel().selection()
+            self.handlePackageChanged(selection, None)
+
     @delayed
     def handleStatistics(self):
         self.messageBox(self.tr('Statistics'),
@@ -509,12 +630,14 @@ class Window(QMainWindow, Ui_Window):
     @delayed
     def handleManual(self):
         if self._help is None:
+            from pkgbrowser.dialogs import HelpDialog
             self._help = HelpDialog()
         self._help.show()
 
     @delayed
     def handleAbout(self):
         if self._about is None:
+            from pkgbrowser.dialogs import AboutDialog
             self._about = AboutDialog()
         self._about.exec_()
 
@@ -533,6 +656,8 @@ class Window(QMainWindow, Ui_Window):
                 if location:
                     self.setActive(True, Callback.LoadCategory)
                     backend.list_category(location)
+            elif state & State.Changes:
+                self.listItems(backend.list_changes(location))
             else:
                 self.listItems(backend.list_packages(state, location))
 
@@ -589,6 +714,13 @@ class Window(QMainWindow, Ui_Window):
         for name in repositories:
             self.addFilter(name.title(), location=name)
         self.addFilter(self.tr('Foreign'), State.Foreign, local)
+        parent = self.addFilter(self.tr('Changes'), State.Changes)
+        for title, kind in ((self.tr('New'), 'new'),
+                            (self.tr('Removed'), 'removed'),
+                            (self.tr('Upgraded'), 'upgraded'),
+                            (self.tr('Downgraded'), 'downgraded'),
+                            (self.tr('Moved'), 'moved')):
+            self.addFilter(title, State.Changes, kind, parent)
         self.addFilter(self.tr('Categories'), State.Category)
         self.setCategoriesDisabled(self.fileOffline.isChecked())
 
@@ -679,6 +811,8 @@ class Window(QMainWindow, Ui_Window):
     def handleSearchChanged(self, text=None):
         if text is None:
             text = self.searchBox.currentText()
+        elif self.keyNames.isChecked() and self.searchBox.hasFocus():
+            self.searchBox.completer().updateCompletions(text)
         self.searchButton.setEnabled(
             bool(self.searchBox.isEnabled() and text))
         qApp.processEvents()
@@ -730,7 +864,23 @@ class Window(QMainWindow, Ui_Window):
             filters &= ~State.AUR
         self.searchButton.setIcon(self.iconStop)
         self.setActive(True, Callback.ListItems)
-        backend.find(text, filters, keys)
+        self._search = text, filters, keys
+        backend.find(text, filters, keys, self._limit)
+
+    def updateMore(self, items):
+        # ranked searches with a limit come back one page at a time
+        token = getattr(items, 'token', None)
+        if token is not None and self._search is not None:
+            self._more = self._search + (token,)
+        else:
+            self._more = None
+        self.moreButton.setVisible(self._more is not None)
+
+    def handleShowMore(self):
+        if self._more is not None and not self._active:
+            text, filters, keys, token = self._more
+            self.setActive(True, Callback.ListMore)
+            backend.find(text, filters, keys, self._limit, token)
 
     def handleCancelTask(self):
         self.setActive(False)
@@ -838,12 +988,29 @@ class Window(QMainWindow, Ui_Window):
             item = self.packages.model().itemFromIndex(row[0])
             summary = item.data(Qt.UserRole)
             if not summary.state & State.Group:
-                qApp.setOverrideCursor(Qt.BusyCursor)
                 self.clearHistory()
-                package = backend.get_package(summary)
-                self.setCurrentPackage(package)
-                self.updateInformation()
-                qApp.restoreOverrideCursor()
+                self._summary = summary
+                neighbors = []
+                for offset in (1, -1):
+                    index = row[0].sibling(row[0].row() + offset, 0)
+                    if index.isValid():
+                        neighbors.append(index.data(Qt.UserRole))
+                def callback(exception):
+                    qApp.postEvent(self.centralWidget(),
+                        Callback(Callback.LoadPackage, summary, exception))
+                if backend.fetch_package(summary, callback, neighbors):
+                    self.setCurrentPackage(None)
+                    self.statusBar().showMessage(self.tr(
+                        'Loading package details for %s...' % summary.name))
+                else:
+                    self.loadPackage(summary)
+
+    def loadPackage(self, summary):
+        qApp.setOverrideCursor(Qt.BusyCursor)
+        package = backend.get_package(summary)
+        self.setCurrentPackage(package)
+        self.updateInformation()
+        qApp.restoreOverrideCursor()
 
     def handlePackageDoubleClick(self, index):
         row = self.packages.selectedIndexes()
@@ -1102,10 +1269,17 @@ class Window(QMainWindow, Ui_Window):
             return self.iconDowngrade
         return QIcon()
 
-    def listItems(self, items, parent=None):
+    def listItems(self, items, parent=None, append=False):
+        start = time.time()
         if parent is None:
+            if not append:
+                # a new listing has no more pages until updateMore says so
+                self._summary = None
+                self._more = None
+                self.moreButton.hide()
             parent = self.packages.model().invisibleRootItem()
-        parent.setRowCount(0)
+        if not append:
+            parent.setRowCount(0)
         disabled = self.packages.palette().color(
             QPalette.Disabled, QPalette.WindowText)
         for item in items:
@@ -1133,9 +1307,10 @@ class Window(QMainWindow, Ui_Window):
             else:
                 row[0].setIcon(self.iconPackage)
             parent.appendRow(row)
-        if not parent.index().isValid():
+        if not parent.index().isValid() and not append:
             self.packages.scrollToTop()
         self.handleSortChanged()
+        backend.add_timing('model', start)
         self.showCount()
 
     def showCount(self, duration=None):
@@ -1149,6 +1324,12 @@ class Window(QMainWindow, Ui_Window):
         if duration is not None:
             message = self.tr('%s (%.3g seconds)' % (message, duration))
         self.statusBar().showMessage(message, 15000)
+        self.statusBar().setToolTip(self.format.timings(
+            backend.timings(), backend.memory()))
+
+    def handleMessageChanged(self, message):
+        if not message:
+            self.statusBar().setToolTip('')
 
     def columnInfo(self):
         model = self.packages.model()
@@ -1218,65 +1399,51 @@ class Formatter(Format, QObject):
         return ''
 
 
+class NameCompleter(QCompleter):
+    # completes the last word of the search text from the package names
+    _word = re.compile(r'[\w@.+-]*$')
+    _minimum = 2
+
+    def __init__(self, parent=None):
+        QCompleter.__init__(self, parent)
+        self.setModel(QStringListModel(self))
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self._head = ''
+        self._path = None
+
+    def updateCompletions(self, text):
+        # the text also changes when a completion is highlighted or chosen
+        if text == self._path:
+            return
+        word = self._word.search(text).group()
+        names = []
+        if len(word) >= self._minimum:
+            names = backend.complete(word, self.maxVisibleItems())
+        if names == [word]:
+            names = []
+        self._head = text[:len(text) - len(word)]
+        self.model().setStringList(names)
+        if names:
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def pathFromIndex(self, index):
+        self._path = self._head + index.data()
+        return self._path
+
+
 class Callback(QEvent):
     ListItems = QEvent.registerEventType()
+    ListMore = QEvent.registerEventType()
     LoadCategories = QEvent.registerEventType()
     LoadCategory = QEvent.registerEventType()
     BackendInitialize = QEvent.registerEventType()
+    BackendRefresh = QEvent.registerEventType()
+    LoadPackage = QEvent.registerEventType()
+    BackendVerify = QEvent.registerEventType()
 
     def __init__(self, *args):
         QEvent.__init__(self, args[0])
         self.data = args[1:]
-
-
-class AboutDialog(QDialog, Ui_AboutDialog):
-    def __init__(self):
-        QDialog.__init__(self, qApp.window())
-        self.setupUi(self)
-        self.setWindowFlags(
-            self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-        from sys import version as py_version
-        from PyQt5.QtCore import qVersion, PYQT_VERSION_STR
-        url = qApp.applicationUrl()
-        title = qApp.applicationTitle()
-        self.setWindowTitle('About - %s' % title)
-        self.title.setText(
-            """<h2>%s %s</h2>""" % (title, qApp.applicationVersion())
-            )
-        self.details.setText(self.tr("""
-            <div align="center">
-            <p>A utility for browsing pacman databases and the AUR</p>
-            <p>Copyright &copy; 2010-2017, kachelaqa<br>
-            &lt;kachelaqa@gmail.com&gt;</p>
-            <p><a href="%s">%s</a></p>
-            <p>Using:<br>Qt %s<br>Python %s<br>PyQt %s<br>libalpm %s</p>
-            </div>
-            """
-            % (url, url, qVersion(), py_version.split()[0],
-               PYQT_VERSION_STR, backend.version())
-            ))
-        self.information.currentChanged.connect(self.handleInformationChanged)
-        self.details.linkActivated.connect(qApp.window().openLink)
-
-    def handleInformationChanged(self, index):
-        tab = self.information.widget(index)
-        if tab is self.licenseTab:
-            if self.license.document().isEmpty():
-                stream = QFile(':/LICENSE')
-                if stream.open(QFile.ReadOnly):
-                    self.license.setPlainText(str(stream.readAll(), 'utf-8'))
-                    stream.close()
-
-
-class HelpDialog(QDialog, Ui_HelpDialog):
-    def __init__(self):
-        QDialog.__init__(self, qApp.window())
-        self.setupUi(self)
-        self.setWindowFlags(
-            self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-        self.setWindowTitle('Manual - %s' % qApp.applicationTitle())
-        stream = QFile(':/doc/manual.html')
-        if stream.open(QFile.ReadOnly):
-            self.browser.setHtml(str(stream.readAll(), 'utf-8'))
-            stream.close()
-        self.browser.anchorClicked.connect(qApp.window().openLink)
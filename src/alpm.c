@@ -639,7 +639,7 @@ static const char *__pyx_f[] = {
 struct __pyx_opt_args_4alpm_to_bytes;
 struct __pyx_opt_args_4alpm_to_unicode;
 
-/* "alpm.pyx":111
+/* "alpm.pyx":112
  * 
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -648,7 +648,7 @@ struct __pyx_opt_args_4alpm_to_unicode;
  */
 enum  {
 
-  /* "alpm.pyx":122
+  /* "alpm.pyx":123
  *     STATUS_UPGRADE = 1 << 7
  *     STATUS_DOWNGRADE = 1 << 8
  *     STATUS_MAX = 1 << 9             # <<<<<<<<<<<<<<
@@ -668,7 +668,7 @@ enum  {
   __pyx_e_4alpm_STATUS_MAX = (1 << 9)
 };
 
-/* "alpm.pyx":124
+/* "alpm.pyx":125
  *     STATUS_MAX = 1 << 9
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -680,7 +680,7 @@ enum  {
   __pyx_e_4alpm_DATA_TYPE_DEPENDS = 1
 };
 
-/* "alpm.pyx":128
+/* "alpm.pyx":129
  *     DATA_TYPE_DEPENDS = 1
  * 
  * cdef enum pkg_vcs_t:             # <<<<<<<<<<<<<<
@@ -697,7 +697,7 @@ enum __pyx_t_4alpm_pkg_vcs_t {
   __pyx_e_4alpm_VCS_DARCS = 6
 };
 
-/* "alpm.pyx":137
+/* "alpm.pyx":138
  *     VCS_DARCS = 6
  * 
  * cdef enum:             # <<<<<<<<<<<<<<
@@ -712,7 +712,7 @@ enum  {
   __pyx_e_4alpm_BACKUP_UNREADABLE = 4
 };
 
-/* "alpm.pyx":148
+/* "alpm.pyx":149
  * cdef unicode fs_errors = u'surrogateescape'
  * 
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):             # <<<<<<<<<<<<<<
@@ -725,7 +725,7 @@ struct __pyx_opt_args_4alpm_to_bytes {
   PyObject *errors;
 };
 
-/* "alpm.pyx":157
+/* "alpm.pyx":158
  *     raise ValueError('expected string value, got %s' % type(pstr))
  * 
  * cdef unicode to_unicode(char *cstr, bint release=False,             # <<<<<<<<<<<<<<
@@ -1135,6 +1135,7 @@ static const char __pyx_k_pkg_get_name[] = "pkg_get_name";
 static const char __pyx_k_pkg_get_size[] = "pkg_get_size";
 static const char __pyx_k_ERR_NOT_A_DIR[] = "ERR_NOT_A_DIR";
 static const char __pyx_k_PKG_VCS_DARCS[] = "PKG_VCS_DARCS";
+static const char __pyx_k_db_unregister[] = "db_unregister";
 static const char __pyx_k_list_join_str[] = "list_join_str";
 static const char __pyx_k_pkg_check_vcs[] = "pkg_check_vcs";
 static const char __pyx_k_pkg_get_isize[] = "pkg_get_isize";
@@ -1254,6 +1255,7 @@ static PyObject *__pyx_n_s_db_get_groupcache;
 static PyObject *__pyx_n_s_db_get_name;
 static PyObject *__pyx_n_s_db_get_pkg;
 static PyObject *__pyx_n_s_db_get_pkgcache;
+static PyObject *__pyx_n_s_db_unregister;
 static PyObject *__pyx_n_s_dbpath;
 static PyObject *__pyx_n_s_decode;
 static PyObject *__pyx_n_s_dep;
@@ -1379,64 +1381,65 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
 static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
 static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
 static PyObject *__pyx_pf_4alpm_16register_syncdb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname); /* proto */
-static PyObject *__pyx_pf_4alpm_18db_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
-static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname); /* proto */
-static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
-static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
-static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname); /* proto */
-static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local); /* proto */
-static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local); /* proto */
-static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_parch); /* proto */
-static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plogfile); /* proto */
-static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pcachedir); /* proto */
-static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ptarget); /* proto */
-static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /* proto */
-static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /* proto */
-static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdep); /* proto */
-static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pa, PyObject *__pyx_v_pb); /* proto */
-static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppath, int __pyx_v_full); /* proto */
-static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, PyObject *__pyx_v_pversion); /* proto */
-static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname); /* proto */
-static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
-static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist, PyObject *__pyx_v_psep); /* proto */
-static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist); /* proto */
-static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
-static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
-static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
-static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
-static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
-static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_18db_unregister(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
+static PyObject *__pyx_pf_4alpm_20db_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
+static PyObject *__pyx_pf_4alpm_22db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname); /* proto */
+static PyObject *__pyx_pf_4alpm_24db_get_groupcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
+static PyObject *__pyx_pf_4alpm_26db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb); /* proto */
+static PyObject *__pyx_pf_4alpm_28db_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname); /* proto */
+static PyObject *__pyx_pf_4alpm_30db_find_provider(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local); /* proto */
+static PyObject *__pyx_pf_4alpm_32db_find_replacer(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local); /* proto */
+static PyObject *__pyx_pf_4alpm_34option_set_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_parch); /* proto */
+static PyObject *__pyx_pf_4alpm_36option_get_logfile(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_4alpm_38option_set_logfile(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plogfile); /* proto */
+static PyObject *__pyx_pf_4alpm_40option_get_cachedirs(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_4alpm_42option_add_cachedir(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pcachedir); /* proto */
+static PyObject *__pyx_pf_4alpm_44option_get_syncdb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ptarget); /* proto */
+static PyObject *__pyx_pf_4alpm_46group_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /* proto */
+static PyObject *__pyx_pf_4alpm_48group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /* proto */
+static PyObject *__pyx_pf_4alpm_50dep_compute_string(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdep); /* proto */
+static PyObject *__pyx_pf_4alpm_52pkg_get_conflicts(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_54pkg_get_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_56pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_58pkg_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_60pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_62pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_64pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_66pkg_get_version(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_68pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_70pkg_get_size(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_72pkg_get_builddate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_74pkg_get_installdate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_76pkg_has_scriptlet(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_78pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_80pkg_compute_requiredby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_82pkg_compute_optionalfor(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_84pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_86pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_88pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_90pkg_get_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_92pkg_get_validation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_94pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pa, PyObject *__pyx_v_pb); /* proto */
+static PyObject *__pyx_pf_4alpm_96pkg_load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppath, int __pyx_v_full); /* proto */
+static PyObject *__pyx_pf_4alpm_98pkg_get_repository(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_100pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_102pkg_get_packager(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_104pkg_get_status(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_106pkg_check_update(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, PyObject *__pyx_v_pversion); /* proto */
+static PyObject *__pyx_pf_4alpm_108pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname); /* proto */
+static PyObject *__pyx_pf_4alpm_110pkg_join_files(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_112pkg_join_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_114pkg_join_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_116pkg_join_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_118pkg_join_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /* proto */
+static PyObject *__pyx_pf_4alpm_120list_join_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist, PyObject *__pyx_v_psep); /* proto */
+static PyObject *__pyx_pf_4alpm_122list_next(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist); /* proto */
+static PyObject *__pyx_pf_4alpm_124list_get_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_126list_get_db(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_128list_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_130list_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_132list_get_dep(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
+static PyObject *__pyx_pf_4alpm_134list_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode); /* proto */
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_tuple_;
@@ -1450,7 +1453,7 @@ static PyObject *__pyx_tuple__21;
 static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__27;
-static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__29;
 static PyObject *__pyx_tuple__32;
 static PyObject *__pyx_tuple__34;
 static PyObject *__pyx_tuple__36;
@@ -1506,6 +1509,7 @@ static PyObject *__pyx_tuple__120;
 static PyObject *__pyx_tuple__122;
 static PyObject *__pyx_tuple__124;
 static PyObject *__pyx_tuple__126;
+static PyObject *__pyx_tuple__128;
 static PyObject *__pyx_codeobj__10;
 static PyObject *__pyx_codeobj__12;
 static PyObject *__pyx_codeobj__14;
@@ -1516,7 +1520,7 @@ static PyObject *__pyx_codeobj__22;
 static PyObject *__pyx_codeobj__24;
 static PyObject *__pyx_codeobj__26;
 static PyObject *__pyx_codeobj__28;
-static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__30;
 static PyObject *__pyx_codeobj__31;
 static PyObject *__pyx_codeobj__33;
 static PyObject *__pyx_codeobj__35;
@@ -1566,8 +1570,9 @@ static PyObject *__pyx_codeobj__121;
 static PyObject *__pyx_codeobj__123;
 static PyObject *__pyx_codeobj__125;
 static PyObject *__pyx_codeobj__127;
+static PyObject *__pyx_codeobj__129;
 
-/* "alpm.pyx":148
+/* "alpm.pyx":149
  * cdef unicode fs_errors = u'surrogateescape'
  * 
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):             # <<<<<<<<<<<<<<
@@ -1597,7 +1602,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
     }
   }
 
-  /* "alpm.pyx":149
+  /* "alpm.pyx":150
  * 
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):
  *     if isinstance(pstr, unicode):             # <<<<<<<<<<<<<<
@@ -1608,7 +1613,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":150
+    /* "alpm.pyx":151
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):
  *     if isinstance(pstr, unicode):
  *         return pstr.encode(encoding, errors)             # <<<<<<<<<<<<<<
@@ -1616,7 +1621,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  *         return pstr
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_pstr, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_pstr, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -1633,7 +1638,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_encoding, __pyx_v_errors};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_3);
     } else
@@ -1641,13 +1646,13 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_encoding, __pyx_v_errors};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_3);
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 151, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       if (__pyx_t_5) {
         __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -1658,17 +1663,17 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
       __Pyx_INCREF(__pyx_v_errors);
       __Pyx_GIVEREF(__pyx_v_errors);
       PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_v_errors);
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(0, 150, __pyx_L1_error)
+    if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(0, 151, __pyx_L1_error)
     __pyx_r = ((PyObject*)__pyx_t_3);
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":149
+    /* "alpm.pyx":150
  * 
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):
  *     if isinstance(pstr, unicode):             # <<<<<<<<<<<<<<
@@ -1677,7 +1682,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  */
   }
 
-  /* "alpm.pyx":151
+  /* "alpm.pyx":152
  *     if isinstance(pstr, unicode):
  *         return pstr.encode(encoding, errors)
  *     elif isinstance(pstr, bytes):             # <<<<<<<<<<<<<<
@@ -1688,7 +1693,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":152
+    /* "alpm.pyx":153
  *         return pstr.encode(encoding, errors)
  *     elif isinstance(pstr, bytes):
  *         return pstr             # <<<<<<<<<<<<<<
@@ -1696,12 +1701,12 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  *         return bytes(pstr)
  */
     __Pyx_XDECREF(__pyx_r);
-    if (!(likely(PyBytes_CheckExact(__pyx_v_pstr))||((__pyx_v_pstr) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_v_pstr)->tp_name), 0))) __PYX_ERR(0, 152, __pyx_L1_error)
+    if (!(likely(PyBytes_CheckExact(__pyx_v_pstr))||((__pyx_v_pstr) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_v_pstr)->tp_name), 0))) __PYX_ERR(0, 153, __pyx_L1_error)
     __Pyx_INCREF(__pyx_v_pstr);
     __pyx_r = ((PyObject*)__pyx_v_pstr);
     goto __pyx_L0;
 
-    /* "alpm.pyx":151
+    /* "alpm.pyx":152
  *     if isinstance(pstr, unicode):
  *         return pstr.encode(encoding, errors)
  *     elif isinstance(pstr, bytes):             # <<<<<<<<<<<<<<
@@ -1710,7 +1715,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  */
   }
 
-  /* "alpm.pyx":153
+  /* "alpm.pyx":154
  *     elif isinstance(pstr, bytes):
  *         return pstr
  *     elif isinstance(pstr, bytearray):             # <<<<<<<<<<<<<<
@@ -1721,7 +1726,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":154
+    /* "alpm.pyx":155
  *         return pstr
  *     elif isinstance(pstr, bytearray):
  *         return bytes(pstr)             # <<<<<<<<<<<<<<
@@ -1729,19 +1734,19 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_v_pstr);
     __Pyx_GIVEREF(__pyx_v_pstr);
     PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_pstr);
-    __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyBytes_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)(&PyBytes_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_r = ((PyObject*)__pyx_t_4);
     __pyx_t_4 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":153
+    /* "alpm.pyx":154
  *     elif isinstance(pstr, bytes):
  *         return pstr
  *     elif isinstance(pstr, bytearray):             # <<<<<<<<<<<<<<
@@ -1750,28 +1755,28 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
  */
   }
 
-  /* "alpm.pyx":155
+  /* "alpm.pyx":156
  *     elif isinstance(pstr, bytearray):
  *         return bytes(pstr)
  *     raise ValueError('expected string value, got %s' % type(pstr))             # <<<<<<<<<<<<<<
  * 
  * cdef unicode to_unicode(char *cstr, bint release=False,
  */
-  __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_expected_string_value_got_s, ((PyObject *)Py_TYPE(__pyx_v_pstr))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_expected_string_value_got_s, ((PyObject *)Py_TYPE(__pyx_v_pstr))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_Raise(__pyx_t_4, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __PYX_ERR(0, 155, __pyx_L1_error)
+  __PYX_ERR(0, 156, __pyx_L1_error)
 
-  /* "alpm.pyx":148
+  /* "alpm.pyx":149
  * cdef unicode fs_errors = u'surrogateescape'
  * 
  * cdef bytes to_bytes(object pstr, unicode encoding=u'utf-8', unicode errors=u'strict'):             # <<<<<<<<<<<<<<
@@ -1793,7 +1798,7 @@ static PyObject *__pyx_f_4alpm_to_bytes(PyObject *__pyx_v_pstr, struct __pyx_opt
   return __pyx_r;
 }
 
-/* "alpm.pyx":157
+/* "alpm.pyx":158
  *     raise ValueError('expected string value, got %s' % type(pstr))
  * 
  * cdef unicode to_unicode(char *cstr, bint release=False,             # <<<<<<<<<<<<<<
@@ -1836,7 +1841,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
     }
   }
 
-  /* "alpm.pyx":161
+  /* "alpm.pyx":162
  *     cdef unicode pstr
  * 
  *     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -1846,7 +1851,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
   __pyx_t_1 = ((__pyx_v_cstr != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":162
+    /* "alpm.pyx":163
  * 
  *     if cstr is not NULL:
  *         try:             # <<<<<<<<<<<<<<
@@ -1855,16 +1860,16 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
  */
     /*try:*/ {
 
-      /* "alpm.pyx":163
+      /* "alpm.pyx":164
  *     if cstr is not NULL:
  *         try:
  *             pstr = cstr.decode(encoding, errors)             # <<<<<<<<<<<<<<
  *             return pstr
  *         finally:
  */
-      __pyx_t_3 = __Pyx_PyBytes_FromString(__pyx_v_cstr); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L5_error)
+      __pyx_t_3 = __Pyx_PyBytes_FromString(__pyx_v_cstr); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_decode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L5_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_decode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_3 = NULL;
@@ -1882,7 +1887,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
       #if CYTHON_FAST_PYCALL
       if (PyFunction_Check(__pyx_t_4)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_encoding, __pyx_v_errors};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L5_error)
+        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L5_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
@@ -1890,13 +1895,13 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
       #if CYTHON_FAST_PYCCALL
       if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
         PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_encoding, __pyx_v_errors};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L5_error)
+        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L5_error)
         __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_GOTREF(__pyx_t_2);
       } else
       #endif
       {
-        __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L5_error)
+        __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_6);
         if (__pyx_t_3) {
           __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -1907,16 +1912,16 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
         __Pyx_INCREF(__pyx_v_errors);
         __Pyx_GIVEREF(__pyx_v_errors);
         PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_errors);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L5_error)
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       }
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 163, __pyx_L5_error)
+      if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 164, __pyx_L5_error)
       __pyx_v_pstr = ((PyObject*)__pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "alpm.pyx":164
+      /* "alpm.pyx":165
  *         try:
  *             pstr = cstr.decode(encoding, errors)
  *             return pstr             # <<<<<<<<<<<<<<
@@ -1929,7 +1934,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
       goto __pyx_L4_return;
     }
 
-    /* "alpm.pyx":166
+    /* "alpm.pyx":167
  *             return pstr
  *         finally:
  *             if release:             # <<<<<<<<<<<<<<
@@ -1959,7 +1964,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
           __pyx_t_1 = (__pyx_v_release != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":167
+            /* "alpm.pyx":168
  *         finally:
  *             if release:
  *                 free(cstr)             # <<<<<<<<<<<<<<
@@ -1968,7 +1973,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
  */
             free(__pyx_v_cstr);
 
-            /* "alpm.pyx":166
+            /* "alpm.pyx":167
  *             return pstr
  *         finally:
  *             if release:             # <<<<<<<<<<<<<<
@@ -1998,7 +2003,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
         __pyx_t_1 = (__pyx_v_release != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":167
+          /* "alpm.pyx":168
  *         finally:
  *             if release:
  *                 free(cstr)             # <<<<<<<<<<<<<<
@@ -2007,7 +2012,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
  */
           free(__pyx_v_cstr);
 
-          /* "alpm.pyx":166
+          /* "alpm.pyx":167
  *             return pstr
  *         finally:
  *             if release:             # <<<<<<<<<<<<<<
@@ -2021,7 +2026,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
       }
     }
 
-    /* "alpm.pyx":161
+    /* "alpm.pyx":162
  *     cdef unicode pstr
  * 
  *     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -2030,7 +2035,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
  */
   }
 
-  /* "alpm.pyx":157
+  /* "alpm.pyx":158
  *     raise ValueError('expected string value, got %s' % type(pstr))
  * 
  * cdef unicode to_unicode(char *cstr, bint release=False,             # <<<<<<<<<<<<<<
@@ -2055,7 +2060,7 @@ static PyObject *__pyx_f_4alpm_to_unicode(char *__pyx_v_cstr, struct __pyx_opt_a
   return __pyx_r;
 }
 
-/* "alpm.pyx":169
+/* "alpm.pyx":170
  *                 free(cstr)
  * 
  * cdef alpm_list_t* to_alpm_list(object capsule):             # <<<<<<<<<<<<<<
@@ -2071,7 +2076,7 @@ static alpm_list_t *__pyx_f_4alpm_to_alpm_list(PyObject *__pyx_v_capsule) {
   void *__pyx_t_3;
   __Pyx_RefNannySetupContext("to_alpm_list", 0);
 
-  /* "alpm.pyx":170
+  /* "alpm.pyx":171
  * 
  * cdef alpm_list_t* to_alpm_list(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2082,18 +2087,18 @@ static alpm_list_t *__pyx_f_4alpm_to_alpm_list(PyObject *__pyx_v_capsule) {
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":171
+    /* "alpm.pyx":172
  * cdef alpm_list_t* to_alpm_list(object capsule):
  *     if capsule is not None:
  *         return <alpm_list_t *>PyCapsule_GetPointer(capsule, NULL)             # <<<<<<<<<<<<<<
  * 
  * cdef alpm_db_t* to_alpm_db(object capsule):
  */
-    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 171, __pyx_L1_error)
+    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L1_error)
     __pyx_r = ((alpm_list_t *)__pyx_t_3);
     goto __pyx_L0;
 
-    /* "alpm.pyx":170
+    /* "alpm.pyx":171
  * 
  * cdef alpm_list_t* to_alpm_list(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2102,7 +2107,7 @@ static alpm_list_t *__pyx_f_4alpm_to_alpm_list(PyObject *__pyx_v_capsule) {
  */
   }
 
-  /* "alpm.pyx":169
+  /* "alpm.pyx":170
  *                 free(cstr)
  * 
  * cdef alpm_list_t* to_alpm_list(object capsule):             # <<<<<<<<<<<<<<
@@ -2121,7 +2126,7 @@ static alpm_list_t *__pyx_f_4alpm_to_alpm_list(PyObject *__pyx_v_capsule) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":173
+/* "alpm.pyx":174
  *         return <alpm_list_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_db_t* to_alpm_db(object capsule):             # <<<<<<<<<<<<<<
@@ -2137,7 +2142,7 @@ static alpm_db_t *__pyx_f_4alpm_to_alpm_db(PyObject *__pyx_v_capsule) {
   void *__pyx_t_3;
   __Pyx_RefNannySetupContext("to_alpm_db", 0);
 
-  /* "alpm.pyx":174
+  /* "alpm.pyx":175
  * 
  * cdef alpm_db_t* to_alpm_db(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2148,18 +2153,18 @@ static alpm_db_t *__pyx_f_4alpm_to_alpm_db(PyObject *__pyx_v_capsule) {
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":175
+    /* "alpm.pyx":176
  * cdef alpm_db_t* to_alpm_db(object capsule):
  *     if capsule is not None:
  *         return <alpm_db_t *>PyCapsule_GetPointer(capsule, NULL)             # <<<<<<<<<<<<<<
  * 
  * cdef alpm_depend_t* to_alpm_dep(object capsule):
  */
-    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 175, __pyx_L1_error)
+    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 176, __pyx_L1_error)
     __pyx_r = ((alpm_db_t *)__pyx_t_3);
     goto __pyx_L0;
 
-    /* "alpm.pyx":174
+    /* "alpm.pyx":175
  * 
  * cdef alpm_db_t* to_alpm_db(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2168,7 +2173,7 @@ static alpm_db_t *__pyx_f_4alpm_to_alpm_db(PyObject *__pyx_v_capsule) {
  */
   }
 
-  /* "alpm.pyx":173
+  /* "alpm.pyx":174
  *         return <alpm_list_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_db_t* to_alpm_db(object capsule):             # <<<<<<<<<<<<<<
@@ -2187,7 +2192,7 @@ static alpm_db_t *__pyx_f_4alpm_to_alpm_db(PyObject *__pyx_v_capsule) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":177
+/* "alpm.pyx":178
  *         return <alpm_db_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_depend_t* to_alpm_dep(object capsule):             # <<<<<<<<<<<<<<
@@ -2203,7 +2208,7 @@ static alpm_depend_t *__pyx_f_4alpm_to_alpm_dep(PyObject *__pyx_v_capsule) {
   void *__pyx_t_3;
   __Pyx_RefNannySetupContext("to_alpm_dep", 0);
 
-  /* "alpm.pyx":178
+  /* "alpm.pyx":179
  * 
  * cdef alpm_depend_t* to_alpm_dep(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2214,18 +2219,18 @@ static alpm_depend_t *__pyx_f_4alpm_to_alpm_dep(PyObject *__pyx_v_capsule) {
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":179
+    /* "alpm.pyx":180
  * cdef alpm_depend_t* to_alpm_dep(object capsule):
  *     if capsule is not None:
  *         return <alpm_depend_t *>PyCapsule_GetPointer(capsule, NULL)             # <<<<<<<<<<<<<<
  * 
  * cdef alpm_group_t* to_alpm_group(object capsule):
  */
-    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L1_error)
+    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L1_error)
     __pyx_r = ((alpm_depend_t *)__pyx_t_3);
     goto __pyx_L0;
 
-    /* "alpm.pyx":178
+    /* "alpm.pyx":179
  * 
  * cdef alpm_depend_t* to_alpm_dep(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2234,7 +2239,7 @@ static alpm_depend_t *__pyx_f_4alpm_to_alpm_dep(PyObject *__pyx_v_capsule) {
  */
   }
 
-  /* "alpm.pyx":177
+  /* "alpm.pyx":178
  *         return <alpm_db_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_depend_t* to_alpm_dep(object capsule):             # <<<<<<<<<<<<<<
@@ -2253,7 +2258,7 @@ static alpm_depend_t *__pyx_f_4alpm_to_alpm_dep(PyObject *__pyx_v_capsule) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":181
+/* "alpm.pyx":182
  *         return <alpm_depend_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_group_t* to_alpm_group(object capsule):             # <<<<<<<<<<<<<<
@@ -2269,7 +2274,7 @@ static alpm_group_t *__pyx_f_4alpm_to_alpm_group(PyObject *__pyx_v_capsule) {
   void *__pyx_t_3;
   __Pyx_RefNannySetupContext("to_alpm_group", 0);
 
-  /* "alpm.pyx":182
+  /* "alpm.pyx":183
  * 
  * cdef alpm_group_t* to_alpm_group(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2280,18 +2285,18 @@ static alpm_group_t *__pyx_f_4alpm_to_alpm_group(PyObject *__pyx_v_capsule) {
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":183
+    /* "alpm.pyx":184
  * cdef alpm_group_t* to_alpm_group(object capsule):
  *     if capsule is not None:
  *         return <alpm_group_t *>PyCapsule_GetPointer(capsule, NULL)             # <<<<<<<<<<<<<<
  * 
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):
  */
-    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L1_error)
+    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 184, __pyx_L1_error)
     __pyx_r = ((alpm_group_t *)__pyx_t_3);
     goto __pyx_L0;
 
-    /* "alpm.pyx":182
+    /* "alpm.pyx":183
  * 
  * cdef alpm_group_t* to_alpm_group(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2300,7 +2305,7 @@ static alpm_group_t *__pyx_f_4alpm_to_alpm_group(PyObject *__pyx_v_capsule) {
  */
   }
 
-  /* "alpm.pyx":181
+  /* "alpm.pyx":182
  *         return <alpm_depend_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_group_t* to_alpm_group(object capsule):             # <<<<<<<<<<<<<<
@@ -2319,7 +2324,7 @@ static alpm_group_t *__pyx_f_4alpm_to_alpm_group(PyObject *__pyx_v_capsule) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":185
+/* "alpm.pyx":186
  *         return <alpm_group_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):             # <<<<<<<<<<<<<<
@@ -2335,7 +2340,7 @@ static alpm_pkg_t *__pyx_f_4alpm_to_alpm_pkg(PyObject *__pyx_v_capsule) {
   void *__pyx_t_3;
   __Pyx_RefNannySetupContext("to_alpm_pkg", 0);
 
-  /* "alpm.pyx":186
+  /* "alpm.pyx":187
  * 
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2346,18 +2351,18 @@ static alpm_pkg_t *__pyx_f_4alpm_to_alpm_pkg(PyObject *__pyx_v_capsule) {
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":187
+    /* "alpm.pyx":188
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):
  *     if capsule is not None:
  *         return <alpm_pkg_t *>PyCapsule_GetPointer(capsule, NULL)             # <<<<<<<<<<<<<<
  * 
  * cdef object to_capsule(void *ptr):
  */
-    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L1_error)
+    __pyx_t_3 = PyCapsule_GetPointer(__pyx_v_capsule, NULL); if (unlikely(__pyx_t_3 == NULL && PyErr_Occurred())) __PYX_ERR(0, 188, __pyx_L1_error)
     __pyx_r = ((alpm_pkg_t *)__pyx_t_3);
     goto __pyx_L0;
 
-    /* "alpm.pyx":186
+    /* "alpm.pyx":187
  * 
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):
  *     if capsule is not None:             # <<<<<<<<<<<<<<
@@ -2366,7 +2371,7 @@ static alpm_pkg_t *__pyx_f_4alpm_to_alpm_pkg(PyObject *__pyx_v_capsule) {
  */
   }
 
-  /* "alpm.pyx":185
+  /* "alpm.pyx":186
  *         return <alpm_group_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef alpm_pkg_t* to_alpm_pkg(object capsule):             # <<<<<<<<<<<<<<
@@ -2385,7 +2390,7 @@ static alpm_pkg_t *__pyx_f_4alpm_to_alpm_pkg(PyObject *__pyx_v_capsule) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":189
+/* "alpm.pyx":190
  *         return <alpm_pkg_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef object to_capsule(void *ptr):             # <<<<<<<<<<<<<<
@@ -2400,7 +2405,7 @@ static PyObject *__pyx_f_4alpm_to_capsule(void *__pyx_v_ptr) {
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("to_capsule", 0);
 
-  /* "alpm.pyx":190
+  /* "alpm.pyx":191
  * 
  * cdef object to_capsule(void *ptr):
  *     if ptr is not NULL:             # <<<<<<<<<<<<<<
@@ -2410,7 +2415,7 @@ static PyObject *__pyx_f_4alpm_to_capsule(void *__pyx_v_ptr) {
   __pyx_t_1 = ((__pyx_v_ptr != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":191
+    /* "alpm.pyx":192
  * cdef object to_capsule(void *ptr):
  *     if ptr is not NULL:
  *         return PyCapsule_New(ptr, NULL, NULL)             # <<<<<<<<<<<<<<
@@ -2418,13 +2423,13 @@ static PyObject *__pyx_f_4alpm_to_capsule(void *__pyx_v_ptr) {
  * cdef char* join_list(alpm_list_t *list, const_char *start, const_char *end, int dtype):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyCapsule_New(__pyx_v_ptr, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 191, __pyx_L1_error)
+    __pyx_t_2 = PyCapsule_New(__pyx_v_ptr, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 192, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":190
+    /* "alpm.pyx":191
  * 
  * cdef object to_capsule(void *ptr):
  *     if ptr is not NULL:             # <<<<<<<<<<<<<<
@@ -2433,7 +2438,7 @@ static PyObject *__pyx_f_4alpm_to_capsule(void *__pyx_v_ptr) {
  */
   }
 
-  /* "alpm.pyx":189
+  /* "alpm.pyx":190
  *         return <alpm_pkg_t *>PyCapsule_GetPointer(capsule, NULL)
  * 
  * cdef object to_capsule(void *ptr):             # <<<<<<<<<<<<<<
@@ -2454,7 +2459,7 @@ static PyObject *__pyx_f_4alpm_to_capsule(void *__pyx_v_ptr) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":193
+/* "alpm.pyx":194
  *         return PyCapsule_New(ptr, NULL, NULL)
  * 
  * cdef char* join_list(alpm_list_t *list, const_char *start, const_char *end, int dtype):             # <<<<<<<<<<<<<<
@@ -2478,7 +2483,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
   int __pyx_t_3;
   __Pyx_RefNannySetupContext("join_list", 0);
 
-  /* "alpm.pyx":197
+  /* "alpm.pyx":198
  *     cdef char *buffer
  *     cdef const_char *cstr
  *     cdef int length = 0, pos = 0             # <<<<<<<<<<<<<<
@@ -2488,7 +2493,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
   __pyx_v_length = 0;
   __pyx_v_pos = 0;
 
-  /* "alpm.pyx":198
+  /* "alpm.pyx":199
  *     cdef const_char *cstr
  *     cdef int length = 0, pos = 0
  *     cdef size_t start_len = strlen(start)             # <<<<<<<<<<<<<<
@@ -2497,7 +2502,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
   __pyx_v_start_len = strlen(__pyx_v_start);
 
-  /* "alpm.pyx":199
+  /* "alpm.pyx":200
  *     cdef int length = 0, pos = 0
  *     cdef size_t start_len = strlen(start)
  *     cdef size_t end_len = strlen(end)             # <<<<<<<<<<<<<<
@@ -2506,7 +2511,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
   __pyx_v_end_len = strlen(__pyx_v_end);
 
-  /* "alpm.pyx":200
+  /* "alpm.pyx":201
  *     cdef size_t start_len = strlen(start)
  *     cdef size_t end_len = strlen(end)
  *     cdef size_t str_len = 0             # <<<<<<<<<<<<<<
@@ -2515,7 +2520,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
   __pyx_v_str_len = 0;
 
-  /* "alpm.pyx":202
+  /* "alpm.pyx":203
  *     cdef size_t str_len = 0
  * 
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -2525,7 +2530,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
   __pyx_t_1 = ((__pyx_v_list != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":203
+    /* "alpm.pyx":204
  * 
  *     if list is not NULL:
  *         node = list             # <<<<<<<<<<<<<<
@@ -2534,7 +2539,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
     __pyx_v_node = __pyx_v_list;
 
-    /* "alpm.pyx":204
+    /* "alpm.pyx":205
  *     if list is not NULL:
  *         node = list
  *         while node is not NULL:             # <<<<<<<<<<<<<<
@@ -2545,7 +2550,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
       if (!__pyx_t_1) break;
 
-      /* "alpm.pyx":205
+      /* "alpm.pyx":206
  *         node = list
  *         while node is not NULL:
  *             if dtype == DATA_TYPE_DEPENDS:             # <<<<<<<<<<<<<<
@@ -2555,7 +2560,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       __pyx_t_1 = ((__pyx_v_dtype == __pyx_e_4alpm_DATA_TYPE_DEPENDS) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":206
+        /* "alpm.pyx":207
  *         while node is not NULL:
  *             if dtype == DATA_TYPE_DEPENDS:
  *                 cstr = (<alpm_depend_t *>node.data).name             # <<<<<<<<<<<<<<
@@ -2565,7 +2570,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
         __pyx_t_2 = ((alpm_depend_t *)__pyx_v_node->data)->name;
         __pyx_v_cstr = __pyx_t_2;
 
-        /* "alpm.pyx":205
+        /* "alpm.pyx":206
  *         node = list
  *         while node is not NULL:
  *             if dtype == DATA_TYPE_DEPENDS:             # <<<<<<<<<<<<<<
@@ -2575,7 +2580,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
         goto __pyx_L6;
       }
 
-      /* "alpm.pyx":208
+      /* "alpm.pyx":209
  *                 cstr = (<alpm_depend_t *>node.data).name
  *             else:
  *                 cstr = <const_char *>node.data             # <<<<<<<<<<<<<<
@@ -2587,7 +2592,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       }
       __pyx_L6:;
 
-      /* "alpm.pyx":209
+      /* "alpm.pyx":210
  *             else:
  *                 cstr = <const_char *>node.data
  *             if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -2597,7 +2602,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       __pyx_t_1 = ((__pyx_v_cstr != NULL) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":210
+        /* "alpm.pyx":211
  *                 cstr = <const_char *>node.data
  *             if cstr is not NULL:
  *                 length += start_len + strlen(cstr) + end_len             # <<<<<<<<<<<<<<
@@ -2606,7 +2611,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
         __pyx_v_length = (__pyx_v_length + ((__pyx_v_start_len + strlen(__pyx_v_cstr)) + __pyx_v_end_len));
 
-        /* "alpm.pyx":209
+        /* "alpm.pyx":210
  *             else:
  *                 cstr = <const_char *>node.data
  *             if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -2615,7 +2620,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
       }
 
-      /* "alpm.pyx":211
+      /* "alpm.pyx":212
  *             if cstr is not NULL:
  *                 length += start_len + strlen(cstr) + end_len
  *             node = alpm_list_next(node)             # <<<<<<<<<<<<<<
@@ -2625,7 +2630,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       __pyx_v_node = alpm_list_next(__pyx_v_node);
     }
 
-    /* "alpm.pyx":212
+    /* "alpm.pyx":213
  *                 length += start_len + strlen(cstr) + end_len
  *             node = alpm_list_next(node)
  *         if length:             # <<<<<<<<<<<<<<
@@ -2635,7 +2640,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
     __pyx_t_1 = (__pyx_v_length != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":213
+      /* "alpm.pyx":214
  *             node = alpm_list_next(node)
  *         if length:
  *             length += 1             # <<<<<<<<<<<<<<
@@ -2644,7 +2649,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
       __pyx_v_length = (__pyx_v_length + 1);
 
-      /* "alpm.pyx":214
+      /* "alpm.pyx":215
  *         if length:
  *             length += 1
  *             buffer = <char *>malloc(sizeof(char) * length)             # <<<<<<<<<<<<<<
@@ -2653,7 +2658,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
       __pyx_v_buffer = ((char *)malloc(((sizeof(char)) * __pyx_v_length)));
 
-      /* "alpm.pyx":215
+      /* "alpm.pyx":216
  *             length += 1
  *             buffer = <char *>malloc(sizeof(char) * length)
  *             if buffer is not NULL:             # <<<<<<<<<<<<<<
@@ -2663,7 +2668,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
       __pyx_t_1 = ((__pyx_v_buffer != NULL) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":216
+        /* "alpm.pyx":217
  *             buffer = <char *>malloc(sizeof(char) * length)
  *             if buffer is not NULL:
  *                 buffer[0] = '\0'             # <<<<<<<<<<<<<<
@@ -2672,7 +2677,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
         (__pyx_v_buffer[0]) = '\x00';
 
-        /* "alpm.pyx":217
+        /* "alpm.pyx":218
  *             if buffer is not NULL:
  *                 buffer[0] = '\0'
  *                 node = list             # <<<<<<<<<<<<<<
@@ -2681,7 +2686,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
         __pyx_v_node = __pyx_v_list;
 
-        /* "alpm.pyx":218
+        /* "alpm.pyx":219
  *                 buffer[0] = '\0'
  *                 node = list
  *                 while node is not NULL:             # <<<<<<<<<<<<<<
@@ -2692,7 +2697,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
           if (!__pyx_t_1) break;
 
-          /* "alpm.pyx":219
+          /* "alpm.pyx":220
  *                 node = list
  *                 while node is not NULL:
  *                     if pos and end_len:             # <<<<<<<<<<<<<<
@@ -2710,7 +2715,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_L13_bool_binop_done:;
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":220
+            /* "alpm.pyx":221
  *                 while node is not NULL:
  *                     if pos and end_len:
  *                         memcpy(buffer + pos, end, end_len)             # <<<<<<<<<<<<<<
@@ -2719,7 +2724,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             memcpy((__pyx_v_buffer + __pyx_v_pos), __pyx_v_end, __pyx_v_end_len);
 
-            /* "alpm.pyx":221
+            /* "alpm.pyx":222
  *                     if pos and end_len:
  *                         memcpy(buffer + pos, end, end_len)
  *                         pos += end_len             # <<<<<<<<<<<<<<
@@ -2728,7 +2733,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             __pyx_v_pos = (__pyx_v_pos + __pyx_v_end_len);
 
-            /* "alpm.pyx":219
+            /* "alpm.pyx":220
  *                 node = list
  *                 while node is not NULL:
  *                     if pos and end_len:             # <<<<<<<<<<<<<<
@@ -2737,7 +2742,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
           }
 
-          /* "alpm.pyx":222
+          /* "alpm.pyx":223
  *                         memcpy(buffer + pos, end, end_len)
  *                         pos += end_len
  *                     if start_len:             # <<<<<<<<<<<<<<
@@ -2747,7 +2752,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_t_1 = (__pyx_v_start_len != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":223
+            /* "alpm.pyx":224
  *                         pos += end_len
  *                     if start_len:
  *                         memcpy(buffer + pos, start, start_len)             # <<<<<<<<<<<<<<
@@ -2756,7 +2761,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             memcpy((__pyx_v_buffer + __pyx_v_pos), __pyx_v_start, __pyx_v_start_len);
 
-            /* "alpm.pyx":224
+            /* "alpm.pyx":225
  *                     if start_len:
  *                         memcpy(buffer + pos, start, start_len)
  *                         pos += start_len             # <<<<<<<<<<<<<<
@@ -2765,7 +2770,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             __pyx_v_pos = (__pyx_v_pos + __pyx_v_start_len);
 
-            /* "alpm.pyx":222
+            /* "alpm.pyx":223
  *                         memcpy(buffer + pos, end, end_len)
  *                         pos += end_len
  *                     if start_len:             # <<<<<<<<<<<<<<
@@ -2774,7 +2779,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
           }
 
-          /* "alpm.pyx":225
+          /* "alpm.pyx":226
  *                         memcpy(buffer + pos, start, start_len)
  *                         pos += start_len
  *                     if dtype == DATA_TYPE_DEPENDS:             # <<<<<<<<<<<<<<
@@ -2784,7 +2789,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_t_1 = ((__pyx_v_dtype == __pyx_e_4alpm_DATA_TYPE_DEPENDS) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":226
+            /* "alpm.pyx":227
  *                         pos += start_len
  *                     if dtype == DATA_TYPE_DEPENDS:
  *                         cstr = (<alpm_depend_t *>node.data).name             # <<<<<<<<<<<<<<
@@ -2794,7 +2799,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
             __pyx_t_2 = ((alpm_depend_t *)__pyx_v_node->data)->name;
             __pyx_v_cstr = __pyx_t_2;
 
-            /* "alpm.pyx":225
+            /* "alpm.pyx":226
  *                         memcpy(buffer + pos, start, start_len)
  *                         pos += start_len
  *                     if dtype == DATA_TYPE_DEPENDS:             # <<<<<<<<<<<<<<
@@ -2804,7 +2809,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
             goto __pyx_L16;
           }
 
-          /* "alpm.pyx":228
+          /* "alpm.pyx":229
  *                         cstr = (<alpm_depend_t *>node.data).name
  *                     else:
  *                         cstr = <const_char *>node.data             # <<<<<<<<<<<<<<
@@ -2816,7 +2821,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           }
           __pyx_L16:;
 
-          /* "alpm.pyx":229
+          /* "alpm.pyx":230
  *                     else:
  *                         cstr = <const_char *>node.data
  *                     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -2826,7 +2831,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_t_1 = ((__pyx_v_cstr != NULL) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":230
+            /* "alpm.pyx":231
  *                         cstr = <const_char *>node.data
  *                     if cstr is not NULL:
  *                         str_len = strlen(cstr)             # <<<<<<<<<<<<<<
@@ -2835,7 +2840,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             __pyx_v_str_len = strlen(__pyx_v_cstr);
 
-            /* "alpm.pyx":231
+            /* "alpm.pyx":232
  *                     if cstr is not NULL:
  *                         str_len = strlen(cstr)
  *                         memcpy(buffer + pos, cstr, str_len + 1)             # <<<<<<<<<<<<<<
@@ -2844,7 +2849,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             memcpy((__pyx_v_buffer + __pyx_v_pos), __pyx_v_cstr, (__pyx_v_str_len + 1));
 
-            /* "alpm.pyx":232
+            /* "alpm.pyx":233
  *                         str_len = strlen(cstr)
  *                         memcpy(buffer + pos, cstr, str_len + 1)
  *                         pos += str_len             # <<<<<<<<<<<<<<
@@ -2853,7 +2858,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             __pyx_v_pos = (__pyx_v_pos + __pyx_v_str_len);
 
-            /* "alpm.pyx":233
+            /* "alpm.pyx":234
  *                         memcpy(buffer + pos, cstr, str_len + 1)
  *                         pos += str_len
  *                         buffer[pos] = '\0'             # <<<<<<<<<<<<<<
@@ -2862,7 +2867,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
             (__pyx_v_buffer[__pyx_v_pos]) = '\x00';
 
-            /* "alpm.pyx":229
+            /* "alpm.pyx":230
  *                     else:
  *                         cstr = <const_char *>node.data
  *                     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -2871,7 +2876,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
           }
 
-          /* "alpm.pyx":234
+          /* "alpm.pyx":235
  *                         pos += str_len
  *                         buffer[pos] = '\0'
  *                     node = alpm_list_next(node)             # <<<<<<<<<<<<<<
@@ -2881,7 +2886,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
           __pyx_v_node = alpm_list_next(__pyx_v_node);
         }
 
-        /* "alpm.pyx":235
+        /* "alpm.pyx":236
  *                         buffer[pos] = '\0'
  *                     node = alpm_list_next(node)
  *                 return buffer             # <<<<<<<<<<<<<<
@@ -2891,7 +2896,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
         __pyx_r = __pyx_v_buffer;
         goto __pyx_L0;
 
-        /* "alpm.pyx":215
+        /* "alpm.pyx":216
  *             length += 1
  *             buffer = <char *>malloc(sizeof(char) * length)
  *             if buffer is not NULL:             # <<<<<<<<<<<<<<
@@ -2900,7 +2905,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
       }
 
-      /* "alpm.pyx":212
+      /* "alpm.pyx":213
  *                 length += start_len + strlen(cstr) + end_len
  *             node = alpm_list_next(node)
  *         if length:             # <<<<<<<<<<<<<<
@@ -2909,7 +2914,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
     }
 
-    /* "alpm.pyx":202
+    /* "alpm.pyx":203
  *     cdef size_t str_len = 0
  * 
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -2918,7 +2923,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
  */
   }
 
-  /* "alpm.pyx":193
+  /* "alpm.pyx":194
  *         return PyCapsule_New(ptr, NULL, NULL)
  * 
  * cdef char* join_list(alpm_list_t *list, const_char *start, const_char *end, int dtype):             # <<<<<<<<<<<<<<
@@ -2933,7 +2938,7 @@ static char *__pyx_f_4alpm_join_list(alpm_list_t *__pyx_v_list, const char *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":237
+/* "alpm.pyx":238
  *                 return buffer
  * 
  * cdef alpm_list_t* create_dep_list(alpm_list_t *deps):             # <<<<<<<<<<<<<<
@@ -2949,7 +2954,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("create_dep_list", 0);
 
-  /* "alpm.pyx":238
+  /* "alpm.pyx":239
  * 
  * cdef alpm_list_t* create_dep_list(alpm_list_t *deps):
  *     cdef alpm_list_t *list = NULL             # <<<<<<<<<<<<<<
@@ -2958,7 +2963,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
  */
   __pyx_v_list = NULL;
 
-  /* "alpm.pyx":241
+  /* "alpm.pyx":242
  *     cdef alpm_list_t *node
  * 
  *     node = deps             # <<<<<<<<<<<<<<
@@ -2967,7 +2972,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
  */
   __pyx_v_node = __pyx_v_deps;
 
-  /* "alpm.pyx":242
+  /* "alpm.pyx":243
  * 
  *     node = deps
  *     while node is not NULL:             # <<<<<<<<<<<<<<
@@ -2978,7 +2983,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
     __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
     if (!__pyx_t_1) break;
 
-    /* "alpm.pyx":243
+    /* "alpm.pyx":244
  *     node = deps
  *     while node is not NULL:
  *         list = alpm_list_add(list, alpm_dep_compute_string(<alpm_depend_t *>node.data))             # <<<<<<<<<<<<<<
@@ -2987,7 +2992,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
  */
     __pyx_v_list = alpm_list_add(__pyx_v_list, alpm_dep_compute_string(((alpm_depend_t *)__pyx_v_node->data)));
 
-    /* "alpm.pyx":244
+    /* "alpm.pyx":245
  *     while node is not NULL:
  *         list = alpm_list_add(list, alpm_dep_compute_string(<alpm_depend_t *>node.data))
  *         node = alpm_list_next(node)             # <<<<<<<<<<<<<<
@@ -2997,7 +3002,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
     __pyx_v_node = alpm_list_next(__pyx_v_node);
   }
 
-  /* "alpm.pyx":245
+  /* "alpm.pyx":246
  *         list = alpm_list_add(list, alpm_dep_compute_string(<alpm_depend_t *>node.data))
  *         node = alpm_list_next(node)
  *     return list             # <<<<<<<<<<<<<<
@@ -3007,7 +3012,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
   __pyx_r = __pyx_v_list;
   goto __pyx_L0;
 
-  /* "alpm.pyx":237
+  /* "alpm.pyx":238
  *                 return buffer
  * 
  * cdef alpm_list_t* create_dep_list(alpm_list_t *deps):             # <<<<<<<<<<<<<<
@@ -3021,7 +3026,7 @@ static alpm_list_t *__pyx_f_4alpm_create_dep_list(alpm_list_t *__pyx_v_deps) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":247
+/* "alpm.pyx":248
  *     return list
  * 
  * cdef const_char* find_pkg_repository(alpm_pkg_t *pkg):             # <<<<<<<<<<<<<<
@@ -3039,7 +3044,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("find_pkg_repository", 0);
 
-  /* "alpm.pyx":252
+  /* "alpm.pyx":253
  *     cdef const_char *name
  * 
  *     if handle is not NULL and pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -3057,7 +3062,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":253
+    /* "alpm.pyx":254
  * 
  *     if handle is not NULL and pkg is not NULL:
  *         if alpm_pkg_get_installdate(pkg):             # <<<<<<<<<<<<<<
@@ -3067,7 +3072,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
     __pyx_t_1 = (alpm_pkg_get_installdate(__pyx_v_pkg) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":254
+      /* "alpm.pyx":255
  *     if handle is not NULL and pkg is not NULL:
  *         if alpm_pkg_get_installdate(pkg):
  *             name = alpm_pkg_get_name(pkg)             # <<<<<<<<<<<<<<
@@ -3076,7 +3081,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
       __pyx_v_name = alpm_pkg_get_name(__pyx_v_pkg);
 
-      /* "alpm.pyx":255
+      /* "alpm.pyx":256
  *         if alpm_pkg_get_installdate(pkg):
  *             name = alpm_pkg_get_name(pkg)
  *             dbs = alpm_get_syncdbs(handle)             # <<<<<<<<<<<<<<
@@ -3085,7 +3090,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
       __pyx_v_dbs = alpm_get_syncdbs(__pyx_v_4alpm_handle);
 
-      /* "alpm.pyx":256
+      /* "alpm.pyx":257
  *             name = alpm_pkg_get_name(pkg)
  *             dbs = alpm_get_syncdbs(handle)
  *             while dbs is not NULL:             # <<<<<<<<<<<<<<
@@ -3096,7 +3101,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
         __pyx_t_1 = ((__pyx_v_dbs != NULL) != 0);
         if (!__pyx_t_1) break;
 
-        /* "alpm.pyx":257
+        /* "alpm.pyx":258
  *             dbs = alpm_get_syncdbs(handle)
  *             while dbs is not NULL:
  *                 db = <alpm_db_t *>dbs.data             # <<<<<<<<<<<<<<
@@ -3105,7 +3110,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
         __pyx_v_db = ((alpm_db_t *)__pyx_v_dbs->data);
 
-        /* "alpm.pyx":258
+        /* "alpm.pyx":259
  *             while dbs is not NULL:
  *                 db = <alpm_db_t *>dbs.data
  *                 if alpm_db_get_pkg(db, name) is not NULL:             # <<<<<<<<<<<<<<
@@ -3115,7 +3120,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
         __pyx_t_1 = ((alpm_db_get_pkg(__pyx_v_db, __pyx_v_name) != NULL) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":259
+          /* "alpm.pyx":260
  *                 db = <alpm_db_t *>dbs.data
  *                 if alpm_db_get_pkg(db, name) is not NULL:
  *                     return alpm_db_get_name(db)             # <<<<<<<<<<<<<<
@@ -3125,7 +3130,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
           __pyx_r = alpm_db_get_name(__pyx_v_db);
           goto __pyx_L0;
 
-          /* "alpm.pyx":258
+          /* "alpm.pyx":259
  *             while dbs is not NULL:
  *                 db = <alpm_db_t *>dbs.data
  *                 if alpm_db_get_pkg(db, name) is not NULL:             # <<<<<<<<<<<<<<
@@ -3134,7 +3139,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
         }
 
-        /* "alpm.pyx":260
+        /* "alpm.pyx":261
  *                 if alpm_db_get_pkg(db, name) is not NULL:
  *                     return alpm_db_get_name(db)
  *                 dbs = alpm_list_next(dbs)             # <<<<<<<<<<<<<<
@@ -3144,7 +3149,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
         __pyx_v_dbs = alpm_list_next(__pyx_v_dbs);
       }
 
-      /* "alpm.pyx":253
+      /* "alpm.pyx":254
  * 
  *     if handle is not NULL and pkg is not NULL:
  *         if alpm_pkg_get_installdate(pkg):             # <<<<<<<<<<<<<<
@@ -3153,7 +3158,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
     }
 
-    /* "alpm.pyx":261
+    /* "alpm.pyx":262
  *                     return alpm_db_get_name(db)
  *                 dbs = alpm_list_next(dbs)
  *         return alpm_db_get_name(alpm_pkg_get_db(pkg))             # <<<<<<<<<<<<<<
@@ -3163,7 +3168,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
     __pyx_r = alpm_db_get_name(alpm_pkg_get_db(__pyx_v_pkg));
     goto __pyx_L0;
 
-    /* "alpm.pyx":252
+    /* "alpm.pyx":253
  *     cdef const_char *name
  * 
  *     if handle is not NULL and pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -3172,7 +3177,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
  */
   }
 
-  /* "alpm.pyx":247
+  /* "alpm.pyx":248
  *     return list
  * 
  * cdef const_char* find_pkg_repository(alpm_pkg_t *pkg):             # <<<<<<<<<<<<<<
@@ -3187,7 +3192,7 @@ static const char *__pyx_f_4alpm_find_pkg_repository(alpm_pkg_t *__pyx_v_pkg) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":263
+/* "alpm.pyx":264
  *         return alpm_db_get_name(alpm_pkg_get_db(pkg))
  * 
  * cdef alpm_pkg_t* filter_by_func(const_char *target, alpm_list_t *(*func)(alpm_pkg_t *), int local):             # <<<<<<<<<<<<<<
@@ -3209,7 +3214,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
   char *__pyx_t_3;
   __Pyx_RefNannySetupContext("filter_by_func", 0);
 
-  /* "alpm.pyx":264
+  /* "alpm.pyx":265
  * 
  * cdef alpm_pkg_t* filter_by_func(const_char *target, alpm_list_t *(*func)(alpm_pkg_t *), int local):
  *     cdef alpm_list_t *dbsnode = NULL             # <<<<<<<<<<<<<<
@@ -3218,7 +3223,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
   __pyx_v_dbsnode = NULL;
 
-  /* "alpm.pyx":271
+  /* "alpm.pyx":272
  *     cdef const_char *candidate
  * 
  *     if handle is not NULL and target is not NULL:             # <<<<<<<<<<<<<<
@@ -3236,7 +3241,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":272
+    /* "alpm.pyx":273
  * 
  *     if handle is not NULL and target is not NULL:
  *         dbsnode = alpm_list_add(dbsnode, alpm_get_localdb(handle))             # <<<<<<<<<<<<<<
@@ -3245,7 +3250,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
     __pyx_v_dbsnode = alpm_list_add(__pyx_v_dbsnode, alpm_get_localdb(__pyx_v_4alpm_handle));
 
-    /* "alpm.pyx":273
+    /* "alpm.pyx":274
  *     if handle is not NULL and target is not NULL:
  *         dbsnode = alpm_list_add(dbsnode, alpm_get_localdb(handle))
  *         if not local:             # <<<<<<<<<<<<<<
@@ -3255,7 +3260,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
     __pyx_t_1 = ((!(__pyx_v_local != 0)) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":274
+      /* "alpm.pyx":275
  *         dbsnode = alpm_list_add(dbsnode, alpm_get_localdb(handle))
  *         if not local:
  *             dbsnode = alpm_list_join(dbsnode, alpm_get_syncdbs(handle))             # <<<<<<<<<<<<<<
@@ -3264,7 +3269,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
       __pyx_v_dbsnode = alpm_list_join(__pyx_v_dbsnode, alpm_get_syncdbs(__pyx_v_4alpm_handle));
 
-      /* "alpm.pyx":273
+      /* "alpm.pyx":274
  *     if handle is not NULL and target is not NULL:
  *         dbsnode = alpm_list_add(dbsnode, alpm_get_localdb(handle))
  *         if not local:             # <<<<<<<<<<<<<<
@@ -3273,7 +3278,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
     }
 
-    /* "alpm.pyx":275
+    /* "alpm.pyx":276
  *         if not local:
  *             dbsnode = alpm_list_join(dbsnode, alpm_get_syncdbs(handle))
  *         while dbsnode is not NULL:             # <<<<<<<<<<<<<<
@@ -3284,7 +3289,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
       __pyx_t_1 = ((__pyx_v_dbsnode != NULL) != 0);
       if (!__pyx_t_1) break;
 
-      /* "alpm.pyx":276
+      /* "alpm.pyx":277
  *             dbsnode = alpm_list_join(dbsnode, alpm_get_syncdbs(handle))
  *         while dbsnode is not NULL:
  *             db = <alpm_db_t *>dbsnode.data             # <<<<<<<<<<<<<<
@@ -3293,7 +3298,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
       __pyx_v_db = ((alpm_db_t *)__pyx_v_dbsnode->data);
 
-      /* "alpm.pyx":277
+      /* "alpm.pyx":278
  *         while dbsnode is not NULL:
  *             db = <alpm_db_t *>dbsnode.data
  *             pkgnode = alpm_db_get_pkgcache(db)             # <<<<<<<<<<<<<<
@@ -3302,7 +3307,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
       __pyx_v_pkgnode = alpm_db_get_pkgcache(__pyx_v_db);
 
-      /* "alpm.pyx":278
+      /* "alpm.pyx":279
  *             db = <alpm_db_t *>dbsnode.data
  *             pkgnode = alpm_db_get_pkgcache(db)
  *             while pkgnode is not NULL:             # <<<<<<<<<<<<<<
@@ -3313,7 +3318,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
         __pyx_t_1 = ((__pyx_v_pkgnode != NULL) != 0);
         if (!__pyx_t_1) break;
 
-        /* "alpm.pyx":279
+        /* "alpm.pyx":280
  *             pkgnode = alpm_db_get_pkgcache(db)
  *             while pkgnode is not NULL:
  *                 pkg = <alpm_pkg_t *>pkgnode.data             # <<<<<<<<<<<<<<
@@ -3322,7 +3327,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
         __pyx_v_pkg = ((alpm_pkg_t *)__pyx_v_pkgnode->data);
 
-        /* "alpm.pyx":280
+        /* "alpm.pyx":281
  *             while pkgnode is not NULL:
  *                 pkg = <alpm_pkg_t *>pkgnode.data
  *                 datnode = func(pkg)             # <<<<<<<<<<<<<<
@@ -3331,7 +3336,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
         __pyx_v_datnode = __pyx_v_func(__pyx_v_pkg);
 
-        /* "alpm.pyx":281
+        /* "alpm.pyx":282
  *                 pkg = <alpm_pkg_t *>pkgnode.data
  *                 datnode = func(pkg)
  *                 while datnode is not NULL:             # <<<<<<<<<<<<<<
@@ -3342,7 +3347,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
           __pyx_t_1 = ((__pyx_v_datnode != NULL) != 0);
           if (!__pyx_t_1) break;
 
-          /* "alpm.pyx":282
+          /* "alpm.pyx":283
  *                 datnode = func(pkg)
  *                 while datnode is not NULL:
  *                     candidate = (<alpm_depend_t *>datnode.data).name             # <<<<<<<<<<<<<<
@@ -3352,7 +3357,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
           __pyx_t_3 = ((alpm_depend_t *)__pyx_v_datnode->data)->name;
           __pyx_v_candidate = __pyx_t_3;
 
-          /* "alpm.pyx":283
+          /* "alpm.pyx":284
  *                 while datnode is not NULL:
  *                     candidate = (<alpm_depend_t *>datnode.data).name
  *                     if strcmp(candidate, target) == 0:             # <<<<<<<<<<<<<<
@@ -3362,7 +3367,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
           __pyx_t_1 = ((strcmp(__pyx_v_candidate, __pyx_v_target) == 0) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":284
+            /* "alpm.pyx":285
  *                     candidate = (<alpm_depend_t *>datnode.data).name
  *                     if strcmp(candidate, target) == 0:
  *                         return pkg             # <<<<<<<<<<<<<<
@@ -3372,7 +3377,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
             __pyx_r = __pyx_v_pkg;
             goto __pyx_L0;
 
-            /* "alpm.pyx":283
+            /* "alpm.pyx":284
  *                 while datnode is not NULL:
  *                     candidate = (<alpm_depend_t *>datnode.data).name
  *                     if strcmp(candidate, target) == 0:             # <<<<<<<<<<<<<<
@@ -3381,7 +3386,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
           }
 
-          /* "alpm.pyx":285
+          /* "alpm.pyx":286
  *                     if strcmp(candidate, target) == 0:
  *                         return pkg
  *                     datnode = alpm_list_next(datnode)             # <<<<<<<<<<<<<<
@@ -3391,7 +3396,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
           __pyx_v_datnode = alpm_list_next(__pyx_v_datnode);
         }
 
-        /* "alpm.pyx":286
+        /* "alpm.pyx":287
  *                         return pkg
  *                     datnode = alpm_list_next(datnode)
  *                 pkgnode = alpm_list_next(pkgnode)             # <<<<<<<<<<<<<<
@@ -3401,7 +3406,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
         __pyx_v_pkgnode = alpm_list_next(__pyx_v_pkgnode);
       }
 
-      /* "alpm.pyx":287
+      /* "alpm.pyx":288
  *                     datnode = alpm_list_next(datnode)
  *                 pkgnode = alpm_list_next(pkgnode)
  *             dbsnode = alpm_list_next(dbsnode)             # <<<<<<<<<<<<<<
@@ -3411,7 +3416,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
       __pyx_v_dbsnode = alpm_list_next(__pyx_v_dbsnode);
     }
 
-    /* "alpm.pyx":271
+    /* "alpm.pyx":272
  *     cdef const_char *candidate
  * 
  *     if handle is not NULL and target is not NULL:             # <<<<<<<<<<<<<<
@@ -3420,7 +3425,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
  */
   }
 
-  /* "alpm.pyx":263
+  /* "alpm.pyx":264
  *         return alpm_db_get_name(alpm_pkg_get_db(pkg))
  * 
  * cdef alpm_pkg_t* filter_by_func(const_char *target, alpm_list_t *(*func)(alpm_pkg_t *), int local):             # <<<<<<<<<<<<<<
@@ -3435,7 +3440,7 @@ static alpm_pkg_t *__pyx_f_4alpm_filter_by_func(const char *__pyx_v_target, alpm
   return __pyx_r;
 }
 
-/* "alpm.pyx":289
+/* "alpm.pyx":290
  *             dbsnode = alpm_list_next(dbsnode)
  * 
  * cdef pkg_vcs_t check_vcs(const_char *name):             # <<<<<<<<<<<<<<
@@ -3456,7 +3461,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
   int __pyx_t_4;
   __Pyx_RefNannySetupContext("check_vcs", 0);
 
-  /* "alpm.pyx":290
+  /* "alpm.pyx":291
  * 
  * cdef pkg_vcs_t check_vcs(const_char *name):
  *     cdef const_char **vcs = ['-git', '-svn', '-hg', '-bzr', '-cvs', '-darcs']             # <<<<<<<<<<<<<<
@@ -3471,7 +3476,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
   __pyx_t_1[5] = ((const char *)"-darcs");
   __pyx_v_vcs = __pyx_t_1;
 
-  /* "alpm.pyx":293
+  /* "alpm.pyx":294
  *     cdef size_t i, vcs_len, name_len
  * 
  *     if name is not NULL:             # <<<<<<<<<<<<<<
@@ -3481,7 +3486,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
   __pyx_t_2 = ((__pyx_v_name != NULL) != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":294
+    /* "alpm.pyx":295
  * 
  *     if name is not NULL:
  *         name_len = strlen(name)             # <<<<<<<<<<<<<<
@@ -3490,7 +3495,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
  */
     __pyx_v_name_len = strlen(__pyx_v_name);
 
-    /* "alpm.pyx":295
+    /* "alpm.pyx":296
  *     if name is not NULL:
  *         name_len = strlen(name)
  *         for i in range(6):             # <<<<<<<<<<<<<<
@@ -3500,7 +3505,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
     for (__pyx_t_3 = 0; __pyx_t_3 < 6; __pyx_t_3+=1) {
       __pyx_v_i = __pyx_t_3;
 
-      /* "alpm.pyx":296
+      /* "alpm.pyx":297
  *         name_len = strlen(name)
  *         for i in range(6):
  *             vcs_len = strlen(vcs[i])             # <<<<<<<<<<<<<<
@@ -3509,7 +3514,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
  */
       __pyx_v_vcs_len = strlen((__pyx_v_vcs[__pyx_v_i]));
 
-      /* "alpm.pyx":297
+      /* "alpm.pyx":298
  *         for i in range(6):
  *             vcs_len = strlen(vcs[i])
  *             if name_len > vcs_len and strcmp(name + name_len - vcs_len, vcs[i]) == 0:             # <<<<<<<<<<<<<<
@@ -3527,7 +3532,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
       __pyx_L7_bool_binop_done:;
       if (__pyx_t_2) {
 
-        /* "alpm.pyx":298
+        /* "alpm.pyx":299
  *             vcs_len = strlen(vcs[i])
  *             if name_len > vcs_len and strcmp(name + name_len - vcs_len, vcs[i]) == 0:
  *                 return <pkg_vcs_t>(i + 1)             # <<<<<<<<<<<<<<
@@ -3537,7 +3542,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
         __pyx_r = ((enum __pyx_t_4alpm_pkg_vcs_t)(__pyx_v_i + 1));
         goto __pyx_L0;
 
-        /* "alpm.pyx":297
+        /* "alpm.pyx":298
  *         for i in range(6):
  *             vcs_len = strlen(vcs[i])
  *             if name_len > vcs_len and strcmp(name + name_len - vcs_len, vcs[i]) == 0:             # <<<<<<<<<<<<<<
@@ -3547,7 +3552,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
       }
     }
 
-    /* "alpm.pyx":293
+    /* "alpm.pyx":294
  *     cdef size_t i, vcs_len, name_len
  * 
  *     if name is not NULL:             # <<<<<<<<<<<<<<
@@ -3556,7 +3561,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
  */
   }
 
-  /* "alpm.pyx":299
+  /* "alpm.pyx":300
  *             if name_len > vcs_len and strcmp(name + name_len - vcs_len, vcs[i]) == 0:
  *                 return <pkg_vcs_t>(i + 1)
  *     return VCS_NULL             # <<<<<<<<<<<<<<
@@ -3566,7 +3571,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
   __pyx_r = __pyx_e_4alpm_VCS_NULL;
   goto __pyx_L0;
 
-  /* "alpm.pyx":289
+  /* "alpm.pyx":290
  *             dbsnode = alpm_list_next(dbsnode)
  * 
  * cdef pkg_vcs_t check_vcs(const_char *name):             # <<<<<<<<<<<<<<
@@ -3580,7 +3585,7 @@ static enum __pyx_t_4alpm_pkg_vcs_t __pyx_f_4alpm_check_vcs(const char *__pyx_v_
   return __pyx_r;
 }
 
-/* "alpm.pyx":301
+/* "alpm.pyx":302
  *     return VCS_NULL
  * 
  * def initialize(object proot, object pdbpath):             # <<<<<<<<<<<<<<
@@ -3617,11 +3622,11 @@ static PyObject *__pyx_pw_4alpm_1initialize(PyObject *__pyx_self, PyObject *__py
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdbpath)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("initialize", 1, 2, 2, 1); __PYX_ERR(0, 301, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("initialize", 1, 2, 2, 1); __PYX_ERR(0, 302, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "initialize") < 0)) __PYX_ERR(0, 301, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "initialize") < 0)) __PYX_ERR(0, 302, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3634,7 +3639,7 @@ static PyObject *__pyx_pw_4alpm_1initialize(PyObject *__pyx_self, PyObject *__py
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("initialize", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 301, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("initialize", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 302, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.initialize", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3663,26 +3668,26 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   int __pyx_t_7;
   __Pyx_RefNannySetupContext("initialize", 0);
 
-  /* "alpm.pyx":306
+  /* "alpm.pyx":307
  *     cdef bytes root, dbpath
  * 
  *     import sys             # <<<<<<<<<<<<<<
  *     fs_encoding = sys.getfilesystemencoding()
  *     root = to_bytes(proot, fs_encoding, fs_errors)
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_sys, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_sys, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_sys = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":307
+  /* "alpm.pyx":308
  * 
  *     import sys
  *     fs_encoding = sys.getfilesystemencoding()             # <<<<<<<<<<<<<<
  *     root = to_bytes(proot, fs_encoding, fs_errors)
  *     dbpath = to_bytes(pdbpath, fs_encoding, fs_errors)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sys, __pyx_n_s_getfilesystemencoding); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sys, __pyx_n_s_getfilesystemencoding); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 308, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -3695,20 +3700,20 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
     }
   }
   if (__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
   }
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 307, __pyx_L1_error)
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 308, __pyx_L1_error)
   __Pyx_XGOTREF(__pyx_v_4alpm_fs_encoding);
   __Pyx_DECREF_SET(__pyx_v_4alpm_fs_encoding, ((PyObject*)__pyx_t_1));
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":308
+  /* "alpm.pyx":309
  *     import sys
  *     fs_encoding = sys.getfilesystemencoding()
  *     root = to_bytes(proot, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -3722,14 +3727,14 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   __pyx_t_4.__pyx_n = 2;
   __pyx_t_4.encoding = ((PyObject*)__pyx_t_1);
   __pyx_t_4.errors = ((PyObject*)__pyx_t_2);
-  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_proot, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_proot, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_root = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "alpm.pyx":309
+  /* "alpm.pyx":310
  *     fs_encoding = sys.getfilesystemencoding()
  *     root = to_bytes(proot, fs_encoding, fs_errors)
  *     dbpath = to_bytes(pdbpath, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -3743,25 +3748,25 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   __pyx_t_4.__pyx_n = 2;
   __pyx_t_4.encoding = ((PyObject*)__pyx_t_3);
   __pyx_t_4.errors = ((PyObject*)__pyx_t_2);
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pdbpath, &__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pdbpath, &__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 310, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_dbpath = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":310
+  /* "alpm.pyx":311
  *     root = to_bytes(proot, fs_encoding, fs_errors)
  *     dbpath = to_bytes(pdbpath, fs_encoding, fs_errors)
  *     handle = alpm_initialize(root, dbpath, &err)             # <<<<<<<<<<<<<<
  *     if handle is NULL:
  *         return <int>err
  */
-  __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_root); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 310, __pyx_L1_error)
-  __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_dbpath); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 310, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_root); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_dbpath); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L1_error)
   __pyx_v_4alpm_handle = alpm_initialize(__pyx_t_5, __pyx_t_6, (&__pyx_v_err));
 
-  /* "alpm.pyx":311
+  /* "alpm.pyx":312
  *     dbpath = to_bytes(pdbpath, fs_encoding, fs_errors)
  *     handle = alpm_initialize(root, dbpath, &err)
  *     if handle is NULL:             # <<<<<<<<<<<<<<
@@ -3771,7 +3776,7 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   __pyx_t_7 = ((__pyx_v_4alpm_handle == NULL) != 0);
   if (__pyx_t_7) {
 
-    /* "alpm.pyx":312
+    /* "alpm.pyx":313
  *     handle = alpm_initialize(root, dbpath, &err)
  *     if handle is NULL:
  *         return <int>err             # <<<<<<<<<<<<<<
@@ -3779,13 +3784,13 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = __Pyx_PyInt_From_int(((int)__pyx_v_err)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_From_int(((int)__pyx_v_err)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 313, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_r = __pyx_t_1;
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":311
+    /* "alpm.pyx":312
  *     dbpath = to_bytes(pdbpath, fs_encoding, fs_errors)
  *     handle = alpm_initialize(root, dbpath, &err)
  *     if handle is NULL:             # <<<<<<<<<<<<<<
@@ -3794,7 +3799,7 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
  */
   }
 
-  /* "alpm.pyx":313
+  /* "alpm.pyx":314
  *     if handle is NULL:
  *         return <int>err
  *     return 0             # <<<<<<<<<<<<<<
@@ -3806,7 +3811,7 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   __pyx_r = __pyx_int_0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":301
+  /* "alpm.pyx":302
  *     return VCS_NULL
  * 
  * def initialize(object proot, object pdbpath):             # <<<<<<<<<<<<<<
@@ -3830,7 +3835,7 @@ static PyObject *__pyx_pf_4alpm_initialize(CYTHON_UNUSED PyObject *__pyx_self, P
   return __pyx_r;
 }
 
-/* "alpm.pyx":315
+/* "alpm.pyx":316
  *     return 0
  * 
  * def release():             # <<<<<<<<<<<<<<
@@ -3859,7 +3864,7 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("release", 0);
 
-  /* "alpm.pyx":316
+  /* "alpm.pyx":317
  * 
  * def release():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -3869,7 +3874,7 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":317
+    /* "alpm.pyx":318
  * def release():
  *     if handle is not NULL:
  *         return alpm_release(handle)             # <<<<<<<<<<<<<<
@@ -3877,13 +3882,13 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_release(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_release(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":316
+    /* "alpm.pyx":317
  * 
  * def release():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -3892,7 +3897,7 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
  */
   }
 
-  /* "alpm.pyx":318
+  /* "alpm.pyx":319
  *     if handle is not NULL:
  *         return alpm_release(handle)
  *     return -1             # <<<<<<<<<<<<<<
@@ -3904,7 +3909,7 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
   __pyx_r = __pyx_int_neg_1;
   goto __pyx_L0;
 
-  /* "alpm.pyx":315
+  /* "alpm.pyx":316
  *     return 0
  * 
  * def release():             # <<<<<<<<<<<<<<
@@ -3923,7 +3928,7 @@ static PyObject *__pyx_pf_4alpm_2release(CYTHON_UNUSED PyObject *__pyx_self) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":320
+/* "alpm.pyx":321
  *     return -1
  * 
  * def version():             # <<<<<<<<<<<<<<
@@ -3951,7 +3956,7 @@ static PyObject *__pyx_pf_4alpm_4version(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("version", 0);
 
-  /* "alpm.pyx":321
+  /* "alpm.pyx":322
  * 
  * def version():
  *     return to_unicode(<char *>alpm_version())             # <<<<<<<<<<<<<<
@@ -3959,13 +3964,13 @@ static PyObject *__pyx_pf_4alpm_4version(CYTHON_UNUSED PyObject *__pyx_self) {
  * def is_initialized():
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_4alpm_to_unicode(((char *)alpm_version()), NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_unicode(((char *)alpm_version()), NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":320
+  /* "alpm.pyx":321
  *     return -1
  * 
  * def version():             # <<<<<<<<<<<<<<
@@ -3984,7 +3989,7 @@ static PyObject *__pyx_pf_4alpm_4version(CYTHON_UNUSED PyObject *__pyx_self) {
   return __pyx_r;
 }
 
-/* "alpm.pyx":323
+/* "alpm.pyx":324
  *     return to_unicode(<char *>alpm_version())
  * 
  * def is_initialized():             # <<<<<<<<<<<<<<
@@ -4012,7 +4017,7 @@ static PyObject *__pyx_pf_4alpm_6is_initialized(CYTHON_UNUSED PyObject *__pyx_se
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("is_initialized", 0);
 
-  /* "alpm.pyx":324
+  /* "alpm.pyx":325
  * 
  * def is_initialized():
  *     return handle is not NULL             # <<<<<<<<<<<<<<
@@ -4020,13 +4025,13 @@ static PyObject *__pyx_pf_4alpm_6is_initialized(CYTHON_UNUSED PyObject *__pyx_se
  * ERR_NOT_A_FILE = ALPM_ERR_NOT_A_FILE
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_4alpm_handle != NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_4alpm_handle != NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":323
+  /* "alpm.pyx":324
  *     return to_unicode(<char *>alpm_version())
  * 
  * def is_initialized():             # <<<<<<<<<<<<<<
@@ -4045,7 +4050,7 @@ static PyObject *__pyx_pf_4alpm_6is_initialized(CYTHON_UNUSED PyObject *__pyx_se
   return __pyx_r;
 }
 
-/* "alpm.pyx":329
+/* "alpm.pyx":330
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR
  * 
  * def error_number():             # <<<<<<<<<<<<<<
@@ -4074,7 +4079,7 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("error_number", 0);
 
-  /* "alpm.pyx":330
+  /* "alpm.pyx":331
  * 
  * def error_number():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4084,7 +4089,7 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":331
+    /* "alpm.pyx":332
  * def error_number():
  *     if handle is not NULL:
  *         return <int>alpm_errno(handle)             # <<<<<<<<<<<<<<
@@ -4092,13 +4097,13 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_int(((int)alpm_errno(__pyx_v_4alpm_handle))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(((int)alpm_errno(__pyx_v_4alpm_handle))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 332, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":330
+    /* "alpm.pyx":331
  * 
  * def error_number():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4107,7 +4112,7 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
  */
   }
 
-  /* "alpm.pyx":332
+  /* "alpm.pyx":333
  *     if handle is not NULL:
  *         return <int>alpm_errno(handle)
  *     return 0             # <<<<<<<<<<<<<<
@@ -4119,7 +4124,7 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
   __pyx_r = __pyx_int_0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":329
+  /* "alpm.pyx":330
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR
  * 
  * def error_number():             # <<<<<<<<<<<<<<
@@ -4138,7 +4143,7 @@ static PyObject *__pyx_pf_4alpm_8error_number(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "alpm.pyx":334
+/* "alpm.pyx":335
  *     return 0
  * 
  * def error_string(int err):             # <<<<<<<<<<<<<<
@@ -4155,7 +4160,7 @@ static PyObject *__pyx_pw_4alpm_11error_string(PyObject *__pyx_self, PyObject *_
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("error_string (wrapper)", 0);
   assert(__pyx_arg_err); {
-    __pyx_v_err = __Pyx_PyInt_As_int(__pyx_arg_err); if (unlikely((__pyx_v_err == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 334, __pyx_L3_error)
+    __pyx_v_err = __Pyx_PyInt_As_int(__pyx_arg_err); if (unlikely((__pyx_v_err == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 335, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4180,7 +4185,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("error_string", 0);
 
-  /* "alpm.pyx":336
+  /* "alpm.pyx":337
  * def error_string(int err):
  *     cdef char *cstr
  *     cdef const_char *strerr = ''             # <<<<<<<<<<<<<<
@@ -4189,7 +4194,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_strerr = ((const char *)"");
 
-  /* "alpm.pyx":338
+  /* "alpm.pyx":339
  *     cdef const_char *strerr = ''
  * 
  *     if err < 0:             # <<<<<<<<<<<<<<
@@ -4199,7 +4204,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_err < 0) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":339
+    /* "alpm.pyx":340
  * 
  *     if err < 0:
  *         if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4209,7 +4214,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
     __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":340
+      /* "alpm.pyx":341
  *     if err < 0:
  *         if handle is not NULL:
  *             strerr = alpm_strerror(alpm_errno(handle))             # <<<<<<<<<<<<<<
@@ -4218,7 +4223,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
       __pyx_v_strerr = alpm_strerror(alpm_errno(__pyx_v_4alpm_handle));
 
-      /* "alpm.pyx":339
+      /* "alpm.pyx":340
  * 
  *     if err < 0:
  *         if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4227,7 +4232,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
     }
 
-    /* "alpm.pyx":338
+    /* "alpm.pyx":339
  *     cdef const_char *strerr = ''
  * 
  *     if err < 0:             # <<<<<<<<<<<<<<
@@ -4237,7 +4242,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
     goto __pyx_L3;
   }
 
-  /* "alpm.pyx":342
+  /* "alpm.pyx":343
  *             strerr = alpm_strerror(alpm_errno(handle))
  *     else:
  *         strerr = alpm_strerror(<alpm_errno_t>err)             # <<<<<<<<<<<<<<
@@ -4249,7 +4254,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
   }
   __pyx_L3:;
 
-  /* "alpm.pyx":343
+  /* "alpm.pyx":344
  *     else:
  *         strerr = alpm_strerror(<alpm_errno_t>err)
  *     cstr = <char *>malloc(sizeof(char) * (strlen(strerr) + 1))             # <<<<<<<<<<<<<<
@@ -4258,7 +4263,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_cstr = ((char *)malloc(((sizeof(char)) * (strlen(__pyx_v_strerr) + 1))));
 
-  /* "alpm.pyx":344
+  /* "alpm.pyx":345
  *         strerr = alpm_strerror(<alpm_errno_t>err)
  *     cstr = <char *>malloc(sizeof(char) * (strlen(strerr) + 1))
  *     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -4268,7 +4273,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_cstr != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":345
+    /* "alpm.pyx":346
  *     cstr = <char *>malloc(sizeof(char) * (strlen(strerr) + 1))
  *     if cstr is not NULL:
  *         strcpy(cstr, strerr)             # <<<<<<<<<<<<<<
@@ -4277,7 +4282,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
     strcpy(__pyx_v_cstr, __pyx_v_strerr);
 
-    /* "alpm.pyx":346
+    /* "alpm.pyx":347
  *     if cstr is not NULL:
  *         strcpy(cstr, strerr)
  *         cstr[0] = toupper(cstr[0])             # <<<<<<<<<<<<<<
@@ -4286,7 +4291,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
     (__pyx_v_cstr[0]) = toupper((__pyx_v_cstr[0]));
 
-    /* "alpm.pyx":347
+    /* "alpm.pyx":348
  *         strcpy(cstr, strerr)
  *         cstr[0] = toupper(cstr[0])
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -4296,13 +4301,13 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 348, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":344
+    /* "alpm.pyx":345
  *         strerr = alpm_strerror(<alpm_errno_t>err)
  *     cstr = <char *>malloc(sizeof(char) * (strlen(strerr) + 1))
  *     if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -4311,7 +4316,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":334
+  /* "alpm.pyx":335
  *     return 0
  * 
  * def error_string(int err):             # <<<<<<<<<<<<<<
@@ -4332,7 +4337,7 @@ static PyObject *__pyx_pf_4alpm_10error_string(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":349
+/* "alpm.pyx":350
  *         return to_unicode(cstr, True)
  * 
  * def get_localdb():             # <<<<<<<<<<<<<<
@@ -4361,7 +4366,7 @@ static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("get_localdb", 0);
 
-  /* "alpm.pyx":350
+  /* "alpm.pyx":351
  * 
  * def get_localdb():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4371,7 +4376,7 @@ static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":351
+    /* "alpm.pyx":352
  * def get_localdb():
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_localdb(handle))             # <<<<<<<<<<<<<<
@@ -4379,13 +4384,13 @@ static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self
  * def get_syncdbs():
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_get_localdb(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_get_localdb(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 352, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":350
+    /* "alpm.pyx":351
  * 
  * def get_localdb():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4394,7 +4399,7 @@ static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self
  */
   }
 
-  /* "alpm.pyx":349
+  /* "alpm.pyx":350
  *         return to_unicode(cstr, True)
  * 
  * def get_localdb():             # <<<<<<<<<<<<<<
@@ -4415,7 +4420,7 @@ static PyObject *__pyx_pf_4alpm_12get_localdb(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "alpm.pyx":353
+/* "alpm.pyx":354
  *         return to_capsule(alpm_get_localdb(handle))
  * 
  * def get_syncdbs():             # <<<<<<<<<<<<<<
@@ -4444,7 +4449,7 @@ static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("get_syncdbs", 0);
 
-  /* "alpm.pyx":354
+  /* "alpm.pyx":355
  * 
  * def get_syncdbs():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4454,7 +4459,7 @@ static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":355
+    /* "alpm.pyx":356
  * def get_syncdbs():
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_syncdbs(handle))             # <<<<<<<<<<<<<<
@@ -4462,13 +4467,13 @@ static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self
  * def register_syncdb(object pname):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_get_syncdbs(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 355, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_get_syncdbs(__pyx_v_4alpm_handle)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 356, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":354
+    /* "alpm.pyx":355
  * 
  * def get_syncdbs():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4477,7 +4482,7 @@ static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self
  */
   }
 
-  /* "alpm.pyx":353
+  /* "alpm.pyx":354
  *         return to_capsule(alpm_get_localdb(handle))
  * 
  * def get_syncdbs():             # <<<<<<<<<<<<<<
@@ -4498,7 +4503,7 @@ static PyObject *__pyx_pf_4alpm_14get_syncdbs(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "alpm.pyx":357
+/* "alpm.pyx":358
  *         return to_capsule(alpm_get_syncdbs(handle))
  * 
  * def register_syncdb(object pname):             # <<<<<<<<<<<<<<
@@ -4529,7 +4534,7 @@ static PyObject *__pyx_pf_4alpm_16register_syncdb(CYTHON_UNUSED PyObject *__pyx_
   const char *__pyx_t_3;
   __Pyx_RefNannySetupContext("register_syncdb", 0);
 
-  /* "alpm.pyx":360
+  /* "alpm.pyx":361
  *     cdef bytes name
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4539,34 +4544,34 @@ static PyObject *__pyx_pf_4alpm_16register_syncdb(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":361
+    /* "alpm.pyx":362
  * 
  *     if handle is not NULL:
  *         name = to_bytes(pname)             # <<<<<<<<<<<<<<
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
  * 
  */
-    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 362, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_name = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "alpm.pyx":362
+    /* "alpm.pyx":363
  *     if handle is not NULL:
  *         name = to_bytes(pname)
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))             # <<<<<<<<<<<<<<
  * 
- * def db_get_name(object pdb):
+ * def db_unregister(object pdb):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 362, __pyx_L1_error)
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_register_syncdb(__pyx_v_4alpm_handle, __pyx_t_3, ALPM_SIG_USE_DEFAULT)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 362, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 363, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_register_syncdb(__pyx_v_4alpm_handle, __pyx_t_3, ALPM_SIG_USE_DEFAULT)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":360
+    /* "alpm.pyx":361
  *     cdef bytes name
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -4575,7 +4580,7 @@ static PyObject *__pyx_pf_4alpm_16register_syncdb(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":357
+  /* "alpm.pyx":358
  *         return to_capsule(alpm_get_syncdbs(handle))
  * 
  * def register_syncdb(object pname):             # <<<<<<<<<<<<<<
@@ -4597,92 +4602,102 @@ static PyObject *__pyx_pf_4alpm_16register_syncdb(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":364
+/* "alpm.pyx":365
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
  * 
- * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
+ * def db_unregister(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_19db_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_19db_get_name = {"db_get_name", (PyCFunction)__pyx_pw_4alpm_19db_get_name, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_19db_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pw_4alpm_19db_unregister(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_19db_unregister = {"db_unregister", (PyCFunction)__pyx_pw_4alpm_19db_unregister, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_19db_unregister(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("db_get_name (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_18db_get_name(__pyx_self, ((PyObject *)__pyx_v_pdb));
+  __Pyx_RefNannySetupContext("db_unregister (wrapper)", 0);
+  __pyx_r = __pyx_pf_4alpm_18db_unregister(__pyx_self, ((PyObject *)__pyx_v_pdb));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_18db_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pf_4alpm_18db_unregister(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   alpm_db_t *__pyx_v_db;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("db_get_name", 0);
+  __Pyx_RefNannySetupContext("db_unregister", 0);
 
-  /* "alpm.pyx":367
+  /* "alpm.pyx":368
  *     cdef alpm_db_t *db
  * 
  *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
  *     if db is not NULL:
- *         return to_unicode(<char *>alpm_db_get_name(db))
+ *         return alpm_db_unregister(db)
  */
   __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
 
-  /* "alpm.pyx":368
+  /* "alpm.pyx":369
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
- *         return to_unicode(<char *>alpm_db_get_name(db))
- * 
+ *         return alpm_db_unregister(db)
+ *     return -1
  */
   __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":369
+    /* "alpm.pyx":370
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:
- *         return to_unicode(<char *>alpm_db_get_name(db))             # <<<<<<<<<<<<<<
+ *         return alpm_db_unregister(db)             # <<<<<<<<<<<<<<
+ *     return -1
  * 
- * def db_get_pkg(object pdb, object pname):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_db_get_name(__pyx_v_db)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_db_unregister(__pyx_v_db)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":368
+    /* "alpm.pyx":369
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
- *         return to_unicode(<char *>alpm_db_get_name(db))
- * 
+ *         return alpm_db_unregister(db)
+ *     return -1
  */
   }
 
-  /* "alpm.pyx":364
+  /* "alpm.pyx":371
+ *     if db is not NULL:
+ *         return alpm_db_unregister(db)
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * def db_get_name(object pdb):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_int_neg_1);
+  __pyx_r = __pyx_int_neg_1;
+  goto __pyx_L0;
+
+  /* "alpm.pyx":365
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
  * 
- * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
+ * def db_unregister(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("alpm.db_get_name", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("alpm.db_unregister", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4690,48 +4705,141 @@ static PyObject *__pyx_pf_4alpm_18db_get_name(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "alpm.pyx":371
- *         return to_unicode(<char *>alpm_db_get_name(db))
+/* "alpm.pyx":373
+ *     return -1
  * 
- * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
+ * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
- *     cdef bytes name
+ * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_21db_get_pkg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_21db_get_pkg = {"db_get_pkg", (PyCFunction)__pyx_pw_4alpm_21db_get_pkg, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_21db_get_pkg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_pdb = 0;
-  PyObject *__pyx_v_pname = 0;
+static PyObject *__pyx_pw_4alpm_21db_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_21db_get_name = {"db_get_name", (PyCFunction)__pyx_pw_4alpm_21db_get_name, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_21db_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("db_get_pkg (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pdb,&__pyx_n_s_pname,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdb)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
+  __Pyx_RefNannySetupContext("db_get_name (wrapper)", 0);
+  __pyx_r = __pyx_pf_4alpm_20db_get_name(__pyx_self, ((PyObject *)__pyx_v_pdb));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4alpm_20db_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+  alpm_db_t *__pyx_v_db;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("db_get_name", 0);
+
+  /* "alpm.pyx":376
+ *     cdef alpm_db_t *db
+ * 
+ *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
+ *     if db is not NULL:
+ *         return to_unicode(<char *>alpm_db_get_name(db))
+ */
+  __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
+
+  /* "alpm.pyx":377
+ * 
+ *     db = to_alpm_db(pdb)
+ *     if db is not NULL:             # <<<<<<<<<<<<<<
+ *         return to_unicode(<char *>alpm_db_get_name(db))
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "alpm.pyx":378
+ *     db = to_alpm_db(pdb)
+ *     if db is not NULL:
+ *         return to_unicode(<char *>alpm_db_get_name(db))             # <<<<<<<<<<<<<<
+ * 
+ * def db_get_pkg(object pdb, object pname):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_db_get_name(__pyx_v_db)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "alpm.pyx":377
+ * 
+ *     db = to_alpm_db(pdb)
+ *     if db is not NULL:             # <<<<<<<<<<<<<<
+ *         return to_unicode(<char *>alpm_db_get_name(db))
+ * 
+ */
+  }
+
+  /* "alpm.pyx":373
+ *     return -1
+ * 
+ * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
+ *     cdef alpm_db_t *db
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("alpm.db_get_name", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "alpm.pyx":380
+ *         return to_unicode(<char *>alpm_db_get_name(db))
+ * 
+ * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
+ *     cdef alpm_db_t *db
+ *     cdef bytes name
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4alpm_23db_get_pkg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_23db_get_pkg = {"db_get_pkg", (PyCFunction)__pyx_pw_4alpm_23db_get_pkg, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_23db_get_pkg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_pdb = 0;
+  PyObject *__pyx_v_pname = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("db_get_pkg (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pdb,&__pyx_n_s_pname,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pdb)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pname)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("db_get_pkg", 1, 2, 2, 1); __PYX_ERR(0, 371, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("db_get_pkg", 1, 2, 2, 1); __PYX_ERR(0, 380, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_get_pkg") < 0)) __PYX_ERR(0, 371, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_get_pkg") < 0)) __PYX_ERR(0, 380, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -4744,20 +4852,20 @@ static PyObject *__pyx_pw_4alpm_21db_get_pkg(PyObject *__pyx_self, PyObject *__p
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("db_get_pkg", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 371, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("db_get_pkg", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 380, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.db_get_pkg", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_20db_get_pkg(__pyx_self, __pyx_v_pdb, __pyx_v_pname);
+  __pyx_r = __pyx_pf_4alpm_22db_get_pkg(__pyx_self, __pyx_v_pdb, __pyx_v_pname);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname) {
+static PyObject *__pyx_pf_4alpm_22db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname) {
   alpm_db_t *__pyx_v_db;
   PyObject *__pyx_v_name = 0;
   PyObject *__pyx_r = NULL;
@@ -4767,7 +4875,7 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
   const char *__pyx_t_3;
   __Pyx_RefNannySetupContext("db_get_pkg", 0);
 
-  /* "alpm.pyx":375
+  /* "alpm.pyx":384
  *     cdef bytes name
  * 
  *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
@@ -4776,7 +4884,7 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
  */
   __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
 
-  /* "alpm.pyx":376
+  /* "alpm.pyx":385
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -4786,19 +4894,19 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
   __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":377
+    /* "alpm.pyx":386
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:
  *         name = to_bytes(pname)             # <<<<<<<<<<<<<<
  *         return to_capsule(alpm_db_get_pkg(db, name))
  * 
  */
-    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_name = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "alpm.pyx":378
+    /* "alpm.pyx":387
  *     if db is not NULL:
  *         name = to_bytes(pname)
  *         return to_capsule(alpm_db_get_pkg(db, name))             # <<<<<<<<<<<<<<
@@ -4806,14 +4914,14 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
  * def db_get_groupcache(object pdb):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 378, __pyx_L1_error)
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_pkg(__pyx_v_db, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 387, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_pkg(__pyx_v_db, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 387, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":376
+    /* "alpm.pyx":385
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -4822,7 +4930,7 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
  */
   }
 
-  /* "alpm.pyx":371
+  /* "alpm.pyx":380
  *         return to_unicode(<char *>alpm_db_get_name(db))
  * 
  * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
@@ -4844,7 +4952,7 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
   return __pyx_r;
 }
 
-/* "alpm.pyx":380
+/* "alpm.pyx":389
  *         return to_capsule(alpm_db_get_pkg(db, name))
  * 
  * def db_get_groupcache(object pdb):             # <<<<<<<<<<<<<<
@@ -4853,20 +4961,20 @@ static PyObject *__pyx_pf_4alpm_20db_get_pkg(CYTHON_UNUSED PyObject *__pyx_self,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_23db_get_groupcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_23db_get_groupcache = {"db_get_groupcache", (PyCFunction)__pyx_pw_4alpm_23db_get_groupcache, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_23db_get_groupcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pw_4alpm_25db_get_groupcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_25db_get_groupcache = {"db_get_groupcache", (PyCFunction)__pyx_pw_4alpm_25db_get_groupcache, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_25db_get_groupcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("db_get_groupcache (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_22db_get_groupcache(__pyx_self, ((PyObject *)__pyx_v_pdb));
+  __pyx_r = __pyx_pf_4alpm_24db_get_groupcache(__pyx_self, ((PyObject *)__pyx_v_pdb));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pf_4alpm_24db_get_groupcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   alpm_db_t *__pyx_v_db;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4874,7 +4982,7 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("db_get_groupcache", 0);
 
-  /* "alpm.pyx":383
+  /* "alpm.pyx":392
  *     cdef alpm_db_t *db
  * 
  *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
@@ -4883,7 +4991,7 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
 
-  /* "alpm.pyx":384
+  /* "alpm.pyx":393
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -4893,7 +5001,7 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":385
+    /* "alpm.pyx":394
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:
  *         return to_capsule(alpm_db_get_groupcache(db))             # <<<<<<<<<<<<<<
@@ -4901,13 +5009,13 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
  * def db_get_pkgcache(object pdb):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_groupcache(__pyx_v_db)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 385, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_groupcache(__pyx_v_db)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 394, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":384
+    /* "alpm.pyx":393
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -4916,7 +5024,7 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":380
+  /* "alpm.pyx":389
  *         return to_capsule(alpm_db_get_pkg(db, name))
  * 
  * def db_get_groupcache(object pdb):             # <<<<<<<<<<<<<<
@@ -4937,7 +5045,7 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":387
+/* "alpm.pyx":396
  *         return to_capsule(alpm_db_get_groupcache(db))
  * 
  * def db_get_pkgcache(object pdb):             # <<<<<<<<<<<<<<
@@ -4946,20 +5054,20 @@ static PyObject *__pyx_pf_4alpm_22db_get_groupcache(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_25db_get_pkgcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_25db_get_pkgcache = {"db_get_pkgcache", (PyCFunction)__pyx_pw_4alpm_25db_get_pkgcache, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_25db_get_pkgcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pw_4alpm_27db_get_pkgcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_27db_get_pkgcache = {"db_get_pkgcache", (PyCFunction)__pyx_pw_4alpm_27db_get_pkgcache, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_27db_get_pkgcache(PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("db_get_pkgcache (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_24db_get_pkgcache(__pyx_self, ((PyObject *)__pyx_v_pdb));
+  __pyx_r = __pyx_pf_4alpm_26db_get_pkgcache(__pyx_self, ((PyObject *)__pyx_v_pdb));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
+static PyObject *__pyx_pf_4alpm_26db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb) {
   alpm_db_t *__pyx_v_db;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4967,7 +5075,7 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("db_get_pkgcache", 0);
 
-  /* "alpm.pyx":390
+  /* "alpm.pyx":399
  *     cdef alpm_db_t *db
  * 
  *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
@@ -4976,7 +5084,7 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
 
-  /* "alpm.pyx":391
+  /* "alpm.pyx":400
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -4986,7 +5094,7 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":392
+    /* "alpm.pyx":401
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:
  *         return to_capsule(alpm_db_get_pkgcache(db))             # <<<<<<<<<<<<<<
@@ -4994,13 +5102,13 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
  * def db_get_group(object pdb, object pname):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_pkgcache(__pyx_v_db)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_pkgcache(__pyx_v_db)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 401, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":391
+    /* "alpm.pyx":400
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -5009,7 +5117,7 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":387
+  /* "alpm.pyx":396
  *         return to_capsule(alpm_db_get_groupcache(db))
  * 
  * def db_get_pkgcache(object pdb):             # <<<<<<<<<<<<<<
@@ -5030,7 +5138,7 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":394
+/* "alpm.pyx":403
  *         return to_capsule(alpm_db_get_pkgcache(db))
  * 
  * def db_get_group(object pdb, object pname):             # <<<<<<<<<<<<<<
@@ -5039,9 +5147,9 @@ static PyObject *__pyx_pf_4alpm_24db_get_pkgcache(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_27db_get_group(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_27db_get_group = {"db_get_group", (PyCFunction)__pyx_pw_4alpm_27db_get_group, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_27db_get_group(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_29db_get_group(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_29db_get_group = {"db_get_group", (PyCFunction)__pyx_pw_4alpm_29db_get_group, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_29db_get_group(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_pdb = 0;
   PyObject *__pyx_v_pname = 0;
   PyObject *__pyx_r = 0;
@@ -5067,11 +5175,11 @@ static PyObject *__pyx_pw_4alpm_27db_get_group(PyObject *__pyx_self, PyObject *_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pname)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("db_get_group", 1, 2, 2, 1); __PYX_ERR(0, 394, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("db_get_group", 1, 2, 2, 1); __PYX_ERR(0, 403, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_get_group") < 0)) __PYX_ERR(0, 394, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_get_group") < 0)) __PYX_ERR(0, 403, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -5084,20 +5192,20 @@ static PyObject *__pyx_pw_4alpm_27db_get_group(PyObject *__pyx_self, PyObject *_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("db_get_group", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 394, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("db_get_group", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 403, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.db_get_group", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_26db_get_group(__pyx_self, __pyx_v_pdb, __pyx_v_pname);
+  __pyx_r = __pyx_pf_4alpm_28db_get_group(__pyx_self, __pyx_v_pdb, __pyx_v_pname);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname) {
+static PyObject *__pyx_pf_4alpm_28db_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdb, PyObject *__pyx_v_pname) {
   alpm_db_t *__pyx_v_db;
   PyObject *__pyx_v_name = 0;
   PyObject *__pyx_r = NULL;
@@ -5107,7 +5215,7 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
   const char *__pyx_t_3;
   __Pyx_RefNannySetupContext("db_get_group", 0);
 
-  /* "alpm.pyx":398
+  /* "alpm.pyx":407
  *     cdef bytes name
  * 
  *     db = to_alpm_db(pdb)             # <<<<<<<<<<<<<<
@@ -5116,7 +5224,7 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_db = __pyx_f_4alpm_to_alpm_db(__pyx_v_pdb);
 
-  /* "alpm.pyx":399
+  /* "alpm.pyx":408
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -5126,19 +5234,19 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":400
+    /* "alpm.pyx":409
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:
  *         name = to_bytes(pname)             # <<<<<<<<<<<<<<
  *         return to_capsule(alpm_db_get_group(db, name))
  * 
  */
-    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 400, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_name = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "alpm.pyx":401
+    /* "alpm.pyx":410
  *     if db is not NULL:
  *         name = to_bytes(pname)
  *         return to_capsule(alpm_db_get_group(db, name))             # <<<<<<<<<<<<<<
@@ -5146,14 +5254,14 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
  * def db_find_provider(object pname, int local):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_group(__pyx_v_db, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 401, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 410, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_db_get_group(__pyx_v_db, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 410, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":399
+    /* "alpm.pyx":408
  * 
  *     db = to_alpm_db(pdb)
  *     if db is not NULL:             # <<<<<<<<<<<<<<
@@ -5162,7 +5270,7 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":394
+  /* "alpm.pyx":403
  *         return to_capsule(alpm_db_get_pkgcache(db))
  * 
  * def db_get_group(object pdb, object pname):             # <<<<<<<<<<<<<<
@@ -5184,7 +5292,7 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":403
+/* "alpm.pyx":412
  *         return to_capsule(alpm_db_get_group(db, name))
  * 
  * def db_find_provider(object pname, int local):             # <<<<<<<<<<<<<<
@@ -5193,9 +5301,9 @@ static PyObject *__pyx_pf_4alpm_26db_get_group(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_29db_find_provider(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_29db_find_provider = {"db_find_provider", (PyCFunction)__pyx_pw_4alpm_29db_find_provider, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_29db_find_provider(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_31db_find_provider(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_31db_find_provider = {"db_find_provider", (PyCFunction)__pyx_pw_4alpm_31db_find_provider, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_31db_find_provider(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_pname = 0;
   int __pyx_v_local;
   PyObject *__pyx_r = 0;
@@ -5221,11 +5329,11 @@ static PyObject *__pyx_pw_4alpm_29db_find_provider(PyObject *__pyx_self, PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_local)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("db_find_provider", 1, 2, 2, 1); __PYX_ERR(0, 403, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("db_find_provider", 1, 2, 2, 1); __PYX_ERR(0, 412, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_find_provider") < 0)) __PYX_ERR(0, 403, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_find_provider") < 0)) __PYX_ERR(0, 412, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -5234,24 +5342,24 @@ static PyObject *__pyx_pw_4alpm_29db_find_provider(PyObject *__pyx_self, PyObjec
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_pname = values[0];
-    __pyx_v_local = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 403, __pyx_L3_error)
+    __pyx_v_local = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 412, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("db_find_provider", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 403, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("db_find_provider", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 412, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.db_find_provider", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_28db_find_provider(__pyx_self, __pyx_v_pname, __pyx_v_local);
+  __pyx_r = __pyx_pf_4alpm_30db_find_provider(__pyx_self, __pyx_v_pname, __pyx_v_local);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local) {
+static PyObject *__pyx_pf_4alpm_30db_find_provider(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local) {
   PyObject *__pyx_v_name = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5259,19 +5367,19 @@ static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx
   const char *__pyx_t_2;
   __Pyx_RefNannySetupContext("db_find_provider", 0);
 
-  /* "alpm.pyx":404
+  /* "alpm.pyx":413
  * 
  * def db_find_provider(object pname, int local):
  *     cdef bytes name = to_bytes(pname)             # <<<<<<<<<<<<<<
  * 
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))
  */
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_name = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":406
+  /* "alpm.pyx":415
  *     cdef bytes name = to_bytes(pname)
  * 
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))             # <<<<<<<<<<<<<<
@@ -5279,14 +5387,14 @@ static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx
  * def db_find_replacer(object pname, int local):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L1_error)
-  __pyx_t_1 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_filter_by_func(__pyx_t_2, alpm_pkg_get_provides, __pyx_v_local)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 415, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_filter_by_func(__pyx_t_2, alpm_pkg_get_provides, __pyx_v_local)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 415, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":403
+  /* "alpm.pyx":412
  *         return to_capsule(alpm_db_get_group(db, name))
  * 
  * def db_find_provider(object pname, int local):             # <<<<<<<<<<<<<<
@@ -5306,7 +5414,7 @@ static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":408
+/* "alpm.pyx":417
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))
  * 
  * def db_find_replacer(object pname, int local):             # <<<<<<<<<<<<<<
@@ -5315,9 +5423,9 @@ static PyObject *__pyx_pf_4alpm_28db_find_provider(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_31db_find_replacer(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_31db_find_replacer = {"db_find_replacer", (PyCFunction)__pyx_pw_4alpm_31db_find_replacer, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_31db_find_replacer(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_33db_find_replacer(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_33db_find_replacer = {"db_find_replacer", (PyCFunction)__pyx_pw_4alpm_33db_find_replacer, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_33db_find_replacer(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_pname = 0;
   int __pyx_v_local;
   PyObject *__pyx_r = 0;
@@ -5343,11 +5451,11 @@ static PyObject *__pyx_pw_4alpm_31db_find_replacer(PyObject *__pyx_self, PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_local)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("db_find_replacer", 1, 2, 2, 1); __PYX_ERR(0, 408, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("db_find_replacer", 1, 2, 2, 1); __PYX_ERR(0, 417, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_find_replacer") < 0)) __PYX_ERR(0, 408, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "db_find_replacer") < 0)) __PYX_ERR(0, 417, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -5356,24 +5464,24 @@ static PyObject *__pyx_pw_4alpm_31db_find_replacer(PyObject *__pyx_self, PyObjec
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_pname = values[0];
-    __pyx_v_local = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 408, __pyx_L3_error)
+    __pyx_v_local = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 417, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("db_find_replacer", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 408, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("db_find_replacer", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 417, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.db_find_replacer", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_30db_find_replacer(__pyx_self, __pyx_v_pname, __pyx_v_local);
+  __pyx_r = __pyx_pf_4alpm_32db_find_replacer(__pyx_self, __pyx_v_pname, __pyx_v_local);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local) {
+static PyObject *__pyx_pf_4alpm_32db_find_replacer(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, int __pyx_v_local) {
   PyObject *__pyx_v_name = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5381,19 +5489,19 @@ static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx
   const char *__pyx_t_2;
   __Pyx_RefNannySetupContext("db_find_replacer", 0);
 
-  /* "alpm.pyx":409
+  /* "alpm.pyx":418
  * 
  * def db_find_replacer(object pname, int local):
  *     cdef bytes name = to_bytes(pname)             # <<<<<<<<<<<<<<
  * 
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))
  */
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 418, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_name = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":411
+  /* "alpm.pyx":420
  *     cdef bytes name = to_bytes(pname)
  * 
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))             # <<<<<<<<<<<<<<
@@ -5401,14 +5509,14 @@ static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx
  * def option_set_arch(object parch):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 411, __pyx_L1_error)
-  __pyx_t_1 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_filter_by_func(__pyx_t_2, alpm_pkg_get_replaces, __pyx_v_local)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 420, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_filter_by_func(__pyx_t_2, alpm_pkg_get_replaces, __pyx_v_local)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 420, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":408
+  /* "alpm.pyx":417
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))
  * 
  * def db_find_replacer(object pname, int local):             # <<<<<<<<<<<<<<
@@ -5428,7 +5536,7 @@ static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":413
+/* "alpm.pyx":422
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))
  * 
  * def option_set_arch(object parch):             # <<<<<<<<<<<<<<
@@ -5437,20 +5545,20 @@ static PyObject *__pyx_pf_4alpm_30db_find_replacer(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_33option_set_arch(PyObject *__pyx_self, PyObject *__pyx_v_parch); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_33option_set_arch = {"option_set_arch", (PyCFunction)__pyx_pw_4alpm_33option_set_arch, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_33option_set_arch(PyObject *__pyx_self, PyObject *__pyx_v_parch) {
+static PyObject *__pyx_pw_4alpm_35option_set_arch(PyObject *__pyx_self, PyObject *__pyx_v_parch); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_35option_set_arch = {"option_set_arch", (PyCFunction)__pyx_pw_4alpm_35option_set_arch, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_35option_set_arch(PyObject *__pyx_self, PyObject *__pyx_v_parch) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_set_arch (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_32option_set_arch(__pyx_self, ((PyObject *)__pyx_v_parch));
+  __pyx_r = __pyx_pf_4alpm_34option_set_arch(__pyx_self, ((PyObject *)__pyx_v_parch));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_parch) {
+static PyObject *__pyx_pf_4alpm_34option_set_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_parch) {
   PyObject *__pyx_v_arch = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5459,7 +5567,7 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
   const char *__pyx_t_3;
   __Pyx_RefNannySetupContext("option_set_arch", 0);
 
-  /* "alpm.pyx":416
+  /* "alpm.pyx":425
  *     cdef bytes arch
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5469,19 +5577,19 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":417
+    /* "alpm.pyx":426
  * 
  *     if handle is not NULL:
  *         arch = to_bytes(parch)             # <<<<<<<<<<<<<<
  *         return alpm_option_set_arch(handle, arch)
  *     return -1
  */
-    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_parch, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_parch, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 426, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_arch = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "alpm.pyx":418
+    /* "alpm.pyx":427
  *     if handle is not NULL:
  *         arch = to_bytes(parch)
  *         return alpm_option_set_arch(handle, arch)             # <<<<<<<<<<<<<<
@@ -5489,14 +5597,14 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_arch); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 418, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_option_set_arch(__pyx_v_4alpm_handle, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_arch); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 427, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_option_set_arch(__pyx_v_4alpm_handle, __pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 427, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":416
+    /* "alpm.pyx":425
  *     cdef bytes arch
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5505,7 +5613,7 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":419
+  /* "alpm.pyx":428
  *         arch = to_bytes(parch)
  *         return alpm_option_set_arch(handle, arch)
  *     return -1             # <<<<<<<<<<<<<<
@@ -5517,7 +5625,7 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
   __pyx_r = __pyx_int_neg_1;
   goto __pyx_L0;
 
-  /* "alpm.pyx":413
+  /* "alpm.pyx":422
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))
  * 
  * def option_set_arch(object parch):             # <<<<<<<<<<<<<<
@@ -5537,7 +5645,7 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":421
+/* "alpm.pyx":430
  *     return -1
  * 
  * def option_get_logfile():             # <<<<<<<<<<<<<<
@@ -5546,20 +5654,20 @@ static PyObject *__pyx_pf_4alpm_32option_set_arch(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_35option_get_logfile(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_35option_get_logfile = {"option_get_logfile", (PyCFunction)__pyx_pw_4alpm_35option_get_logfile, METH_NOARGS, 0};
-static PyObject *__pyx_pw_4alpm_35option_get_logfile(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_4alpm_37option_get_logfile(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_37option_get_logfile = {"option_get_logfile", (PyCFunction)__pyx_pw_4alpm_37option_get_logfile, METH_NOARGS, 0};
+static PyObject *__pyx_pw_4alpm_37option_get_logfile(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_get_logfile (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_34option_get_logfile(__pyx_self);
+  __pyx_r = __pyx_pf_4alpm_36option_get_logfile(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_4alpm_36option_get_logfile(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -5569,7 +5677,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_5;
   __Pyx_RefNannySetupContext("option_get_logfile", 0);
 
-  /* "alpm.pyx":422
+  /* "alpm.pyx":431
  * 
  * def option_get_logfile():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5579,7 +5687,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":423
+    /* "alpm.pyx":432
  * def option_get_logfile():
  *     if handle is not NULL:
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -5595,7 +5703,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
     __pyx_t_5.release = 0;
     __pyx_t_5.encoding = ((PyObject*)__pyx_t_2);
     __pyx_t_5.errors = ((PyObject*)__pyx_t_3);
-    __pyx_t_4 = __pyx_f_4alpm_to_unicode(((char *)alpm_option_get_logfile(__pyx_v_4alpm_handle)), &__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_4alpm_to_unicode(((char *)alpm_option_get_logfile(__pyx_v_4alpm_handle)), &__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 432, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5603,7 +5711,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
     __pyx_t_4 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":422
+    /* "alpm.pyx":431
  * 
  * def option_get_logfile():
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5612,7 +5720,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":421
+  /* "alpm.pyx":430
  *     return -1
  * 
  * def option_get_logfile():             # <<<<<<<<<<<<<<
@@ -5635,7 +5743,7 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":425
+/* "alpm.pyx":434
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  * 
  * def option_set_logfile(object plogfile):             # <<<<<<<<<<<<<<
@@ -5644,20 +5752,20 @@ static PyObject *__pyx_pf_4alpm_34option_get_logfile(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_37option_set_logfile(PyObject *__pyx_self, PyObject *__pyx_v_plogfile); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_37option_set_logfile = {"option_set_logfile", (PyCFunction)__pyx_pw_4alpm_37option_set_logfile, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_37option_set_logfile(PyObject *__pyx_self, PyObject *__pyx_v_plogfile) {
+static PyObject *__pyx_pw_4alpm_39option_set_logfile(PyObject *__pyx_self, PyObject *__pyx_v_plogfile); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_39option_set_logfile = {"option_set_logfile", (PyCFunction)__pyx_pw_4alpm_39option_set_logfile, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_39option_set_logfile(PyObject *__pyx_self, PyObject *__pyx_v_plogfile) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_set_logfile (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_36option_set_logfile(__pyx_self, ((PyObject *)__pyx_v_plogfile));
+  __pyx_r = __pyx_pf_4alpm_38option_set_logfile(__pyx_self, ((PyObject *)__pyx_v_plogfile));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plogfile) {
+static PyObject *__pyx_pf_4alpm_38option_set_logfile(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plogfile) {
   PyObject *__pyx_v_logfile = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5669,7 +5777,7 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
   const char *__pyx_t_6;
   __Pyx_RefNannySetupContext("option_set_logfile", 0);
 
-  /* "alpm.pyx":426
+  /* "alpm.pyx":435
  * 
  * def option_set_logfile(object plogfile):
  *     cdef bytes logfile = to_bytes(plogfile, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -5683,14 +5791,14 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
   __pyx_t_4.__pyx_n = 2;
   __pyx_t_4.encoding = ((PyObject*)__pyx_t_1);
   __pyx_t_4.errors = ((PyObject*)__pyx_t_2);
-  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_plogfile, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_plogfile, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_logfile = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "alpm.pyx":428
+  /* "alpm.pyx":437
  *     cdef bytes logfile = to_bytes(plogfile, fs_encoding, fs_errors)
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5700,7 +5808,7 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
   __pyx_t_5 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_5) {
 
-    /* "alpm.pyx":429
+    /* "alpm.pyx":438
  * 
  *     if handle is not NULL:
  *         return alpm_option_set_logfile(handle, logfile)             # <<<<<<<<<<<<<<
@@ -5708,14 +5816,14 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_logfile); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 429, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyInt_From_int(alpm_option_set_logfile(__pyx_v_4alpm_handle, __pyx_t_6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_logfile); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 438, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyInt_From_int(alpm_option_set_logfile(__pyx_v_4alpm_handle, __pyx_t_6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 438, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":428
+    /* "alpm.pyx":437
  *     cdef bytes logfile = to_bytes(plogfile, fs_encoding, fs_errors)
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5724,7 +5832,7 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":430
+  /* "alpm.pyx":439
  *     if handle is not NULL:
  *         return alpm_option_set_logfile(handle, logfile)
  *     return -1             # <<<<<<<<<<<<<<
@@ -5736,7 +5844,7 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
   __pyx_r = __pyx_int_neg_1;
   goto __pyx_L0;
 
-  /* "alpm.pyx":425
+  /* "alpm.pyx":434
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  * 
  * def option_set_logfile(object plogfile):             # <<<<<<<<<<<<<<
@@ -5758,7 +5866,7 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":432
+/* "alpm.pyx":441
  *     return -1
  * 
  * def option_get_cachedirs():             # <<<<<<<<<<<<<<
@@ -5767,20 +5875,20 @@ static PyObject *__pyx_pf_4alpm_36option_set_logfile(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_39option_get_cachedirs(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_39option_get_cachedirs = {"option_get_cachedirs", (PyCFunction)__pyx_pw_4alpm_39option_get_cachedirs, METH_NOARGS, 0};
-static PyObject *__pyx_pw_4alpm_39option_get_cachedirs(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_4alpm_41option_get_cachedirs(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_41option_get_cachedirs = {"option_get_cachedirs", (PyCFunction)__pyx_pw_4alpm_41option_get_cachedirs, METH_NOARGS, 0};
+static PyObject *__pyx_pw_4alpm_41option_get_cachedirs(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_get_cachedirs (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_38option_get_cachedirs(__pyx_self);
+  __pyx_r = __pyx_pf_4alpm_40option_get_cachedirs(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_4alpm_40option_get_cachedirs(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_v_cachedirs = 0;
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
@@ -5793,19 +5901,19 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
   int __pyx_t_6;
   __Pyx_RefNannySetupContext("option_get_cachedirs", 0);
 
-  /* "alpm.pyx":433
+  /* "alpm.pyx":442
  * 
  * def option_get_cachedirs():
  *     cdef list cachedirs = []             # <<<<<<<<<<<<<<
  * 
  *     if handle is not NULL:
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_cachedirs = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":435
+  /* "alpm.pyx":444
  *     cdef list cachedirs = []
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5815,7 +5923,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
   __pyx_t_2 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_2) {
 
-    /* "alpm.pyx":436
+    /* "alpm.pyx":445
  * 
  *     if handle is not NULL:
  *         node = alpm_option_get_cachedirs(handle)             # <<<<<<<<<<<<<<
@@ -5824,7 +5932,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
  */
     __pyx_v_node = alpm_option_get_cachedirs(__pyx_v_4alpm_handle);
 
-    /* "alpm.pyx":437
+    /* "alpm.pyx":446
  *     if handle is not NULL:
  *         node = alpm_option_get_cachedirs(handle)
  *         while node is not NULL:             # <<<<<<<<<<<<<<
@@ -5835,7 +5943,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
       __pyx_t_2 = ((__pyx_v_node != NULL) != 0);
       if (!__pyx_t_2) break;
 
-      /* "alpm.pyx":438
+      /* "alpm.pyx":447
  *         node = alpm_option_get_cachedirs(handle)
  *         while node is not NULL:
  *             cachedirs.append(to_unicode(<char *>node.data, False, fs_encoding, fs_errors))             # <<<<<<<<<<<<<<
@@ -5850,14 +5958,14 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
       __pyx_t_5.release = 0;
       __pyx_t_5.encoding = ((PyObject*)__pyx_t_1);
       __pyx_t_5.errors = ((PyObject*)__pyx_t_3);
-      __pyx_t_4 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_node->data), &__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 438, __pyx_L1_error)
+      __pyx_t_4 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_node->data), &__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 447, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_cachedirs, __pyx_t_4); if (unlikely(__pyx_t_6 == -1)) __PYX_ERR(0, 438, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_cachedirs, __pyx_t_4); if (unlikely(__pyx_t_6 == -1)) __PYX_ERR(0, 447, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "alpm.pyx":439
+      /* "alpm.pyx":448
  *         while node is not NULL:
  *             cachedirs.append(to_unicode(<char *>node.data, False, fs_encoding, fs_errors))
  *             node = alpm_list_next(node)             # <<<<<<<<<<<<<<
@@ -5867,7 +5975,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
       __pyx_v_node = alpm_list_next(__pyx_v_node);
     }
 
-    /* "alpm.pyx":435
+    /* "alpm.pyx":444
  *     cdef list cachedirs = []
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5876,7 +5984,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
  */
   }
 
-  /* "alpm.pyx":440
+  /* "alpm.pyx":449
  *             cachedirs.append(to_unicode(<char *>node.data, False, fs_encoding, fs_errors))
  *             node = alpm_list_next(node)
  *     return cachedirs             # <<<<<<<<<<<<<<
@@ -5888,7 +5996,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
   __pyx_r = __pyx_v_cachedirs;
   goto __pyx_L0;
 
-  /* "alpm.pyx":432
+  /* "alpm.pyx":441
  *     return -1
  * 
  * def option_get_cachedirs():             # <<<<<<<<<<<<<<
@@ -5910,7 +6018,7 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "alpm.pyx":442
+/* "alpm.pyx":451
  *     return cachedirs
  * 
  * def option_add_cachedir(object pcachedir):             # <<<<<<<<<<<<<<
@@ -5919,20 +6027,20 @@ static PyObject *__pyx_pf_4alpm_38option_get_cachedirs(CYTHON_UNUSED PyObject *_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_41option_add_cachedir(PyObject *__pyx_self, PyObject *__pyx_v_pcachedir); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_41option_add_cachedir = {"option_add_cachedir", (PyCFunction)__pyx_pw_4alpm_41option_add_cachedir, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_41option_add_cachedir(PyObject *__pyx_self, PyObject *__pyx_v_pcachedir) {
+static PyObject *__pyx_pw_4alpm_43option_add_cachedir(PyObject *__pyx_self, PyObject *__pyx_v_pcachedir); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_43option_add_cachedir = {"option_add_cachedir", (PyCFunction)__pyx_pw_4alpm_43option_add_cachedir, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_43option_add_cachedir(PyObject *__pyx_self, PyObject *__pyx_v_pcachedir) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_add_cachedir (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_40option_add_cachedir(__pyx_self, ((PyObject *)__pyx_v_pcachedir));
+  __pyx_r = __pyx_pf_4alpm_42option_add_cachedir(__pyx_self, ((PyObject *)__pyx_v_pcachedir));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pcachedir) {
+static PyObject *__pyx_pf_4alpm_42option_add_cachedir(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pcachedir) {
   PyObject *__pyx_v_cachedir = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5944,7 +6052,7 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
   const char *__pyx_t_6;
   __Pyx_RefNannySetupContext("option_add_cachedir", 0);
 
-  /* "alpm.pyx":443
+  /* "alpm.pyx":452
  * 
  * def option_add_cachedir(object pcachedir):
  *     cdef bytes cachedir = to_bytes(pcachedir, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -5958,14 +6066,14 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
   __pyx_t_4.__pyx_n = 2;
   __pyx_t_4.encoding = ((PyObject*)__pyx_t_1);
   __pyx_t_4.errors = ((PyObject*)__pyx_t_2);
-  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_pcachedir, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_4alpm_to_bytes(__pyx_v_pcachedir, &__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 452, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_cachedir = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "alpm.pyx":445
+  /* "alpm.pyx":454
  *     cdef bytes cachedir = to_bytes(pcachedir, fs_encoding, fs_errors)
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5975,7 +6083,7 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
   __pyx_t_5 = ((__pyx_v_4alpm_handle != NULL) != 0);
   if (__pyx_t_5) {
 
-    /* "alpm.pyx":446
+    /* "alpm.pyx":455
  * 
  *     if handle is not NULL:
  *         return alpm_option_add_cachedir(handle, cachedir)             # <<<<<<<<<<<<<<
@@ -5983,14 +6091,14 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_cachedir); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 446, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyInt_From_int(alpm_option_add_cachedir(__pyx_v_4alpm_handle, __pyx_t_6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 446, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_cachedir); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 455, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyInt_From_int(alpm_option_add_cachedir(__pyx_v_4alpm_handle, __pyx_t_6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 455, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":445
+    /* "alpm.pyx":454
  *     cdef bytes cachedir = to_bytes(pcachedir, fs_encoding, fs_errors)
  * 
  *     if handle is not NULL:             # <<<<<<<<<<<<<<
@@ -5999,7 +6107,7 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
  */
   }
 
-  /* "alpm.pyx":447
+  /* "alpm.pyx":456
  *     if handle is not NULL:
  *         return alpm_option_add_cachedir(handle, cachedir)
  *     return -1             # <<<<<<<<<<<<<<
@@ -6011,7 +6119,7 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
   __pyx_r = __pyx_int_neg_1;
   goto __pyx_L0;
 
-  /* "alpm.pyx":442
+  /* "alpm.pyx":451
  *     return cachedirs
  * 
  * def option_add_cachedir(object pcachedir):             # <<<<<<<<<<<<<<
@@ -6033,7 +6141,7 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
   return __pyx_r;
 }
 
-/* "alpm.pyx":449
+/* "alpm.pyx":458
  *     return -1
  * 
  * def option_get_syncdb(object ptarget):             # <<<<<<<<<<<<<<
@@ -6042,20 +6150,20 @@ static PyObject *__pyx_pf_4alpm_40option_add_cachedir(CYTHON_UNUSED PyObject *__
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_43option_get_syncdb(PyObject *__pyx_self, PyObject *__pyx_v_ptarget); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_43option_get_syncdb = {"option_get_syncdb", (PyCFunction)__pyx_pw_4alpm_43option_get_syncdb, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_43option_get_syncdb(PyObject *__pyx_self, PyObject *__pyx_v_ptarget) {
+static PyObject *__pyx_pw_4alpm_45option_get_syncdb(PyObject *__pyx_self, PyObject *__pyx_v_ptarget); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_45option_get_syncdb = {"option_get_syncdb", (PyCFunction)__pyx_pw_4alpm_45option_get_syncdb, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_45option_get_syncdb(PyObject *__pyx_self, PyObject *__pyx_v_ptarget) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("option_get_syncdb (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_42option_get_syncdb(__pyx_self, ((PyObject *)__pyx_v_ptarget));
+  __pyx_r = __pyx_pf_4alpm_44option_get_syncdb(__pyx_self, ((PyObject *)__pyx_v_ptarget));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ptarget) {
+static PyObject *__pyx_pf_4alpm_44option_get_syncdb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ptarget) {
   alpm_list_t *__pyx_v_node;
   alpm_db_t *__pyx_v_db;
   const char *__pyx_v_name;
@@ -6069,7 +6177,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
   char const *__pyx_t_5;
   __Pyx_RefNannySetupContext("option_get_syncdb", 0);
 
-  /* "alpm.pyx":455
+  /* "alpm.pyx":464
  *     cdef bytes target
  * 
  *     if handle is not NULL and ptarget is not None:             # <<<<<<<<<<<<<<
@@ -6088,19 +6196,19 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":456
+    /* "alpm.pyx":465
  * 
  *     if handle is not NULL and ptarget is not None:
  *         target = to_bytes(ptarget)             # <<<<<<<<<<<<<<
  *         node = alpm_get_syncdbs(handle)
  *         while node is not NULL:
  */
-    __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_ptarget, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_ptarget, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 465, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_v_target = ((PyObject*)__pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "alpm.pyx":457
+    /* "alpm.pyx":466
  *     if handle is not NULL and ptarget is not None:
  *         target = to_bytes(ptarget)
  *         node = alpm_get_syncdbs(handle)             # <<<<<<<<<<<<<<
@@ -6109,7 +6217,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
     __pyx_v_node = alpm_get_syncdbs(__pyx_v_4alpm_handle);
 
-    /* "alpm.pyx":458
+    /* "alpm.pyx":467
  *         target = to_bytes(ptarget)
  *         node = alpm_get_syncdbs(handle)
  *         while node is not NULL:             # <<<<<<<<<<<<<<
@@ -6120,7 +6228,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
       __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
       if (!__pyx_t_1) break;
 
-      /* "alpm.pyx":459
+      /* "alpm.pyx":468
  *         node = alpm_get_syncdbs(handle)
  *         while node is not NULL:
  *             db = <alpm_db_t *>node.data             # <<<<<<<<<<<<<<
@@ -6129,7 +6237,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
       __pyx_v_db = ((alpm_db_t *)__pyx_v_node->data);
 
-      /* "alpm.pyx":460
+      /* "alpm.pyx":469
  *         while node is not NULL:
  *             db = <alpm_db_t *>node.data
  *             if db is not NULL:             # <<<<<<<<<<<<<<
@@ -6139,7 +6247,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
       __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":461
+        /* "alpm.pyx":470
  *             db = <alpm_db_t *>node.data
  *             if db is not NULL:
  *                 name = alpm_db_get_name(db)             # <<<<<<<<<<<<<<
@@ -6148,18 +6256,18 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
         __pyx_v_name = alpm_db_get_name(__pyx_v_db);
 
-        /* "alpm.pyx":462
+        /* "alpm.pyx":471
  *             if db is not NULL:
  *                 name = alpm_db_get_name(db)
  *                 if strcmp(name, target) == 0:             # <<<<<<<<<<<<<<
  *                     return to_capsule(db)
  *             node = alpm_list_next(node)
  */
-        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_target); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 462, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_target); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 471, __pyx_L1_error)
         __pyx_t_1 = ((strcmp(__pyx_v_name, __pyx_t_5) == 0) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":463
+          /* "alpm.pyx":472
  *                 name = alpm_db_get_name(db)
  *                 if strcmp(name, target) == 0:
  *                     return to_capsule(db)             # <<<<<<<<<<<<<<
@@ -6167,13 +6275,13 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  * 
  */
           __Pyx_XDECREF(__pyx_r);
-          __pyx_t_4 = __pyx_f_4alpm_to_capsule(__pyx_v_db); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 463, __pyx_L1_error)
+          __pyx_t_4 = __pyx_f_4alpm_to_capsule(__pyx_v_db); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 472, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           __pyx_r = __pyx_t_4;
           __pyx_t_4 = 0;
           goto __pyx_L0;
 
-          /* "alpm.pyx":462
+          /* "alpm.pyx":471
  *             if db is not NULL:
  *                 name = alpm_db_get_name(db)
  *                 if strcmp(name, target) == 0:             # <<<<<<<<<<<<<<
@@ -6182,7 +6290,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
         }
 
-        /* "alpm.pyx":460
+        /* "alpm.pyx":469
  *         while node is not NULL:
  *             db = <alpm_db_t *>node.data
  *             if db is not NULL:             # <<<<<<<<<<<<<<
@@ -6191,7 +6299,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
       }
 
-      /* "alpm.pyx":464
+      /* "alpm.pyx":473
  *                 if strcmp(name, target) == 0:
  *                     return to_capsule(db)
  *             node = alpm_list_next(node)             # <<<<<<<<<<<<<<
@@ -6201,7 +6309,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
       __pyx_v_node = alpm_list_next(__pyx_v_node);
     }
 
-    /* "alpm.pyx":455
+    /* "alpm.pyx":464
  *     cdef bytes target
  * 
  *     if handle is not NULL and ptarget is not None:             # <<<<<<<<<<<<<<
@@ -6210,7 +6318,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":449
+  /* "alpm.pyx":458
  *     return -1
  * 
  * def option_get_syncdb(object ptarget):             # <<<<<<<<<<<<<<
@@ -6232,7 +6340,7 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":466
+/* "alpm.pyx":475
  *             node = alpm_list_next(node)
  * 
  * def group_get_name(object pgroup):             # <<<<<<<<<<<<<<
@@ -6241,20 +6349,20 @@ static PyObject *__pyx_pf_4alpm_42option_get_syncdb(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_45group_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_45group_get_name = {"group_get_name", (PyCFunction)__pyx_pw_4alpm_45group_get_name, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_45group_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
+static PyObject *__pyx_pw_4alpm_47group_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_47group_get_name = {"group_get_name", (PyCFunction)__pyx_pw_4alpm_47group_get_name, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_47group_get_name(PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("group_get_name (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_44group_get_name(__pyx_self, ((PyObject *)__pyx_v_pgroup));
+  __pyx_r = __pyx_pf_4alpm_46group_get_name(__pyx_self, ((PyObject *)__pyx_v_pgroup));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
+static PyObject *__pyx_pf_4alpm_46group_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
   alpm_group_t *__pyx_v_group;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6263,7 +6371,7 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("group_get_name", 0);
 
-  /* "alpm.pyx":469
+  /* "alpm.pyx":478
  *     cdef alpm_group_t *group
  * 
  *     group = to_alpm_group(pgroup)             # <<<<<<<<<<<<<<
@@ -6272,7 +6380,7 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
  */
   __pyx_v_group = __pyx_f_4alpm_to_alpm_group(__pyx_v_pgroup);
 
-  /* "alpm.pyx":470
+  /* "alpm.pyx":479
  * 
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.name is not NULL:             # <<<<<<<<<<<<<<
@@ -6290,7 +6398,7 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":471
+    /* "alpm.pyx":480
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.name is not NULL:
  *         return to_unicode(group.name)             # <<<<<<<<<<<<<<
@@ -6298,13 +6406,13 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
  * def group_get_pkgs(object pgroup):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __pyx_f_4alpm_to_unicode(__pyx_v_group->name, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 471, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_4alpm_to_unicode(__pyx_v_group->name, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 480, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":470
+    /* "alpm.pyx":479
  * 
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.name is not NULL:             # <<<<<<<<<<<<<<
@@ -6313,7 +6421,7 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
  */
   }
 
-  /* "alpm.pyx":466
+  /* "alpm.pyx":475
  *             node = alpm_list_next(node)
  * 
  * def group_get_name(object pgroup):             # <<<<<<<<<<<<<<
@@ -6334,7 +6442,7 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":473
+/* "alpm.pyx":482
  *         return to_unicode(group.name)
  * 
  * def group_get_pkgs(object pgroup):             # <<<<<<<<<<<<<<
@@ -6343,20 +6451,20 @@ static PyObject *__pyx_pf_4alpm_44group_get_name(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_47group_get_pkgs(PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_47group_get_pkgs = {"group_get_pkgs", (PyCFunction)__pyx_pw_4alpm_47group_get_pkgs, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_47group_get_pkgs(PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
+static PyObject *__pyx_pw_4alpm_49group_get_pkgs(PyObject *__pyx_self, PyObject *__pyx_v_pgroup); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_49group_get_pkgs = {"group_get_pkgs", (PyCFunction)__pyx_pw_4alpm_49group_get_pkgs, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_49group_get_pkgs(PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("group_get_pkgs (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_46group_get_pkgs(__pyx_self, ((PyObject *)__pyx_v_pgroup));
+  __pyx_r = __pyx_pf_4alpm_48group_get_pkgs(__pyx_self, ((PyObject *)__pyx_v_pgroup));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
+static PyObject *__pyx_pf_4alpm_48group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pgroup) {
   alpm_group_t *__pyx_v_group;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6365,7 +6473,7 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("group_get_pkgs", 0);
 
-  /* "alpm.pyx":476
+  /* "alpm.pyx":485
  *     cdef alpm_group_t *group
  * 
  *     group = to_alpm_group(pgroup)             # <<<<<<<<<<<<<<
@@ -6374,7 +6482,7 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
  */
   __pyx_v_group = __pyx_f_4alpm_to_alpm_group(__pyx_v_pgroup);
 
-  /* "alpm.pyx":477
+  /* "alpm.pyx":486
  * 
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.packages is not NULL:             # <<<<<<<<<<<<<<
@@ -6392,7 +6500,7 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":478
+    /* "alpm.pyx":487
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.packages is not NULL:
  *         return to_capsule(group.packages)             # <<<<<<<<<<<<<<
@@ -6400,13 +6508,13 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
  * def dep_compute_string(object pdep):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __pyx_f_4alpm_to_capsule(__pyx_v_group->packages); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 478, __pyx_L1_error)
+    __pyx_t_3 = __pyx_f_4alpm_to_capsule(__pyx_v_group->packages); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":477
+    /* "alpm.pyx":486
  * 
  *     group = to_alpm_group(pgroup)
  *     if group is not NULL and group.packages is not NULL:             # <<<<<<<<<<<<<<
@@ -6415,7 +6523,7 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
  */
   }
 
-  /* "alpm.pyx":473
+  /* "alpm.pyx":482
  *         return to_unicode(group.name)
  * 
  * def group_get_pkgs(object pgroup):             # <<<<<<<<<<<<<<
@@ -6436,7 +6544,7 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":480
+/* "alpm.pyx":489
  *         return to_capsule(group.packages)
  * 
  * def dep_compute_string(object pdep):             # <<<<<<<<<<<<<<
@@ -6445,20 +6553,20 @@ static PyObject *__pyx_pf_4alpm_46group_get_pkgs(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_49dep_compute_string(PyObject *__pyx_self, PyObject *__pyx_v_pdep); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_49dep_compute_string = {"dep_compute_string", (PyCFunction)__pyx_pw_4alpm_49dep_compute_string, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_49dep_compute_string(PyObject *__pyx_self, PyObject *__pyx_v_pdep) {
+static PyObject *__pyx_pw_4alpm_51dep_compute_string(PyObject *__pyx_self, PyObject *__pyx_v_pdep); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_51dep_compute_string = {"dep_compute_string", (PyCFunction)__pyx_pw_4alpm_51dep_compute_string, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_51dep_compute_string(PyObject *__pyx_self, PyObject *__pyx_v_pdep) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("dep_compute_string (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_48dep_compute_string(__pyx_self, ((PyObject *)__pyx_v_pdep));
+  __pyx_r = __pyx_pf_4alpm_50dep_compute_string(__pyx_self, ((PyObject *)__pyx_v_pdep));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdep) {
+static PyObject *__pyx_pf_4alpm_50dep_compute_string(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pdep) {
   alpm_depend_t *__pyx_v_dep;
   char *__pyx_v_cstr;
   PyObject *__pyx_r = NULL;
@@ -6468,7 +6576,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("dep_compute_string", 0);
 
-  /* "alpm.pyx":484
+  /* "alpm.pyx":493
  *     cdef char *cstr
  * 
  *     dep = to_alpm_dep(pdep)             # <<<<<<<<<<<<<<
@@ -6477,7 +6585,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_dep = __pyx_f_4alpm_to_alpm_dep(__pyx_v_pdep);
 
-  /* "alpm.pyx":485
+  /* "alpm.pyx":494
  * 
  *     dep = to_alpm_dep(pdep)
  *     if dep is not NULL:             # <<<<<<<<<<<<<<
@@ -6487,7 +6595,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_dep != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":486
+    /* "alpm.pyx":495
  *     dep = to_alpm_dep(pdep)
  *     if dep is not NULL:
  *         cstr = alpm_dep_compute_string(dep)             # <<<<<<<<<<<<<<
@@ -6496,7 +6604,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
  */
     __pyx_v_cstr = alpm_dep_compute_string(__pyx_v_dep);
 
-    /* "alpm.pyx":487
+    /* "alpm.pyx":496
  *     if dep is not NULL:
  *         cstr = alpm_dep_compute_string(dep)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -6506,13 +6614,13 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 496, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":485
+    /* "alpm.pyx":494
  * 
  *     dep = to_alpm_dep(pdep)
  *     if dep is not NULL:             # <<<<<<<<<<<<<<
@@ -6521,7 +6629,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":480
+  /* "alpm.pyx":489
  *         return to_capsule(group.packages)
  * 
  * def dep_compute_string(object pdep):             # <<<<<<<<<<<<<<
@@ -6542,7 +6650,7 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":489
+/* "alpm.pyx":498
  *         return to_unicode(cstr, True)
  * 
  * def pkg_get_conflicts(object ppkg):             # <<<<<<<<<<<<<<
@@ -6551,20 +6659,20 @@ static PyObject *__pyx_pf_4alpm_48dep_compute_string(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_51pkg_get_conflicts(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_51pkg_get_conflicts = {"pkg_get_conflicts", (PyCFunction)__pyx_pw_4alpm_51pkg_get_conflicts, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_51pkg_get_conflicts(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_53pkg_get_conflicts(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_53pkg_get_conflicts = {"pkg_get_conflicts", (PyCFunction)__pyx_pw_4alpm_53pkg_get_conflicts, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_53pkg_get_conflicts(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_conflicts (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_50pkg_get_conflicts(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_52pkg_get_conflicts(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_52pkg_get_conflicts(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6572,7 +6680,7 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_conflicts", 0);
 
-  /* "alpm.pyx":492
+  /* "alpm.pyx":501
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -6581,7 +6689,7 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":493
+  /* "alpm.pyx":502
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6591,7 +6699,7 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":494
+    /* "alpm.pyx":503
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(create_dep_list(alpm_pkg_get_conflicts(pkg)))             # <<<<<<<<<<<<<<
@@ -6599,13 +6707,13 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
  * def pkg_get_provides(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_conflicts(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_conflicts(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 503, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":493
+    /* "alpm.pyx":502
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6614,7 +6722,7 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":489
+  /* "alpm.pyx":498
  *         return to_unicode(cstr, True)
  * 
  * def pkg_get_conflicts(object ppkg):             # <<<<<<<<<<<<<<
@@ -6635,7 +6743,7 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":496
+/* "alpm.pyx":505
  *         return to_capsule(create_dep_list(alpm_pkg_get_conflicts(pkg)))
  * 
  * def pkg_get_provides(object ppkg):             # <<<<<<<<<<<<<<
@@ -6644,20 +6752,20 @@ static PyObject *__pyx_pf_4alpm_50pkg_get_conflicts(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_53pkg_get_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_53pkg_get_provides = {"pkg_get_provides", (PyCFunction)__pyx_pw_4alpm_53pkg_get_provides, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_53pkg_get_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_55pkg_get_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_55pkg_get_provides = {"pkg_get_provides", (PyCFunction)__pyx_pw_4alpm_55pkg_get_provides, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_55pkg_get_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_provides (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_52pkg_get_provides(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_54pkg_get_provides(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_54pkg_get_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6665,7 +6773,7 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_provides", 0);
 
-  /* "alpm.pyx":499
+  /* "alpm.pyx":508
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -6674,7 +6782,7 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":500
+  /* "alpm.pyx":509
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6684,7 +6792,7 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":501
+    /* "alpm.pyx":510
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(create_dep_list(alpm_pkg_get_provides(pkg)))             # <<<<<<<<<<<<<<
@@ -6692,13 +6800,13 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
  * def pkg_get_replaces(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_provides(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 501, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_provides(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 510, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":500
+    /* "alpm.pyx":509
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6707,7 +6815,7 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
  */
   }
 
-  /* "alpm.pyx":496
+  /* "alpm.pyx":505
  *         return to_capsule(create_dep_list(alpm_pkg_get_conflicts(pkg)))
  * 
  * def pkg_get_provides(object ppkg):             # <<<<<<<<<<<<<<
@@ -6728,7 +6836,7 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":503
+/* "alpm.pyx":512
  *         return to_capsule(create_dep_list(alpm_pkg_get_provides(pkg)))
  * 
  * def pkg_get_replaces(object ppkg):             # <<<<<<<<<<<<<<
@@ -6737,20 +6845,20 @@ static PyObject *__pyx_pf_4alpm_52pkg_get_provides(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_55pkg_get_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_55pkg_get_replaces = {"pkg_get_replaces", (PyCFunction)__pyx_pw_4alpm_55pkg_get_replaces, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_55pkg_get_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_57pkg_get_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_57pkg_get_replaces = {"pkg_get_replaces", (PyCFunction)__pyx_pw_4alpm_57pkg_get_replaces, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_57pkg_get_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_replaces (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_54pkg_get_replaces(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_56pkg_get_replaces(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_56pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6758,7 +6866,7 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_replaces", 0);
 
-  /* "alpm.pyx":506
+  /* "alpm.pyx":515
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -6767,7 +6875,7 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":507
+  /* "alpm.pyx":516
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6777,7 +6885,7 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":508
+    /* "alpm.pyx":517
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(create_dep_list(alpm_pkg_get_replaces(pkg)))             # <<<<<<<<<<<<<<
@@ -6785,13 +6893,13 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
  * def pkg_get_name(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_replaces(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 508, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(__pyx_f_4alpm_create_dep_list(alpm_pkg_get_replaces(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 517, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":507
+    /* "alpm.pyx":516
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6800,7 +6908,7 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
  */
   }
 
-  /* "alpm.pyx":503
+  /* "alpm.pyx":512
  *         return to_capsule(create_dep_list(alpm_pkg_get_provides(pkg)))
  * 
  * def pkg_get_replaces(object ppkg):             # <<<<<<<<<<<<<<
@@ -6821,7 +6929,7 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":510
+/* "alpm.pyx":519
  *         return to_capsule(create_dep_list(alpm_pkg_get_replaces(pkg)))
  * 
  * def pkg_get_name(object ppkg):             # <<<<<<<<<<<<<<
@@ -6830,20 +6938,20 @@ static PyObject *__pyx_pf_4alpm_54pkg_get_replaces(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_57pkg_get_name(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_57pkg_get_name = {"pkg_get_name", (PyCFunction)__pyx_pw_4alpm_57pkg_get_name, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_57pkg_get_name(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_59pkg_get_name(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_59pkg_get_name = {"pkg_get_name", (PyCFunction)__pyx_pw_4alpm_59pkg_get_name, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_59pkg_get_name(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_name (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_56pkg_get_name(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_58pkg_get_name(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_58pkg_get_name(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6851,7 +6959,7 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_name", 0);
 
-  /* "alpm.pyx":513
+  /* "alpm.pyx":522
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -6860,7 +6968,7 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":514
+  /* "alpm.pyx":523
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6870,7 +6978,7 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":515
+    /* "alpm.pyx":524
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>alpm_pkg_get_name(pkg))             # <<<<<<<<<<<<<<
@@ -6878,13 +6986,13 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
  * def pkg_get_arch(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_name(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 515, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_name(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 524, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":514
+    /* "alpm.pyx":523
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6893,7 +7001,7 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":510
+  /* "alpm.pyx":519
  *         return to_capsule(create_dep_list(alpm_pkg_get_replaces(pkg)))
  * 
  * def pkg_get_name(object ppkg):             # <<<<<<<<<<<<<<
@@ -6914,7 +7022,7 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":517
+/* "alpm.pyx":526
  *         return to_unicode(<char *>alpm_pkg_get_name(pkg))
  * 
  * def pkg_get_arch(object ppkg):             # <<<<<<<<<<<<<<
@@ -6923,20 +7031,20 @@ static PyObject *__pyx_pf_4alpm_56pkg_get_name(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_59pkg_get_arch(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_59pkg_get_arch = {"pkg_get_arch", (PyCFunction)__pyx_pw_4alpm_59pkg_get_arch, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_59pkg_get_arch(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_61pkg_get_arch(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_61pkg_get_arch = {"pkg_get_arch", (PyCFunction)__pyx_pw_4alpm_61pkg_get_arch, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_61pkg_get_arch(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_arch (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_58pkg_get_arch(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_60pkg_get_arch(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_60pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6944,7 +7052,7 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_arch", 0);
 
-  /* "alpm.pyx":520
+  /* "alpm.pyx":529
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -6953,7 +7061,7 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":521
+  /* "alpm.pyx":530
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6963,7 +7071,7 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":522
+    /* "alpm.pyx":531
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>alpm_pkg_get_arch(pkg))             # <<<<<<<<<<<<<<
@@ -6971,13 +7079,13 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
  * def pkg_get_desc(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_arch(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 522, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_arch(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 531, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":521
+    /* "alpm.pyx":530
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -6986,7 +7094,7 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":517
+  /* "alpm.pyx":526
  *         return to_unicode(<char *>alpm_pkg_get_name(pkg))
  * 
  * def pkg_get_arch(object ppkg):             # <<<<<<<<<<<<<<
@@ -7007,7 +7115,7 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":524
+/* "alpm.pyx":533
  *         return to_unicode(<char *>alpm_pkg_get_arch(pkg))
  * 
  * def pkg_get_desc(object ppkg):             # <<<<<<<<<<<<<<
@@ -7016,20 +7124,20 @@ static PyObject *__pyx_pf_4alpm_58pkg_get_arch(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_61pkg_get_desc(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_61pkg_get_desc = {"pkg_get_desc", (PyCFunction)__pyx_pw_4alpm_61pkg_get_desc, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_61pkg_get_desc(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_63pkg_get_desc(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_63pkg_get_desc = {"pkg_get_desc", (PyCFunction)__pyx_pw_4alpm_63pkg_get_desc, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_63pkg_get_desc(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_desc (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_60pkg_get_desc(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_62pkg_get_desc(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_62pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7037,7 +7145,7 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_desc", 0);
 
-  /* "alpm.pyx":527
+  /* "alpm.pyx":536
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7046,7 +7154,7 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":528
+  /* "alpm.pyx":537
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7056,7 +7164,7 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":529
+    /* "alpm.pyx":538
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>alpm_pkg_get_desc(pkg))             # <<<<<<<<<<<<<<
@@ -7064,13 +7172,13 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
  * def pkg_get_url(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_desc(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_desc(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 538, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":528
+    /* "alpm.pyx":537
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7079,7 +7187,7 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":524
+  /* "alpm.pyx":533
  *         return to_unicode(<char *>alpm_pkg_get_arch(pkg))
  * 
  * def pkg_get_desc(object ppkg):             # <<<<<<<<<<<<<<
@@ -7100,7 +7208,7 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":531
+/* "alpm.pyx":540
  *         return to_unicode(<char *>alpm_pkg_get_desc(pkg))
  * 
  * def pkg_get_url(object ppkg):             # <<<<<<<<<<<<<<
@@ -7109,20 +7217,20 @@ static PyObject *__pyx_pf_4alpm_60pkg_get_desc(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_63pkg_get_url(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_63pkg_get_url = {"pkg_get_url", (PyCFunction)__pyx_pw_4alpm_63pkg_get_url, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_63pkg_get_url(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_65pkg_get_url(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_65pkg_get_url = {"pkg_get_url", (PyCFunction)__pyx_pw_4alpm_65pkg_get_url, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_65pkg_get_url(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_url (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_62pkg_get_url(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_64pkg_get_url(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_64pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7130,7 +7238,7 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_url", 0);
 
-  /* "alpm.pyx":534
+  /* "alpm.pyx":543
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7139,7 +7247,7 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":535
+  /* "alpm.pyx":544
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7149,7 +7257,7 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":536
+    /* "alpm.pyx":545
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>alpm_pkg_get_url(pkg))             # <<<<<<<<<<<<<<
@@ -7157,13 +7265,13 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
  * def pkg_get_version(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_url(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_url(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 545, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":535
+    /* "alpm.pyx":544
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7172,7 +7280,7 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
  */
   }
 
-  /* "alpm.pyx":531
+  /* "alpm.pyx":540
  *         return to_unicode(<char *>alpm_pkg_get_desc(pkg))
  * 
  * def pkg_get_url(object ppkg):             # <<<<<<<<<<<<<<
@@ -7193,7 +7301,7 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "alpm.pyx":538
+/* "alpm.pyx":547
  *         return to_unicode(<char *>alpm_pkg_get_url(pkg))
  * 
  * def pkg_get_version(object ppkg):             # <<<<<<<<<<<<<<
@@ -7202,20 +7310,20 @@ static PyObject *__pyx_pf_4alpm_62pkg_get_url(CYTHON_UNUSED PyObject *__pyx_self
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_65pkg_get_version(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_65pkg_get_version = {"pkg_get_version", (PyCFunction)__pyx_pw_4alpm_65pkg_get_version, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_65pkg_get_version(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_67pkg_get_version(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_67pkg_get_version = {"pkg_get_version", (PyCFunction)__pyx_pw_4alpm_67pkg_get_version, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_67pkg_get_version(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_version (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_64pkg_get_version(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_66pkg_get_version(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_66pkg_get_version(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7223,7 +7331,7 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_version", 0);
 
-  /* "alpm.pyx":541
+  /* "alpm.pyx":550
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7232,7 +7340,7 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":542
+  /* "alpm.pyx":551
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7242,7 +7350,7 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":543
+    /* "alpm.pyx":552
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>alpm_pkg_get_version(pkg))             # <<<<<<<<<<<<<<
@@ -7250,13 +7358,13 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
  * def pkg_get_isize(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_version(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 543, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)alpm_pkg_get_version(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 552, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":542
+    /* "alpm.pyx":551
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7265,7 +7373,7 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":538
+  /* "alpm.pyx":547
  *         return to_unicode(<char *>alpm_pkg_get_url(pkg))
  * 
  * def pkg_get_version(object ppkg):             # <<<<<<<<<<<<<<
@@ -7286,7 +7394,7 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":545
+/* "alpm.pyx":554
  *         return to_unicode(<char *>alpm_pkg_get_version(pkg))
  * 
  * def pkg_get_isize(object ppkg):             # <<<<<<<<<<<<<<
@@ -7295,20 +7403,20 @@ static PyObject *__pyx_pf_4alpm_64pkg_get_version(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_67pkg_get_isize(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_67pkg_get_isize = {"pkg_get_isize", (PyCFunction)__pyx_pw_4alpm_67pkg_get_isize, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_67pkg_get_isize(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_69pkg_get_isize(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_69pkg_get_isize = {"pkg_get_isize", (PyCFunction)__pyx_pw_4alpm_69pkg_get_isize, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_69pkg_get_isize(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_isize (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_66pkg_get_isize(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_68pkg_get_isize(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_68pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7316,7 +7424,7 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_isize", 0);
 
-  /* "alpm.pyx":548
+  /* "alpm.pyx":557
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7325,7 +7433,7 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":549
+  /* "alpm.pyx":558
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7335,7 +7443,7 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":550
+    /* "alpm.pyx":559
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return alpm_pkg_get_isize(pkg)             # <<<<<<<<<<<<<<
@@ -7343,13 +7451,13 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
  * def pkg_get_size(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_off_t(alpm_pkg_get_isize(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 550, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_off_t(alpm_pkg_get_isize(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 559, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":549
+    /* "alpm.pyx":558
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7358,7 +7466,7 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
  */
   }
 
-  /* "alpm.pyx":545
+  /* "alpm.pyx":554
  *         return to_unicode(<char *>alpm_pkg_get_version(pkg))
  * 
  * def pkg_get_isize(object ppkg):             # <<<<<<<<<<<<<<
@@ -7379,7 +7487,7 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
   return __pyx_r;
 }
 
-/* "alpm.pyx":552
+/* "alpm.pyx":561
  *         return alpm_pkg_get_isize(pkg)
  * 
  * def pkg_get_size(object ppkg):             # <<<<<<<<<<<<<<
@@ -7388,20 +7496,20 @@ static PyObject *__pyx_pf_4alpm_66pkg_get_isize(CYTHON_UNUSED PyObject *__pyx_se
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_69pkg_get_size(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_69pkg_get_size = {"pkg_get_size", (PyCFunction)__pyx_pw_4alpm_69pkg_get_size, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_69pkg_get_size(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_71pkg_get_size(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_71pkg_get_size = {"pkg_get_size", (PyCFunction)__pyx_pw_4alpm_71pkg_get_size, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_71pkg_get_size(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_size (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_68pkg_get_size(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_70pkg_get_size(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_70pkg_get_size(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7409,7 +7517,7 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_size", 0);
 
-  /* "alpm.pyx":555
+  /* "alpm.pyx":564
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7418,7 +7526,7 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":556
+  /* "alpm.pyx":565
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7428,7 +7536,7 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":557
+    /* "alpm.pyx":566
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return alpm_pkg_get_size(pkg)             # <<<<<<<<<<<<<<
@@ -7436,13 +7544,13 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
  * def pkg_get_builddate(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_off_t(alpm_pkg_get_size(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_off_t(alpm_pkg_get_size(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 566, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":556
+    /* "alpm.pyx":565
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7451,7 +7559,7 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":552
+  /* "alpm.pyx":561
  *         return alpm_pkg_get_isize(pkg)
  * 
  * def pkg_get_size(object ppkg):             # <<<<<<<<<<<<<<
@@ -7472,7 +7580,7 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":559
+/* "alpm.pyx":568
  *         return alpm_pkg_get_size(pkg)
  * 
  * def pkg_get_builddate(object ppkg):             # <<<<<<<<<<<<<<
@@ -7481,20 +7589,20 @@ static PyObject *__pyx_pf_4alpm_68pkg_get_size(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_71pkg_get_builddate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_71pkg_get_builddate = {"pkg_get_builddate", (PyCFunction)__pyx_pw_4alpm_71pkg_get_builddate, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_71pkg_get_builddate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_73pkg_get_builddate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_73pkg_get_builddate = {"pkg_get_builddate", (PyCFunction)__pyx_pw_4alpm_73pkg_get_builddate, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_73pkg_get_builddate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_builddate (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_70pkg_get_builddate(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_72pkg_get_builddate(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_72pkg_get_builddate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7502,7 +7610,7 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_builddate", 0);
 
-  /* "alpm.pyx":562
+  /* "alpm.pyx":571
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7511,7 +7619,7 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":563
+  /* "alpm.pyx":572
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7521,7 +7629,7 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":564
+    /* "alpm.pyx":573
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return alpm_pkg_get_builddate(pkg)             # <<<<<<<<<<<<<<
@@ -7529,13 +7637,13 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
  * def pkg_get_installdate(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_alpm_time_t(alpm_pkg_get_builddate(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 564, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_alpm_time_t(alpm_pkg_get_builddate(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 573, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":563
+    /* "alpm.pyx":572
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7544,7 +7652,7 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":559
+  /* "alpm.pyx":568
  *         return alpm_pkg_get_size(pkg)
  * 
  * def pkg_get_builddate(object ppkg):             # <<<<<<<<<<<<<<
@@ -7565,7 +7673,7 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":566
+/* "alpm.pyx":575
  *         return alpm_pkg_get_builddate(pkg)
  * 
  * def pkg_get_installdate(object ppkg):             # <<<<<<<<<<<<<<
@@ -7574,20 +7682,20 @@ static PyObject *__pyx_pf_4alpm_70pkg_get_builddate(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_73pkg_get_installdate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_73pkg_get_installdate = {"pkg_get_installdate", (PyCFunction)__pyx_pw_4alpm_73pkg_get_installdate, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_73pkg_get_installdate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_75pkg_get_installdate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_75pkg_get_installdate = {"pkg_get_installdate", (PyCFunction)__pyx_pw_4alpm_75pkg_get_installdate, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_75pkg_get_installdate(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_installdate (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_72pkg_get_installdate(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_74pkg_get_installdate(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_74pkg_get_installdate(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7595,7 +7703,7 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_installdate", 0);
 
-  /* "alpm.pyx":569
+  /* "alpm.pyx":578
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7604,7 +7712,7 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":570
+  /* "alpm.pyx":579
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7614,7 +7722,7 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":571
+    /* "alpm.pyx":580
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return alpm_pkg_get_installdate(pkg)             # <<<<<<<<<<<<<<
@@ -7622,13 +7730,13 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
  * def pkg_has_scriptlet(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_alpm_time_t(alpm_pkg_get_installdate(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 571, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_alpm_time_t(alpm_pkg_get_installdate(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 580, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":570
+    /* "alpm.pyx":579
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7637,7 +7745,7 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
  */
   }
 
-  /* "alpm.pyx":566
+  /* "alpm.pyx":575
  *         return alpm_pkg_get_builddate(pkg)
  * 
  * def pkg_get_installdate(object ppkg):             # <<<<<<<<<<<<<<
@@ -7658,7 +7766,7 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
   return __pyx_r;
 }
 
-/* "alpm.pyx":573
+/* "alpm.pyx":582
  *         return alpm_pkg_get_installdate(pkg)
  * 
  * def pkg_has_scriptlet(object ppkg):             # <<<<<<<<<<<<<<
@@ -7667,20 +7775,20 @@ static PyObject *__pyx_pf_4alpm_72pkg_get_installdate(CYTHON_UNUSED PyObject *__
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_75pkg_has_scriptlet(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_75pkg_has_scriptlet = {"pkg_has_scriptlet", (PyCFunction)__pyx_pw_4alpm_75pkg_has_scriptlet, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_75pkg_has_scriptlet(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_77pkg_has_scriptlet(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_77pkg_has_scriptlet = {"pkg_has_scriptlet", (PyCFunction)__pyx_pw_4alpm_77pkg_has_scriptlet, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_77pkg_has_scriptlet(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_has_scriptlet (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_74pkg_has_scriptlet(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_76pkg_has_scriptlet(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_76pkg_has_scriptlet(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7688,7 +7796,7 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_has_scriptlet", 0);
 
-  /* "alpm.pyx":576
+  /* "alpm.pyx":585
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7697,7 +7805,7 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":577
+  /* "alpm.pyx":586
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7707,7 +7815,7 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":578
+    /* "alpm.pyx":587
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return bool(alpm_pkg_has_scriptlet(pkg))             # <<<<<<<<<<<<<<
@@ -7715,17 +7823,17 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
  * def pkg_get_backup(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_pkg_has_scriptlet(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 578, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(alpm_pkg_has_scriptlet(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 587, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 578, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 587, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyBool_FromLong((!(!__pyx_t_1))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 578, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyBool_FromLong((!(!__pyx_t_1))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 587, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":577
+    /* "alpm.pyx":586
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7734,7 +7842,7 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":573
+  /* "alpm.pyx":582
  *         return alpm_pkg_get_installdate(pkg)
  * 
  * def pkg_has_scriptlet(object ppkg):             # <<<<<<<<<<<<<<
@@ -7755,7 +7863,7 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":580
+/* "alpm.pyx":589
  *         return bool(alpm_pkg_has_scriptlet(pkg))
  * 
  * def pkg_get_backup(object ppkg):             # <<<<<<<<<<<<<<
@@ -7764,20 +7872,20 @@ static PyObject *__pyx_pf_4alpm_74pkg_has_scriptlet(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_77pkg_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_77pkg_get_backup = {"pkg_get_backup", (PyCFunction)__pyx_pw_4alpm_77pkg_get_backup, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_77pkg_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_79pkg_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_79pkg_get_backup = {"pkg_get_backup", (PyCFunction)__pyx_pw_4alpm_79pkg_get_backup, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_79pkg_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_backup (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_76pkg_get_backup(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_78pkg_get_backup(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_78pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7785,7 +7893,7 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_backup", 0);
 
-  /* "alpm.pyx":583
+  /* "alpm.pyx":592
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7794,7 +7902,7 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":584
+  /* "alpm.pyx":593
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7804,7 +7912,7 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":585
+    /* "alpm.pyx":594
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_get_backup(pkg))             # <<<<<<<<<<<<<<
@@ -7812,13 +7920,13 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
  * def pkg_compute_requiredby(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_backup(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 585, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_backup(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 594, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":584
+    /* "alpm.pyx":593
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7827,7 +7935,7 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
  */
   }
 
-  /* "alpm.pyx":580
+  /* "alpm.pyx":589
  *         return bool(alpm_pkg_has_scriptlet(pkg))
  * 
  * def pkg_get_backup(object ppkg):             # <<<<<<<<<<<<<<
@@ -7848,7 +7956,7 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":587
+/* "alpm.pyx":596
  *         return to_capsule(alpm_pkg_get_backup(pkg))
  * 
  * def pkg_compute_requiredby(object ppkg):             # <<<<<<<<<<<<<<
@@ -7857,20 +7965,20 @@ static PyObject *__pyx_pf_4alpm_76pkg_get_backup(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_79pkg_compute_requiredby(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_79pkg_compute_requiredby = {"pkg_compute_requiredby", (PyCFunction)__pyx_pw_4alpm_79pkg_compute_requiredby, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_79pkg_compute_requiredby(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_81pkg_compute_requiredby(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_81pkg_compute_requiredby = {"pkg_compute_requiredby", (PyCFunction)__pyx_pw_4alpm_81pkg_compute_requiredby, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_81pkg_compute_requiredby(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_compute_requiredby (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_78pkg_compute_requiredby(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_80pkg_compute_requiredby(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_80pkg_compute_requiredby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7878,7 +7986,7 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_compute_requiredby", 0);
 
-  /* "alpm.pyx":590
+  /* "alpm.pyx":599
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7887,7 +7995,7 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":591
+  /* "alpm.pyx":600
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7897,7 +8005,7 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":592
+    /* "alpm.pyx":601
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_compute_requiredby(pkg))             # <<<<<<<<<<<<<<
@@ -7905,13 +8013,13 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
  * def pkg_compute_optionalfor(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_compute_requiredby(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 592, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_compute_requiredby(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 601, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":591
+    /* "alpm.pyx":600
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7920,7 +8028,7 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
  */
   }
 
-  /* "alpm.pyx":587
+  /* "alpm.pyx":596
  *         return to_capsule(alpm_pkg_get_backup(pkg))
  * 
  * def pkg_compute_requiredby(object ppkg):             # <<<<<<<<<<<<<<
@@ -7941,7 +8049,7 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "alpm.pyx":594
+/* "alpm.pyx":603
  *         return to_capsule(alpm_pkg_compute_requiredby(pkg))
  * 
  * def pkg_compute_optionalfor(object ppkg):             # <<<<<<<<<<<<<<
@@ -7950,20 +8058,20 @@ static PyObject *__pyx_pf_4alpm_78pkg_compute_requiredby(CYTHON_UNUSED PyObject
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_81pkg_compute_optionalfor(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_81pkg_compute_optionalfor = {"pkg_compute_optionalfor", (PyCFunction)__pyx_pw_4alpm_81pkg_compute_optionalfor, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_81pkg_compute_optionalfor(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_83pkg_compute_optionalfor(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_83pkg_compute_optionalfor = {"pkg_compute_optionalfor", (PyCFunction)__pyx_pw_4alpm_83pkg_compute_optionalfor, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_83pkg_compute_optionalfor(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_compute_optionalfor (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_80pkg_compute_optionalfor(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_82pkg_compute_optionalfor(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_82pkg_compute_optionalfor(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7971,7 +8079,7 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_compute_optionalfor", 0);
 
-  /* "alpm.pyx":597
+  /* "alpm.pyx":606
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -7980,7 +8088,7 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":598
+  /* "alpm.pyx":607
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -7990,7 +8098,7 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":599
+    /* "alpm.pyx":608
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_compute_optionalfor(pkg))             # <<<<<<<<<<<<<<
@@ -7998,13 +8106,13 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
  * def pkg_get_depends(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_compute_optionalfor(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 599, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_compute_optionalfor(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 608, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":598
+    /* "alpm.pyx":607
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8013,7 +8121,7 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
  */
   }
 
-  /* "alpm.pyx":594
+  /* "alpm.pyx":603
  *         return to_capsule(alpm_pkg_compute_requiredby(pkg))
  * 
  * def pkg_compute_optionalfor(object ppkg):             # <<<<<<<<<<<<<<
@@ -8034,7 +8142,7 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "alpm.pyx":601
+/* "alpm.pyx":610
  *         return to_capsule(alpm_pkg_compute_optionalfor(pkg))
  * 
  * def pkg_get_depends(object ppkg):             # <<<<<<<<<<<<<<
@@ -8043,20 +8151,20 @@ static PyObject *__pyx_pf_4alpm_80pkg_compute_optionalfor(CYTHON_UNUSED PyObject
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_83pkg_get_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_83pkg_get_depends = {"pkg_get_depends", (PyCFunction)__pyx_pw_4alpm_83pkg_get_depends, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_83pkg_get_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_85pkg_get_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_85pkg_get_depends = {"pkg_get_depends", (PyCFunction)__pyx_pw_4alpm_85pkg_get_depends, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_85pkg_get_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_depends (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_82pkg_get_depends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_84pkg_get_depends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_84pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8064,7 +8172,7 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_depends", 0);
 
-  /* "alpm.pyx":604
+  /* "alpm.pyx":613
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8073,7 +8181,7 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":605
+  /* "alpm.pyx":614
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8083,7 +8191,7 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":606
+    /* "alpm.pyx":615
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_get_depends(pkg))             # <<<<<<<<<<<<<<
@@ -8091,13 +8199,13 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
  * def pkg_get_groups(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_depends(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 606, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_depends(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 615, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":605
+    /* "alpm.pyx":614
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8106,7 +8214,7 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":601
+  /* "alpm.pyx":610
  *         return to_capsule(alpm_pkg_compute_optionalfor(pkg))
  * 
  * def pkg_get_depends(object ppkg):             # <<<<<<<<<<<<<<
@@ -8127,7 +8235,7 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":608
+/* "alpm.pyx":617
  *         return to_capsule(alpm_pkg_get_depends(pkg))
  * 
  * def pkg_get_groups(object ppkg):             # <<<<<<<<<<<<<<
@@ -8136,20 +8244,20 @@ static PyObject *__pyx_pf_4alpm_82pkg_get_depends(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_85pkg_get_groups(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_85pkg_get_groups = {"pkg_get_groups", (PyCFunction)__pyx_pw_4alpm_85pkg_get_groups, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_85pkg_get_groups(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_87pkg_get_groups(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_87pkg_get_groups = {"pkg_get_groups", (PyCFunction)__pyx_pw_4alpm_87pkg_get_groups, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_87pkg_get_groups(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_groups (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_84pkg_get_groups(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_86pkg_get_groups(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_86pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8157,7 +8265,7 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_groups", 0);
 
-  /* "alpm.pyx":611
+  /* "alpm.pyx":620
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8166,7 +8274,7 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":612
+  /* "alpm.pyx":621
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8176,7 +8284,7 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":613
+    /* "alpm.pyx":622
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_get_groups(pkg))             # <<<<<<<<<<<<<<
@@ -8184,13 +8292,13 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
  * def pkg_get_licenses(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_groups(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 613, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_groups(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 622, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":612
+    /* "alpm.pyx":621
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8199,7 +8307,7 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
  */
   }
 
-  /* "alpm.pyx":608
+  /* "alpm.pyx":617
  *         return to_capsule(alpm_pkg_get_depends(pkg))
  * 
  * def pkg_get_groups(object ppkg):             # <<<<<<<<<<<<<<
@@ -8220,7 +8328,7 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":615
+/* "alpm.pyx":624
  *         return to_capsule(alpm_pkg_get_groups(pkg))
  * 
  * def pkg_get_licenses(object ppkg):             # <<<<<<<<<<<<<<
@@ -8229,20 +8337,20 @@ static PyObject *__pyx_pf_4alpm_84pkg_get_groups(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_87pkg_get_licenses(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_87pkg_get_licenses = {"pkg_get_licenses", (PyCFunction)__pyx_pw_4alpm_87pkg_get_licenses, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_87pkg_get_licenses(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_89pkg_get_licenses(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_89pkg_get_licenses = {"pkg_get_licenses", (PyCFunction)__pyx_pw_4alpm_89pkg_get_licenses, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_89pkg_get_licenses(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_licenses (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_86pkg_get_licenses(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_88pkg_get_licenses(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_88pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8250,7 +8358,7 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_licenses", 0);
 
-  /* "alpm.pyx":618
+  /* "alpm.pyx":627
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8259,7 +8367,7 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":619
+  /* "alpm.pyx":628
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8269,7 +8377,7 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":620
+    /* "alpm.pyx":629
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_get_licenses(pkg))             # <<<<<<<<<<<<<<
@@ -8277,13 +8385,13 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
  * def pkg_get_optdepends(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_licenses(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 620, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_licenses(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 629, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":619
+    /* "alpm.pyx":628
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8292,7 +8400,7 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
  */
   }
 
-  /* "alpm.pyx":615
+  /* "alpm.pyx":624
  *         return to_capsule(alpm_pkg_get_groups(pkg))
  * 
  * def pkg_get_licenses(object ppkg):             # <<<<<<<<<<<<<<
@@ -8313,7 +8421,7 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":622
+/* "alpm.pyx":631
  *         return to_capsule(alpm_pkg_get_licenses(pkg))
  * 
  * def pkg_get_optdepends(object ppkg):             # <<<<<<<<<<<<<<
@@ -8322,20 +8430,20 @@ static PyObject *__pyx_pf_4alpm_86pkg_get_licenses(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_89pkg_get_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_89pkg_get_optdepends = {"pkg_get_optdepends", (PyCFunction)__pyx_pw_4alpm_89pkg_get_optdepends, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_89pkg_get_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_91pkg_get_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_91pkg_get_optdepends = {"pkg_get_optdepends", (PyCFunction)__pyx_pw_4alpm_91pkg_get_optdepends, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_91pkg_get_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_optdepends (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_88pkg_get_optdepends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_90pkg_get_optdepends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_90pkg_get_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8343,7 +8451,7 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_optdepends", 0);
 
-  /* "alpm.pyx":625
+  /* "alpm.pyx":634
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8352,7 +8460,7 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":626
+  /* "alpm.pyx":635
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8362,7 +8470,7 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":627
+    /* "alpm.pyx":636
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_capsule(alpm_pkg_get_optdepends(pkg))             # <<<<<<<<<<<<<<
@@ -8370,13 +8478,13 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
  * PKG_VALIDATION_UNKNOWN = ALPM_PKG_VALIDATION_UNKNOWN
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_optdepends(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 627, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_pkg_get_optdepends(__pyx_v_pkg)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 636, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":626
+    /* "alpm.pyx":635
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8385,7 +8493,7 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":622
+  /* "alpm.pyx":631
  *         return to_capsule(alpm_pkg_get_licenses(pkg))
  * 
  * def pkg_get_optdepends(object ppkg):             # <<<<<<<<<<<<<<
@@ -8406,7 +8514,7 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":635
+/* "alpm.pyx":644
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  * 
  * def pkg_get_validation(object ppkg):             # <<<<<<<<<<<<<<
@@ -8415,20 +8523,20 @@ static PyObject *__pyx_pf_4alpm_88pkg_get_optdepends(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_91pkg_get_validation(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_91pkg_get_validation = {"pkg_get_validation", (PyCFunction)__pyx_pw_4alpm_91pkg_get_validation, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_91pkg_get_validation(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_93pkg_get_validation(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_93pkg_get_validation = {"pkg_get_validation", (PyCFunction)__pyx_pw_4alpm_93pkg_get_validation, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_93pkg_get_validation(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_validation (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_90pkg_get_validation(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_92pkg_get_validation(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_92pkg_get_validation(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8436,7 +8544,7 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_validation", 0);
 
-  /* "alpm.pyx":638
+  /* "alpm.pyx":647
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8445,7 +8553,7 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":639
+  /* "alpm.pyx":648
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8455,7 +8563,7 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":640
+    /* "alpm.pyx":649
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return <int>alpm_pkg_get_validation(pkg)             # <<<<<<<<<<<<<<
@@ -8463,13 +8571,13 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
  * def pkg_vercmp(object pa, object pb):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_int(((int)alpm_pkg_get_validation(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 640, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(((int)alpm_pkg_get_validation(__pyx_v_pkg))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 649, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":639
+    /* "alpm.pyx":648
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8478,7 +8586,7 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":635
+  /* "alpm.pyx":644
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  * 
  * def pkg_get_validation(object ppkg):             # <<<<<<<<<<<<<<
@@ -8499,7 +8607,7 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":642
+/* "alpm.pyx":651
  *         return <int>alpm_pkg_get_validation(pkg)
  * 
  * def pkg_vercmp(object pa, object pb):             # <<<<<<<<<<<<<<
@@ -8508,9 +8616,9 @@ static PyObject *__pyx_pf_4alpm_90pkg_get_validation(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_93pkg_vercmp(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_93pkg_vercmp = {"pkg_vercmp", (PyCFunction)__pyx_pw_4alpm_93pkg_vercmp, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_93pkg_vercmp(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_95pkg_vercmp(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_95pkg_vercmp = {"pkg_vercmp", (PyCFunction)__pyx_pw_4alpm_95pkg_vercmp, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_95pkg_vercmp(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_pa = 0;
   PyObject *__pyx_v_pb = 0;
   PyObject *__pyx_r = 0;
@@ -8536,11 +8644,11 @@ static PyObject *__pyx_pw_4alpm_93pkg_vercmp(PyObject *__pyx_self, PyObject *__p
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pb)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pkg_vercmp", 1, 2, 2, 1); __PYX_ERR(0, 642, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pkg_vercmp", 1, 2, 2, 1); __PYX_ERR(0, 651, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_vercmp") < 0)) __PYX_ERR(0, 642, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_vercmp") < 0)) __PYX_ERR(0, 651, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -8553,20 +8661,20 @@ static PyObject *__pyx_pw_4alpm_93pkg_vercmp(PyObject *__pyx_self, PyObject *__p
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pkg_vercmp", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 642, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pkg_vercmp", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 651, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.pkg_vercmp", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_92pkg_vercmp(__pyx_self, __pyx_v_pa, __pyx_v_pb);
+  __pyx_r = __pyx_pf_4alpm_94pkg_vercmp(__pyx_self, __pyx_v_pa, __pyx_v_pb);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pa, PyObject *__pyx_v_pb) {
+static PyObject *__pyx_pf_4alpm_94pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pa, PyObject *__pyx_v_pb) {
   PyObject *__pyx_v_a = 0;
   PyObject *__pyx_v_b = 0;
   PyObject *__pyx_r = NULL;
@@ -8576,31 +8684,31 @@ static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self,
   const char *__pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_vercmp", 0);
 
-  /* "alpm.pyx":643
+  /* "alpm.pyx":652
  * 
  * def pkg_vercmp(object pa, object pb):
  *     cdef bytes a = to_bytes(pa)             # <<<<<<<<<<<<<<
  *     cdef bytes b = to_bytes(pb)
  * 
  */
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pa, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pa, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 652, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_a = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":644
+  /* "alpm.pyx":653
  * def pkg_vercmp(object pa, object pb):
  *     cdef bytes a = to_bytes(pa)
  *     cdef bytes b = to_bytes(pb)             # <<<<<<<<<<<<<<
  * 
  *     return alpm_pkg_vercmp(a, b)
  */
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pb, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 644, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pb, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 653, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_b = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":646
+  /* "alpm.pyx":655
  *     cdef bytes b = to_bytes(pb)
  * 
  *     return alpm_pkg_vercmp(a, b)             # <<<<<<<<<<<<<<
@@ -8608,15 +8716,15 @@ static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self,
  * def pkg_load(object ppath, int full):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_a); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 646, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_b); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 646, __pyx_L1_error)
-  __pyx_t_1 = __Pyx_PyInt_From_int(alpm_pkg_vercmp(__pyx_t_2, __pyx_t_3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 646, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_a); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 655, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_b); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 655, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(alpm_pkg_vercmp(__pyx_t_2, __pyx_t_3)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 655, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":642
+  /* "alpm.pyx":651
  *         return <int>alpm_pkg_get_validation(pkg)
  * 
  * def pkg_vercmp(object pa, object pb):             # <<<<<<<<<<<<<<
@@ -8637,7 +8745,7 @@ static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self,
   return __pyx_r;
 }
 
-/* "alpm.pyx":648
+/* "alpm.pyx":657
  *     return alpm_pkg_vercmp(a, b)
  * 
  * def pkg_load(object ppath, int full):             # <<<<<<<<<<<<<<
@@ -8646,9 +8754,9 @@ static PyObject *__pyx_pf_4alpm_92pkg_vercmp(CYTHON_UNUSED PyObject *__pyx_self,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_95pkg_load(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_95pkg_load = {"pkg_load", (PyCFunction)__pyx_pw_4alpm_95pkg_load, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_95pkg_load(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_97pkg_load(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_97pkg_load = {"pkg_load", (PyCFunction)__pyx_pw_4alpm_97pkg_load, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_97pkg_load(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_ppath = 0;
   int __pyx_v_full;
   PyObject *__pyx_r = 0;
@@ -8674,11 +8782,11 @@ static PyObject *__pyx_pw_4alpm_95pkg_load(PyObject *__pyx_self, PyObject *__pyx
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_full)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pkg_load", 1, 2, 2, 1); __PYX_ERR(0, 648, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pkg_load", 1, 2, 2, 1); __PYX_ERR(0, 657, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_load") < 0)) __PYX_ERR(0, 648, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_load") < 0)) __PYX_ERR(0, 657, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -8687,24 +8795,24 @@ static PyObject *__pyx_pw_4alpm_95pkg_load(PyObject *__pyx_self, PyObject *__pyx
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_ppath = values[0];
-    __pyx_v_full = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_full == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 648, __pyx_L3_error)
+    __pyx_v_full = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_full == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 657, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pkg_load", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 648, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pkg_load", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 657, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.pkg_load", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_94pkg_load(__pyx_self, __pyx_v_ppath, __pyx_v_full);
+  __pyx_r = __pyx_pf_4alpm_96pkg_load(__pyx_self, __pyx_v_ppath, __pyx_v_full);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppath, int __pyx_v_full) {
+static PyObject *__pyx_pf_4alpm_96pkg_load(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppath, int __pyx_v_full) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_v_path = 0;
   PyObject *__pyx_r = NULL;
@@ -8719,7 +8827,7 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
   const char *__pyx_t_8;
   __Pyx_RefNannySetupContext("pkg_load", 0);
 
-  /* "alpm.pyx":649
+  /* "alpm.pyx":658
  * 
  * def pkg_load(object ppath, int full):
  *     cdef alpm_pkg_t *pkg = NULL             # <<<<<<<<<<<<<<
@@ -8728,7 +8836,7 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
  */
   __pyx_v_pkg = NULL;
 
-  /* "alpm.pyx":652
+  /* "alpm.pyx":661
  *     cdef bytes path
  * 
  *     if handle != NULL and ppath is not None:             # <<<<<<<<<<<<<<
@@ -8747,7 +8855,7 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":653
+    /* "alpm.pyx":662
  * 
  *     if handle != NULL and ppath is not None:
  *         path = to_bytes(ppath, fs_encoding, fs_errors)             # <<<<<<<<<<<<<<
@@ -8761,24 +8869,24 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
     __pyx_t_7.__pyx_n = 2;
     __pyx_t_7.encoding = ((PyObject*)__pyx_t_4);
     __pyx_t_7.errors = ((PyObject*)__pyx_t_5);
-    __pyx_t_6 = __pyx_f_4alpm_to_bytes(__pyx_v_ppath, &__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 653, __pyx_L1_error)
+    __pyx_t_6 = __pyx_f_4alpm_to_bytes(__pyx_v_ppath, &__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 662, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_v_path = ((PyObject*)__pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "alpm.pyx":654
+    /* "alpm.pyx":663
  *     if handle != NULL and ppath is not None:
  *         path = to_bytes(ppath, fs_encoding, fs_errors)
  *         alpm_pkg_load(handle, path, full, ALPM_SIG_USE_DEFAULT, &pkg)             # <<<<<<<<<<<<<<
  *         return to_capsule(pkg)
  * 
  */
-    __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_v_path); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 654, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_v_path); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 663, __pyx_L1_error)
     alpm_pkg_load(__pyx_v_4alpm_handle, __pyx_t_8, __pyx_v_full, ALPM_SIG_USE_DEFAULT, (&__pyx_v_pkg));
 
-    /* "alpm.pyx":655
+    /* "alpm.pyx":664
  *         path = to_bytes(ppath, fs_encoding, fs_errors)
  *         alpm_pkg_load(handle, path, full, ALPM_SIG_USE_DEFAULT, &pkg)
  *         return to_capsule(pkg)             # <<<<<<<<<<<<<<
@@ -8786,13 +8894,13 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
  * def pkg_get_repository(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_6 = __pyx_f_4alpm_to_capsule(__pyx_v_pkg); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 655, __pyx_L1_error)
+    __pyx_t_6 = __pyx_f_4alpm_to_capsule(__pyx_v_pkg); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 664, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_r = __pyx_t_6;
     __pyx_t_6 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":652
+    /* "alpm.pyx":661
  *     cdef bytes path
  * 
  *     if handle != NULL and ppath is not None:             # <<<<<<<<<<<<<<
@@ -8801,7 +8909,7 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
  */
   }
 
-  /* "alpm.pyx":648
+  /* "alpm.pyx":657
  *     return alpm_pkg_vercmp(a, b)
  * 
  * def pkg_load(object ppath, int full):             # <<<<<<<<<<<<<<
@@ -8825,7 +8933,7 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
   return __pyx_r;
 }
 
-/* "alpm.pyx":657
+/* "alpm.pyx":666
  *         return to_capsule(pkg)
  * 
  * def pkg_get_repository(object ppkg):             # <<<<<<<<<<<<<<
@@ -8834,20 +8942,20 @@ static PyObject *__pyx_pf_4alpm_94pkg_load(CYTHON_UNUSED PyObject *__pyx_self, P
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_97pkg_get_repository(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_97pkg_get_repository = {"pkg_get_repository", (PyCFunction)__pyx_pw_4alpm_97pkg_get_repository, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_97pkg_get_repository(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_99pkg_get_repository(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_99pkg_get_repository = {"pkg_get_repository", (PyCFunction)__pyx_pw_4alpm_99pkg_get_repository, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_99pkg_get_repository(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_repository (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_96pkg_get_repository(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_98pkg_get_repository(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_98pkg_get_repository(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -8855,7 +8963,7 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_repository", 0);
 
-  /* "alpm.pyx":660
+  /* "alpm.pyx":669
  *     cdef alpm_pkg_t *pkg
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8864,7 +8972,7 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":661
+  /* "alpm.pyx":670
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8874,7 +8982,7 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":662
+    /* "alpm.pyx":671
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         return to_unicode(<char *>find_pkg_repository(pkg))             # <<<<<<<<<<<<<<
@@ -8882,13 +8990,13 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
  * def pkg_get_fullname(object ppkg):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_f_4alpm_find_pkg_repository(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 662, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_f_4alpm_find_pkg_repository(__pyx_v_pkg)), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 671, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":661
+    /* "alpm.pyx":670
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8897,7 +9005,7 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":657
+  /* "alpm.pyx":666
  *         return to_capsule(pkg)
  * 
  * def pkg_get_repository(object ppkg):             # <<<<<<<<<<<<<<
@@ -8918,7 +9026,7 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":664
+/* "alpm.pyx":673
  *         return to_unicode(<char *>find_pkg_repository(pkg))
  * 
  * def pkg_get_fullname(object ppkg):             # <<<<<<<<<<<<<<
@@ -8927,20 +9035,20 @@ static PyObject *__pyx_pf_4alpm_96pkg_get_repository(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_99pkg_get_fullname(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_99pkg_get_fullname = {"pkg_get_fullname", (PyCFunction)__pyx_pw_4alpm_99pkg_get_fullname, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_99pkg_get_fullname(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_101pkg_get_fullname(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_101pkg_get_fullname = {"pkg_get_fullname", (PyCFunction)__pyx_pw_4alpm_101pkg_get_fullname, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_101pkg_get_fullname(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_fullname (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_98pkg_get_fullname(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_100pkg_get_fullname(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_100pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   char *__pyx_v_fullname;
   PyObject *__pyx_r = NULL;
@@ -8950,7 +9058,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_get_fullname", 0);
 
-  /* "alpm.pyx":668
+  /* "alpm.pyx":677
  *     cdef char *fullname
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -8959,7 +9067,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":669
+  /* "alpm.pyx":678
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -8969,7 +9077,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":670
+    /* "alpm.pyx":679
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         fullname = <char *>malloc(sizeof(char) * PATH_MAX)             # <<<<<<<<<<<<<<
@@ -8978,7 +9086,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
     __pyx_v_fullname = ((char *)malloc(((sizeof(char)) * PATH_MAX)));
 
-    /* "alpm.pyx":671
+    /* "alpm.pyx":680
  *     if pkg is not NULL:
  *         fullname = <char *>malloc(sizeof(char) * PATH_MAX)
  *         if fullname is not NULL:             # <<<<<<<<<<<<<<
@@ -8988,7 +9096,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
     __pyx_t_1 = ((__pyx_v_fullname != NULL) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":672
+      /* "alpm.pyx":681
  *         fullname = <char *>malloc(sizeof(char) * PATH_MAX)
  *         if fullname is not NULL:
  *             sprintf(fullname, '%s-%s', alpm_pkg_get_name(pkg), alpm_pkg_get_version(pkg))             # <<<<<<<<<<<<<<
@@ -8997,7 +9105,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
       sprintf(__pyx_v_fullname, ((char const *)"%s-%s"), alpm_pkg_get_name(__pyx_v_pkg), alpm_pkg_get_version(__pyx_v_pkg));
 
-      /* "alpm.pyx":673
+      /* "alpm.pyx":682
  *         if fullname is not NULL:
  *             sprintf(fullname, '%s-%s', alpm_pkg_get_name(pkg), alpm_pkg_get_version(pkg))
  *             return to_unicode(fullname, True)             # <<<<<<<<<<<<<<
@@ -9007,13 +9115,13 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
       __Pyx_XDECREF(__pyx_r);
       __pyx_t_3.__pyx_n = 1;
       __pyx_t_3.release = 1;
-      __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_fullname, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 673, __pyx_L1_error)
+      __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_fullname, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 682, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_r = __pyx_t_2;
       __pyx_t_2 = 0;
       goto __pyx_L0;
 
-      /* "alpm.pyx":671
+      /* "alpm.pyx":680
  *     if pkg is not NULL:
  *         fullname = <char *>malloc(sizeof(char) * PATH_MAX)
  *         if fullname is not NULL:             # <<<<<<<<<<<<<<
@@ -9022,7 +9130,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
     }
 
-    /* "alpm.pyx":669
+    /* "alpm.pyx":678
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -9031,7 +9139,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
   }
 
-  /* "alpm.pyx":664
+  /* "alpm.pyx":673
  *         return to_unicode(<char *>find_pkg_repository(pkg))
  * 
  * def pkg_get_fullname(object ppkg):             # <<<<<<<<<<<<<<
@@ -9052,7 +9160,7 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "alpm.pyx":675
+/* "alpm.pyx":684
  *             return to_unicode(fullname, True)
  * 
  * def pkg_get_packager(object ppkg):             # <<<<<<<<<<<<<<
@@ -9061,20 +9169,20 @@ static PyObject *__pyx_pf_4alpm_98pkg_get_fullname(CYTHON_UNUSED PyObject *__pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_101pkg_get_packager(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_101pkg_get_packager = {"pkg_get_packager", (PyCFunction)__pyx_pw_4alpm_101pkg_get_packager, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_101pkg_get_packager(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_103pkg_get_packager(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_103pkg_get_packager = {"pkg_get_packager", (PyCFunction)__pyx_pw_4alpm_103pkg_get_packager, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_103pkg_get_packager(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_packager (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_100pkg_get_packager(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_102pkg_get_packager(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_102pkg_get_packager(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   const char *__pyx_v_packager;
   PyObject *__pyx_r = NULL;
@@ -9083,7 +9191,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_packager", 0);
 
-  /* "alpm.pyx":679
+  /* "alpm.pyx":688
  *     cdef const_char *packager
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -9092,7 +9200,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":680
+  /* "alpm.pyx":689
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -9102,7 +9210,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":681
+    /* "alpm.pyx":690
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         packager = alpm_pkg_get_packager(pkg)             # <<<<<<<<<<<<<<
@@ -9111,7 +9219,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
     __pyx_v_packager = alpm_pkg_get_packager(__pyx_v_pkg);
 
-    /* "alpm.pyx":682
+    /* "alpm.pyx":691
  *     if pkg is not NULL:
  *         packager = alpm_pkg_get_packager(pkg)
  *         if packager is not NULL:             # <<<<<<<<<<<<<<
@@ -9121,7 +9229,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
     __pyx_t_1 = ((__pyx_v_packager != NULL) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":683
+      /* "alpm.pyx":692
  *         packager = alpm_pkg_get_packager(pkg)
  *         if packager is not NULL:
  *             if strcasecmp(packager, 'unknown packager') != 0:             # <<<<<<<<<<<<<<
@@ -9131,7 +9239,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
       __pyx_t_1 = ((strcasecmp(__pyx_v_packager, ((char const *)"unknown packager")) != 0) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":684
+        /* "alpm.pyx":693
  *         if packager is not NULL:
  *             if strcasecmp(packager, 'unknown packager') != 0:
  *                 return to_unicode(<char *>packager)             # <<<<<<<<<<<<<<
@@ -9139,13 +9247,13 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  * PKG_STATUS_NULL = STATUS_NULL
  */
         __Pyx_XDECREF(__pyx_r);
-        __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_packager), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 684, __pyx_L1_error)
+        __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_packager), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 693, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __pyx_r = __pyx_t_2;
         __pyx_t_2 = 0;
         goto __pyx_L0;
 
-        /* "alpm.pyx":683
+        /* "alpm.pyx":692
  *         packager = alpm_pkg_get_packager(pkg)
  *         if packager is not NULL:
  *             if strcasecmp(packager, 'unknown packager') != 0:             # <<<<<<<<<<<<<<
@@ -9154,7 +9262,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
       }
 
-      /* "alpm.pyx":682
+      /* "alpm.pyx":691
  *     if pkg is not NULL:
  *         packager = alpm_pkg_get_packager(pkg)
  *         if packager is not NULL:             # <<<<<<<<<<<<<<
@@ -9163,7 +9271,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
     }
 
-    /* "alpm.pyx":680
+    /* "alpm.pyx":689
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -9172,7 +9280,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":675
+  /* "alpm.pyx":684
  *             return to_unicode(fullname, True)
  * 
  * def pkg_get_packager(object ppkg):             # <<<<<<<<<<<<<<
@@ -9193,7 +9301,7 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":698
+/* "alpm.pyx":707
  * PKG_STATUS_MAX = STATUS_MAX
  * 
  * def pkg_get_status(object ppkg):             # <<<<<<<<<<<<<<
@@ -9202,20 +9310,20 @@ static PyObject *__pyx_pf_4alpm_100pkg_get_packager(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_103pkg_get_status(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_103pkg_get_status = {"pkg_get_status", (PyCFunction)__pyx_pw_4alpm_103pkg_get_status, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_103pkg_get_status(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_105pkg_get_status(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_105pkg_get_status = {"pkg_get_status", (PyCFunction)__pyx_pw_4alpm_105pkg_get_status, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_105pkg_get_status(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_get_status (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_102pkg_get_status(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_104pkg_get_status(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_104pkg_get_status(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   int __pyx_v_status;
   alpm_pkgreason_t __pyx_v_reason;
   alpm_db_t *__pyx_v_db;
@@ -9229,7 +9337,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("pkg_get_status", 0);
 
-  /* "alpm.pyx":699
+  /* "alpm.pyx":708
  * 
  * def pkg_get_status(object ppkg):
  *     cdef int status = STATUS_NULL             # <<<<<<<<<<<<<<
@@ -9238,7 +9346,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_status = __pyx_e_4alpm_STATUS_NULL;
 
-  /* "alpm.pyx":706
+  /* "alpm.pyx":715
  *     cdef const_char *name
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -9247,7 +9355,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":707
+  /* "alpm.pyx":716
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if handle is not NULL and pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -9265,7 +9373,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":708
+    /* "alpm.pyx":717
  *     pkg = to_alpm_pkg(ppkg)
  *     if handle is not NULL and pkg is not NULL:
  *         db = alpm_get_localdb(handle)             # <<<<<<<<<<<<<<
@@ -9274,7 +9382,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
     __pyx_v_db = alpm_get_localdb(__pyx_v_4alpm_handle);
 
-    /* "alpm.pyx":709
+    /* "alpm.pyx":718
  *     if handle is not NULL and pkg is not NULL:
  *         db = alpm_get_localdb(handle)
  *         if db is not NULL:             # <<<<<<<<<<<<<<
@@ -9284,7 +9392,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
     __pyx_t_1 = ((__pyx_v_db != NULL) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":710
+      /* "alpm.pyx":719
  *         db = alpm_get_localdb(handle)
  *         if db is not NULL:
  *             name = alpm_pkg_get_name(pkg)             # <<<<<<<<<<<<<<
@@ -9293,7 +9401,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
       __pyx_v_name = alpm_pkg_get_name(__pyx_v_pkg);
 
-      /* "alpm.pyx":711
+      /* "alpm.pyx":720
  *         if db is not NULL:
  *             name = alpm_pkg_get_name(pkg)
  *             local = alpm_db_get_pkg(db, name)             # <<<<<<<<<<<<<<
@@ -9302,7 +9410,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
       __pyx_v_local = alpm_db_get_pkg(__pyx_v_db, __pyx_v_name);
 
-      /* "alpm.pyx":712
+      /* "alpm.pyx":721
  *             name = alpm_pkg_get_name(pkg)
  *             local = alpm_db_get_pkg(db, name)
  *             if local is not NULL:             # <<<<<<<<<<<<<<
@@ -9312,7 +9420,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
       __pyx_t_1 = ((__pyx_v_local != NULL) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":713
+        /* "alpm.pyx":722
  *             local = alpm_db_get_pkg(db, name)
  *             if local is not NULL:
  *                 status = STATUS_INSTALLED             # <<<<<<<<<<<<<<
@@ -9321,7 +9429,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
         __pyx_v_status = __pyx_e_4alpm_STATUS_INSTALLED;
 
-        /* "alpm.pyx":714
+        /* "alpm.pyx":723
  *             if local is not NULL:
  *                 status = STATUS_INSTALLED
  *                 if strcmp(find_pkg_repository(pkg), alpm_db_get_name(db)) == 0:             # <<<<<<<<<<<<<<
@@ -9331,7 +9439,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
         __pyx_t_1 = ((strcmp(__pyx_f_4alpm_find_pkg_repository(__pyx_v_pkg), alpm_db_get_name(__pyx_v_db)) == 0) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":715
+          /* "alpm.pyx":724
  *                 status = STATUS_INSTALLED
  *                 if strcmp(find_pkg_repository(pkg), alpm_db_get_name(db)) == 0:
  *                     status = status | STATUS_FOREIGN             # <<<<<<<<<<<<<<
@@ -9340,7 +9448,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
           __pyx_v_status = (__pyx_v_status | __pyx_e_4alpm_STATUS_FOREIGN);
 
-          /* "alpm.pyx":714
+          /* "alpm.pyx":723
  *             if local is not NULL:
  *                 status = STATUS_INSTALLED
  *                 if strcmp(find_pkg_repository(pkg), alpm_db_get_name(db)) == 0:             # <<<<<<<<<<<<<<
@@ -9349,7 +9457,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
         }
 
-        /* "alpm.pyx":716
+        /* "alpm.pyx":725
  *                 if strcmp(find_pkg_repository(pkg), alpm_db_get_name(db)) == 0:
  *                     status = status | STATUS_FOREIGN
  *                 reason = alpm_pkg_get_reason(local)             # <<<<<<<<<<<<<<
@@ -9358,7 +9466,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
         __pyx_v_reason = alpm_pkg_get_reason(__pyx_v_local);
 
-        /* "alpm.pyx":717
+        /* "alpm.pyx":726
  *                     status = status | STATUS_FOREIGN
  *                 reason = alpm_pkg_get_reason(local)
  *                 if reason == ALPM_PKG_REASON_EXPLICIT:             # <<<<<<<<<<<<<<
@@ -9368,7 +9476,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
         switch (__pyx_v_reason) {
           case ALPM_PKG_REASON_EXPLICIT:
 
-          /* "alpm.pyx":718
+          /* "alpm.pyx":727
  *                 reason = alpm_pkg_get_reason(local)
  *                 if reason == ALPM_PKG_REASON_EXPLICIT:
  *                     status = status | STATUS_EXPLICIT             # <<<<<<<<<<<<<<
@@ -9377,7 +9485,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
           __pyx_v_status = (__pyx_v_status | __pyx_e_4alpm_STATUS_EXPLICIT);
 
-          /* "alpm.pyx":717
+          /* "alpm.pyx":726
  *                     status = status | STATUS_FOREIGN
  *                 reason = alpm_pkg_get_reason(local)
  *                 if reason == ALPM_PKG_REASON_EXPLICIT:             # <<<<<<<<<<<<<<
@@ -9386,7 +9494,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
           break;
 
-          /* "alpm.pyx":719
+          /* "alpm.pyx":728
  *                 if reason == ALPM_PKG_REASON_EXPLICIT:
  *                     status = status | STATUS_EXPLICIT
  *                 elif reason == ALPM_PKG_REASON_DEPEND:             # <<<<<<<<<<<<<<
@@ -9395,7 +9503,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
           case ALPM_PKG_REASON_DEPEND:
 
-          /* "alpm.pyx":720
+          /* "alpm.pyx":729
  *                     status = status | STATUS_EXPLICIT
  *                 elif reason == ALPM_PKG_REASON_DEPEND:
  *                     if alpm_pkg_compute_requiredby(local) is not NULL:             # <<<<<<<<<<<<<<
@@ -9405,7 +9513,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
           __pyx_t_1 = ((alpm_pkg_compute_requiredby(__pyx_v_local) != NULL) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":721
+            /* "alpm.pyx":730
  *                 elif reason == ALPM_PKG_REASON_DEPEND:
  *                     if alpm_pkg_compute_requiredby(local) is not NULL:
  *                         status |= STATUS_DEPENDENCY             # <<<<<<<<<<<<<<
@@ -9414,7 +9522,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
             __pyx_v_status = (__pyx_v_status | __pyx_e_4alpm_STATUS_DEPENDENCY);
 
-            /* "alpm.pyx":720
+            /* "alpm.pyx":729
  *                     status = status | STATUS_EXPLICIT
  *                 elif reason == ALPM_PKG_REASON_DEPEND:
  *                     if alpm_pkg_compute_requiredby(local) is not NULL:             # <<<<<<<<<<<<<<
@@ -9424,7 +9532,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
             goto __pyx_L9;
           }
 
-          /* "alpm.pyx":722
+          /* "alpm.pyx":731
  *                     if alpm_pkg_compute_requiredby(local) is not NULL:
  *                         status |= STATUS_DEPENDENCY
  *                     elif alpm_pkg_compute_optionalfor(local) is not NULL:             # <<<<<<<<<<<<<<
@@ -9434,7 +9542,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
           __pyx_t_1 = ((alpm_pkg_compute_optionalfor(__pyx_v_local) != NULL) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":723
+            /* "alpm.pyx":732
  *                         status |= STATUS_DEPENDENCY
  *                     elif alpm_pkg_compute_optionalfor(local) is not NULL:
  *                         status |= STATUS_OPTIONAL             # <<<<<<<<<<<<<<
@@ -9443,7 +9551,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
             __pyx_v_status = (__pyx_v_status | __pyx_e_4alpm_STATUS_OPTIONAL);
 
-            /* "alpm.pyx":722
+            /* "alpm.pyx":731
  *                     if alpm_pkg_compute_requiredby(local) is not NULL:
  *                         status |= STATUS_DEPENDENCY
  *                     elif alpm_pkg_compute_optionalfor(local) is not NULL:             # <<<<<<<<<<<<<<
@@ -9453,7 +9561,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
             goto __pyx_L9;
           }
 
-          /* "alpm.pyx":725
+          /* "alpm.pyx":734
  *                         status |= STATUS_OPTIONAL
  *                     else:
  *                         status = status | STATUS_ORPHAN             # <<<<<<<<<<<<<<
@@ -9465,7 +9573,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
           }
           __pyx_L9:;
 
-          /* "alpm.pyx":719
+          /* "alpm.pyx":728
  *                 if reason == ALPM_PKG_REASON_EXPLICIT:
  *                     status = status | STATUS_EXPLICIT
  *                 elif reason == ALPM_PKG_REASON_DEPEND:             # <<<<<<<<<<<<<<
@@ -9476,7 +9584,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
           default: break;
         }
 
-        /* "alpm.pyx":712
+        /* "alpm.pyx":721
  *             name = alpm_pkg_get_name(pkg)
  *             local = alpm_db_get_pkg(db, name)
  *             if local is not NULL:             # <<<<<<<<<<<<<<
@@ -9486,7 +9594,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
         goto __pyx_L7;
       }
 
-      /* "alpm.pyx":727
+      /* "alpm.pyx":736
  *                         status = status | STATUS_ORPHAN
  *             else:
  *                 status = STATUS_NONINSTALLED             # <<<<<<<<<<<<<<
@@ -9498,7 +9606,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
       }
       __pyx_L7:;
 
-      /* "alpm.pyx":709
+      /* "alpm.pyx":718
  *     if handle is not NULL and pkg is not NULL:
  *         db = alpm_get_localdb(handle)
  *         if db is not NULL:             # <<<<<<<<<<<<<<
@@ -9507,7 +9615,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
     }
 
-    /* "alpm.pyx":707
+    /* "alpm.pyx":716
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if handle is not NULL and pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -9516,7 +9624,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":728
+  /* "alpm.pyx":737
  *             else:
  *                 status = STATUS_NONINSTALLED
  *     return status             # <<<<<<<<<<<<<<
@@ -9524,13 +9632,13 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  * def pkg_check_update(object pname, object pversion):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 728, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 737, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":698
+  /* "alpm.pyx":707
  * PKG_STATUS_MAX = STATUS_MAX
  * 
  * def pkg_get_status(object ppkg):             # <<<<<<<<<<<<<<
@@ -9549,7 +9657,7 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":730
+/* "alpm.pyx":739
  *     return status
  * 
  * def pkg_check_update(object pname, object pversion):             # <<<<<<<<<<<<<<
@@ -9558,9 +9666,9 @@ static PyObject *__pyx_pf_4alpm_102pkg_get_status(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_105pkg_check_update(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_105pkg_check_update = {"pkg_check_update", (PyCFunction)__pyx_pw_4alpm_105pkg_check_update, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_105pkg_check_update(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_107pkg_check_update(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_107pkg_check_update = {"pkg_check_update", (PyCFunction)__pyx_pw_4alpm_107pkg_check_update, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_107pkg_check_update(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_pname = 0;
   PyObject *__pyx_v_pversion = 0;
   PyObject *__pyx_r = 0;
@@ -9586,11 +9694,11 @@ static PyObject *__pyx_pw_4alpm_105pkg_check_update(PyObject *__pyx_self, PyObje
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pversion)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pkg_check_update", 1, 2, 2, 1); __PYX_ERR(0, 730, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pkg_check_update", 1, 2, 2, 1); __PYX_ERR(0, 739, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_check_update") < 0)) __PYX_ERR(0, 730, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pkg_check_update") < 0)) __PYX_ERR(0, 739, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -9603,20 +9711,20 @@ static PyObject *__pyx_pw_4alpm_105pkg_check_update(PyObject *__pyx_self, PyObje
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pkg_check_update", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 730, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pkg_check_update", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 739, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.pkg_check_update", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_104pkg_check_update(__pyx_self, __pyx_v_pname, __pyx_v_pversion);
+  __pyx_r = __pyx_pf_4alpm_106pkg_check_update(__pyx_self, __pyx_v_pname, __pyx_v_pversion);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, PyObject *__pyx_v_pversion) {
+static PyObject *__pyx_pf_4alpm_106pkg_check_update(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname, PyObject *__pyx_v_pversion) {
   int __pyx_v_status;
   alpm_db_t *__pyx_v_db;
   alpm_pkg_t *__pyx_v_local;
@@ -9633,7 +9741,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
   char const *__pyx_t_6;
   __Pyx_RefNannySetupContext("pkg_check_update", 0);
 
-  /* "alpm.pyx":731
+  /* "alpm.pyx":740
  * 
  * def pkg_check_update(object pname, object pversion):
  *     cdef int status = STATUS_NULL             # <<<<<<<<<<<<<<
@@ -9642,7 +9750,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_status = __pyx_e_4alpm_STATUS_NULL;
 
-  /* "alpm.pyx":737
+  /* "alpm.pyx":746
  *     cdef bytes name, version
  * 
  *     if handle is not NULL and pname is not None and pversion is not None:             # <<<<<<<<<<<<<<
@@ -9668,7 +9776,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":738
+    /* "alpm.pyx":747
  * 
  *     if handle is not NULL and pname is not None and pversion is not None:
  *         db = alpm_get_localdb(handle)             # <<<<<<<<<<<<<<
@@ -9677,29 +9785,29 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
     __pyx_v_db = alpm_get_localdb(__pyx_v_4alpm_handle);
 
-    /* "alpm.pyx":739
+    /* "alpm.pyx":748
  *     if handle is not NULL and pname is not None and pversion is not None:
  *         db = alpm_get_localdb(handle)
  *         name = to_bytes(pname)             # <<<<<<<<<<<<<<
  *         local = alpm_db_get_pkg(db, name)
  *         if db is not NULL and local is not NULL:
  */
-    __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 739, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 748, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_v_name = ((PyObject*)__pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "alpm.pyx":740
+    /* "alpm.pyx":749
  *         db = alpm_get_localdb(handle)
  *         name = to_bytes(pname)
  *         local = alpm_db_get_pkg(db, name)             # <<<<<<<<<<<<<<
  *         if db is not NULL and local is not NULL:
  *             current = alpm_pkg_get_version(local)
  */
-    __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 740, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 749, __pyx_L1_error)
     __pyx_v_local = alpm_db_get_pkg(__pyx_v_db, __pyx_t_5);
 
-    /* "alpm.pyx":741
+    /* "alpm.pyx":750
  *         name = to_bytes(pname)
  *         local = alpm_db_get_pkg(db, name)
  *         if db is not NULL and local is not NULL:             # <<<<<<<<<<<<<<
@@ -9717,7 +9825,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
     __pyx_L8_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":742
+      /* "alpm.pyx":751
  *         local = alpm_db_get_pkg(db, name)
  *         if db is not NULL and local is not NULL:
  *             current = alpm_pkg_get_version(local)             # <<<<<<<<<<<<<<
@@ -9726,19 +9834,19 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
       __pyx_v_current = alpm_pkg_get_version(__pyx_v_local);
 
-      /* "alpm.pyx":743
+      /* "alpm.pyx":752
  *         if db is not NULL and local is not NULL:
  *             current = alpm_pkg_get_version(local)
  *             version = to_bytes(pversion)             # <<<<<<<<<<<<<<
  *             if current is not NULL and strcmp(current, version) != 0:
  *                 if alpm_pkg_vercmp(current, version) < 0:
  */
-      __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_pversion, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 743, __pyx_L1_error)
+      __pyx_t_4 = __pyx_f_4alpm_to_bytes(__pyx_v_pversion, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 752, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_v_version = ((PyObject*)__pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "alpm.pyx":744
+      /* "alpm.pyx":753
  *             current = alpm_pkg_get_version(local)
  *             version = to_bytes(pversion)
  *             if current is not NULL and strcmp(current, version) != 0:             # <<<<<<<<<<<<<<
@@ -9751,24 +9859,24 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
         __pyx_t_1 = __pyx_t_2;
         goto __pyx_L11_bool_binop_done;
       }
-      __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_version); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 744, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_v_version); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 753, __pyx_L1_error)
       __pyx_t_2 = ((strcmp(__pyx_v_current, __pyx_t_6) != 0) != 0);
       __pyx_t_1 = __pyx_t_2;
       __pyx_L11_bool_binop_done:;
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":745
+        /* "alpm.pyx":754
  *             version = to_bytes(pversion)
  *             if current is not NULL and strcmp(current, version) != 0:
  *                 if alpm_pkg_vercmp(current, version) < 0:             # <<<<<<<<<<<<<<
  *                     status = STATUS_UPGRADE | STATUS_NONINSTALLED
  *                 elif check_vcs(name) == VCS_NULL:
  */
-        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_version); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 745, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_version); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 754, __pyx_L1_error)
         __pyx_t_1 = ((alpm_pkg_vercmp(__pyx_v_current, __pyx_t_5) < 0) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":746
+          /* "alpm.pyx":755
  *             if current is not NULL and strcmp(current, version) != 0:
  *                 if alpm_pkg_vercmp(current, version) < 0:
  *                     status = STATUS_UPGRADE | STATUS_NONINSTALLED             # <<<<<<<<<<<<<<
@@ -9777,7 +9885,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
           __pyx_v_status = (__pyx_e_4alpm_STATUS_UPGRADE | __pyx_e_4alpm_STATUS_NONINSTALLED);
 
-          /* "alpm.pyx":745
+          /* "alpm.pyx":754
  *             version = to_bytes(pversion)
  *             if current is not NULL and strcmp(current, version) != 0:
  *                 if alpm_pkg_vercmp(current, version) < 0:             # <<<<<<<<<<<<<<
@@ -9787,18 +9895,18 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
           goto __pyx_L13;
         }
 
-        /* "alpm.pyx":747
+        /* "alpm.pyx":756
  *                 if alpm_pkg_vercmp(current, version) < 0:
  *                     status = STATUS_UPGRADE | STATUS_NONINSTALLED
  *                 elif check_vcs(name) == VCS_NULL:             # <<<<<<<<<<<<<<
  *                     status = STATUS_DOWNGRADE | STATUS_NONINSTALLED
  *     return status
  */
-        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 747, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 756, __pyx_L1_error)
         __pyx_t_1 = ((__pyx_f_4alpm_check_vcs(__pyx_t_5) == __pyx_e_4alpm_VCS_NULL) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":748
+          /* "alpm.pyx":757
  *                     status = STATUS_UPGRADE | STATUS_NONINSTALLED
  *                 elif check_vcs(name) == VCS_NULL:
  *                     status = STATUS_DOWNGRADE | STATUS_NONINSTALLED             # <<<<<<<<<<<<<<
@@ -9807,7 +9915,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
           __pyx_v_status = (__pyx_e_4alpm_STATUS_DOWNGRADE | __pyx_e_4alpm_STATUS_NONINSTALLED);
 
-          /* "alpm.pyx":747
+          /* "alpm.pyx":756
  *                 if alpm_pkg_vercmp(current, version) < 0:
  *                     status = STATUS_UPGRADE | STATUS_NONINSTALLED
  *                 elif check_vcs(name) == VCS_NULL:             # <<<<<<<<<<<<<<
@@ -9817,7 +9925,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
         }
         __pyx_L13:;
 
-        /* "alpm.pyx":744
+        /* "alpm.pyx":753
  *             current = alpm_pkg_get_version(local)
  *             version = to_bytes(pversion)
  *             if current is not NULL and strcmp(current, version) != 0:             # <<<<<<<<<<<<<<
@@ -9826,7 +9934,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
       }
 
-      /* "alpm.pyx":741
+      /* "alpm.pyx":750
  *         name = to_bytes(pname)
  *         local = alpm_db_get_pkg(db, name)
  *         if db is not NULL and local is not NULL:             # <<<<<<<<<<<<<<
@@ -9835,7 +9943,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
     }
 
-    /* "alpm.pyx":737
+    /* "alpm.pyx":746
  *     cdef bytes name, version
  * 
  *     if handle is not NULL and pname is not None and pversion is not None:             # <<<<<<<<<<<<<<
@@ -9844,7 +9952,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":749
+  /* "alpm.pyx":758
  *                 elif check_vcs(name) == VCS_NULL:
  *                     status = STATUS_DOWNGRADE | STATUS_NONINSTALLED
  *     return status             # <<<<<<<<<<<<<<
@@ -9852,13 +9960,13 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  * PKG_VCS_NULL = VCS_NULL
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 749, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 758, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":730
+  /* "alpm.pyx":739
  *     return status
  * 
  * def pkg_check_update(object pname, object pversion):             # <<<<<<<<<<<<<<
@@ -9879,7 +9987,7 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":759
+/* "alpm.pyx":768
  * PKG_VCS_DARCS = VCS_DARCS
  * 
  * def pkg_check_vcs(object pname):             # <<<<<<<<<<<<<<
@@ -9888,20 +9996,20 @@ static PyObject *__pyx_pf_4alpm_104pkg_check_update(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_107pkg_check_vcs(PyObject *__pyx_self, PyObject *__pyx_v_pname); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_107pkg_check_vcs = {"pkg_check_vcs", (PyCFunction)__pyx_pw_4alpm_107pkg_check_vcs, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_107pkg_check_vcs(PyObject *__pyx_self, PyObject *__pyx_v_pname) {
+static PyObject *__pyx_pw_4alpm_109pkg_check_vcs(PyObject *__pyx_self, PyObject *__pyx_v_pname); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_109pkg_check_vcs = {"pkg_check_vcs", (PyCFunction)__pyx_pw_4alpm_109pkg_check_vcs, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_109pkg_check_vcs(PyObject *__pyx_self, PyObject *__pyx_v_pname) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_check_vcs (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_106pkg_check_vcs(__pyx_self, ((PyObject *)__pyx_v_pname));
+  __pyx_r = __pyx_pf_4alpm_108pkg_check_vcs(__pyx_self, ((PyObject *)__pyx_v_pname));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname) {
+static PyObject *__pyx_pf_4alpm_108pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pname) {
   PyObject *__pyx_v_name = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -9909,19 +10017,19 @@ static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_s
   const char *__pyx_t_2;
   __Pyx_RefNannySetupContext("pkg_check_vcs", 0);
 
-  /* "alpm.pyx":760
+  /* "alpm.pyx":769
  * 
  * def pkg_check_vcs(object pname):
  *     cdef bytes name = to_bytes(pname)             # <<<<<<<<<<<<<<
  * 
  *     return check_vcs(name)
  */
-  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 760, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4alpm_to_bytes(__pyx_v_pname, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 769, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_name = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "alpm.pyx":762
+  /* "alpm.pyx":771
  *     cdef bytes name = to_bytes(pname)
  * 
  *     return check_vcs(name)             # <<<<<<<<<<<<<<
@@ -9929,14 +10037,14 @@ static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_s
  * def pkg_join_files(object ppkg):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 762, __pyx_L1_error)
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_f_4alpm_check_vcs(__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 762, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_name); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 771, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_f_4alpm_check_vcs(__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 771, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "alpm.pyx":759
+  /* "alpm.pyx":768
  * PKG_VCS_DARCS = VCS_DARCS
  * 
  * def pkg_check_vcs(object pname):             # <<<<<<<<<<<<<<
@@ -9956,7 +10064,7 @@ static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":764
+/* "alpm.pyx":773
  *     return check_vcs(name)
  * 
  * def pkg_join_files(object ppkg):             # <<<<<<<<<<<<<<
@@ -9965,20 +10073,20 @@ static PyObject *__pyx_pf_4alpm_106pkg_check_vcs(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_109pkg_join_files(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_109pkg_join_files = {"pkg_join_files", (PyCFunction)__pyx_pw_4alpm_109pkg_join_files, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_109pkg_join_files(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_111pkg_join_files(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_111pkg_join_files = {"pkg_join_files", (PyCFunction)__pyx_pw_4alpm_111pkg_join_files, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_111pkg_join_files(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_join_files (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_108pkg_join_files(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_110pkg_join_files(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_110pkg_join_files(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   alpm_filelist_t *__pyx_v_files;
   const char *__pyx_v_name;
@@ -9996,7 +10104,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_6;
   __Pyx_RefNannySetupContext("pkg_join_files", 0);
 
-  /* "alpm.pyx":769
+  /* "alpm.pyx":778
  *     cdef const_char *name
  *     cdef char *cstr
  *     cdef size_t i, pos = 0, length = 0             # <<<<<<<<<<<<<<
@@ -10006,7 +10114,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
   __pyx_v_pos = 0;
   __pyx_v_length = 0;
 
-  /* "alpm.pyx":771
+  /* "alpm.pyx":780
  *     cdef size_t i, pos = 0, length = 0
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -10015,7 +10123,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":772
+  /* "alpm.pyx":781
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10025,7 +10133,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":773
+    /* "alpm.pyx":782
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         files = alpm_pkg_get_files(pkg)             # <<<<<<<<<<<<<<
@@ -10034,7 +10142,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
     __pyx_v_files = alpm_pkg_get_files(__pyx_v_pkg);
 
-    /* "alpm.pyx":774
+    /* "alpm.pyx":783
  *     if pkg is not NULL:
  *         files = alpm_pkg_get_files(pkg)
  *         if files is not NULL:             # <<<<<<<<<<<<<<
@@ -10044,7 +10152,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
     __pyx_t_1 = ((__pyx_v_files != NULL) != 0);
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":775
+      /* "alpm.pyx":784
  *         files = alpm_pkg_get_files(pkg)
  *         if files is not NULL:
  *             for i in range(files.count):             # <<<<<<<<<<<<<<
@@ -10055,7 +10163,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
       for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
         __pyx_v_i = __pyx_t_3;
 
-        /* "alpm.pyx":776
+        /* "alpm.pyx":785
  *         if files is not NULL:
  *             for i in range(files.count):
  *                 length += strlen(files.files[i].name) + 2             # <<<<<<<<<<<<<<
@@ -10065,7 +10173,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
         __pyx_v_length = (__pyx_v_length + (strlen((__pyx_v_files->files[__pyx_v_i]).name) + 2));
       }
 
-      /* "alpm.pyx":777
+      /* "alpm.pyx":786
  *             for i in range(files.count):
  *                 length += strlen(files.files[i].name) + 2
  *             if length:             # <<<<<<<<<<<<<<
@@ -10075,7 +10183,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
       __pyx_t_1 = (__pyx_v_length != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":778
+        /* "alpm.pyx":787
  *                 length += strlen(files.files[i].name) + 2
  *             if length:
  *                 cstr = <char *>malloc(sizeof(char) * (length + 2))             # <<<<<<<<<<<<<<
@@ -10084,7 +10192,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
         __pyx_v_cstr = ((char *)malloc(((sizeof(char)) * (__pyx_v_length + 2))));
 
-        /* "alpm.pyx":779
+        /* "alpm.pyx":788
  *             if length:
  *                 cstr = <char *>malloc(sizeof(char) * (length + 2))
  *                 if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -10094,7 +10202,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
         __pyx_t_1 = ((__pyx_v_cstr != NULL) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":780
+          /* "alpm.pyx":789
  *                 cstr = <char *>malloc(sizeof(char) * (length + 2))
  *                 if cstr is not NULL:
  *                     cstr[0] = '\0'             # <<<<<<<<<<<<<<
@@ -10103,7 +10211,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
           (__pyx_v_cstr[0]) = '\x00';
 
-          /* "alpm.pyx":781
+          /* "alpm.pyx":790
  *                 if cstr is not NULL:
  *                     cstr[0] = '\0'
  *                     if files.count:             # <<<<<<<<<<<<<<
@@ -10113,7 +10221,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
           __pyx_t_1 = (__pyx_v_files->count != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":782
+            /* "alpm.pyx":791
  *                     cstr[0] = '\0'
  *                     if files.count:
  *                         memcpy(cstr + pos, '\n', 1)             # <<<<<<<<<<<<<<
@@ -10122,7 +10230,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
             memcpy((__pyx_v_cstr + __pyx_v_pos), ((char *)"\n"), 1);
 
-            /* "alpm.pyx":783
+            /* "alpm.pyx":792
  *                     if files.count:
  *                         memcpy(cstr + pos, '\n', 1)
  *                         pos += 1             # <<<<<<<<<<<<<<
@@ -10131,7 +10239,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
             __pyx_v_pos = (__pyx_v_pos + 1);
 
-            /* "alpm.pyx":784
+            /* "alpm.pyx":793
  *                         memcpy(cstr + pos, '\n', 1)
  *                         pos += 1
  *                         for i in range(files.count):             # <<<<<<<<<<<<<<
@@ -10142,7 +10250,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
             for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
               __pyx_v_i = __pyx_t_3;
 
-              /* "alpm.pyx":785
+              /* "alpm.pyx":794
  *                         pos += 1
  *                         for i in range(files.count):
  *                             memcpy(cstr + pos, '/', 1)             # <<<<<<<<<<<<<<
@@ -10151,7 +10259,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               memcpy((__pyx_v_cstr + __pyx_v_pos), ((char *)"/"), 1);
 
-              /* "alpm.pyx":786
+              /* "alpm.pyx":795
  *                         for i in range(files.count):
  *                             memcpy(cstr + pos, '/', 1)
  *                             pos += 1             # <<<<<<<<<<<<<<
@@ -10160,7 +10268,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               __pyx_v_pos = (__pyx_v_pos + 1);
 
-              /* "alpm.pyx":787
+              /* "alpm.pyx":796
  *                             memcpy(cstr + pos, '/', 1)
  *                             pos += 1
  *                             name = files.files[i].name             # <<<<<<<<<<<<<<
@@ -10170,7 +10278,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
               __pyx_t_4 = (__pyx_v_files->files[__pyx_v_i]).name;
               __pyx_v_name = __pyx_t_4;
 
-              /* "alpm.pyx":788
+              /* "alpm.pyx":797
  *                             pos += 1
  *                             name = files.files[i].name
  *                             length = strlen(name)             # <<<<<<<<<<<<<<
@@ -10179,7 +10287,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               __pyx_v_length = strlen(__pyx_v_name);
 
-              /* "alpm.pyx":789
+              /* "alpm.pyx":798
  *                             name = files.files[i].name
  *                             length = strlen(name)
  *                             memcpy(cstr + pos, name, length + 1)             # <<<<<<<<<<<<<<
@@ -10188,7 +10296,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               memcpy((__pyx_v_cstr + __pyx_v_pos), __pyx_v_name, (__pyx_v_length + 1));
 
-              /* "alpm.pyx":790
+              /* "alpm.pyx":799
  *                             length = strlen(name)
  *                             memcpy(cstr + pos, name, length + 1)
  *                             pos += length             # <<<<<<<<<<<<<<
@@ -10197,7 +10305,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               __pyx_v_pos = (__pyx_v_pos + __pyx_v_length);
 
-              /* "alpm.pyx":791
+              /* "alpm.pyx":800
  *                             memcpy(cstr + pos, name, length + 1)
  *                             pos += length
  *                             memcpy(cstr + pos, '\n', 1)             # <<<<<<<<<<<<<<
@@ -10206,7 +10314,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               memcpy((__pyx_v_cstr + __pyx_v_pos), ((char *)"\n"), 1);
 
-              /* "alpm.pyx":792
+              /* "alpm.pyx":801
  *                             pos += length
  *                             memcpy(cstr + pos, '\n', 1)
  *                             pos += 1             # <<<<<<<<<<<<<<
@@ -10215,7 +10323,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
               __pyx_v_pos = (__pyx_v_pos + 1);
 
-              /* "alpm.pyx":793
+              /* "alpm.pyx":802
  *                             memcpy(cstr + pos, '\n', 1)
  *                             pos += 1
  *                             cstr[pos] = '\0'             # <<<<<<<<<<<<<<
@@ -10225,7 +10333,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
               (__pyx_v_cstr[__pyx_v_pos]) = '\x00';
             }
 
-            /* "alpm.pyx":781
+            /* "alpm.pyx":790
  *                 if cstr is not NULL:
  *                     cstr[0] = '\0'
  *                     if files.count:             # <<<<<<<<<<<<<<
@@ -10234,7 +10342,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
           }
 
-          /* "alpm.pyx":794
+          /* "alpm.pyx":803
  *                             pos += 1
  *                             cstr[pos] = '\0'
  *                     return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10244,13 +10352,13 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
           __Pyx_XDECREF(__pyx_r);
           __pyx_t_6.__pyx_n = 1;
           __pyx_t_6.release = 1;
-          __pyx_t_5 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 794, __pyx_L1_error)
+          __pyx_t_5 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 803, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_5);
           __pyx_r = __pyx_t_5;
           __pyx_t_5 = 0;
           goto __pyx_L0;
 
-          /* "alpm.pyx":779
+          /* "alpm.pyx":788
  *             if length:
  *                 cstr = <char *>malloc(sizeof(char) * (length + 2))
  *                 if cstr is not NULL:             # <<<<<<<<<<<<<<
@@ -10259,7 +10367,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
         }
 
-        /* "alpm.pyx":777
+        /* "alpm.pyx":786
  *             for i in range(files.count):
  *                 length += strlen(files.files[i].name) + 2
  *             if length:             # <<<<<<<<<<<<<<
@@ -10268,7 +10376,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
       }
 
-      /* "alpm.pyx":774
+      /* "alpm.pyx":783
  *     if pkg is not NULL:
  *         files = alpm_pkg_get_files(pkg)
  *         if files is not NULL:             # <<<<<<<<<<<<<<
@@ -10277,7 +10385,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
     }
 
-    /* "alpm.pyx":772
+    /* "alpm.pyx":781
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10286,7 +10394,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":764
+  /* "alpm.pyx":773
  *     return check_vcs(name)
  * 
  * def pkg_join_files(object ppkg):             # <<<<<<<<<<<<<<
@@ -10307,7 +10415,7 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":796
+/* "alpm.pyx":805
  *                     return to_unicode(cstr, True)
  * 
  * def pkg_join_depends(object ppkg):             # <<<<<<<<<<<<<<
@@ -10316,20 +10424,20 @@ static PyObject *__pyx_pf_4alpm_108pkg_join_files(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_111pkg_join_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_111pkg_join_depends = {"pkg_join_depends", (PyCFunction)__pyx_pw_4alpm_111pkg_join_depends, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_111pkg_join_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_113pkg_join_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_113pkg_join_depends = {"pkg_join_depends", (PyCFunction)__pyx_pw_4alpm_113pkg_join_depends, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_113pkg_join_depends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_join_depends (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_110pkg_join_depends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_112pkg_join_depends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_112pkg_join_depends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   char *__pyx_v_cstr;
   PyObject *__pyx_r = NULL;
@@ -10339,7 +10447,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_join_depends", 0);
 
-  /* "alpm.pyx":800
+  /* "alpm.pyx":809
  *     cdef char *cstr
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -10348,7 +10456,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":801
+  /* "alpm.pyx":810
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10358,7 +10466,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":802
+    /* "alpm.pyx":811
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_depends(pkg), '', '\n', DATA_TYPE_DEPENDS)             # <<<<<<<<<<<<<<
@@ -10367,7 +10475,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
  */
     __pyx_v_cstr = __pyx_f_4alpm_join_list(alpm_pkg_get_depends(__pyx_v_pkg), ((const char *)""), ((const char *)"\n"), __pyx_e_4alpm_DATA_TYPE_DEPENDS);
 
-    /* "alpm.pyx":803
+    /* "alpm.pyx":812
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_depends(pkg), '', '\n', DATA_TYPE_DEPENDS)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10377,13 +10485,13 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 803, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 812, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":801
+    /* "alpm.pyx":810
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10392,7 +10500,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
  */
   }
 
-  /* "alpm.pyx":796
+  /* "alpm.pyx":805
  *                     return to_unicode(cstr, True)
  * 
  * def pkg_join_depends(object ppkg):             # <<<<<<<<<<<<<<
@@ -10413,7 +10521,7 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "alpm.pyx":805
+/* "alpm.pyx":814
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_provides(object ppkg):             # <<<<<<<<<<<<<<
@@ -10422,20 +10530,20 @@ static PyObject *__pyx_pf_4alpm_110pkg_join_depends(CYTHON_UNUSED PyObject *__py
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_113pkg_join_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_113pkg_join_provides = {"pkg_join_provides", (PyCFunction)__pyx_pw_4alpm_113pkg_join_provides, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_113pkg_join_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_115pkg_join_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_115pkg_join_provides = {"pkg_join_provides", (PyCFunction)__pyx_pw_4alpm_115pkg_join_provides, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_115pkg_join_provides(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_join_provides (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_112pkg_join_provides(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_114pkg_join_provides(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_114pkg_join_provides(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   char *__pyx_v_cstr;
   PyObject *__pyx_r = NULL;
@@ -10445,7 +10553,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_join_provides", 0);
 
-  /* "alpm.pyx":809
+  /* "alpm.pyx":818
  *     cdef char *cstr
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -10454,7 +10562,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":810
+  /* "alpm.pyx":819
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10464,7 +10572,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":811
+    /* "alpm.pyx":820
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_provides(pkg), '', '\n', DATA_TYPE_DEPENDS)             # <<<<<<<<<<<<<<
@@ -10473,7 +10581,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
  */
     __pyx_v_cstr = __pyx_f_4alpm_join_list(alpm_pkg_get_provides(__pyx_v_pkg), ((const char *)""), ((const char *)"\n"), __pyx_e_4alpm_DATA_TYPE_DEPENDS);
 
-    /* "alpm.pyx":812
+    /* "alpm.pyx":821
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_provides(pkg), '', '\n', DATA_TYPE_DEPENDS)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10483,13 +10591,13 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 812, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 821, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":810
+    /* "alpm.pyx":819
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10498,7 +10606,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":805
+  /* "alpm.pyx":814
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_provides(object ppkg):             # <<<<<<<<<<<<<<
@@ -10519,7 +10627,7 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":814
+/* "alpm.pyx":823
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_replaces(object ppkg):             # <<<<<<<<<<<<<<
@@ -10528,20 +10636,20 @@ static PyObject *__pyx_pf_4alpm_112pkg_join_provides(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_115pkg_join_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_115pkg_join_replaces = {"pkg_join_replaces", (PyCFunction)__pyx_pw_4alpm_115pkg_join_replaces, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_115pkg_join_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_117pkg_join_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_117pkg_join_replaces = {"pkg_join_replaces", (PyCFunction)__pyx_pw_4alpm_117pkg_join_replaces, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_117pkg_join_replaces(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_join_replaces (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_114pkg_join_replaces(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_116pkg_join_replaces(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_116pkg_join_replaces(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   char *__pyx_v_cstr;
   PyObject *__pyx_r = NULL;
@@ -10551,7 +10659,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_join_replaces", 0);
 
-  /* "alpm.pyx":818
+  /* "alpm.pyx":827
  *     cdef char *cstr
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -10560,7 +10668,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":819
+  /* "alpm.pyx":828
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10570,7 +10678,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":820
+    /* "alpm.pyx":829
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_replaces(pkg), '', '\n', DATA_TYPE_DEPENDS)             # <<<<<<<<<<<<<<
@@ -10579,7 +10687,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
  */
     __pyx_v_cstr = __pyx_f_4alpm_join_list(alpm_pkg_get_replaces(__pyx_v_pkg), ((const char *)""), ((const char *)"\n"), __pyx_e_4alpm_DATA_TYPE_DEPENDS);
 
-    /* "alpm.pyx":821
+    /* "alpm.pyx":830
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_replaces(pkg), '', '\n', DATA_TYPE_DEPENDS)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10589,13 +10697,13 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 821, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 830, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":819
+    /* "alpm.pyx":828
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10604,7 +10712,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
  */
   }
 
-  /* "alpm.pyx":814
+  /* "alpm.pyx":823
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_replaces(object ppkg):             # <<<<<<<<<<<<<<
@@ -10625,7 +10733,7 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "alpm.pyx":823
+/* "alpm.pyx":832
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_optdepends(object ppkg):             # <<<<<<<<<<<<<<
@@ -10634,20 +10742,20 @@ static PyObject *__pyx_pf_4alpm_114pkg_join_replaces(CYTHON_UNUSED PyObject *__p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_117pkg_join_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_117pkg_join_optdepends = {"pkg_join_optdepends", (PyCFunction)__pyx_pw_4alpm_117pkg_join_optdepends, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_117pkg_join_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pw_4alpm_119pkg_join_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_119pkg_join_optdepends = {"pkg_join_optdepends", (PyCFunction)__pyx_pw_4alpm_119pkg_join_optdepends, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_119pkg_join_optdepends(PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pkg_join_optdepends (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_116pkg_join_optdepends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
+  __pyx_r = __pyx_pf_4alpm_118pkg_join_optdepends(__pyx_self, ((PyObject *)__pyx_v_ppkg));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
+static PyObject *__pyx_pf_4alpm_118pkg_join_optdepends(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ppkg) {
   alpm_pkg_t *__pyx_v_pkg;
   char *__pyx_v_cstr;
   PyObject *__pyx_r = NULL;
@@ -10657,7 +10765,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_3;
   __Pyx_RefNannySetupContext("pkg_join_optdepends", 0);
 
-  /* "alpm.pyx":827
+  /* "alpm.pyx":836
  *     cdef char *cstr
  * 
  *     pkg = to_alpm_pkg(ppkg)             # <<<<<<<<<<<<<<
@@ -10666,7 +10774,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
  */
   __pyx_v_pkg = __pyx_f_4alpm_to_alpm_pkg(__pyx_v_ppkg);
 
-  /* "alpm.pyx":828
+  /* "alpm.pyx":837
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10676,7 +10784,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
   __pyx_t_1 = ((__pyx_v_pkg != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":829
+    /* "alpm.pyx":838
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_optdepends(pkg), '', '\n', DATA_TYPE_DEPENDS)             # <<<<<<<<<<<<<<
@@ -10685,7 +10793,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
  */
     __pyx_v_cstr = __pyx_f_4alpm_join_list(alpm_pkg_get_optdepends(__pyx_v_pkg), ((const char *)""), ((const char *)"\n"), __pyx_e_4alpm_DATA_TYPE_DEPENDS);
 
-    /* "alpm.pyx":830
+    /* "alpm.pyx":839
  *     if pkg is not NULL:
  *         cstr = join_list(alpm_pkg_get_optdepends(pkg), '', '\n', DATA_TYPE_DEPENDS)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10695,13 +10803,13 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_3.__pyx_n = 1;
     __pyx_t_3.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 830, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 839, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":828
+    /* "alpm.pyx":837
  * 
  *     pkg = to_alpm_pkg(ppkg)
  *     if pkg is not NULL:             # <<<<<<<<<<<<<<
@@ -10710,7 +10818,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
  */
   }
 
-  /* "alpm.pyx":823
+  /* "alpm.pyx":832
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_optdepends(object ppkg):             # <<<<<<<<<<<<<<
@@ -10731,7 +10839,7 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "alpm.pyx":832
+/* "alpm.pyx":841
  *         return to_unicode(cstr, True)
  * 
  * def list_join_str(object plist, object psep):             # <<<<<<<<<<<<<<
@@ -10740,9 +10848,9 @@ static PyObject *__pyx_pf_4alpm_116pkg_join_optdepends(CYTHON_UNUSED PyObject *_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_119list_join_str(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_119list_join_str = {"list_join_str", (PyCFunction)__pyx_pw_4alpm_119list_join_str, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_4alpm_119list_join_str(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_4alpm_121list_join_str(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_121list_join_str = {"list_join_str", (PyCFunction)__pyx_pw_4alpm_121list_join_str, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4alpm_121list_join_str(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_plist = 0;
   PyObject *__pyx_v_psep = 0;
   PyObject *__pyx_r = 0;
@@ -10768,11 +10876,11 @@ static PyObject *__pyx_pw_4alpm_119list_join_str(PyObject *__pyx_self, PyObject
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_psep)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("list_join_str", 1, 2, 2, 1); __PYX_ERR(0, 832, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("list_join_str", 1, 2, 2, 1); __PYX_ERR(0, 841, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "list_join_str") < 0)) __PYX_ERR(0, 832, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "list_join_str") < 0)) __PYX_ERR(0, 841, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -10785,20 +10893,20 @@ static PyObject *__pyx_pw_4alpm_119list_join_str(PyObject *__pyx_self, PyObject
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("list_join_str", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 832, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("list_join_str", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 841, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("alpm.list_join_str", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_4alpm_118list_join_str(__pyx_self, __pyx_v_plist, __pyx_v_psep);
+  __pyx_r = __pyx_pf_4alpm_120list_join_str(__pyx_self, __pyx_v_plist, __pyx_v_psep);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist, PyObject *__pyx_v_psep) {
+static PyObject *__pyx_pf_4alpm_120list_join_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist, PyObject *__pyx_v_psep) {
   alpm_list_t *__pyx_v_list;
   char *__pyx_v_cstr;
   PyObject *__pyx_v_sep = 0;
@@ -10810,7 +10918,7 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_4;
   __Pyx_RefNannySetupContext("list_join_str", 0);
 
-  /* "alpm.pyx":837
+  /* "alpm.pyx":846
  *     cdef bytes sep
  * 
  *     list = to_alpm_list(plist)             # <<<<<<<<<<<<<<
@@ -10819,7 +10927,7 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
  */
   __pyx_v_list = __pyx_f_4alpm_to_alpm_list(__pyx_v_plist);
 
-  /* "alpm.pyx":838
+  /* "alpm.pyx":847
  * 
  *     list = to_alpm_list(plist)
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -10829,29 +10937,29 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
   __pyx_t_1 = ((__pyx_v_list != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":839
+    /* "alpm.pyx":848
  *     list = to_alpm_list(plist)
  *     if list is not NULL:
  *         sep = to_bytes(psep)             # <<<<<<<<<<<<<<
  *         cstr = join_list(list, '', sep, DATA_TYPE_DEFAULT)
  *         return to_unicode(cstr, True)
  */
-    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_psep, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 839, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_bytes(__pyx_v_psep, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 848, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_v_sep = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "alpm.pyx":840
+    /* "alpm.pyx":849
  *     if list is not NULL:
  *         sep = to_bytes(psep)
  *         cstr = join_list(list, '', sep, DATA_TYPE_DEFAULT)             # <<<<<<<<<<<<<<
  *         return to_unicode(cstr, True)
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_sep); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 840, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_AsString(__pyx_v_sep); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 849, __pyx_L1_error)
     __pyx_v_cstr = __pyx_f_4alpm_join_list(__pyx_v_list, ((const char *)""), __pyx_t_3, __pyx_e_4alpm_DATA_TYPE_DEFAULT);
 
-    /* "alpm.pyx":841
+    /* "alpm.pyx":850
  *         sep = to_bytes(psep)
  *         cstr = join_list(list, '', sep, DATA_TYPE_DEFAULT)
  *         return to_unicode(cstr, True)             # <<<<<<<<<<<<<<
@@ -10861,13 +10969,13 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_4.__pyx_n = 1;
     __pyx_t_4.release = 1;
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 841, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(__pyx_v_cstr, &__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 850, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":838
+    /* "alpm.pyx":847
  * 
  *     list = to_alpm_list(plist)
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -10876,7 +10984,7 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
  */
   }
 
-  /* "alpm.pyx":832
+  /* "alpm.pyx":841
  *         return to_unicode(cstr, True)
  * 
  * def list_join_str(object plist, object psep):             # <<<<<<<<<<<<<<
@@ -10898,7 +11006,7 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "alpm.pyx":843
+/* "alpm.pyx":852
  *         return to_unicode(cstr, True)
  * 
  * def list_next(object plist):             # <<<<<<<<<<<<<<
@@ -10907,20 +11015,20 @@ static PyObject *__pyx_pf_4alpm_118list_join_str(CYTHON_UNUSED PyObject *__pyx_s
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_121list_next(PyObject *__pyx_self, PyObject *__pyx_v_plist); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_121list_next = {"list_next", (PyCFunction)__pyx_pw_4alpm_121list_next, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_121list_next(PyObject *__pyx_self, PyObject *__pyx_v_plist) {
+static PyObject *__pyx_pw_4alpm_123list_next(PyObject *__pyx_self, PyObject *__pyx_v_plist); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_123list_next = {"list_next", (PyCFunction)__pyx_pw_4alpm_123list_next, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_123list_next(PyObject *__pyx_self, PyObject *__pyx_v_plist) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_next (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_120list_next(__pyx_self, ((PyObject *)__pyx_v_plist));
+  __pyx_r = __pyx_pf_4alpm_122list_next(__pyx_self, ((PyObject *)__pyx_v_plist));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist) {
+static PyObject *__pyx_pf_4alpm_122list_next(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_plist) {
   alpm_list_t *__pyx_v_list;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -10928,7 +11036,7 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_next", 0);
 
-  /* "alpm.pyx":846
+  /* "alpm.pyx":855
  *     cdef alpm_list_t *list
  * 
  *     list = to_alpm_list(plist)             # <<<<<<<<<<<<<<
@@ -10937,7 +11045,7 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
  */
   __pyx_v_list = __pyx_f_4alpm_to_alpm_list(__pyx_v_plist);
 
-  /* "alpm.pyx":847
+  /* "alpm.pyx":856
  * 
  *     list = to_alpm_list(plist)
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -10947,7 +11055,7 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
   __pyx_t_1 = ((__pyx_v_list != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":848
+    /* "alpm.pyx":857
  *     list = to_alpm_list(plist)
  *     if list is not NULL:
  *         return to_capsule(alpm_list_next(list))             # <<<<<<<<<<<<<<
@@ -10955,13 +11063,13 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
  * def list_get_str(object pnode):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_list_next(__pyx_v_list)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 848, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(alpm_list_next(__pyx_v_list)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 857, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":847
+    /* "alpm.pyx":856
  * 
  *     list = to_alpm_list(plist)
  *     if list is not NULL:             # <<<<<<<<<<<<<<
@@ -10970,7 +11078,7 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
  */
   }
 
-  /* "alpm.pyx":843
+  /* "alpm.pyx":852
  *         return to_unicode(cstr, True)
  * 
  * def list_next(object plist):             # <<<<<<<<<<<<<<
@@ -10991,7 +11099,7 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
   return __pyx_r;
 }
 
-/* "alpm.pyx":850
+/* "alpm.pyx":859
  *         return to_capsule(alpm_list_next(list))
  * 
  * def list_get_str(object pnode):             # <<<<<<<<<<<<<<
@@ -11000,20 +11108,20 @@ static PyObject *__pyx_pf_4alpm_120list_next(CYTHON_UNUSED PyObject *__pyx_self,
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_123list_get_str(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_123list_get_str = {"list_get_str", (PyCFunction)__pyx_pw_4alpm_123list_get_str, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_123list_get_str(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_125list_get_str(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_125list_get_str = {"list_get_str", (PyCFunction)__pyx_pw_4alpm_125list_get_str, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_125list_get_str(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_str (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_122list_get_str(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_124list_get_str(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_124list_get_str(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -11021,7 +11129,7 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_get_str", 0);
 
-  /* "alpm.pyx":853
+  /* "alpm.pyx":862
  *     cdef alpm_list_t *node
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11030,7 +11138,7 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":854
+  /* "alpm.pyx":863
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11040,7 +11148,7 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":855
+    /* "alpm.pyx":864
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         return to_unicode(<char *>node.data)             # <<<<<<<<<<<<<<
@@ -11048,13 +11156,13 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
  * def list_get_db(object pnode):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_node->data), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 855, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_unicode(((char *)__pyx_v_node->data), NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 864, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":854
+    /* "alpm.pyx":863
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11063,7 +11171,7 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
  */
   }
 
-  /* "alpm.pyx":850
+  /* "alpm.pyx":859
  *         return to_capsule(alpm_list_next(list))
  * 
  * def list_get_str(object pnode):             # <<<<<<<<<<<<<<
@@ -11084,7 +11192,7 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
   return __pyx_r;
 }
 
-/* "alpm.pyx":857
+/* "alpm.pyx":866
  *         return to_unicode(<char *>node.data)
  * 
  * def list_get_db(object pnode):             # <<<<<<<<<<<<<<
@@ -11093,20 +11201,20 @@ static PyObject *__pyx_pf_4alpm_122list_get_str(CYTHON_UNUSED PyObject *__pyx_se
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_125list_get_db(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_125list_get_db = {"list_get_db", (PyCFunction)__pyx_pw_4alpm_125list_get_db, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_125list_get_db(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_127list_get_db(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_127list_get_db = {"list_get_db", (PyCFunction)__pyx_pw_4alpm_127list_get_db, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_127list_get_db(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_db (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_124list_get_db(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_126list_get_db(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_126list_get_db(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -11114,7 +11222,7 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_get_db", 0);
 
-  /* "alpm.pyx":860
+  /* "alpm.pyx":869
  *     cdef alpm_list_t *node
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11123,7 +11231,7 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":861
+  /* "alpm.pyx":870
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11133,7 +11241,7 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":862
+    /* "alpm.pyx":871
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         return to_capsule(<alpm_db_t *>node.data)             # <<<<<<<<<<<<<<
@@ -11141,13 +11249,13 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
  * def list_get_group(object pnode):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_db_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 862, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_db_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 871, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":861
+    /* "alpm.pyx":870
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11156,7 +11264,7 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
  */
   }
 
-  /* "alpm.pyx":857
+  /* "alpm.pyx":866
  *         return to_unicode(<char *>node.data)
  * 
  * def list_get_db(object pnode):             # <<<<<<<<<<<<<<
@@ -11177,7 +11285,7 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "alpm.pyx":864
+/* "alpm.pyx":873
  *         return to_capsule(<alpm_db_t *>node.data)
  * 
  * def list_get_group(object pnode):             # <<<<<<<<<<<<<<
@@ -11186,20 +11294,20 @@ static PyObject *__pyx_pf_4alpm_124list_get_db(CYTHON_UNUSED PyObject *__pyx_sel
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_127list_get_group(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_127list_get_group = {"list_get_group", (PyCFunction)__pyx_pw_4alpm_127list_get_group, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_127list_get_group(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_129list_get_group(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_129list_get_group = {"list_get_group", (PyCFunction)__pyx_pw_4alpm_129list_get_group, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_129list_get_group(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_group (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_126list_get_group(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_128list_get_group(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_128list_get_group(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -11207,7 +11315,7 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_get_group", 0);
 
-  /* "alpm.pyx":867
+  /* "alpm.pyx":876
  *     cdef alpm_list_t *node
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11216,7 +11324,7 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":868
+  /* "alpm.pyx":877
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11226,7 +11334,7 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":869
+    /* "alpm.pyx":878
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         return to_capsule(<alpm_group_t *>node.data)             # <<<<<<<<<<<<<<
@@ -11234,13 +11342,13 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
  * def list_get_pkg(object pnode):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_group_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 869, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_group_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 878, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":868
+    /* "alpm.pyx":877
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11249,7 +11357,7 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
  */
   }
 
-  /* "alpm.pyx":864
+  /* "alpm.pyx":873
  *         return to_capsule(<alpm_db_t *>node.data)
  * 
  * def list_get_group(object pnode):             # <<<<<<<<<<<<<<
@@ -11270,7 +11378,7 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "alpm.pyx":871
+/* "alpm.pyx":880
  *         return to_capsule(<alpm_group_t *>node.data)
  * 
  * def list_get_pkg(object pnode):             # <<<<<<<<<<<<<<
@@ -11279,20 +11387,20 @@ static PyObject *__pyx_pf_4alpm_126list_get_group(CYTHON_UNUSED PyObject *__pyx_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_129list_get_pkg(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_129list_get_pkg = {"list_get_pkg", (PyCFunction)__pyx_pw_4alpm_129list_get_pkg, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_129list_get_pkg(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_131list_get_pkg(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_131list_get_pkg = {"list_get_pkg", (PyCFunction)__pyx_pw_4alpm_131list_get_pkg, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_131list_get_pkg(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_pkg (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_128list_get_pkg(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_130list_get_pkg(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_130list_get_pkg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -11300,7 +11408,7 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_get_pkg", 0);
 
-  /* "alpm.pyx":874
+  /* "alpm.pyx":883
  *     cdef alpm_list_t *node
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11309,7 +11417,7 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":875
+  /* "alpm.pyx":884
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11319,7 +11427,7 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":876
+    /* "alpm.pyx":885
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         return to_capsule(<alpm_pkg_t *>node.data)             # <<<<<<<<<<<<<<
@@ -11327,13 +11435,13 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
  * def list_get_dep(object pnode):
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_pkg_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 876, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_pkg_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 885, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":875
+    /* "alpm.pyx":884
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11342,7 +11450,7 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
  */
   }
 
-  /* "alpm.pyx":871
+  /* "alpm.pyx":880
  *         return to_capsule(<alpm_group_t *>node.data)
  * 
  * def list_get_pkg(object pnode):             # <<<<<<<<<<<<<<
@@ -11363,7 +11471,7 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
   return __pyx_r;
 }
 
-/* "alpm.pyx":878
+/* "alpm.pyx":887
  *         return to_capsule(<alpm_pkg_t *>node.data)
  * 
  * def list_get_dep(object pnode):             # <<<<<<<<<<<<<<
@@ -11372,20 +11480,20 @@ static PyObject *__pyx_pf_4alpm_128list_get_pkg(CYTHON_UNUSED PyObject *__pyx_se
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_131list_get_dep(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_131list_get_dep = {"list_get_dep", (PyCFunction)__pyx_pw_4alpm_131list_get_dep, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_131list_get_dep(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_133list_get_dep(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_133list_get_dep = {"list_get_dep", (PyCFunction)__pyx_pw_4alpm_133list_get_dep, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_133list_get_dep(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_dep (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_130list_get_dep(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_132list_get_dep(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_132list_get_dep(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -11393,7 +11501,7 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("list_get_dep", 0);
 
-  /* "alpm.pyx":881
+  /* "alpm.pyx":890
  *     cdef alpm_list_t *node
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11402,7 +11510,7 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":882
+  /* "alpm.pyx":891
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11412,7 +11520,7 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":883
+    /* "alpm.pyx":892
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         return to_capsule(<alpm_depend_t *>node.data)             # <<<<<<<<<<<<<<
@@ -11420,13 +11528,13 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
  * PKG_BACKUP_UNKNOWN = BACKUP_UNKNOWN
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_depend_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 883, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_4alpm_to_capsule(((alpm_depend_t *)__pyx_v_node->data)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 892, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "alpm.pyx":882
+    /* "alpm.pyx":891
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11435,7 +11543,7 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
  */
   }
 
-  /* "alpm.pyx":878
+  /* "alpm.pyx":887
  *         return to_capsule(<alpm_pkg_t *>node.data)
  * 
  * def list_get_dep(object pnode):             # <<<<<<<<<<<<<<
@@ -11456,7 +11564,7 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
   return __pyx_r;
 }
 
-/* "alpm.pyx":891
+/* "alpm.pyx":900
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  * 
  * def list_get_backup(object pnode):             # <<<<<<<<<<<<<<
@@ -11465,20 +11573,20 @@ static PyObject *__pyx_pf_4alpm_130list_get_dep(CYTHON_UNUSED PyObject *__pyx_se
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4alpm_133list_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
-static PyMethodDef __pyx_mdef_4alpm_133list_get_backup = {"list_get_backup", (PyCFunction)__pyx_pw_4alpm_133list_get_backup, METH_O, 0};
-static PyObject *__pyx_pw_4alpm_133list_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pw_4alpm_135list_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_pnode); /*proto*/
+static PyMethodDef __pyx_mdef_4alpm_135list_get_backup = {"list_get_backup", (PyCFunction)__pyx_pw_4alpm_135list_get_backup, METH_O, 0};
+static PyObject *__pyx_pw_4alpm_135list_get_backup(PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("list_get_backup (wrapper)", 0);
-  __pyx_r = __pyx_pf_4alpm_132list_get_backup(__pyx_self, ((PyObject *)__pyx_v_pnode));
+  __pyx_r = __pyx_pf_4alpm_134list_get_backup(__pyx_self, ((PyObject *)__pyx_v_pnode));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
+static PyObject *__pyx_pf_4alpm_134list_get_backup(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pnode) {
   alpm_list_t *__pyx_v_node;
   alpm_backup_t *__pyx_v_backup;
   char *__pyx_v_path;
@@ -11495,7 +11603,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
   struct __pyx_opt_args_4alpm_to_unicode __pyx_t_7;
   __Pyx_RefNannySetupContext("list_get_backup", 0);
 
-  /* "alpm.pyx":898
+  /* "alpm.pyx":907
  *     cdef int status
  * 
  *     node = to_alpm_list(pnode)             # <<<<<<<<<<<<<<
@@ -11504,7 +11612,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
   __pyx_v_node = __pyx_f_4alpm_to_alpm_list(__pyx_v_pnode);
 
-  /* "alpm.pyx":899
+  /* "alpm.pyx":908
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11514,7 +11622,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
   __pyx_t_1 = ((__pyx_v_node != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "alpm.pyx":900
+    /* "alpm.pyx":909
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:
  *         backup = <alpm_backup_t *>node.data             # <<<<<<<<<<<<<<
@@ -11523,7 +11631,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
     __pyx_v_backup = ((alpm_backup_t *)__pyx_v_node->data);
 
-    /* "alpm.pyx":901
+    /* "alpm.pyx":910
  *     if node is not NULL:
  *         backup = <alpm_backup_t *>node.data
  *         if backup.name is not NULL and backup.hash is not NULL:             # <<<<<<<<<<<<<<
@@ -11541,7 +11649,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
     __pyx_L5_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "alpm.pyx":902
+      /* "alpm.pyx":911
  *         backup = <alpm_backup_t *>node.data
  *         if backup.name is not NULL and backup.hash is not NULL:
  *             path = <char *>malloc(sizeof(char) * PATH_MAX)             # <<<<<<<<<<<<<<
@@ -11550,7 +11658,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
       __pyx_v_path = ((char *)malloc(((sizeof(char)) * PATH_MAX)));
 
-      /* "alpm.pyx":903
+      /* "alpm.pyx":912
  *         if backup.name is not NULL and backup.hash is not NULL:
  *             path = <char *>malloc(sizeof(char) * PATH_MAX)
  *             if path is not NULL:             # <<<<<<<<<<<<<<
@@ -11560,7 +11668,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
       __pyx_t_1 = ((__pyx_v_path != NULL) != 0);
       if (__pyx_t_1) {
 
-        /* "alpm.pyx":904
+        /* "alpm.pyx":913
  *             path = <char *>malloc(sizeof(char) * PATH_MAX)
  *             if path is not NULL:
  *                 status = BACKUP_UNKNOWN             # <<<<<<<<<<<<<<
@@ -11569,7 +11677,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
         __pyx_v_status = __pyx_e_4alpm_BACKUP_UNKNOWN;
 
-        /* "alpm.pyx":905
+        /* "alpm.pyx":914
  *             if path is not NULL:
  *                 status = BACKUP_UNKNOWN
  *                 snprintf(path, PATH_MAX, '%s%s', alpm_option_get_root(handle), backup.name)             # <<<<<<<<<<<<<<
@@ -11578,7 +11686,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
         snprintf(__pyx_v_path, PATH_MAX, ((char const *)"%s%s"), alpm_option_get_root(__pyx_v_4alpm_handle), __pyx_v_backup->name);
 
-        /* "alpm.pyx":906
+        /* "alpm.pyx":915
  *                 status = BACKUP_UNKNOWN
  *                 snprintf(path, PATH_MAX, '%s%s', alpm_option_get_root(handle), backup.name)
  *                 if access(path, R_OK) == 0:             # <<<<<<<<<<<<<<
@@ -11588,7 +11696,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         __pyx_t_1 = ((access(__pyx_v_path, R_OK) == 0) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":907
+          /* "alpm.pyx":916
  *                 snprintf(path, PATH_MAX, '%s%s', alpm_option_get_root(handle), backup.name)
  *                 if access(path, R_OK) == 0:
  *                     md5sum = alpm_compute_md5sum(path)             # <<<<<<<<<<<<<<
@@ -11597,7 +11705,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
           __pyx_v_md5sum = alpm_compute_md5sum(__pyx_v_path);
 
-          /* "alpm.pyx":908
+          /* "alpm.pyx":917
  *                 if access(path, R_OK) == 0:
  *                     md5sum = alpm_compute_md5sum(path)
  *                     if md5sum is not NULL:             # <<<<<<<<<<<<<<
@@ -11607,7 +11715,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
           __pyx_t_1 = ((__pyx_v_md5sum != NULL) != 0);
           if (__pyx_t_1) {
 
-            /* "alpm.pyx":909
+            /* "alpm.pyx":918
  *                     md5sum = alpm_compute_md5sum(path)
  *                     if md5sum is not NULL:
  *                         if strcmp(md5sum, backup.hash) != 0:             # <<<<<<<<<<<<<<
@@ -11617,7 +11725,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
             __pyx_t_1 = ((strcmp(__pyx_v_md5sum, __pyx_v_backup->hash) != 0) != 0);
             if (__pyx_t_1) {
 
-              /* "alpm.pyx":910
+              /* "alpm.pyx":919
  *                     if md5sum is not NULL:
  *                         if strcmp(md5sum, backup.hash) != 0:
  *                             status = BACKUP_MODIFIED             # <<<<<<<<<<<<<<
@@ -11626,7 +11734,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
               __pyx_v_status = __pyx_e_4alpm_BACKUP_MODIFIED;
 
-              /* "alpm.pyx":909
+              /* "alpm.pyx":918
  *                     md5sum = alpm_compute_md5sum(path)
  *                     if md5sum is not NULL:
  *                         if strcmp(md5sum, backup.hash) != 0:             # <<<<<<<<<<<<<<
@@ -11636,7 +11744,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
               goto __pyx_L10;
             }
 
-            /* "alpm.pyx":912
+            /* "alpm.pyx":921
  *                             status = BACKUP_MODIFIED
  *                         else:
  *                             status = BACKUP_UNMODIFIED             # <<<<<<<<<<<<<<
@@ -11648,7 +11756,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
             }
             __pyx_L10:;
 
-            /* "alpm.pyx":908
+            /* "alpm.pyx":917
  *                 if access(path, R_OK) == 0:
  *                     md5sum = alpm_compute_md5sum(path)
  *                     if md5sum is not NULL:             # <<<<<<<<<<<<<<
@@ -11657,7 +11765,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
           }
 
-          /* "alpm.pyx":906
+          /* "alpm.pyx":915
  *                 status = BACKUP_UNKNOWN
  *                 snprintf(path, PATH_MAX, '%s%s', alpm_option_get_root(handle), backup.name)
  *                 if access(path, R_OK) == 0:             # <<<<<<<<<<<<<<
@@ -11667,7 +11775,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
           goto __pyx_L8;
         }
 
-        /* "alpm.pyx":913
+        /* "alpm.pyx":922
  *                         else:
  *                             status = BACKUP_UNMODIFIED
  *                 elif errno == EACCES:             # <<<<<<<<<<<<<<
@@ -11677,7 +11785,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         __pyx_t_1 = ((errno == EACCES) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":914
+          /* "alpm.pyx":923
  *                             status = BACKUP_UNMODIFIED
  *                 elif errno == EACCES:
  *                     status = BACKUP_UNREADABLE             # <<<<<<<<<<<<<<
@@ -11686,7 +11794,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
           __pyx_v_status = __pyx_e_4alpm_BACKUP_UNREADABLE;
 
-          /* "alpm.pyx":913
+          /* "alpm.pyx":922
  *                         else:
  *                             status = BACKUP_UNMODIFIED
  *                 elif errno == EACCES:             # <<<<<<<<<<<<<<
@@ -11696,7 +11804,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
           goto __pyx_L8;
         }
 
-        /* "alpm.pyx":915
+        /* "alpm.pyx":924
  *                 elif errno == EACCES:
  *                     status = BACKUP_UNREADABLE
  *                 elif errno == ENOENT:             # <<<<<<<<<<<<<<
@@ -11706,7 +11814,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         __pyx_t_1 = ((errno == ENOENT) != 0);
         if (__pyx_t_1) {
 
-          /* "alpm.pyx":916
+          /* "alpm.pyx":925
  *                     status = BACKUP_UNREADABLE
  *                 elif errno == ENOENT:
  *                     status = BACKUP_MISSING             # <<<<<<<<<<<<<<
@@ -11714,7 +11822,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
           __pyx_v_status = __pyx_e_4alpm_BACKUP_MISSING;
 
-          /* "alpm.pyx":915
+          /* "alpm.pyx":924
  *                 elif errno == EACCES:
  *                     status = BACKUP_UNREADABLE
  *                 elif errno == ENOENT:             # <<<<<<<<<<<<<<
@@ -11724,13 +11832,13 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         }
         __pyx_L8:;
 
-        /* "alpm.pyx":917
+        /* "alpm.pyx":926
  *                 elif errno == ENOENT:
  *                     status = BACKUP_MISSING
  *                 return (status, to_unicode(path, True, fs_encoding, fs_errors))             # <<<<<<<<<<<<<<
  */
         __Pyx_XDECREF(__pyx_r);
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 917, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 926, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_4 = __pyx_v_4alpm_fs_encoding;
         __Pyx_INCREF(__pyx_t_4);
@@ -11740,11 +11848,11 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         __pyx_t_7.release = 1;
         __pyx_t_7.encoding = ((PyObject*)__pyx_t_4);
         __pyx_t_7.errors = ((PyObject*)__pyx_t_5);
-        __pyx_t_6 = __pyx_f_4alpm_to_unicode(__pyx_v_path, &__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 917, __pyx_L1_error)
+        __pyx_t_6 = __pyx_f_4alpm_to_unicode(__pyx_v_path, &__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 926, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 917, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 926, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_GIVEREF(__pyx_t_3);
         PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
@@ -11756,7 +11864,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
         __pyx_t_5 = 0;
         goto __pyx_L0;
 
-        /* "alpm.pyx":903
+        /* "alpm.pyx":912
  *         if backup.name is not NULL and backup.hash is not NULL:
  *             path = <char *>malloc(sizeof(char) * PATH_MAX)
  *             if path is not NULL:             # <<<<<<<<<<<<<<
@@ -11765,7 +11873,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
       }
 
-      /* "alpm.pyx":901
+      /* "alpm.pyx":910
  *     if node is not NULL:
  *         backup = <alpm_backup_t *>node.data
  *         if backup.name is not NULL and backup.hash is not NULL:             # <<<<<<<<<<<<<<
@@ -11774,7 +11882,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
     }
 
-    /* "alpm.pyx":899
+    /* "alpm.pyx":908
  * 
  *     node = to_alpm_list(pnode)
  *     if node is not NULL:             # <<<<<<<<<<<<<<
@@ -11783,7 +11891,7 @@ static PyObject *__pyx_pf_4alpm_132list_get_backup(CYTHON_UNUSED PyObject *__pyx
  */
   }
 
-  /* "alpm.pyx":891
+  /* "alpm.pyx":900
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  * 
  * def list_get_backup(object pnode):             # <<<<<<<<<<<<<<
@@ -11878,6 +11986,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_db_get_name, __pyx_k_db_get_name, sizeof(__pyx_k_db_get_name), 0, 0, 1, 1},
   {&__pyx_n_s_db_get_pkg, __pyx_k_db_get_pkg, sizeof(__pyx_k_db_get_pkg), 0, 0, 1, 1},
   {&__pyx_n_s_db_get_pkgcache, __pyx_k_db_get_pkgcache, sizeof(__pyx_k_db_get_pkgcache), 0, 0, 1, 1},
+  {&__pyx_n_s_db_unregister, __pyx_k_db_unregister, sizeof(__pyx_k_db_unregister), 0, 0, 1, 1},
   {&__pyx_n_s_dbpath, __pyx_k_dbpath, sizeof(__pyx_k_dbpath), 0, 0, 1, 1},
   {&__pyx_n_s_decode, __pyx_k_decode, sizeof(__pyx_k_decode), 0, 0, 1, 1},
   {&__pyx_n_s_dep, __pyx_k_dep, sizeof(__pyx_k_dep), 0, 0, 1, 1},
@@ -11997,8 +12106,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 155, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 295, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 296, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -12008,788 +12117,800 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "alpm.pyx":301
+  /* "alpm.pyx":302
  *     return VCS_NULL
  * 
  * def initialize(object proot, object pdbpath):             # <<<<<<<<<<<<<<
  *     global handle, fs_encoding
  *     cdef alpm_errno_t err
  */
-  __pyx_tuple_ = PyTuple_Pack(6, __pyx_n_s_proot, __pyx_n_s_pdbpath, __pyx_n_s_err, __pyx_n_s_root, __pyx_n_s_dbpath, __pyx_n_s_sys); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(6, __pyx_n_s_proot, __pyx_n_s_pdbpath, __pyx_n_s_err, __pyx_n_s_root, __pyx_n_s_dbpath, __pyx_n_s_sys); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 302, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
-  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_initialize, 301, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(2, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_initialize, 302, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 302, __pyx_L1_error)
 
-  /* "alpm.pyx":315
+  /* "alpm.pyx":316
  *     return 0
  * 
  * def release():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return alpm_release(handle)
  */
-  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_release, 315, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_release, 316, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 316, __pyx_L1_error)
 
-  /* "alpm.pyx":320
+  /* "alpm.pyx":321
  *     return -1
  * 
  * def version():             # <<<<<<<<<<<<<<
  *     return to_unicode(<char *>alpm_version())
  * 
  */
-  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_version, 320, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_version, 321, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(0, 321, __pyx_L1_error)
 
-  /* "alpm.pyx":323
+  /* "alpm.pyx":324
  *     return to_unicode(<char *>alpm_version())
  * 
  * def is_initialized():             # <<<<<<<<<<<<<<
  *     return handle is not NULL
  * 
  */
-  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_is_initialized, 323, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_is_initialized, 324, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 324, __pyx_L1_error)
 
-  /* "alpm.pyx":329
+  /* "alpm.pyx":330
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR
  * 
  * def error_number():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return <int>alpm_errno(handle)
  */
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_error_number, 329, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_error_number, 330, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 330, __pyx_L1_error)
 
-  /* "alpm.pyx":334
+  /* "alpm.pyx":335
  *     return 0
  * 
  * def error_string(int err):             # <<<<<<<<<<<<<<
  *     cdef char *cstr
  *     cdef const_char *strerr = ''
  */
-  __pyx_tuple__7 = PyTuple_Pack(4, __pyx_n_s_err, __pyx_n_s_err, __pyx_n_s_cstr, __pyx_n_s_strerr); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_tuple__7 = PyTuple_Pack(4, __pyx_n_s_err, __pyx_n_s_err, __pyx_n_s_cstr, __pyx_n_s_strerr); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__7);
   __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_error_string, 334, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_error_string, 335, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 335, __pyx_L1_error)
 
-  /* "alpm.pyx":349
+  /* "alpm.pyx":350
  *         return to_unicode(cstr, True)
  * 
  * def get_localdb():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_localdb(handle))
  */
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_get_localdb, 349, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_get_localdb, 350, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 350, __pyx_L1_error)
 
-  /* "alpm.pyx":353
+  /* "alpm.pyx":354
  *         return to_capsule(alpm_get_localdb(handle))
  * 
  * def get_syncdbs():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_syncdbs(handle))
  */
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_get_syncdbs, 353, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_get_syncdbs, 354, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 354, __pyx_L1_error)
 
-  /* "alpm.pyx":357
+  /* "alpm.pyx":358
  *         return to_capsule(alpm_get_syncdbs(handle))
  * 
  * def register_syncdb(object pname):             # <<<<<<<<<<<<<<
  *     cdef bytes name
  * 
  */
-  __pyx_tuple__11 = PyTuple_Pack(2, __pyx_n_s_pname, __pyx_n_s_name); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(2, __pyx_n_s_pname, __pyx_n_s_name); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__11);
   __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_register_syncdb, 357, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_register_syncdb, 358, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 358, __pyx_L1_error)
 
-  /* "alpm.pyx":364
+  /* "alpm.pyx":365
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
  * 
- * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
+ * def db_unregister(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_tuple__13 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 365, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__13);
   __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_name, 364, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_unregister, 365, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 365, __pyx_L1_error)
 
-  /* "alpm.pyx":371
- *         return to_unicode(<char *>alpm_db_get_name(db))
+  /* "alpm.pyx":373
+ *     return -1
  * 
- * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
+ * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
- *     cdef bytes name
+ * 
  */
-  __pyx_tuple__15 = PyTuple_Pack(4, __pyx_n_s_pdb, __pyx_n_s_pname, __pyx_n_s_db, __pyx_n_s_name); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__15);
   __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_pkg, 371, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_name, 373, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 373, __pyx_L1_error)
 
   /* "alpm.pyx":380
+ *         return to_unicode(<char *>alpm_db_get_name(db))
+ * 
+ * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
+ *     cdef alpm_db_t *db
+ *     cdef bytes name
+ */
+  __pyx_tuple__17 = PyTuple_Pack(4, __pyx_n_s_pdb, __pyx_n_s_pname, __pyx_n_s_db, __pyx_n_s_name); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_pkg, 380, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 380, __pyx_L1_error)
+
+  /* "alpm.pyx":389
  *         return to_capsule(alpm_db_get_pkg(db, name))
  * 
  * def db_get_groupcache(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_tuple__17 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 380, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
-  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_groupcache, 380, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_groupcache, 389, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 389, __pyx_L1_error)
 
-  /* "alpm.pyx":387
+  /* "alpm.pyx":396
  *         return to_capsule(alpm_db_get_groupcache(db))
  * 
  * def db_get_pkgcache(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_tuple__19 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 387, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_pkgcache, 387, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(2, __pyx_n_s_pdb, __pyx_n_s_db); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 396, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_pkgcache, 396, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 396, __pyx_L1_error)
 
-  /* "alpm.pyx":394
+  /* "alpm.pyx":403
  *         return to_capsule(alpm_db_get_pkgcache(db))
  * 
  * def db_get_group(object pdb, object pname):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  *     cdef bytes name
  */
-  __pyx_tuple__21 = PyTuple_Pack(4, __pyx_n_s_pdb, __pyx_n_s_pname, __pyx_n_s_db, __pyx_n_s_name); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 394, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_group, 394, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __pyx_tuple__23 = PyTuple_Pack(4, __pyx_n_s_pdb, __pyx_n_s_pname, __pyx_n_s_db, __pyx_n_s_name); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_get_group, 403, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 403, __pyx_L1_error)
 
-  /* "alpm.pyx":403
+  /* "alpm.pyx":412
  *         return to_capsule(alpm_db_get_group(db, name))
  * 
  * def db_find_provider(object pname, int local):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_tuple__23 = PyTuple_Pack(3, __pyx_n_s_pname, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 403, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_find_provider, 403, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __pyx_tuple__25 = PyTuple_Pack(3, __pyx_n_s_pname, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_find_provider, 412, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 412, __pyx_L1_error)
 
-  /* "alpm.pyx":408
+  /* "alpm.pyx":417
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))
  * 
  * def db_find_replacer(object pname, int local):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_tuple__25 = PyTuple_Pack(3, __pyx_n_s_pname, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 408, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_find_replacer, 408, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 408, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(3, __pyx_n_s_pname, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_db_find_replacer, 417, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 417, __pyx_L1_error)
 
-  /* "alpm.pyx":413
+  /* "alpm.pyx":422
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))
  * 
  * def option_set_arch(object parch):             # <<<<<<<<<<<<<<
  *     cdef bytes arch
  * 
  */
-  __pyx_tuple__27 = PyTuple_Pack(2, __pyx_n_s_parch, __pyx_n_s_arch); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 413, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_set_arch, 413, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __pyx_tuple__29 = PyTuple_Pack(2, __pyx_n_s_parch, __pyx_n_s_arch); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_set_arch, 422, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 422, __pyx_L1_error)
 
-  /* "alpm.pyx":421
+  /* "alpm.pyx":430
  *     return -1
  * 
  * def option_get_logfile():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  */
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_logfile, 421, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 421, __pyx_L1_error)
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_logfile, 430, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 430, __pyx_L1_error)
 
-  /* "alpm.pyx":425
+  /* "alpm.pyx":434
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  * 
  * def option_set_logfile(object plogfile):             # <<<<<<<<<<<<<<
  *     cdef bytes logfile = to_bytes(plogfile, fs_encoding, fs_errors)
  * 
  */
-  __pyx_tuple__30 = PyTuple_Pack(2, __pyx_n_s_plogfile, __pyx_n_s_logfile); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 425, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__30);
-  __Pyx_GIVEREF(__pyx_tuple__30);
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_set_logfile, 425, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 425, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(2, __pyx_n_s_plogfile, __pyx_n_s_logfile); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 434, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_set_logfile, 434, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 434, __pyx_L1_error)
 
-  /* "alpm.pyx":432
+  /* "alpm.pyx":441
  *     return -1
  * 
  * def option_get_cachedirs():             # <<<<<<<<<<<<<<
  *     cdef list cachedirs = []
  * 
  */
-  __pyx_tuple__32 = PyTuple_Pack(2, __pyx_n_s_cachedirs, __pyx_n_s_node); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 432, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__32);
-  __Pyx_GIVEREF(__pyx_tuple__32);
-  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(0, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_cachedirs, 432, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(2, __pyx_n_s_cachedirs, __pyx_n_s_node); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(0, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_cachedirs, 441, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 441, __pyx_L1_error)
 
-  /* "alpm.pyx":442
+  /* "alpm.pyx":451
  *     return cachedirs
  * 
  * def option_add_cachedir(object pcachedir):             # <<<<<<<<<<<<<<
  *     cdef bytes cachedir = to_bytes(pcachedir, fs_encoding, fs_errors)
  * 
  */
-  __pyx_tuple__34 = PyTuple_Pack(2, __pyx_n_s_pcachedir, __pyx_n_s_cachedir); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 442, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__34);
-  __Pyx_GIVEREF(__pyx_tuple__34);
-  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_add_cachedir, 442, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __pyx_tuple__36 = PyTuple_Pack(2, __pyx_n_s_pcachedir, __pyx_n_s_cachedir); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_add_cachedir, 451, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 451, __pyx_L1_error)
 
-  /* "alpm.pyx":449
+  /* "alpm.pyx":458
  *     return -1
  * 
  * def option_get_syncdb(object ptarget):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  *     cdef alpm_db_t *db
  */
-  __pyx_tuple__36 = PyTuple_Pack(5, __pyx_n_s_ptarget, __pyx_n_s_node, __pyx_n_s_db, __pyx_n_s_name, __pyx_n_s_target); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 449, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
-  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(1, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_syncdb, 449, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __pyx_tuple__38 = PyTuple_Pack(5, __pyx_n_s_ptarget, __pyx_n_s_node, __pyx_n_s_db, __pyx_n_s_name, __pyx_n_s_target); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(1, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_option_get_syncdb, 458, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 458, __pyx_L1_error)
 
-  /* "alpm.pyx":466
+  /* "alpm.pyx":475
  *             node = alpm_list_next(node)
  * 
  * def group_get_name(object pgroup):             # <<<<<<<<<<<<<<
  *     cdef alpm_group_t *group
  * 
  */
-  __pyx_tuple__38 = PyTuple_Pack(2, __pyx_n_s_pgroup, __pyx_n_s_group); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 466, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__38);
-  __Pyx_GIVEREF(__pyx_tuple__38);
-  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_group_get_name, 466, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __pyx_tuple__40 = PyTuple_Pack(2, __pyx_n_s_pgroup, __pyx_n_s_group); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_group_get_name, 475, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 475, __pyx_L1_error)
 
-  /* "alpm.pyx":473
+  /* "alpm.pyx":482
  *         return to_unicode(group.name)
  * 
  * def group_get_pkgs(object pgroup):             # <<<<<<<<<<<<<<
  *     cdef alpm_group_t *group
  * 
  */
-  __pyx_tuple__40 = PyTuple_Pack(2, __pyx_n_s_pgroup, __pyx_n_s_group); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 473, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__40);
-  __Pyx_GIVEREF(__pyx_tuple__40);
-  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_group_get_pkgs, 473, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_tuple__42 = PyTuple_Pack(2, __pyx_n_s_pgroup, __pyx_n_s_group); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 482, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_group_get_pkgs, 482, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 482, __pyx_L1_error)
 
-  /* "alpm.pyx":480
+  /* "alpm.pyx":489
  *         return to_capsule(group.packages)
  * 
  * def dep_compute_string(object pdep):             # <<<<<<<<<<<<<<
  *     cdef alpm_depend_t *dep
  *     cdef char *cstr
  */
-  __pyx_tuple__42 = PyTuple_Pack(3, __pyx_n_s_pdep, __pyx_n_s_dep, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 480, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__42);
-  __Pyx_GIVEREF(__pyx_tuple__42);
-  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_dep_compute_string, 480, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __pyx_tuple__44 = PyTuple_Pack(3, __pyx_n_s_pdep, __pyx_n_s_dep, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 489, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_dep_compute_string, 489, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 489, __pyx_L1_error)
 
-  /* "alpm.pyx":489
+  /* "alpm.pyx":498
  *         return to_unicode(cstr, True)
  * 
  * def pkg_get_conflicts(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__44 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 489, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__44);
-  __Pyx_GIVEREF(__pyx_tuple__44);
-  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_conflicts, 489, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 489, __pyx_L1_error)
+  __pyx_tuple__46 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 498, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_conflicts, 498, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 498, __pyx_L1_error)
 
-  /* "alpm.pyx":496
+  /* "alpm.pyx":505
  *         return to_capsule(create_dep_list(alpm_pkg_get_conflicts(pkg)))
  * 
  * def pkg_get_provides(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__46 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 496, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__46);
-  __Pyx_GIVEREF(__pyx_tuple__46);
-  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_provides, 496, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __pyx_tuple__48 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 505, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_provides, 505, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 505, __pyx_L1_error)
 
-  /* "alpm.pyx":503
+  /* "alpm.pyx":512
  *         return to_capsule(create_dep_list(alpm_pkg_get_provides(pkg)))
  * 
  * def pkg_get_replaces(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__48 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 503, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__48);
-  __Pyx_GIVEREF(__pyx_tuple__48);
-  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_replaces, 503, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 503, __pyx_L1_error)
+  __pyx_tuple__50 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_replaces, 512, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 512, __pyx_L1_error)
 
-  /* "alpm.pyx":510
+  /* "alpm.pyx":519
  *         return to_capsule(create_dep_list(alpm_pkg_get_replaces(pkg)))
  * 
  * def pkg_get_name(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__50 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 510, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__50);
-  __Pyx_GIVEREF(__pyx_tuple__50);
-  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_name, 510, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __pyx_tuple__52 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
+  __pyx_codeobj__53 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__52, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_name, 519, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__53)) __PYX_ERR(0, 519, __pyx_L1_error)
 
-  /* "alpm.pyx":517
+  /* "alpm.pyx":526
  *         return to_unicode(<char *>alpm_pkg_get_name(pkg))
  * 
  * def pkg_get_arch(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__52 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 517, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__52);
-  __Pyx_GIVEREF(__pyx_tuple__52);
-  __pyx_codeobj__53 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__52, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_arch, 517, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__53)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __pyx_tuple__54 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_arch, 526, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 526, __pyx_L1_error)
 
-  /* "alpm.pyx":524
+  /* "alpm.pyx":533
  *         return to_unicode(<char *>alpm_pkg_get_arch(pkg))
  * 
  * def pkg_get_desc(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__54 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 524, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__54);
-  __Pyx_GIVEREF(__pyx_tuple__54);
-  __pyx_codeobj__55 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__54, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_desc, 524, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__55)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __pyx_tuple__56 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__56);
+  __Pyx_GIVEREF(__pyx_tuple__56);
+  __pyx_codeobj__57 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__56, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_desc, 533, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__57)) __PYX_ERR(0, 533, __pyx_L1_error)
 
-  /* "alpm.pyx":531
+  /* "alpm.pyx":540
  *         return to_unicode(<char *>alpm_pkg_get_desc(pkg))
  * 
  * def pkg_get_url(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__56 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 531, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__56);
-  __Pyx_GIVEREF(__pyx_tuple__56);
-  __pyx_codeobj__57 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__56, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_url, 531, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__57)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __pyx_tuple__58 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__58)) __PYX_ERR(0, 540, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__58);
+  __Pyx_GIVEREF(__pyx_tuple__58);
+  __pyx_codeobj__59 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__58, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_url, 540, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__59)) __PYX_ERR(0, 540, __pyx_L1_error)
 
-  /* "alpm.pyx":538
+  /* "alpm.pyx":547
  *         return to_unicode(<char *>alpm_pkg_get_url(pkg))
  * 
  * def pkg_get_version(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__58 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__58)) __PYX_ERR(0, 538, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__58);
-  __Pyx_GIVEREF(__pyx_tuple__58);
-  __pyx_codeobj__59 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__58, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_version, 538, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__59)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __pyx_tuple__60 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__60);
+  __Pyx_GIVEREF(__pyx_tuple__60);
+  __pyx_codeobj__61 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__60, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_version, 547, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__61)) __PYX_ERR(0, 547, __pyx_L1_error)
 
-  /* "alpm.pyx":545
+  /* "alpm.pyx":554
  *         return to_unicode(<char *>alpm_pkg_get_version(pkg))
  * 
  * def pkg_get_isize(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__60 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 545, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__60);
-  __Pyx_GIVEREF(__pyx_tuple__60);
-  __pyx_codeobj__61 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__60, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_isize, 545, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__61)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __pyx_tuple__62 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__62)) __PYX_ERR(0, 554, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__62);
+  __Pyx_GIVEREF(__pyx_tuple__62);
+  __pyx_codeobj__63 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_isize, 554, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__63)) __PYX_ERR(0, 554, __pyx_L1_error)
 
-  /* "alpm.pyx":552
+  /* "alpm.pyx":561
  *         return alpm_pkg_get_isize(pkg)
  * 
  * def pkg_get_size(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__62 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__62)) __PYX_ERR(0, 552, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__62);
-  __Pyx_GIVEREF(__pyx_tuple__62);
-  __pyx_codeobj__63 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_size, 552, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__63)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __pyx_tuple__64 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__64)) __PYX_ERR(0, 561, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__64);
+  __Pyx_GIVEREF(__pyx_tuple__64);
+  __pyx_codeobj__65 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_size, 561, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__65)) __PYX_ERR(0, 561, __pyx_L1_error)
 
-  /* "alpm.pyx":559
+  /* "alpm.pyx":568
  *         return alpm_pkg_get_size(pkg)
  * 
  * def pkg_get_builddate(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__64 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__64)) __PYX_ERR(0, 559, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__64);
-  __Pyx_GIVEREF(__pyx_tuple__64);
-  __pyx_codeobj__65 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_builddate, 559, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__65)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __pyx_tuple__66 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 568, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__66);
+  __Pyx_GIVEREF(__pyx_tuple__66);
+  __pyx_codeobj__67 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__66, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_builddate, 568, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__67)) __PYX_ERR(0, 568, __pyx_L1_error)
 
-  /* "alpm.pyx":566
+  /* "alpm.pyx":575
  *         return alpm_pkg_get_builddate(pkg)
  * 
  * def pkg_get_installdate(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__66 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 566, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__66);
-  __Pyx_GIVEREF(__pyx_tuple__66);
-  __pyx_codeobj__67 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__66, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_installdate, 566, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__67)) __PYX_ERR(0, 566, __pyx_L1_error)
+  __pyx_tuple__68 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 575, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__68);
+  __Pyx_GIVEREF(__pyx_tuple__68);
+  __pyx_codeobj__69 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__68, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_installdate, 575, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__69)) __PYX_ERR(0, 575, __pyx_L1_error)
 
-  /* "alpm.pyx":573
+  /* "alpm.pyx":582
  *         return alpm_pkg_get_installdate(pkg)
  * 
  * def pkg_has_scriptlet(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__68 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 573, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__68);
-  __Pyx_GIVEREF(__pyx_tuple__68);
-  __pyx_codeobj__69 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__68, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_has_scriptlet, 573, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__69)) __PYX_ERR(0, 573, __pyx_L1_error)
+  __pyx_tuple__70 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 582, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__70);
+  __Pyx_GIVEREF(__pyx_tuple__70);
+  __pyx_codeobj__71 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_has_scriptlet, 582, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__71)) __PYX_ERR(0, 582, __pyx_L1_error)
 
-  /* "alpm.pyx":580
+  /* "alpm.pyx":589
  *         return bool(alpm_pkg_has_scriptlet(pkg))
  * 
  * def pkg_get_backup(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__70 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 580, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__70);
-  __Pyx_GIVEREF(__pyx_tuple__70);
-  __pyx_codeobj__71 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_backup, 580, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__71)) __PYX_ERR(0, 580, __pyx_L1_error)
+  __pyx_tuple__72 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 589, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__72);
+  __Pyx_GIVEREF(__pyx_tuple__72);
+  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_backup, 589, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 589, __pyx_L1_error)
 
-  /* "alpm.pyx":587
+  /* "alpm.pyx":596
  *         return to_capsule(alpm_pkg_get_backup(pkg))
  * 
  * def pkg_compute_requiredby(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__72 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 587, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__72);
-  __Pyx_GIVEREF(__pyx_tuple__72);
-  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_compute_requiredby, 587, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __pyx_tuple__74 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 596, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__74);
+  __Pyx_GIVEREF(__pyx_tuple__74);
+  __pyx_codeobj__75 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__74, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_compute_requiredby, 596, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__75)) __PYX_ERR(0, 596, __pyx_L1_error)
 
-  /* "alpm.pyx":594
+  /* "alpm.pyx":603
  *         return to_capsule(alpm_pkg_compute_requiredby(pkg))
  * 
  * def pkg_compute_optionalfor(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__74 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 594, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__74);
-  __Pyx_GIVEREF(__pyx_tuple__74);
-  __pyx_codeobj__75 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__74, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_compute_optionalfor, 594, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__75)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __pyx_tuple__76 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__76);
+  __Pyx_GIVEREF(__pyx_tuple__76);
+  __pyx_codeobj__77 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__76, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_compute_optionalfor, 603, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__77)) __PYX_ERR(0, 603, __pyx_L1_error)
 
-  /* "alpm.pyx":601
+  /* "alpm.pyx":610
  *         return to_capsule(alpm_pkg_compute_optionalfor(pkg))
  * 
  * def pkg_get_depends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__76 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(0, 601, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__76);
-  __Pyx_GIVEREF(__pyx_tuple__76);
-  __pyx_codeobj__77 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__76, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_depends, 601, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__77)) __PYX_ERR(0, 601, __pyx_L1_error)
+  __pyx_tuple__78 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(0, 610, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__78);
+  __Pyx_GIVEREF(__pyx_tuple__78);
+  __pyx_codeobj__79 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__78, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_depends, 610, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__79)) __PYX_ERR(0, 610, __pyx_L1_error)
 
-  /* "alpm.pyx":608
+  /* "alpm.pyx":617
  *         return to_capsule(alpm_pkg_get_depends(pkg))
  * 
  * def pkg_get_groups(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__78 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(0, 608, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__78);
-  __Pyx_GIVEREF(__pyx_tuple__78);
-  __pyx_codeobj__79 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__78, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_groups, 608, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__79)) __PYX_ERR(0, 608, __pyx_L1_error)
+  __pyx_tuple__80 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(0, 617, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__80);
+  __Pyx_GIVEREF(__pyx_tuple__80);
+  __pyx_codeobj__81 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__80, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_groups, 617, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__81)) __PYX_ERR(0, 617, __pyx_L1_error)
 
-  /* "alpm.pyx":615
+  /* "alpm.pyx":624
  *         return to_capsule(alpm_pkg_get_groups(pkg))
  * 
  * def pkg_get_licenses(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__80 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(0, 615, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__80);
-  __Pyx_GIVEREF(__pyx_tuple__80);
-  __pyx_codeobj__81 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__80, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_licenses, 615, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__81)) __PYX_ERR(0, 615, __pyx_L1_error)
+  __pyx_tuple__82 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(0, 624, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__82);
+  __Pyx_GIVEREF(__pyx_tuple__82);
+  __pyx_codeobj__83 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__82, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_licenses, 624, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__83)) __PYX_ERR(0, 624, __pyx_L1_error)
 
-  /* "alpm.pyx":622
+  /* "alpm.pyx":631
  *         return to_capsule(alpm_pkg_get_licenses(pkg))
  * 
  * def pkg_get_optdepends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__82 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(0, 622, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__82);
-  __Pyx_GIVEREF(__pyx_tuple__82);
-  __pyx_codeobj__83 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__82, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_optdepends, 622, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__83)) __PYX_ERR(0, 622, __pyx_L1_error)
+  __pyx_tuple__84 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__84)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__84);
+  __Pyx_GIVEREF(__pyx_tuple__84);
+  __pyx_codeobj__85 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__84, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_optdepends, 631, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__85)) __PYX_ERR(0, 631, __pyx_L1_error)
 
-  /* "alpm.pyx":635
+  /* "alpm.pyx":644
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  * 
  * def pkg_get_validation(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__84 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__84)) __PYX_ERR(0, 635, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__84);
-  __Pyx_GIVEREF(__pyx_tuple__84);
-  __pyx_codeobj__85 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__84, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_validation, 635, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__85)) __PYX_ERR(0, 635, __pyx_L1_error)
+  __pyx_tuple__86 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__86)) __PYX_ERR(0, 644, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__86);
+  __Pyx_GIVEREF(__pyx_tuple__86);
+  __pyx_codeobj__87 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__86, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_validation, 644, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__87)) __PYX_ERR(0, 644, __pyx_L1_error)
 
-  /* "alpm.pyx":642
+  /* "alpm.pyx":651
  *         return <int>alpm_pkg_get_validation(pkg)
  * 
  * def pkg_vercmp(object pa, object pb):             # <<<<<<<<<<<<<<
  *     cdef bytes a = to_bytes(pa)
  *     cdef bytes b = to_bytes(pb)
  */
-  __pyx_tuple__86 = PyTuple_Pack(4, __pyx_n_s_pa, __pyx_n_s_pb, __pyx_n_s_a, __pyx_n_s_b); if (unlikely(!__pyx_tuple__86)) __PYX_ERR(0, 642, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__86);
-  __Pyx_GIVEREF(__pyx_tuple__86);
-  __pyx_codeobj__87 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__86, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_vercmp, 642, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__87)) __PYX_ERR(0, 642, __pyx_L1_error)
+  __pyx_tuple__88 = PyTuple_Pack(4, __pyx_n_s_pa, __pyx_n_s_pb, __pyx_n_s_a, __pyx_n_s_b); if (unlikely(!__pyx_tuple__88)) __PYX_ERR(0, 651, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__88);
+  __Pyx_GIVEREF(__pyx_tuple__88);
+  __pyx_codeobj__89 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__88, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_vercmp, 651, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__89)) __PYX_ERR(0, 651, __pyx_L1_error)
 
-  /* "alpm.pyx":648
+  /* "alpm.pyx":657
  *     return alpm_pkg_vercmp(a, b)
  * 
  * def pkg_load(object ppath, int full):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg = NULL
  *     cdef bytes path
  */
-  __pyx_tuple__88 = PyTuple_Pack(4, __pyx_n_s_ppath, __pyx_n_s_full, __pyx_n_s_pkg, __pyx_n_s_path); if (unlikely(!__pyx_tuple__88)) __PYX_ERR(0, 648, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__88);
-  __Pyx_GIVEREF(__pyx_tuple__88);
-  __pyx_codeobj__89 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__88, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_load, 648, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__89)) __PYX_ERR(0, 648, __pyx_L1_error)
+  __pyx_tuple__90 = PyTuple_Pack(4, __pyx_n_s_ppath, __pyx_n_s_full, __pyx_n_s_pkg, __pyx_n_s_path); if (unlikely(!__pyx_tuple__90)) __PYX_ERR(0, 657, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__90);
+  __Pyx_GIVEREF(__pyx_tuple__90);
+  __pyx_codeobj__91 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__90, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_load, 657, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__91)) __PYX_ERR(0, 657, __pyx_L1_error)
 
-  /* "alpm.pyx":657
+  /* "alpm.pyx":666
  *         return to_capsule(pkg)
  * 
  * def pkg_get_repository(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_tuple__90 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__90)) __PYX_ERR(0, 657, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__90);
-  __Pyx_GIVEREF(__pyx_tuple__90);
-  __pyx_codeobj__91 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__90, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_repository, 657, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__91)) __PYX_ERR(0, 657, __pyx_L1_error)
+  __pyx_tuple__92 = PyTuple_Pack(2, __pyx_n_s_ppkg, __pyx_n_s_pkg); if (unlikely(!__pyx_tuple__92)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__92);
+  __Pyx_GIVEREF(__pyx_tuple__92);
+  __pyx_codeobj__93 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__92, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_repository, 666, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__93)) __PYX_ERR(0, 666, __pyx_L1_error)
 
-  /* "alpm.pyx":664
+  /* "alpm.pyx":673
  *         return to_unicode(<char *>find_pkg_repository(pkg))
  * 
  * def pkg_get_fullname(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *fullname
  */
-  __pyx_tuple__92 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_fullname); if (unlikely(!__pyx_tuple__92)) __PYX_ERR(0, 664, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__92);
-  __Pyx_GIVEREF(__pyx_tuple__92);
-  __pyx_codeobj__93 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__92, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_fullname, 664, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__93)) __PYX_ERR(0, 664, __pyx_L1_error)
+  __pyx_tuple__94 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_fullname); if (unlikely(!__pyx_tuple__94)) __PYX_ERR(0, 673, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__94);
+  __Pyx_GIVEREF(__pyx_tuple__94);
+  __pyx_codeobj__95 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__94, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_fullname, 673, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__95)) __PYX_ERR(0, 673, __pyx_L1_error)
 
-  /* "alpm.pyx":675
+  /* "alpm.pyx":684
  *             return to_unicode(fullname, True)
  * 
  * def pkg_get_packager(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef const_char *packager
  */
-  __pyx_tuple__94 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_packager); if (unlikely(!__pyx_tuple__94)) __PYX_ERR(0, 675, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__94);
-  __Pyx_GIVEREF(__pyx_tuple__94);
-  __pyx_codeobj__95 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__94, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_packager, 675, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__95)) __PYX_ERR(0, 675, __pyx_L1_error)
+  __pyx_tuple__96 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_packager); if (unlikely(!__pyx_tuple__96)) __PYX_ERR(0, 684, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__96);
+  __Pyx_GIVEREF(__pyx_tuple__96);
+  __pyx_codeobj__97 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__96, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_packager, 684, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__97)) __PYX_ERR(0, 684, __pyx_L1_error)
 
-  /* "alpm.pyx":698
+  /* "alpm.pyx":707
  * PKG_STATUS_MAX = STATUS_MAX
  * 
  * def pkg_get_status(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef int status = STATUS_NULL
  *     cdef alpm_pkgreason_t reason
  */
-  __pyx_tuple__96 = PyTuple_Pack(7, __pyx_n_s_ppkg, __pyx_n_s_status, __pyx_n_s_reason, __pyx_n_s_db, __pyx_n_s_pkg, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__96)) __PYX_ERR(0, 698, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__96);
-  __Pyx_GIVEREF(__pyx_tuple__96);
-  __pyx_codeobj__97 = (PyObject*)__Pyx_PyCode_New(1, 0, 7, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__96, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_status, 698, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__97)) __PYX_ERR(0, 698, __pyx_L1_error)
+  __pyx_tuple__98 = PyTuple_Pack(7, __pyx_n_s_ppkg, __pyx_n_s_status, __pyx_n_s_reason, __pyx_n_s_db, __pyx_n_s_pkg, __pyx_n_s_local, __pyx_n_s_name); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(0, 707, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__98);
+  __Pyx_GIVEREF(__pyx_tuple__98);
+  __pyx_codeobj__99 = (PyObject*)__Pyx_PyCode_New(1, 0, 7, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__98, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_get_status, 707, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__99)) __PYX_ERR(0, 707, __pyx_L1_error)
 
-  /* "alpm.pyx":730
+  /* "alpm.pyx":739
  *     return status
  * 
  * def pkg_check_update(object pname, object pversion):             # <<<<<<<<<<<<<<
  *     cdef int status = STATUS_NULL
  *     cdef alpm_db_t *db
  */
-  __pyx_tuple__98 = PyTuple_Pack(8, __pyx_n_s_pname, __pyx_n_s_pversion, __pyx_n_s_status, __pyx_n_s_db, __pyx_n_s_local, __pyx_n_s_current, __pyx_n_s_name, __pyx_n_s_version); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(0, 730, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__98);
-  __Pyx_GIVEREF(__pyx_tuple__98);
-  __pyx_codeobj__99 = (PyObject*)__Pyx_PyCode_New(2, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__98, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_check_update, 730, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__99)) __PYX_ERR(0, 730, __pyx_L1_error)
+  __pyx_tuple__100 = PyTuple_Pack(8, __pyx_n_s_pname, __pyx_n_s_pversion, __pyx_n_s_status, __pyx_n_s_db, __pyx_n_s_local, __pyx_n_s_current, __pyx_n_s_name, __pyx_n_s_version); if (unlikely(!__pyx_tuple__100)) __PYX_ERR(0, 739, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__100);
+  __Pyx_GIVEREF(__pyx_tuple__100);
+  __pyx_codeobj__101 = (PyObject*)__Pyx_PyCode_New(2, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__100, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_check_update, 739, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__101)) __PYX_ERR(0, 739, __pyx_L1_error)
 
-  /* "alpm.pyx":759
+  /* "alpm.pyx":768
  * PKG_VCS_DARCS = VCS_DARCS
  * 
  * def pkg_check_vcs(object pname):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_tuple__100 = PyTuple_Pack(2, __pyx_n_s_pname, __pyx_n_s_name); if (unlikely(!__pyx_tuple__100)) __PYX_ERR(0, 759, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__100);
-  __Pyx_GIVEREF(__pyx_tuple__100);
-  __pyx_codeobj__101 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__100, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_check_vcs, 759, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__101)) __PYX_ERR(0, 759, __pyx_L1_error)
+  __pyx_tuple__102 = PyTuple_Pack(2, __pyx_n_s_pname, __pyx_n_s_name); if (unlikely(!__pyx_tuple__102)) __PYX_ERR(0, 768, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__102);
+  __Pyx_GIVEREF(__pyx_tuple__102);
+  __pyx_codeobj__103 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__102, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_check_vcs, 768, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__103)) __PYX_ERR(0, 768, __pyx_L1_error)
 
-  /* "alpm.pyx":764
+  /* "alpm.pyx":773
  *     return check_vcs(name)
  * 
  * def pkg_join_files(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef alpm_filelist_t *files
  */
-  __pyx_tuple__102 = PyTuple_Pack(8, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_files, __pyx_n_s_name, __pyx_n_s_cstr, __pyx_n_s_i, __pyx_n_s_pos, __pyx_n_s_length); if (unlikely(!__pyx_tuple__102)) __PYX_ERR(0, 764, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__102);
-  __Pyx_GIVEREF(__pyx_tuple__102);
-  __pyx_codeobj__103 = (PyObject*)__Pyx_PyCode_New(1, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__102, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_files, 764, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__103)) __PYX_ERR(0, 764, __pyx_L1_error)
-
-  /* "alpm.pyx":796
- *                     return to_unicode(cstr, True)
- * 
- * def pkg_join_depends(object ppkg):             # <<<<<<<<<<<<<<
- *     cdef alpm_pkg_t *pkg
- *     cdef char *cstr
- */
-  __pyx_tuple__104 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__104)) __PYX_ERR(0, 796, __pyx_L1_error)
+  __pyx_tuple__104 = PyTuple_Pack(8, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_files, __pyx_n_s_name, __pyx_n_s_cstr, __pyx_n_s_i, __pyx_n_s_pos, __pyx_n_s_length); if (unlikely(!__pyx_tuple__104)) __PYX_ERR(0, 773, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__104);
   __Pyx_GIVEREF(__pyx_tuple__104);
-  __pyx_codeobj__105 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__104, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_depends, 796, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__105)) __PYX_ERR(0, 796, __pyx_L1_error)
+  __pyx_codeobj__105 = (PyObject*)__Pyx_PyCode_New(1, 0, 8, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__104, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_files, 773, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__105)) __PYX_ERR(0, 773, __pyx_L1_error)
 
   /* "alpm.pyx":805
- *         return to_unicode(cstr, True)
+ *                     return to_unicode(cstr, True)
  * 
- * def pkg_join_provides(object ppkg):             # <<<<<<<<<<<<<<
+ * def pkg_join_depends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
   __pyx_tuple__106 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__106)) __PYX_ERR(0, 805, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__106);
   __Pyx_GIVEREF(__pyx_tuple__106);
-  __pyx_codeobj__107 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__106, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_provides, 805, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__107)) __PYX_ERR(0, 805, __pyx_L1_error)
+  __pyx_codeobj__107 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__106, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_depends, 805, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__107)) __PYX_ERR(0, 805, __pyx_L1_error)
 
   /* "alpm.pyx":814
  *         return to_unicode(cstr, True)
  * 
- * def pkg_join_replaces(object ppkg):             # <<<<<<<<<<<<<<
+ * def pkg_join_provides(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
   __pyx_tuple__108 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__108)) __PYX_ERR(0, 814, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__108);
   __Pyx_GIVEREF(__pyx_tuple__108);
-  __pyx_codeobj__109 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__108, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_replaces, 814, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__109)) __PYX_ERR(0, 814, __pyx_L1_error)
+  __pyx_codeobj__109 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__108, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_provides, 814, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__109)) __PYX_ERR(0, 814, __pyx_L1_error)
 
   /* "alpm.pyx":823
  *         return to_unicode(cstr, True)
  * 
- * def pkg_join_optdepends(object ppkg):             # <<<<<<<<<<<<<<
+ * def pkg_join_replaces(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
   __pyx_tuple__110 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__110)) __PYX_ERR(0, 823, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__110);
   __Pyx_GIVEREF(__pyx_tuple__110);
-  __pyx_codeobj__111 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__110, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_optdepends, 823, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__111)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __pyx_codeobj__111 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__110, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_replaces, 823, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__111)) __PYX_ERR(0, 823, __pyx_L1_error)
 
   /* "alpm.pyx":832
  *         return to_unicode(cstr, True)
  * 
- * def list_join_str(object plist, object psep):             # <<<<<<<<<<<<<<
- *     cdef alpm_list_t *list
+ * def pkg_join_optdepends(object ppkg):             # <<<<<<<<<<<<<<
+ *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
-  __pyx_tuple__112 = PyTuple_Pack(5, __pyx_n_s_plist, __pyx_n_s_psep, __pyx_n_s_list, __pyx_n_s_cstr, __pyx_n_s_sep); if (unlikely(!__pyx_tuple__112)) __PYX_ERR(0, 832, __pyx_L1_error)
+  __pyx_tuple__112 = PyTuple_Pack(3, __pyx_n_s_ppkg, __pyx_n_s_pkg, __pyx_n_s_cstr); if (unlikely(!__pyx_tuple__112)) __PYX_ERR(0, 832, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__112);
   __Pyx_GIVEREF(__pyx_tuple__112);
-  __pyx_codeobj__113 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__112, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_join_str, 832, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__113)) __PYX_ERR(0, 832, __pyx_L1_error)
+  __pyx_codeobj__113 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__112, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_pkg_join_optdepends, 832, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__113)) __PYX_ERR(0, 832, __pyx_L1_error)
 
-  /* "alpm.pyx":843
+  /* "alpm.pyx":841
  *         return to_unicode(cstr, True)
  * 
- * def list_next(object plist):             # <<<<<<<<<<<<<<
+ * def list_join_str(object plist, object psep):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *list
- * 
+ *     cdef char *cstr
  */
-  __pyx_tuple__114 = PyTuple_Pack(2, __pyx_n_s_plist, __pyx_n_s_list); if (unlikely(!__pyx_tuple__114)) __PYX_ERR(0, 843, __pyx_L1_error)
+  __pyx_tuple__114 = PyTuple_Pack(5, __pyx_n_s_plist, __pyx_n_s_psep, __pyx_n_s_list, __pyx_n_s_cstr, __pyx_n_s_sep); if (unlikely(!__pyx_tuple__114)) __PYX_ERR(0, 841, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__114);
   __Pyx_GIVEREF(__pyx_tuple__114);
-  __pyx_codeobj__115 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__114, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_next, 843, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__115)) __PYX_ERR(0, 843, __pyx_L1_error)
+  __pyx_codeobj__115 = (PyObject*)__Pyx_PyCode_New(2, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__114, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_join_str, 841, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__115)) __PYX_ERR(0, 841, __pyx_L1_error)
 
-  /* "alpm.pyx":850
+  /* "alpm.pyx":852
+ *         return to_unicode(cstr, True)
+ * 
+ * def list_next(object plist):             # <<<<<<<<<<<<<<
+ *     cdef alpm_list_t *list
+ * 
+ */
+  __pyx_tuple__116 = PyTuple_Pack(2, __pyx_n_s_plist, __pyx_n_s_list); if (unlikely(!__pyx_tuple__116)) __PYX_ERR(0, 852, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__116);
+  __Pyx_GIVEREF(__pyx_tuple__116);
+  __pyx_codeobj__117 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__116, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_next, 852, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__117)) __PYX_ERR(0, 852, __pyx_L1_error)
+
+  /* "alpm.pyx":859
  *         return to_capsule(alpm_list_next(list))
  * 
  * def list_get_str(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_tuple__116 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__116)) __PYX_ERR(0, 850, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__116);
-  __Pyx_GIVEREF(__pyx_tuple__116);
-  __pyx_codeobj__117 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__116, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_str, 850, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__117)) __PYX_ERR(0, 850, __pyx_L1_error)
+  __pyx_tuple__118 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__118)) __PYX_ERR(0, 859, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__118);
+  __Pyx_GIVEREF(__pyx_tuple__118);
+  __pyx_codeobj__119 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__118, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_str, 859, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__119)) __PYX_ERR(0, 859, __pyx_L1_error)
 
-  /* "alpm.pyx":857
+  /* "alpm.pyx":866
  *         return to_unicode(<char *>node.data)
  * 
  * def list_get_db(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_tuple__118 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__118)) __PYX_ERR(0, 857, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__118);
-  __Pyx_GIVEREF(__pyx_tuple__118);
-  __pyx_codeobj__119 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__118, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_db, 857, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__119)) __PYX_ERR(0, 857, __pyx_L1_error)
+  __pyx_tuple__120 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__120)) __PYX_ERR(0, 866, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__120);
+  __Pyx_GIVEREF(__pyx_tuple__120);
+  __pyx_codeobj__121 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__120, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_db, 866, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__121)) __PYX_ERR(0, 866, __pyx_L1_error)
 
-  /* "alpm.pyx":864
+  /* "alpm.pyx":873
  *         return to_capsule(<alpm_db_t *>node.data)
  * 
  * def list_get_group(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_tuple__120 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__120)) __PYX_ERR(0, 864, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__120);
-  __Pyx_GIVEREF(__pyx_tuple__120);
-  __pyx_codeobj__121 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__120, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_group, 864, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__121)) __PYX_ERR(0, 864, __pyx_L1_error)
+  __pyx_tuple__122 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__122)) __PYX_ERR(0, 873, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__122);
+  __Pyx_GIVEREF(__pyx_tuple__122);
+  __pyx_codeobj__123 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__122, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_group, 873, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__123)) __PYX_ERR(0, 873, __pyx_L1_error)
 
-  /* "alpm.pyx":871
+  /* "alpm.pyx":880
  *         return to_capsule(<alpm_group_t *>node.data)
  * 
  * def list_get_pkg(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_tuple__122 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__122)) __PYX_ERR(0, 871, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__122);
-  __Pyx_GIVEREF(__pyx_tuple__122);
-  __pyx_codeobj__123 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__122, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_pkg, 871, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__123)) __PYX_ERR(0, 871, __pyx_L1_error)
+  __pyx_tuple__124 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__124)) __PYX_ERR(0, 880, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__124);
+  __Pyx_GIVEREF(__pyx_tuple__124);
+  __pyx_codeobj__125 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__124, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_pkg, 880, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__125)) __PYX_ERR(0, 880, __pyx_L1_error)
 
-  /* "alpm.pyx":878
+  /* "alpm.pyx":887
  *         return to_capsule(<alpm_pkg_t *>node.data)
  * 
  * def list_get_dep(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_tuple__124 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__124)) __PYX_ERR(0, 878, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__124);
-  __Pyx_GIVEREF(__pyx_tuple__124);
-  __pyx_codeobj__125 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__124, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_dep, 878, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__125)) __PYX_ERR(0, 878, __pyx_L1_error)
+  __pyx_tuple__126 = PyTuple_Pack(2, __pyx_n_s_pnode, __pyx_n_s_node); if (unlikely(!__pyx_tuple__126)) __PYX_ERR(0, 887, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__126);
+  __Pyx_GIVEREF(__pyx_tuple__126);
+  __pyx_codeobj__127 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__126, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_dep, 887, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__127)) __PYX_ERR(0, 887, __pyx_L1_error)
 
-  /* "alpm.pyx":891
+  /* "alpm.pyx":900
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  * 
  * def list_get_backup(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  *     cdef alpm_backup_t *backup
  */
-  __pyx_tuple__126 = PyTuple_Pack(6, __pyx_n_s_pnode, __pyx_n_s_node, __pyx_n_s_backup, __pyx_n_s_path, __pyx_n_s_md5sum, __pyx_n_s_status); if (unlikely(!__pyx_tuple__126)) __PYX_ERR(0, 891, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__126);
-  __Pyx_GIVEREF(__pyx_tuple__126);
-  __pyx_codeobj__127 = (PyObject*)__Pyx_PyCode_New(1, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__126, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_backup, 891, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__127)) __PYX_ERR(0, 891, __pyx_L1_error)
+  __pyx_tuple__128 = PyTuple_Pack(6, __pyx_n_s_pnode, __pyx_n_s_node, __pyx_n_s_backup, __pyx_n_s_path, __pyx_n_s_md5sum, __pyx_n_s_status); if (unlikely(!__pyx_tuple__128)) __PYX_ERR(0, 900, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__128);
+  __Pyx_GIVEREF(__pyx_tuple__128);
+  __pyx_codeobj__129 = (PyObject*)__Pyx_PyCode_New(1, 0, 6, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__128, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_home_baz_code_projects_pkgbrows, __pyx_n_s_list_get_backup, 900, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__129)) __PYX_ERR(0, 900, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -12900,7 +13021,7 @@ PyMODINIT_FUNC PyInit_alpm(void)
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "alpm.pyx":144
+  /* "alpm.pyx":145
  *     BACKUP_UNREADABLE = 4
  * 
  * cdef alpm_handle_t *handle = NULL             # <<<<<<<<<<<<<<
@@ -12909,7 +13030,7 @@ PyMODINIT_FUNC PyInit_alpm(void)
  */
   __pyx_v_4alpm_handle = NULL;
 
-  /* "alpm.pyx":145
+  /* "alpm.pyx":146
  * 
  * cdef alpm_handle_t *handle = NULL
  * cdef unicode fs_encoding = u'utf-8'             # <<<<<<<<<<<<<<
@@ -12921,7 +13042,7 @@ PyMODINIT_FUNC PyInit_alpm(void)
   __Pyx_DECREF_SET(__pyx_v_4alpm_fs_encoding, __pyx_kp_u_utf_8);
   __Pyx_GIVEREF(__pyx_kp_u_utf_8);
 
-  /* "alpm.pyx":146
+  /* "alpm.pyx":147
  * cdef alpm_handle_t *handle = NULL
  * cdef unicode fs_encoding = u'utf-8'
  * cdef unicode fs_errors = u'surrogateescape'             # <<<<<<<<<<<<<<
@@ -12933,1168 +13054,1180 @@ PyMODINIT_FUNC PyInit_alpm(void)
   __Pyx_DECREF_SET(__pyx_v_4alpm_fs_errors, __pyx_n_u_surrogateescape);
   __Pyx_GIVEREF(__pyx_n_u_surrogateescape);
 
-  /* "alpm.pyx":301
+  /* "alpm.pyx":302
  *     return VCS_NULL
  * 
  * def initialize(object proot, object pdbpath):             # <<<<<<<<<<<<<<
  *     global handle, fs_encoding
  *     cdef alpm_errno_t err
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_1initialize, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_1initialize, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_initialize, __pyx_t_1) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_initialize, __pyx_t_1) < 0) __PYX_ERR(0, 302, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":315
+  /* "alpm.pyx":316
  *     return 0
  * 
  * def release():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return alpm_release(handle)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_3release, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_3release, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_release, __pyx_t_1) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_release, __pyx_t_1) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":320
+  /* "alpm.pyx":321
  *     return -1
  * 
  * def version():             # <<<<<<<<<<<<<<
  *     return to_unicode(<char *>alpm_version())
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_5version, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_5version, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_version, __pyx_t_1) < 0) __PYX_ERR(0, 320, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_version, __pyx_t_1) < 0) __PYX_ERR(0, 321, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":323
+  /* "alpm.pyx":324
  *     return to_unicode(<char *>alpm_version())
  * 
  * def is_initialized():             # <<<<<<<<<<<<<<
  *     return handle is not NULL
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_7is_initialized, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_7is_initialized, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_initialized, __pyx_t_1) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_initialized, __pyx_t_1) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":326
+  /* "alpm.pyx":327
  *     return handle is not NULL
  * 
  * ERR_NOT_A_FILE = ALPM_ERR_NOT_A_FILE             # <<<<<<<<<<<<<<
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_errno_t(ALPM_ERR_NOT_A_FILE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_errno_t(ALPM_ERR_NOT_A_FILE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ERR_NOT_A_FILE, __pyx_t_1) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ERR_NOT_A_FILE, __pyx_t_1) < 0) __PYX_ERR(0, 327, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":327
+  /* "alpm.pyx":328
  * 
  * ERR_NOT_A_FILE = ALPM_ERR_NOT_A_FILE
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR             # <<<<<<<<<<<<<<
  * 
  * def error_number():
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_errno_t(ALPM_ERR_NOT_A_DIR); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_errno_t(ALPM_ERR_NOT_A_DIR); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 328, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ERR_NOT_A_DIR, __pyx_t_1) < 0) __PYX_ERR(0, 327, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ERR_NOT_A_DIR, __pyx_t_1) < 0) __PYX_ERR(0, 328, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":329
+  /* "alpm.pyx":330
  * ERR_NOT_A_DIR =  ALPM_ERR_NOT_A_DIR
  * 
  * def error_number():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return <int>alpm_errno(handle)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_9error_number, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_9error_number, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_error_number, __pyx_t_1) < 0) __PYX_ERR(0, 329, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_error_number, __pyx_t_1) < 0) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":334
+  /* "alpm.pyx":335
  *     return 0
  * 
  * def error_string(int err):             # <<<<<<<<<<<<<<
  *     cdef char *cstr
  *     cdef const_char *strerr = ''
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_11error_string, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_11error_string, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_error_string, __pyx_t_1) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_error_string, __pyx_t_1) < 0) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":349
+  /* "alpm.pyx":350
  *         return to_unicode(cstr, True)
  * 
  * def get_localdb():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_localdb(handle))
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_13get_localdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_13get_localdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_localdb, __pyx_t_1) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_localdb, __pyx_t_1) < 0) __PYX_ERR(0, 350, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":353
+  /* "alpm.pyx":354
  *         return to_capsule(alpm_get_localdb(handle))
  * 
  * def get_syncdbs():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_capsule(alpm_get_syncdbs(handle))
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_15get_syncdbs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_15get_syncdbs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 354, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_syncdbs, __pyx_t_1) < 0) __PYX_ERR(0, 353, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_syncdbs, __pyx_t_1) < 0) __PYX_ERR(0, 354, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":357
+  /* "alpm.pyx":358
  *         return to_capsule(alpm_get_syncdbs(handle))
  * 
  * def register_syncdb(object pname):             # <<<<<<<<<<<<<<
  *     cdef bytes name
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_17register_syncdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_17register_syncdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_register_syncdb, __pyx_t_1) < 0) __PYX_ERR(0, 357, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_register_syncdb, __pyx_t_1) < 0) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":364
+  /* "alpm.pyx":365
  *         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
  * 
+ * def db_unregister(object pdb):             # <<<<<<<<<<<<<<
+ *     cdef alpm_db_t *db
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_19db_unregister, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_unregister, __pyx_t_1) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "alpm.pyx":373
+ *     return -1
+ * 
  * def db_get_name(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_19db_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_21db_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 364, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":371
+  /* "alpm.pyx":380
  *         return to_unicode(<char *>alpm_db_get_name(db))
  * 
  * def db_get_pkg(object pdb, object pname):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  *     cdef bytes name
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_21db_get_pkg, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_23db_get_pkg, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_pkg, __pyx_t_1) < 0) __PYX_ERR(0, 371, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_pkg, __pyx_t_1) < 0) __PYX_ERR(0, 380, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":380
+  /* "alpm.pyx":389
  *         return to_capsule(alpm_db_get_pkg(db, name))
  * 
  * def db_get_groupcache(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_23db_get_groupcache, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_25db_get_groupcache, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 389, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_groupcache, __pyx_t_1) < 0) __PYX_ERR(0, 380, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_groupcache, __pyx_t_1) < 0) __PYX_ERR(0, 389, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":387
+  /* "alpm.pyx":396
  *         return to_capsule(alpm_db_get_groupcache(db))
  * 
  * def db_get_pkgcache(object pdb):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_25db_get_pkgcache, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_27db_get_pkgcache, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 396, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_pkgcache, __pyx_t_1) < 0) __PYX_ERR(0, 387, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_pkgcache, __pyx_t_1) < 0) __PYX_ERR(0, 396, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":394
+  /* "alpm.pyx":403
  *         return to_capsule(alpm_db_get_pkgcache(db))
  * 
  * def db_get_group(object pdb, object pname):             # <<<<<<<<<<<<<<
  *     cdef alpm_db_t *db
  *     cdef bytes name
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_27db_get_group, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_29db_get_group, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_group, __pyx_t_1) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_get_group, __pyx_t_1) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":403
+  /* "alpm.pyx":412
  *         return to_capsule(alpm_db_get_group(db, name))
  * 
  * def db_find_provider(object pname, int local):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_29db_find_provider, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_31db_find_provider, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 412, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_find_provider, __pyx_t_1) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_find_provider, __pyx_t_1) < 0) __PYX_ERR(0, 412, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":408
+  /* "alpm.pyx":417
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_provides, local))
  * 
  * def db_find_replacer(object pname, int local):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_31db_find_replacer, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 408, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_33db_find_replacer, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_find_replacer, __pyx_t_1) < 0) __PYX_ERR(0, 408, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_db_find_replacer, __pyx_t_1) < 0) __PYX_ERR(0, 417, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":413
+  /* "alpm.pyx":422
  *     return to_capsule(filter_by_func(name, alpm_pkg_get_replaces, local))
  * 
  * def option_set_arch(object parch):             # <<<<<<<<<<<<<<
  *     cdef bytes arch
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_33option_set_arch, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_35option_set_arch, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 422, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_set_arch, __pyx_t_1) < 0) __PYX_ERR(0, 413, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_set_arch, __pyx_t_1) < 0) __PYX_ERR(0, 422, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":421
+  /* "alpm.pyx":430
  *     return -1
  * 
  * def option_get_logfile():             # <<<<<<<<<<<<<<
  *     if handle is not NULL:
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_35option_get_logfile, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 421, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_37option_get_logfile, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 430, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_logfile, __pyx_t_1) < 0) __PYX_ERR(0, 421, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_logfile, __pyx_t_1) < 0) __PYX_ERR(0, 430, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":425
+  /* "alpm.pyx":434
  *         return to_unicode(<char*>alpm_option_get_logfile(handle), False, fs_encoding, fs_errors)
  * 
  * def option_set_logfile(object plogfile):             # <<<<<<<<<<<<<<
  *     cdef bytes logfile = to_bytes(plogfile, fs_encoding, fs_errors)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_37option_set_logfile, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 425, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_39option_set_logfile, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 434, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_set_logfile, __pyx_t_1) < 0) __PYX_ERR(0, 425, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_set_logfile, __pyx_t_1) < 0) __PYX_ERR(0, 434, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":432
+  /* "alpm.pyx":441
  *     return -1
  * 
  * def option_get_cachedirs():             # <<<<<<<<<<<<<<
  *     cdef list cachedirs = []
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_39option_get_cachedirs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_41option_get_cachedirs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 441, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_cachedirs, __pyx_t_1) < 0) __PYX_ERR(0, 432, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_cachedirs, __pyx_t_1) < 0) __PYX_ERR(0, 441, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":442
+  /* "alpm.pyx":451
  *     return cachedirs
  * 
  * def option_add_cachedir(object pcachedir):             # <<<<<<<<<<<<<<
  *     cdef bytes cachedir = to_bytes(pcachedir, fs_encoding, fs_errors)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_41option_add_cachedir, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_43option_add_cachedir, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 451, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_add_cachedir, __pyx_t_1) < 0) __PYX_ERR(0, 442, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_add_cachedir, __pyx_t_1) < 0) __PYX_ERR(0, 451, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":449
+  /* "alpm.pyx":458
  *     return -1
  * 
  * def option_get_syncdb(object ptarget):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  *     cdef alpm_db_t *db
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_43option_get_syncdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_45option_get_syncdb, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_syncdb, __pyx_t_1) < 0) __PYX_ERR(0, 449, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_option_get_syncdb, __pyx_t_1) < 0) __PYX_ERR(0, 458, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":466
+  /* "alpm.pyx":475
  *             node = alpm_list_next(node)
  * 
  * def group_get_name(object pgroup):             # <<<<<<<<<<<<<<
  *     cdef alpm_group_t *group
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_45group_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_47group_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 475, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_group_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 466, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_group_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 475, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":473
+  /* "alpm.pyx":482
  *         return to_unicode(group.name)
  * 
  * def group_get_pkgs(object pgroup):             # <<<<<<<<<<<<<<
  *     cdef alpm_group_t *group
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_47group_get_pkgs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_49group_get_pkgs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 482, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_group_get_pkgs, __pyx_t_1) < 0) __PYX_ERR(0, 473, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_group_get_pkgs, __pyx_t_1) < 0) __PYX_ERR(0, 482, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":480
+  /* "alpm.pyx":489
  *         return to_capsule(group.packages)
  * 
  * def dep_compute_string(object pdep):             # <<<<<<<<<<<<<<
  *     cdef alpm_depend_t *dep
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_49dep_compute_string, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 480, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_51dep_compute_string, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 489, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dep_compute_string, __pyx_t_1) < 0) __PYX_ERR(0, 480, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dep_compute_string, __pyx_t_1) < 0) __PYX_ERR(0, 489, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":489
+  /* "alpm.pyx":498
  *         return to_unicode(cstr, True)
  * 
  * def pkg_get_conflicts(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_51pkg_get_conflicts, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 489, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_53pkg_get_conflicts, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 498, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_conflicts, __pyx_t_1) < 0) __PYX_ERR(0, 489, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_conflicts, __pyx_t_1) < 0) __PYX_ERR(0, 498, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":496
+  /* "alpm.pyx":505
  *         return to_capsule(create_dep_list(alpm_pkg_get_conflicts(pkg)))
  * 
  * def pkg_get_provides(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_53pkg_get_provides, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 496, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_55pkg_get_provides, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 505, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_provides, __pyx_t_1) < 0) __PYX_ERR(0, 496, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_provides, __pyx_t_1) < 0) __PYX_ERR(0, 505, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":503
+  /* "alpm.pyx":512
  *         return to_capsule(create_dep_list(alpm_pkg_get_provides(pkg)))
  * 
  * def pkg_get_replaces(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_55pkg_get_replaces, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 503, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_57pkg_get_replaces, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 512, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_replaces, __pyx_t_1) < 0) __PYX_ERR(0, 503, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_replaces, __pyx_t_1) < 0) __PYX_ERR(0, 512, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":510
+  /* "alpm.pyx":519
  *         return to_capsule(create_dep_list(alpm_pkg_get_replaces(pkg)))
  * 
  * def pkg_get_name(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_57pkg_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_59pkg_get_name, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 510, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_name, __pyx_t_1) < 0) __PYX_ERR(0, 519, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":517
+  /* "alpm.pyx":526
  *         return to_unicode(<char *>alpm_pkg_get_name(pkg))
  * 
  * def pkg_get_arch(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_59pkg_get_arch, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_61pkg_get_arch, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 526, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_arch, __pyx_t_1) < 0) __PYX_ERR(0, 517, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_arch, __pyx_t_1) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":524
+  /* "alpm.pyx":533
  *         return to_unicode(<char *>alpm_pkg_get_arch(pkg))
  * 
  * def pkg_get_desc(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_61pkg_get_desc, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_63pkg_get_desc, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_desc, __pyx_t_1) < 0) __PYX_ERR(0, 524, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_desc, __pyx_t_1) < 0) __PYX_ERR(0, 533, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":531
+  /* "alpm.pyx":540
  *         return to_unicode(<char *>alpm_pkg_get_desc(pkg))
  * 
  * def pkg_get_url(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_63pkg_get_url, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 531, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_65pkg_get_url, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 540, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_url, __pyx_t_1) < 0) __PYX_ERR(0, 531, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_url, __pyx_t_1) < 0) __PYX_ERR(0, 540, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":538
+  /* "alpm.pyx":547
  *         return to_unicode(<char *>alpm_pkg_get_url(pkg))
  * 
  * def pkg_get_version(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_65pkg_get_version, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_67pkg_get_version, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 547, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_version, __pyx_t_1) < 0) __PYX_ERR(0, 538, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_version, __pyx_t_1) < 0) __PYX_ERR(0, 547, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":545
+  /* "alpm.pyx":554
  *         return to_unicode(<char *>alpm_pkg_get_version(pkg))
  * 
  * def pkg_get_isize(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_67pkg_get_isize, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_69pkg_get_isize, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 554, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_isize, __pyx_t_1) < 0) __PYX_ERR(0, 545, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_isize, __pyx_t_1) < 0) __PYX_ERR(0, 554, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":552
+  /* "alpm.pyx":561
  *         return alpm_pkg_get_isize(pkg)
  * 
  * def pkg_get_size(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_69pkg_get_size, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_71pkg_get_size, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 561, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_size, __pyx_t_1) < 0) __PYX_ERR(0, 552, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_size, __pyx_t_1) < 0) __PYX_ERR(0, 561, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":559
+  /* "alpm.pyx":568
  *         return alpm_pkg_get_size(pkg)
  * 
  * def pkg_get_builddate(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_71pkg_get_builddate, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_73pkg_get_builddate, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 568, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_builddate, __pyx_t_1) < 0) __PYX_ERR(0, 559, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_builddate, __pyx_t_1) < 0) __PYX_ERR(0, 568, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":566
+  /* "alpm.pyx":575
  *         return alpm_pkg_get_builddate(pkg)
  * 
  * def pkg_get_installdate(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_73pkg_get_installdate, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 566, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_75pkg_get_installdate, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 575, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_installdate, __pyx_t_1) < 0) __PYX_ERR(0, 566, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_installdate, __pyx_t_1) < 0) __PYX_ERR(0, 575, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":573
+  /* "alpm.pyx":582
  *         return alpm_pkg_get_installdate(pkg)
  * 
  * def pkg_has_scriptlet(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_75pkg_has_scriptlet, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 573, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_77pkg_has_scriptlet, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 582, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_has_scriptlet, __pyx_t_1) < 0) __PYX_ERR(0, 573, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_has_scriptlet, __pyx_t_1) < 0) __PYX_ERR(0, 582, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":580
+  /* "alpm.pyx":589
  *         return bool(alpm_pkg_has_scriptlet(pkg))
  * 
  * def pkg_get_backup(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_77pkg_get_backup, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 580, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_79pkg_get_backup, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 589, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_backup, __pyx_t_1) < 0) __PYX_ERR(0, 580, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_backup, __pyx_t_1) < 0) __PYX_ERR(0, 589, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":587
+  /* "alpm.pyx":596
  *         return to_capsule(alpm_pkg_get_backup(pkg))
  * 
  * def pkg_compute_requiredby(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_79pkg_compute_requiredby, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_81pkg_compute_requiredby, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 596, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_compute_requiredby, __pyx_t_1) < 0) __PYX_ERR(0, 587, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_compute_requiredby, __pyx_t_1) < 0) __PYX_ERR(0, 596, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":594
+  /* "alpm.pyx":603
  *         return to_capsule(alpm_pkg_compute_requiredby(pkg))
  * 
  * def pkg_compute_optionalfor(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_81pkg_compute_optionalfor, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 594, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_83pkg_compute_optionalfor, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 603, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_compute_optionalfor, __pyx_t_1) < 0) __PYX_ERR(0, 594, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_compute_optionalfor, __pyx_t_1) < 0) __PYX_ERR(0, 603, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":601
+  /* "alpm.pyx":610
  *         return to_capsule(alpm_pkg_compute_optionalfor(pkg))
  * 
  * def pkg_get_depends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_83pkg_get_depends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 601, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_85pkg_get_depends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 610, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_depends, __pyx_t_1) < 0) __PYX_ERR(0, 601, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_depends, __pyx_t_1) < 0) __PYX_ERR(0, 610, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":608
+  /* "alpm.pyx":617
  *         return to_capsule(alpm_pkg_get_depends(pkg))
  * 
  * def pkg_get_groups(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_85pkg_get_groups, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 608, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_87pkg_get_groups, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_groups, __pyx_t_1) < 0) __PYX_ERR(0, 608, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_groups, __pyx_t_1) < 0) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":615
+  /* "alpm.pyx":624
  *         return to_capsule(alpm_pkg_get_groups(pkg))
  * 
  * def pkg_get_licenses(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_87pkg_get_licenses, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 615, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_89pkg_get_licenses, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 624, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_licenses, __pyx_t_1) < 0) __PYX_ERR(0, 615, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_licenses, __pyx_t_1) < 0) __PYX_ERR(0, 624, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":622
+  /* "alpm.pyx":631
  *         return to_capsule(alpm_pkg_get_licenses(pkg))
  * 
  * def pkg_get_optdepends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_89pkg_get_optdepends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 622, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_91pkg_get_optdepends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_optdepends, __pyx_t_1) < 0) __PYX_ERR(0, 622, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_optdepends, __pyx_t_1) < 0) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":629
+  /* "alpm.pyx":638
  *         return to_capsule(alpm_pkg_get_optdepends(pkg))
  * 
  * PKG_VALIDATION_UNKNOWN = ALPM_PKG_VALIDATION_UNKNOWN             # <<<<<<<<<<<<<<
  * PKG_VALIDATION_NONE = ALPM_PKG_VALIDATION_NONE
  * PKG_VALIDATION_MD5SUM = ALPM_PKG_VALIDATION_MD5SUM
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_UNKNOWN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 629, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_UNKNOWN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 638, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_UNKNOWN, __pyx_t_1) < 0) __PYX_ERR(0, 629, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_UNKNOWN, __pyx_t_1) < 0) __PYX_ERR(0, 638, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":630
+  /* "alpm.pyx":639
  * 
  * PKG_VALIDATION_UNKNOWN = ALPM_PKG_VALIDATION_UNKNOWN
  * PKG_VALIDATION_NONE = ALPM_PKG_VALIDATION_NONE             # <<<<<<<<<<<<<<
  * PKG_VALIDATION_MD5SUM = ALPM_PKG_VALIDATION_MD5SUM
  * PKG_VALIDATION_SHA256SUM = ALPM_PKG_VALIDATION_SHA256SUM
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_NONE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 630, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_NONE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 639, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_NONE, __pyx_t_1) < 0) __PYX_ERR(0, 630, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_NONE, __pyx_t_1) < 0) __PYX_ERR(0, 639, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":631
+  /* "alpm.pyx":640
  * PKG_VALIDATION_UNKNOWN = ALPM_PKG_VALIDATION_UNKNOWN
  * PKG_VALIDATION_NONE = ALPM_PKG_VALIDATION_NONE
  * PKG_VALIDATION_MD5SUM = ALPM_PKG_VALIDATION_MD5SUM             # <<<<<<<<<<<<<<
  * PKG_VALIDATION_SHA256SUM = ALPM_PKG_VALIDATION_SHA256SUM
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_MD5SUM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_MD5SUM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 640, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_MD5SUM, __pyx_t_1) < 0) __PYX_ERR(0, 631, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_MD5SUM, __pyx_t_1) < 0) __PYX_ERR(0, 640, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":632
+  /* "alpm.pyx":641
  * PKG_VALIDATION_NONE = ALPM_PKG_VALIDATION_NONE
  * PKG_VALIDATION_MD5SUM = ALPM_PKG_VALIDATION_MD5SUM
  * PKG_VALIDATION_SHA256SUM = ALPM_PKG_VALIDATION_SHA256SUM             # <<<<<<<<<<<<<<
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_SHA256SUM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_SHA256SUM); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 641, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_SHA256SUM, __pyx_t_1) < 0) __PYX_ERR(0, 632, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_SHA256SUM, __pyx_t_1) < 0) __PYX_ERR(0, 641, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":633
+  /* "alpm.pyx":642
  * PKG_VALIDATION_MD5SUM = ALPM_PKG_VALIDATION_MD5SUM
  * PKG_VALIDATION_SHA256SUM = ALPM_PKG_VALIDATION_SHA256SUM
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE             # <<<<<<<<<<<<<<
  * 
  * def pkg_get_validation(object ppkg):
  */
-  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_SIGNATURE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 633, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_alpm_pkgvalidation_t(ALPM_PKG_VALIDATION_SIGNATURE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 642, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_SIGNATURE, __pyx_t_1) < 0) __PYX_ERR(0, 633, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VALIDATION_SIGNATURE, __pyx_t_1) < 0) __PYX_ERR(0, 642, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":635
+  /* "alpm.pyx":644
  * PKG_VALIDATION_SIGNATURE = ALPM_PKG_VALIDATION_SIGNATURE
  * 
  * def pkg_get_validation(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_91pkg_get_validation, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 635, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_93pkg_get_validation, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 644, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_validation, __pyx_t_1) < 0) __PYX_ERR(0, 635, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_validation, __pyx_t_1) < 0) __PYX_ERR(0, 644, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":642
+  /* "alpm.pyx":651
  *         return <int>alpm_pkg_get_validation(pkg)
  * 
  * def pkg_vercmp(object pa, object pb):             # <<<<<<<<<<<<<<
  *     cdef bytes a = to_bytes(pa)
  *     cdef bytes b = to_bytes(pb)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_93pkg_vercmp, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 642, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_95pkg_vercmp, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 651, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_vercmp, __pyx_t_1) < 0) __PYX_ERR(0, 642, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_vercmp, __pyx_t_1) < 0) __PYX_ERR(0, 651, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":648
+  /* "alpm.pyx":657
  *     return alpm_pkg_vercmp(a, b)
  * 
  * def pkg_load(object ppath, int full):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg = NULL
  *     cdef bytes path
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_95pkg_load, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 648, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_97pkg_load, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 657, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_load, __pyx_t_1) < 0) __PYX_ERR(0, 648, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_load, __pyx_t_1) < 0) __PYX_ERR(0, 657, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":657
+  /* "alpm.pyx":666
  *         return to_capsule(pkg)
  * 
  * def pkg_get_repository(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_97pkg_get_repository, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 657, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_99pkg_get_repository, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 666, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_repository, __pyx_t_1) < 0) __PYX_ERR(0, 657, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_repository, __pyx_t_1) < 0) __PYX_ERR(0, 666, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":664
+  /* "alpm.pyx":673
  *         return to_unicode(<char *>find_pkg_repository(pkg))
  * 
  * def pkg_get_fullname(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *fullname
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_99pkg_get_fullname, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 664, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_101pkg_get_fullname, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_fullname, __pyx_t_1) < 0) __PYX_ERR(0, 664, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_fullname, __pyx_t_1) < 0) __PYX_ERR(0, 673, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":675
+  /* "alpm.pyx":684
  *             return to_unicode(fullname, True)
  * 
  * def pkg_get_packager(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef const_char *packager
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_101pkg_get_packager, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 675, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_103pkg_get_packager, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 684, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_packager, __pyx_t_1) < 0) __PYX_ERR(0, 675, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_packager, __pyx_t_1) < 0) __PYX_ERR(0, 684, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":686
+  /* "alpm.pyx":695
  *                 return to_unicode(<char *>packager)
  * 
  * PKG_STATUS_NULL = STATUS_NULL             # <<<<<<<<<<<<<<
  * PKG_STATUS_NONINSTALLED = STATUS_NONINSTALLED
  * PKG_STATUS_INSTALLED = STATUS_INSTALLED
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 686, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 695, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_NULL, __pyx_t_1) < 0) __PYX_ERR(0, 686, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_NULL, __pyx_t_1) < 0) __PYX_ERR(0, 695, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":687
+  /* "alpm.pyx":696
  * 
  * PKG_STATUS_NULL = STATUS_NULL
  * PKG_STATUS_NONINSTALLED = STATUS_NONINSTALLED             # <<<<<<<<<<<<<<
  * PKG_STATUS_INSTALLED = STATUS_INSTALLED
  * PKG_STATUS_EXPLICIT = STATUS_EXPLICIT
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_NONINSTALLED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 687, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_NONINSTALLED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 696, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_NONINSTALLED, __pyx_t_1) < 0) __PYX_ERR(0, 687, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_NONINSTALLED, __pyx_t_1) < 0) __PYX_ERR(0, 696, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":688
+  /* "alpm.pyx":697
  * PKG_STATUS_NULL = STATUS_NULL
  * PKG_STATUS_NONINSTALLED = STATUS_NONINSTALLED
  * PKG_STATUS_INSTALLED = STATUS_INSTALLED             # <<<<<<<<<<<<<<
  * PKG_STATUS_EXPLICIT = STATUS_EXPLICIT
  * PKG_STATUS_DEPENDENCY = STATUS_DEPENDENCY
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_INSTALLED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 688, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_INSTALLED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 697, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_INSTALLED, __pyx_t_1) < 0) __PYX_ERR(0, 688, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_INSTALLED, __pyx_t_1) < 0) __PYX_ERR(0, 697, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":689
+  /* "alpm.pyx":698
  * PKG_STATUS_NONINSTALLED = STATUS_NONINSTALLED
  * PKG_STATUS_INSTALLED = STATUS_INSTALLED
  * PKG_STATUS_EXPLICIT = STATUS_EXPLICIT             # <<<<<<<<<<<<<<
  * PKG_STATUS_DEPENDENCY = STATUS_DEPENDENCY
  * PKG_STATUS_OPTIONAL = STATUS_OPTIONAL
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_EXPLICIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 689, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_EXPLICIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 698, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_EXPLICIT, __pyx_t_1) < 0) __PYX_ERR(0, 689, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_EXPLICIT, __pyx_t_1) < 0) __PYX_ERR(0, 698, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":690
+  /* "alpm.pyx":699
  * PKG_STATUS_INSTALLED = STATUS_INSTALLED
  * PKG_STATUS_EXPLICIT = STATUS_EXPLICIT
  * PKG_STATUS_DEPENDENCY = STATUS_DEPENDENCY             # <<<<<<<<<<<<<<
  * PKG_STATUS_OPTIONAL = STATUS_OPTIONAL
  * PKG_STATUS_ORPHAN = STATUS_ORPHAN
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_DEPENDENCY); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 690, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_DEPENDENCY); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 699, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_DEPENDENCY, __pyx_t_1) < 0) __PYX_ERR(0, 690, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_DEPENDENCY, __pyx_t_1) < 0) __PYX_ERR(0, 699, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":691
+  /* "alpm.pyx":700
  * PKG_STATUS_EXPLICIT = STATUS_EXPLICIT
  * PKG_STATUS_DEPENDENCY = STATUS_DEPENDENCY
  * PKG_STATUS_OPTIONAL = STATUS_OPTIONAL             # <<<<<<<<<<<<<<
  * PKG_STATUS_ORPHAN = STATUS_ORPHAN
  * PKG_STATUS_FOREIGN = STATUS_FOREIGN
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_OPTIONAL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 691, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_OPTIONAL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 700, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_OPTIONAL, __pyx_t_1) < 0) __PYX_ERR(0, 691, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_OPTIONAL, __pyx_t_1) < 0) __PYX_ERR(0, 700, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":692
+  /* "alpm.pyx":701
  * PKG_STATUS_DEPENDENCY = STATUS_DEPENDENCY
  * PKG_STATUS_OPTIONAL = STATUS_OPTIONAL
  * PKG_STATUS_ORPHAN = STATUS_ORPHAN             # <<<<<<<<<<<<<<
  * PKG_STATUS_FOREIGN = STATUS_FOREIGN
  * PKG_STATUS_UPGRADE = STATUS_UPGRADE
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_ORPHAN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 692, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_ORPHAN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 701, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_ORPHAN, __pyx_t_1) < 0) __PYX_ERR(0, 692, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_ORPHAN, __pyx_t_1) < 0) __PYX_ERR(0, 701, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":693
+  /* "alpm.pyx":702
  * PKG_STATUS_OPTIONAL = STATUS_OPTIONAL
  * PKG_STATUS_ORPHAN = STATUS_ORPHAN
  * PKG_STATUS_FOREIGN = STATUS_FOREIGN             # <<<<<<<<<<<<<<
  * PKG_STATUS_UPGRADE = STATUS_UPGRADE
  * PKG_STATUS_DOWNGRADE = STATUS_DOWNGRADE
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_FOREIGN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 693, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_FOREIGN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_FOREIGN, __pyx_t_1) < 0) __PYX_ERR(0, 693, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_FOREIGN, __pyx_t_1) < 0) __PYX_ERR(0, 702, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":694
+  /* "alpm.pyx":703
  * PKG_STATUS_ORPHAN = STATUS_ORPHAN
  * PKG_STATUS_FOREIGN = STATUS_FOREIGN
  * PKG_STATUS_UPGRADE = STATUS_UPGRADE             # <<<<<<<<<<<<<<
  * PKG_STATUS_DOWNGRADE = STATUS_DOWNGRADE
  * PKG_STATUS_MAX = STATUS_MAX
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_UPGRADE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 694, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_UPGRADE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 703, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_UPGRADE, __pyx_t_1) < 0) __PYX_ERR(0, 694, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_UPGRADE, __pyx_t_1) < 0) __PYX_ERR(0, 703, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":695
+  /* "alpm.pyx":704
  * PKG_STATUS_FOREIGN = STATUS_FOREIGN
  * PKG_STATUS_UPGRADE = STATUS_UPGRADE
  * PKG_STATUS_DOWNGRADE = STATUS_DOWNGRADE             # <<<<<<<<<<<<<<
  * PKG_STATUS_MAX = STATUS_MAX
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_DOWNGRADE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 695, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_DOWNGRADE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 704, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_DOWNGRADE, __pyx_t_1) < 0) __PYX_ERR(0, 695, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_DOWNGRADE, __pyx_t_1) < 0) __PYX_ERR(0, 704, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":696
+  /* "alpm.pyx":705
  * PKG_STATUS_UPGRADE = STATUS_UPGRADE
  * PKG_STATUS_DOWNGRADE = STATUS_DOWNGRADE
  * PKG_STATUS_MAX = STATUS_MAX             # <<<<<<<<<<<<<<
  * 
  * def pkg_get_status(object ppkg):
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_MAX); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 696, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_STATUS_MAX); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 705, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_MAX, __pyx_t_1) < 0) __PYX_ERR(0, 696, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_STATUS_MAX, __pyx_t_1) < 0) __PYX_ERR(0, 705, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":698
+  /* "alpm.pyx":707
  * PKG_STATUS_MAX = STATUS_MAX
  * 
  * def pkg_get_status(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef int status = STATUS_NULL
  *     cdef alpm_pkgreason_t reason
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_103pkg_get_status, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 698, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_105pkg_get_status, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 707, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_status, __pyx_t_1) < 0) __PYX_ERR(0, 698, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_get_status, __pyx_t_1) < 0) __PYX_ERR(0, 707, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":730
+  /* "alpm.pyx":739
  *     return status
  * 
  * def pkg_check_update(object pname, object pversion):             # <<<<<<<<<<<<<<
  *     cdef int status = STATUS_NULL
  *     cdef alpm_db_t *db
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_105pkg_check_update, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 730, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_107pkg_check_update, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 739, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_check_update, __pyx_t_1) < 0) __PYX_ERR(0, 730, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_check_update, __pyx_t_1) < 0) __PYX_ERR(0, 739, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":751
+  /* "alpm.pyx":760
  *     return status
  * 
  * PKG_VCS_NULL = VCS_NULL             # <<<<<<<<<<<<<<
  * PKG_VCS_GIT = VCS_GIT
  * PKG_VCS_SVN = VCS_SVN
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 751, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 760, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_NULL, __pyx_t_1) < 0) __PYX_ERR(0, 751, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_NULL, __pyx_t_1) < 0) __PYX_ERR(0, 760, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":752
+  /* "alpm.pyx":761
  * 
  * PKG_VCS_NULL = VCS_NULL
  * PKG_VCS_GIT = VCS_GIT             # <<<<<<<<<<<<<<
  * PKG_VCS_SVN = VCS_SVN
  * PKG_VCS_HG = VCS_HG
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_GIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 752, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_GIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 761, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_GIT, __pyx_t_1) < 0) __PYX_ERR(0, 752, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_GIT, __pyx_t_1) < 0) __PYX_ERR(0, 761, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":753
+  /* "alpm.pyx":762
  * PKG_VCS_NULL = VCS_NULL
  * PKG_VCS_GIT = VCS_GIT
  * PKG_VCS_SVN = VCS_SVN             # <<<<<<<<<<<<<<
  * PKG_VCS_HG = VCS_HG
  * PKG_VCS_BZR = VCS_BZR
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_SVN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 753, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_SVN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 762, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_SVN, __pyx_t_1) < 0) __PYX_ERR(0, 753, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_SVN, __pyx_t_1) < 0) __PYX_ERR(0, 762, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":754
+  /* "alpm.pyx":763
  * PKG_VCS_GIT = VCS_GIT
  * PKG_VCS_SVN = VCS_SVN
  * PKG_VCS_HG = VCS_HG             # <<<<<<<<<<<<<<
  * PKG_VCS_BZR = VCS_BZR
  * PKG_VCS_CVS = VCS_CVS
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_HG); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 754, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_HG); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 763, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_HG, __pyx_t_1) < 0) __PYX_ERR(0, 754, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_HG, __pyx_t_1) < 0) __PYX_ERR(0, 763, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":755
+  /* "alpm.pyx":764
  * PKG_VCS_SVN = VCS_SVN
  * PKG_VCS_HG = VCS_HG
  * PKG_VCS_BZR = VCS_BZR             # <<<<<<<<<<<<<<
  * PKG_VCS_CVS = VCS_CVS
  * PKG_VCS_DARCS = VCS_DARCS
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_BZR); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 755, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_BZR); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 764, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_BZR, __pyx_t_1) < 0) __PYX_ERR(0, 755, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_BZR, __pyx_t_1) < 0) __PYX_ERR(0, 764, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":756
+  /* "alpm.pyx":765
  * PKG_VCS_HG = VCS_HG
  * PKG_VCS_BZR = VCS_BZR
  * PKG_VCS_CVS = VCS_CVS             # <<<<<<<<<<<<<<
  * PKG_VCS_DARCS = VCS_DARCS
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_CVS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 756, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_CVS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 765, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_CVS, __pyx_t_1) < 0) __PYX_ERR(0, 756, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_CVS, __pyx_t_1) < 0) __PYX_ERR(0, 765, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":757
+  /* "alpm.pyx":766
  * PKG_VCS_BZR = VCS_BZR
  * PKG_VCS_CVS = VCS_CVS
  * PKG_VCS_DARCS = VCS_DARCS             # <<<<<<<<<<<<<<
  * 
  * def pkg_check_vcs(object pname):
  */
-  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_DARCS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 757, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_enum____pyx_t_4alpm_pkg_vcs_t(__pyx_e_4alpm_VCS_DARCS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 766, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_DARCS, __pyx_t_1) < 0) __PYX_ERR(0, 757, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_VCS_DARCS, __pyx_t_1) < 0) __PYX_ERR(0, 766, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":759
+  /* "alpm.pyx":768
  * PKG_VCS_DARCS = VCS_DARCS
  * 
  * def pkg_check_vcs(object pname):             # <<<<<<<<<<<<<<
  *     cdef bytes name = to_bytes(pname)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_107pkg_check_vcs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 759, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_109pkg_check_vcs, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 768, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_check_vcs, __pyx_t_1) < 0) __PYX_ERR(0, 759, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_check_vcs, __pyx_t_1) < 0) __PYX_ERR(0, 768, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":764
+  /* "alpm.pyx":773
  *     return check_vcs(name)
  * 
  * def pkg_join_files(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef alpm_filelist_t *files
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_109pkg_join_files, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 764, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_111pkg_join_files, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 773, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_files, __pyx_t_1) < 0) __PYX_ERR(0, 764, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_files, __pyx_t_1) < 0) __PYX_ERR(0, 773, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":796
+  /* "alpm.pyx":805
  *                     return to_unicode(cstr, True)
  * 
  * def pkg_join_depends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_111pkg_join_depends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 796, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_113pkg_join_depends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 805, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_depends, __pyx_t_1) < 0) __PYX_ERR(0, 796, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_depends, __pyx_t_1) < 0) __PYX_ERR(0, 805, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":805
+  /* "alpm.pyx":814
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_provides(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_113pkg_join_provides, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 805, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_115pkg_join_provides, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 814, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_provides, __pyx_t_1) < 0) __PYX_ERR(0, 805, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_provides, __pyx_t_1) < 0) __PYX_ERR(0, 814, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":814
+  /* "alpm.pyx":823
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_replaces(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_115pkg_join_replaces, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 814, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_117pkg_join_replaces, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 823, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_replaces, __pyx_t_1) < 0) __PYX_ERR(0, 814, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_replaces, __pyx_t_1) < 0) __PYX_ERR(0, 823, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":823
+  /* "alpm.pyx":832
  *         return to_unicode(cstr, True)
  * 
  * def pkg_join_optdepends(object ppkg):             # <<<<<<<<<<<<<<
  *     cdef alpm_pkg_t *pkg
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_117pkg_join_optdepends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_119pkg_join_optdepends, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 832, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_optdepends, __pyx_t_1) < 0) __PYX_ERR(0, 823, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pkg_join_optdepends, __pyx_t_1) < 0) __PYX_ERR(0, 832, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":832
+  /* "alpm.pyx":841
  *         return to_unicode(cstr, True)
  * 
  * def list_join_str(object plist, object psep):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *list
  *     cdef char *cstr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_119list_join_str, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 832, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_121list_join_str, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 841, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_join_str, __pyx_t_1) < 0) __PYX_ERR(0, 832, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_join_str, __pyx_t_1) < 0) __PYX_ERR(0, 841, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":843
+  /* "alpm.pyx":852
  *         return to_unicode(cstr, True)
  * 
  * def list_next(object plist):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *list
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_121list_next, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 843, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_123list_next, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 852, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_next, __pyx_t_1) < 0) __PYX_ERR(0, 843, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_next, __pyx_t_1) < 0) __PYX_ERR(0, 852, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":850
+  /* "alpm.pyx":859
  *         return to_capsule(alpm_list_next(list))
  * 
  * def list_get_str(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_123list_get_str, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 850, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_125list_get_str, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 859, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_str, __pyx_t_1) < 0) __PYX_ERR(0, 850, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_str, __pyx_t_1) < 0) __PYX_ERR(0, 859, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":857
+  /* "alpm.pyx":866
  *         return to_unicode(<char *>node.data)
  * 
  * def list_get_db(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_125list_get_db, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 857, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_127list_get_db, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 866, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_db, __pyx_t_1) < 0) __PYX_ERR(0, 857, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_db, __pyx_t_1) < 0) __PYX_ERR(0, 866, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":864
+  /* "alpm.pyx":873
  *         return to_capsule(<alpm_db_t *>node.data)
  * 
  * def list_get_group(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_127list_get_group, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 864, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_129list_get_group, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 873, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_group, __pyx_t_1) < 0) __PYX_ERR(0, 864, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_group, __pyx_t_1) < 0) __PYX_ERR(0, 873, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":871
+  /* "alpm.pyx":880
  *         return to_capsule(<alpm_group_t *>node.data)
  * 
  * def list_get_pkg(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_129list_get_pkg, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 871, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_131list_get_pkg, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 880, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_pkg, __pyx_t_1) < 0) __PYX_ERR(0, 871, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_pkg, __pyx_t_1) < 0) __PYX_ERR(0, 880, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":878
+  /* "alpm.pyx":887
  *         return to_capsule(<alpm_pkg_t *>node.data)
  * 
  * def list_get_dep(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_131list_get_dep, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 878, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_133list_get_dep, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 887, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_dep, __pyx_t_1) < 0) __PYX_ERR(0, 878, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_dep, __pyx_t_1) < 0) __PYX_ERR(0, 887, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":885
+  /* "alpm.pyx":894
  *         return to_capsule(<alpm_depend_t *>node.data)
  * 
  * PKG_BACKUP_UNKNOWN = BACKUP_UNKNOWN             # <<<<<<<<<<<<<<
  * PKG_BACKUP_UNMODIFIED = BACKUP_UNMODIFIED
  * PKG_BACKUP_MODIFIED = BACKUP_MODIFIED
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNKNOWN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 885, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNKNOWN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 894, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNKNOWN, __pyx_t_1) < 0) __PYX_ERR(0, 885, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNKNOWN, __pyx_t_1) < 0) __PYX_ERR(0, 894, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":886
+  /* "alpm.pyx":895
  * 
  * PKG_BACKUP_UNKNOWN = BACKUP_UNKNOWN
  * PKG_BACKUP_UNMODIFIED = BACKUP_UNMODIFIED             # <<<<<<<<<<<<<<
  * PKG_BACKUP_MODIFIED = BACKUP_MODIFIED
  * PKG_BACKUP_MISSING = BACKUP_MISSING
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNMODIFIED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 886, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNMODIFIED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 895, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNMODIFIED, __pyx_t_1) < 0) __PYX_ERR(0, 886, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNMODIFIED, __pyx_t_1) < 0) __PYX_ERR(0, 895, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":887
+  /* "alpm.pyx":896
  * PKG_BACKUP_UNKNOWN = BACKUP_UNKNOWN
  * PKG_BACKUP_UNMODIFIED = BACKUP_UNMODIFIED
  * PKG_BACKUP_MODIFIED = BACKUP_MODIFIED             # <<<<<<<<<<<<<<
  * PKG_BACKUP_MISSING = BACKUP_MISSING
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_MODIFIED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 887, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_MODIFIED); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 896, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_MODIFIED, __pyx_t_1) < 0) __PYX_ERR(0, 887, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_MODIFIED, __pyx_t_1) < 0) __PYX_ERR(0, 896, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":888
+  /* "alpm.pyx":897
  * PKG_BACKUP_UNMODIFIED = BACKUP_UNMODIFIED
  * PKG_BACKUP_MODIFIED = BACKUP_MODIFIED
  * PKG_BACKUP_MISSING = BACKUP_MISSING             # <<<<<<<<<<<<<<
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_MISSING); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 888, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_MISSING); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 897, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_MISSING, __pyx_t_1) < 0) __PYX_ERR(0, 888, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_MISSING, __pyx_t_1) < 0) __PYX_ERR(0, 897, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":889
+  /* "alpm.pyx":898
  * PKG_BACKUP_MODIFIED = BACKUP_MODIFIED
  * PKG_BACKUP_MISSING = BACKUP_MISSING
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE             # <<<<<<<<<<<<<<
  * 
  * def list_get_backup(object pnode):
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNREADABLE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 889, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_e_4alpm_BACKUP_UNREADABLE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 898, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNREADABLE, __pyx_t_1) < 0) __PYX_ERR(0, 889, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PKG_BACKUP_UNREADABLE, __pyx_t_1) < 0) __PYX_ERR(0, 898, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "alpm.pyx":891
+  /* "alpm.pyx":900
  * PKG_BACKUP_UNREADABLE = BACKUP_UNREADABLE
  * 
  * def list_get_backup(object pnode):             # <<<<<<<<<<<<<<
  *     cdef alpm_list_t *node
  *     cdef alpm_backup_t *backup
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_133list_get_backup, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 891, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4alpm_135list_get_backup, NULL, __pyx_n_s_alpm); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 900, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_backup, __pyx_t_1) < 0) __PYX_ERR(0, 891, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_list_get_backup, __pyx_t_1) < 0) __PYX_ERR(0, 900, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "alpm.pyx":1
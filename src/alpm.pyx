@@ -62,6 +62,7 @@ cdef extern from "alpm.h":
     alpm_list_t * alpm_get_syncdbs(alpm_handle_t *)
     alpm_db_t * alpm_get_localdb(alpm_handle_t *)
     alpm_db_t * alpm_register_syncdb(alpm_handle_t *, const_char *, alpm_siglevel_t)
+    int alpm_db_unregister(alpm_db_t *)
     alpm_group_t * alpm_db_get_group(alpm_db_t *, const_char *)
     alpm_list_t * alpm_db_get_groupcache(alpm_db_t *)
     alpm_list_t * alpm_db_get_pkgcache(alpm_db_t *)
@@ -361,6 +362,14 @@ def register_syncdb(object pname):
         name = to_bytes(pname)
         return to_capsule(alpm_register_syncdb(handle, name, ALPM_SIG_USE_DEFAULT))
 
+def db_unregister(object pdb):
+    cdef alpm_db_t *db
+
+    db = to_alpm_db(pdb)
+    if db is not NULL:
+        return alpm_db_unregister(db)
+    return -1
+
 def db_get_name(object pdb):
     cdef alpm_db_t *db
 